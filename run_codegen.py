@@ -2,8 +2,15 @@ import asyncio
 import logging
 from pathlib import Path
 
-from assembly_client.codegen.generator import generate_model_code, generate_params_model_code, generate_services_enum
+from assembly_client.codegen.generator import (
+    generate_models_init,
+    generate_package_init,
+    generate_registry_module,
+    generate_service_module,
+    generate_services_enum,
+)
 from assembly_client.parser import SpecParser
+from assembly_client.registry import get_registry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("codegen")
@@ -20,8 +27,8 @@ async def main():
     with open(generated_dir / "services.py", "w", encoding="utf-8") as f:
         f.write(services_code)
 
-    # 2. Generate Models
-    logger.info("Generating models.py...")
+    # 2. Generate Models (one module per service, imported lazily)
+    logger.info("Generating models/...")
     # We need to iterate over all cached specs.
     # If cache is empty, we might need to sync first?
     # For now, let's assume cache is populated or we iterate over what we have.
@@ -34,63 +41,64 @@ async def main():
     # Actually, let's try to generate for ALL if possible, but maybe limit to avoid timeout?
     # Let's just iterate over existing JSON files in cache for now.
 
-    models_code = [
-        "from pydantic import BaseModel, Field",
-        "from typing import Optional, Union",
-        "",
-    ]
+    models_dir = generated_dir / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
 
-    json_files = list(parser.cache_dir.glob("*.json"))
-    logger.info(f"Found {len(json_files)} cached specs.")
+    # The models used to live in a single module
+    legacy_models = generated_dir / "models.py"
+    if legacy_models.exists():
+        legacy_models.unlink()
 
-    for json_file in json_files:
-        if json_file.name == "all_apis.json":
-            continue
+    cached_ids = sorted(parser.store.service_ids())
+    logger.info(f"Found {len(cached_ids)} cached specs.")
 
+    service_info = get_registry(parser.cache_dir).info
+    service_ids = []
+    endpoints = {}
+    for service_id in cached_ids:
         try:
-            # Load spec manually to avoid re-parsing logic if possible, or just use parser
             # parser.parse_spec checks cache first.
-            service_id = json_file.stem
             spec = await parser.parse_spec(service_id)
 
-            # Response Model
-            code = generate_model_code(spec)
-            models_code.append(code)
-            models_code.append("")
-
-            # Request Params Model
-            p_code = generate_params_model_code(spec)
-            models_code.append(p_code)
-            models_code.append("")
+            # Response + Request Params Models
+            with open(models_dir / f"{service_id}.py", "w", encoding="utf-8") as f:
+                f.write(generate_service_module(spec))
+            service_ids.append(service_id)
+            endpoints[service_id] = spec.endpoint
 
         except Exception as e:
-            logger.error(f"Failed to generate model for {json_file}: {e}")
-
-    with open(generated_dir / "models.py", "w", encoding="utf-8") as f:
-        f.write("\n".join(models_code))
-
-    # Create __init__.py with MODEL_MAP
-    with open(generated_dir / "__init__.py", "w") as f:
-        f.write("from .services import Service\n")
-        f.write("from .models import *\n\n")
-
-        f.write("MODEL_MAP = {\n")
-        for json_file in json_files:
-            if json_file.name == "all_apis.json":
-                continue
-            service_id = json_file.stem
-            class_name = f"Model_{service_id}"
-            f.write(f"    '{service_id}': {class_name},\n")
-        f.write("}\n\n")
-
-        f.write("PARAM_MAP = {\n")
-        for json_file in json_files:
-            if json_file.name == "all_apis.json":
-                continue
-            service_id = json_file.stem
-            class_name = f"Params_{service_id}"
-            f.write(f"    '{service_id}': {class_name},\n")
-        f.write("}\n")
+            logger.error(f"Failed to generate model for {service_id}: {e}")
+
+    # Remove modules of services that no longer exist
+    for module_file in models_dir.glob("*.py"):
+        if module_file.name != "__init__.py" and module_file.stem not in service_ids:
+            module_file.unlink()
+
+    with open(models_dir / "__init__.py", "w", encoding="utf-8") as f:
+        f.write(generate_models_init(service_ids))
+
+    # 3. Frozen service registry (ID -> name, endpoint, category) for cache-less lookups.
+    # Only written from a complete cache: every service of the master list needs its spec,
+    # otherwise the table would promise I/O-free endpoints it does not have.
+    registry_entries = [
+        (service_id, info.name, endpoints[service_id], info.category)
+        for service_id, info in service_info.items()
+        if endpoints.get(service_id)
+    ]
+    missing = sorted(set(service_info) - {entry[0] for entry in registry_entries})
+    if not service_info or missing:
+        logger.error(
+            f"Not generating registry.py: {len(missing)} services have no cached spec "
+            f"(run `sync` first): {missing}"
+        )
+    else:
+        logger.info("Generating registry.py...")
+        with open(generated_dir / "registry.py", "w", encoding="utf-8") as f:
+            f.write(generate_registry_module(registry_entries))
+
+    # Create __init__.py with lazy MODEL_MAP / PARAM_MAP
+    with open(generated_dir / "__init__.py", "w", encoding="utf-8") as f:
+        f.write(generate_package_init())
 
     logger.info("Code generation complete.")
 
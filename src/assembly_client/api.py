@@ -1,13 +1,26 @@
+import asyncio
 import logging
 import os
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any, Literal
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from .cache import MemoryCache, ResponseCache
+from .columnar import ColumnBuffer
 from .errors import AssemblyAPIError, SpecParseError
-from .parser import APISpec, SpecParser, load_service_map, load_service_metadata
+from .parser import APISpec, SpecParser
+from .ratelimit import retry_after_delay
+from .registry import ServiceRegistry, baked_endpoint, baked_service_id, baked_services
+from .session import AssemblySession
+from .state import ClientState
+from .streaming import RowStreamDecoder
+from .transport import TransportConfig
+from .watermark import WatermarkStore, date_key
 
 # Try to import generated types, but don't fail if not generated yet
 try:
@@ -24,8 +37,20 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class _RequestFailed(AssemblyAPIError):
+    """Failure of ``_request_raw``'s own HTTP call; the only errors the retry policy unwraps."""
+
+
+def _http_error(exception) -> Exception:
+    """Return the underlying httpx error if ``exception`` wraps the failed API request."""
+    if isinstance(exception, _RequestFailed) and isinstance(exception.__cause__, httpx.HTTPError):
+        return exception.__cause__
+    return exception
+
+
 def _is_retryable_error(exception):
     """Check if the exception is retryable."""
+    exception = _http_error(exception)
     if isinstance(exception, (httpx.NetworkError, httpx.TimeoutException)):
         return True
     if isinstance(exception, httpx.HTTPStatusError):
@@ -33,73 +58,264 @@ def _is_retryable_error(exception):
     return False
 
 
+_exponential_wait = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _retry_wait(retry_state) -> float:
+    """
+    Wait as long as the server's Retry-After asks (capped at the client's
+    ``TransportConfig.max_retry_after``), else back off exponentially.
+    """
+    exception = _http_error(retry_state.outcome.exception())
+    if isinstance(exception, httpx.HTTPStatusError):
+        session = getattr(retry_state.args[0], "session", None) if retry_state.args else None
+        transport = session.transport if session is not None else TransportConfig()
+        delay = retry_after_delay(exception.response, transport.max_retry_after)
+        if delay is not None:
+            return delay
+    return _exponential_wait(retry_state)
+
+
+def _cancel_tasks(tasks) -> None:
+    """Cancel pending tasks and retrieve exceptions of finished ones."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
+
+DecodeMode = Literal["model", "construct", "dict", "tuple"]
+DECODE_MODES = ("model", "construct", "dict", "tuple")
+
+
+def _check_decode(decode: str) -> str:
+    if decode not in DECODE_MODES:
+        raise ValueError(f"decode must be one of {DECODE_MODES}, got {decode!r}")
+    return decode
+
+
+@lru_cache(maxsize=None)
+def _rows_adapter(model_cls: type[BaseModel]) -> TypeAdapter:
+    """Cached adapter validating a whole page of rows in one pydantic-core call."""
+    return TypeAdapter(list[model_cls])
+
+
+def _construct_rows(model_cls: type[BaseModel], rows: list[dict[str, Any]]) -> list[BaseModel]:
+    """
+    Build model instances without validation (``model_construct``).
+
+    Values are stored as returned by the API; fields missing from a row get their
+    default (None for every generated field).
+    """
+    construct = model_cls.model_construct
+    return [construct(**row) for row in rows]
+
+
 class AssemblyAPIClient:
     """Client for Korean National Assembly Open API."""
 
     BASE_URL = "https://open.assembly.go.kr/portal/openapi"
 
-    def __init__(self, api_key: str | None = None, spec_parser: SpecParser | None = None):
+    # Default row decoding, see _parse_response
+    decode: DecodeMode = "model"
+    # Watermarks for get_new_data (created on first use)
+    watermarks: WatermarkStore | None = None
+    # Spec parser, registry and parsed specs (possibly shared with other clients)
+    state: ClientState | None = None
+    # Explicitly assigned service maps, overriding the registry
+    _service_map: Mapping[str, str] | None = None
+    _name_to_id: Mapping[str, str] | None = None
+    _service_metadata: Mapping[str, dict[str, str]] | None = None
+    # In-memory response cache (see _fetch_raw)
+    memory_cache: MemoryCache | None = None
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        spec_parser: SpecParser | None = None,
+        transport: TransportConfig | None = None,
+        session: AssemblySession | None = None,
+        cache: ResponseCache | None = None,
+        memory_cache: MemoryCache | None = None,
+        decode: DecodeMode = "model",
+        watermarks: WatermarkStore | None = None,
+        state: ClientState | None = None,
+    ):
         """
         Initialize the Assembly API Client.
 
+        Construction does no I/O: the spec parser, the master list and the specs
+        are loaded when first needed.
+
         Args:
             api_key: API Key. If None, tries to read from ASSEMBLY_API_KEY env var.
-            spec_parser: Instance of SpecParser. If None, creates a default one.
+            spec_parser: Instance of SpecParser. If None, a default one that shares this
+                         client's HTTP session is created on first use. Ignored when
+                         ``state`` is given.
+            transport: Connection pool / keep-alive / timeout / HTTP/2 settings.
+                       If None, uses TransportConfig defaults. Ignored when ``session`` is given.
+            session: Shared HTTP session. If None, the client creates (and closes) its own.
+            cache: Optional on-disk response cache consulted before every JSON request.
+            memory_cache: Optional in-memory LRU that also merges identical concurrent requests.
+            decode: Default row decoding for get_data / get_all_data
+                    ("model", "construct", "dict" or "tuple", see ``_parse_response``).
+            watermarks: Store used by get_new_data. If None, a ``WatermarkStore`` in the
+                        user cache directory is created on first use.
+            state: Spec parser, service registry and parsed specs shared with other
+                   clients (see ``ClientState``). If None, the client gets its own.
         """
         self.api_key = api_key or os.getenv("ASSEMBLY_API_KEY")
 
         if not self.api_key:
             logger.warning("ASSEMBLY_API_KEY is not set. Some APIs may fail.")
 
-        self.client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
-        self.spec_parser = spec_parser or SpecParser()
-        self.parsed_specs: dict[str, APISpec] = {}
+        self._owns_session = session is None
+        self.session = session or AssemblySession(transport)
+        self.transport = self.session.transport
+        self.state = state or ClientState(spec_parser, session=self.session)
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.decode = _check_decode(decode)
+        self.watermarks = watermarks
+        self.parsed_specs: dict[str, APISpec] = self.state.parsed_specs
+
+    @property
+    def spec_parser(self) -> SpecParser:
+        """The spec parser (created on first access unless one was given)."""
+        return self.state.spec_parser
+
+    @spec_parser.setter
+    def spec_parser(self, value: SpecParser) -> None:
+        if self.state is None:
+            self.state = ClientState()
+        self.state.spec_parser = value
+
+    @property
+    def registry(self) -> ServiceRegistry | None:
+        """Process-wide master list registry (None for clients built without a state)."""
+        return self.state.registry if self.state is not None else None
+
+    # Service map (ID -> Name), reverse map (Name -> ID) and metadata come from the
+    # process-wide registry, so the master list is parsed once, not per client.
+    # Reading one returns a plain dict copy the caller may modify; assigning one
+    # replaces it for this client only. Lookups inside the client use the shared
+    # read-only views directly.
+
+    def _names(self) -> Mapping[str, str]:
+        if self._service_map is not None:
+            return self._service_map
+        return self.registry.names if self.state is not None else {}
+
+    def _ids(self) -> Mapping[str, str]:
+        if self._name_to_id is not None:
+            return self._name_to_id
+        return self.registry.ids if self.state is not None else {}
+
+    @property
+    def service_map(self) -> dict[str, str]:
+        if self._service_map is not None:
+            return self._service_map
+        return dict(self._names())
+
+    @service_map.setter
+    def service_map(self, value: dict[str, str]) -> None:
+        self._service_map = value
+
+    @property
+    def name_to_id(self) -> dict[str, str]:
+        if self._name_to_id is not None:
+            return self._name_to_id
+        return dict(self._ids())
+
+    @name_to_id.setter
+    def name_to_id(self, value: dict[str, str]) -> None:
+        self._name_to_id = value
+
+    @property
+    def service_metadata(self) -> dict[str, dict[str, str]]:
+        if self._service_metadata is not None:
+            return self._service_metadata
+        if self.state is None:
+            return {}
+        return {sid: dict(entry) for sid, entry in self.registry.metadata.items()}
+
+    @service_metadata.setter
+    def service_metadata(self, value: dict[str, dict[str, str]]) -> None:
+        self._service_metadata = value
+
+    def preload_specs(self) -> int:
+        """
+        Load every cached spec into memory at once so later endpoint lookups skip the store.
 
-        # Load service map (ID -> Name) for name resolution
-        self.service_map = load_service_map(self.spec_parser.cache_dir)
-        # Create reverse map (Name -> ID)
-        self.name_to_id = {name: sid for sid, name in self.service_map.items()}
+        With a ``SQLiteSpecStore`` this is a single read instead of one file per service.
 
-        # Load comprehensive service metadata
-        self.service_metadata = load_service_metadata(self.spec_parser.cache_dir)
+        Returns:
+            Number of specs loaded.
+        """
+        specs = self.spec_parser.load_cached_specs()
+        self.parsed_specs.update(specs)
+        return len(specs)
 
-    def search_services(self, keyword: str) -> dict[str, str]:
+    def search_services(self, keyword: str, limit: int | None = None) -> dict[str, str]:
         """
-        Search for services by name or ID.
+        Search for services by ID, name, category, organization or description.
 
         Args:
-            keyword: Search term (case-insensitive).
+            keyword: Search term (case, spaces and underscores are ignored). Initial
+                     consonants such as "ㄱㅎㅇㅇ" match service names by chosung.
+            limit: Maximum number of results. None returns all matches.
 
         Returns:
-            Dictionary of {service_id: service_name}
+            Dictionary of {service_id: service_name}, best match first.
         """
-        results = {}
-        keyword = keyword.lower()
-        for sid, name in self.service_map.items():
-            if keyword in sid.lower() or keyword in name.lower():
-                results[sid] = name
-        return results
+        names = self._names()
+        if self._service_map is None and self.state is not None:
+            index = self.registry.search_index
+        else:
+            from .search import ServiceSearchIndex
+
+            index = ServiceSearchIndex.from_names(names)
+        return {sid: names.get(sid, "") for sid, _ in index.search(keyword, limit)}
 
     def _resolve_service_id(self, service_id_or_name: str) -> str:
         """Resolve a string to a Service ID."""
+        # 0. Service members and IDs in the generated registry need no lookup tables
+        if HAS_GENERATED_TYPES and isinstance(service_id_or_name, Service):
+            return service_id_or_name.value
+        if service_id_or_name in baked_services():
+            return service_id_or_name
+
         # 1. Check if it's a known ID
-        if service_id_or_name in self.service_map:
+        if service_id_or_name in self._names():
             return service_id_or_name
 
         # 2. Check if it's a known Name
-        if service_id_or_name in self.name_to_id:
-            return self.name_to_id[service_id_or_name]
+        ids = self._ids()
+        if service_id_or_name in ids:
+            return ids[service_id_or_name]
 
-        # 3. If it looks like an ID (alphanumeric, long), assume it's an ID
+        # 3. Fall back to the generated registry (works without a synced master list)
+        service_id = baked_service_id(service_id_or_name)
+        if service_id is not None:
+            return service_id
+
+        # 4. If it looks like an ID (alphanumeric, long), assume it's an ID
         # (Even if not in our cache, maybe it's new?)
         if len(service_id_or_name) > 10 and service_id_or_name.isalnum():
             return service_id_or_name
 
         raise AssemblyAPIError("INVALID_ID", f"Could not resolve service: {service_id_or_name}")
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying ``httpx.AsyncClient`` of the HTTP session."""
+        return self.session.client
+
     async def close(self):
-        """Close the underlying HTTP client."""
-        await self.client.aclose()
+        """Close the underlying HTTP session (only if this client created it)."""
+        if self._owns_session:
+            await self.session.aclose()
 
     async def __aenter__(self):
         return self
@@ -111,6 +327,10 @@ class AssemblyAPIClient:
         """
         Get the actual API endpoint for a service ID.
 
+        Precedence: a spec already loaded by this client, then the spec store (so a
+        re-synced spec overrides the generated table), then the generated registry,
+        and only then a spec download.
+
         Args:
             service_id: The service ID
 
@@ -120,35 +340,80 @@ class AssemblyAPIClient:
         Raises:
             SpecParseError: If spec parsing fails
         """
-        if service_id not in self.parsed_specs:
-            logger.debug(f"Resolving endpoint for {service_id}")
-
-            # We don't have the master list loaded here to check for infSeq.
-            # But SpecParser defaults to infSeq=2 which works for most.
-            # If we need robust infSeq handling, we might need to look it up from a master list.
-            # For now, we'll stick to the default behavior of the original client
-            # which tried to look it up from self.specs (which was loaded from all_apis.json).
-
-            # TODO: Consider loading all_apis.json if it exists to get hints like infSeq.
+        spec = self.parsed_specs.get(service_id)
+        if spec is None:
+            spec = self.state.cached_spec(service_id)
+            if spec is not None:
+                self.parsed_specs[service_id] = spec
+        if spec is not None:
+            return spec.endpoint
+
+        endpoint = baked_endpoint(service_id)
+        if endpoint is not None:
+            return endpoint
+
+        logger.debug(f"Resolving endpoint for {service_id}")
+        return (await self.get_spec(service_id)).endpoint
+
+    async def get_spec(self, service_id: str) -> APISpec:
+        """
+        Get the parsed specification of a service, loading it on first use.
 
-            spec = await self.spec_parser.parse_spec(service_id)
-            self.parsed_specs[service_id] = spec
+        Raises:
+            SpecParseError: If spec parsing fails
+        """
+        if service_id not in self.parsed_specs:
+            self.parsed_specs[service_id] = await self.spec_parser.parse_spec(service_id)
+        return self.parsed_specs[service_id]
 
-        return self.parsed_specs[service_id].endpoint
+    async def _fetch_raw(
+        self,
+        service_id: str,
+        params: dict[str, Any] | None = None,
+        fmt: str = "json",
+    ) -> dict[str, Any] | str:
+        """
+        Internal: fetch raw API response as dict (JSON) or str (XML).
 
+        JSON responses go through the in-memory cache (which also coalesces identical
+        concurrent requests) and the on-disk cache when those are configured.
+        """
+        if fmt.lower() != "json":
+            return await self._request_raw(service_id, params, fmt)
+
+        if self.memory_cache is not None:
+            return await self.memory_cache.get_or_fetch(
+                service_id, params, lambda: self._fetch_json(service_id, params)
+            )
+        return await self._fetch_json(service_id, params)
+
+    async def _fetch_json(self, service_id: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Internal: fetch a JSON response through the on-disk cache (if any)."""
+        if self.cache is None:
+            return await self._request_raw(service_id, params)
+
+        data = await self.cache.aget(service_id, params)
+        if data is None:
+            data = await self._request_raw(service_id, params)
+            await self.cache.aset(service_id, params, data)
+        return data
+
+    # reraise: once retries are exhausted callers get the last AssemblyAPIError, as they
+    # did before requests were retried, instead of a tenacity.RetryError
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_retry_wait,
         retry=retry_if_exception(_is_retryable_error),
+        reraise=True,
     )
-    async def _fetch_raw(
+    async def _request_raw(
         self,
         service_id: str,
         params: dict[str, Any] | None = None,
         fmt: str = "json",
     ) -> dict[str, Any] | str:
         """
-        Internal: fetch raw API response as dict (JSON) or str (XML).
+        Internal: send the API request, bypassing any cache.
 
         Handles endpoint resolution, HTTP call, and API error checking.
         """
@@ -168,7 +433,7 @@ class AssemblyAPIClient:
         merged_params = {**default_params, **(params or {})}
 
         try:
-            response = await self.client.get(url, params=merged_params)
+            response = await self.session.get(url, params=merged_params)
             response.raise_for_status()
 
             if fmt.lower() == "json":
@@ -180,18 +445,19 @@ class AssemblyAPIClient:
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise AssemblyAPIError(str(e.response.status_code), str(e)) from e
+            raise _RequestFailed(str(e.response.status_code), str(e)) from e
         except (AssemblyAPIError, SpecParseError):
             raise
         except Exception as e:
             logger.error(f"API request failed: {e}")
-            raise AssemblyAPIError("UNKNOWN", str(e)) from e
+            raise _RequestFailed("UNKNOWN", str(e)) from e
 
     async def get_data(
         self,
         service_id_or_name: str | Service,
         params: dict[str, Any] | BaseModel = None,
         fmt: str = "json",
+        decode: DecodeMode | None = None,
     ) -> list[BaseModel] | str:
         """
         Fetch data from the API using dynamic endpoint resolution.
@@ -203,6 +469,8 @@ class AssemblyAPIClient:
             service_id_or_name: The API service ID, Service Name, or Service Enum member.
             params: Query parameters.
             fmt: Response format ('json' or 'xml').
+            decode: Row type for JSON responses ("model", "construct", "dict" or "tuple").
+                    Defaults to the client's ``decode``.
 
         Returns:
             list[BaseModel] for JSON responses (or list[dict] without generated types),
@@ -227,18 +495,27 @@ class AssemblyAPIClient:
         if isinstance(data, str):
             return data
 
-        return self._parse_response(data, service_id)
+        return self._parse_response(data, service_id, decode)
 
     def _parse_response(
-        self, data: dict[str, Any], service_id: str
-    ) -> list[BaseModel] | list[dict[str, Any]]:
+        self, data: dict[str, Any], service_id: str, decode: DecodeMode | None = None
+    ) -> list[BaseModel] | list[dict[str, Any]] | list[tuple]:
         """
-        Parse API JSON response into a list of Pydantic models.
+        Parse API JSON response into a list of rows.
+
+        ``decode`` selects the row type (defaults to the client's ``decode``):
+        - "model": validated Pydantic models (the whole page is validated in one call)
+        - "construct": Pydantic models built without validation (trusted input only)
+        - "dict": the raw row dicts from the response (copies when a ``memory_cache``
+          holds the response, so callers may modify them)
+        - "tuple": plain tuples ordered like ``field_names(service_id)``
 
         Falls back to list of raw dicts if generated types are unavailable.
         Returns [] for empty/no-data responses.
         Raises AssemblyAPIError on parse failure (no silent fallback).
         """
+        decode = _check_decode(decode or self.decode)
+
         # Find the response key containing rows
         target_key = service_id
         if service_id not in data:
@@ -254,24 +531,73 @@ class AssemblyAPIClient:
         if not items:
             return []
 
+        if decode == "dict":
+            return self._unshared_rows(items)
+
+        if decode == "tuple":
+            names = self.field_names(service_id) or list(items[0])
+            return [tuple(row.get(name) for name in names) for row in items]
+
         # If no generated types, return raw dicts
         if not HAS_GENERATED_TYPES or service_id not in MODEL_MAP:
-            return items
+            return self._unshared_rows(items)
 
         model_cls = MODEL_MAP[service_id]
         try:
-            return [model_cls(**row) for row in items]
+            if decode == "construct":
+                return _construct_rows(model_cls, items)
+            return _rows_adapter(model_cls).validate_python(items)
         except Exception as e:
             raise AssemblyAPIError(
                 "MODEL_PARSE_ERROR",
                 f"Failed to parse response into {model_cls.__name__}: {e}",
             ) from e
 
+    def _unshared_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Internal: shallow-copy rows of responses kept by the memory cache, which are shared."""
+        if self.memory_cache is None:
+            return rows
+        return [dict(row) for row in rows]
+
+    def field_names(self, service_id: str) -> list[str]:
+        """
+        Response field names of a service, in ``APISpec.response_fields`` order.
+
+        Uses the parsed spec if it is loaded, else the generated model (which is
+        generated from the same spec). Returns [] if neither is available.
+        """
+        spec = self.parsed_specs.get(service_id)
+        if spec is not None and spec.response_fields:
+            return [field.name for field in spec.response_fields]
+        if HAS_GENERATED_TYPES and service_id in MODEL_MAP:
+            return [field.alias or name for name, field in MODEL_MAP[service_id].model_fields.items()]
+        return []
+
+    async def load_field_names(self, service_id: str) -> list[str]:
+        """
+        Like ``field_names``, but loads the spec when neither it nor a generated model
+        is available (endpoints may come from the generated registry, so requests alone
+        no longer load specs). Returns [] if the spec cannot be loaded either.
+        """
+        names = self.field_names(service_id)
+        if names:
+            return names
+        try:
+            await self.get_spec(service_id)
+        except SpecParseError as e:
+            logger.warning(f"No field metadata for {service_id}, using the order of the row keys: {e}")
+            return []
+        return self.field_names(service_id)
+
     async def get_all_data(
         self,
         service_id_or_name: str | Service,
         params: dict[str, Any] | BaseModel = None,
         p_size: int = 100,
+        concurrency: int = 1,
+        ordered: bool = True,
+        prefetch: bool = False,
+        decode: DecodeMode | None = None,
     ):
         """
         Fetch all pages of data from the API with automatic pagination.
@@ -279,19 +605,36 @@ class AssemblyAPIClient:
         Yields a list of Pydantic models (or raw dicts) per page.
         For INFO-200 (no data) responses, yields nothing and exits cleanly.
 
+        With ``concurrency > 1`` the first page is fetched alone to read
+        ``list_total_count``; the remaining pages are then requested concurrently,
+        keeping at most ``concurrency`` requests in flight.
+
         Args:
             service_id_or_name: The API service ID, Service Name, or Service Enum member.
             params: Query parameters (pIndex/pSize will be managed internally).
             p_size: Page size for pagination (default: 100).
+            concurrency: Max number of pages fetched at once (default: 1, sequential).
+            ordered: If True, pages are yielded in pIndex order. If False, pages are
+                     yielded as soon as they arrive (only relevant with concurrency > 1).
+            prefetch: If True, the next page is requested while the caller is still
+                      processing the current one (sequential mode). Off by default, since
+                      a consumer that stops early would have caused one extra request.
+            decode: Row type ("model", "construct", "dict" or "tuple").
+                    Defaults to the client's ``decode``.
 
         Yields:
             list[BaseModel]: Models from each page (or list[dict] without generated types).
 
         Example:
-            async for rows in client.get_all_data("ServiceName"):
+            async for rows in client.get_all_data("ServiceName", concurrency=8):
                 for row in rows:
                     process(row)
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        if decode is not None:
+            _check_decode(decode)
+
         # Resolve ID once
         if HAS_GENERATED_TYPES and isinstance(service_id_or_name, Service):
             service_id = service_id_or_name.value
@@ -304,65 +647,431 @@ class AssemblyAPIClient:
         else:
             params = dict(params) if params else {}
 
+        page = await self._fetch_page(service_id, params, 1, p_size, decode)
+        if page is None:
+            return
+        rows, total_count = page
+
+        # Fan out over the remaining pages once the total is known
+        if concurrency > 1 and total_count:
+            yield rows
+            if len(rows) < p_size:
+                return
+            last_page = -(-total_count // p_size)
+            async for rows in self._fetch_pages_concurrently(
+                service_id, params, p_size, range(2, last_page + 1), concurrency, ordered, decode
+            ):
+                yield rows
+            return
+
+        # Sequential walk (total unknown or concurrency == 1)
         p_index = 1
+        pending: asyncio.Task | None = None
+        try:
+            while True:
+                has_next = len(rows) >= p_size and not (total_count and p_index * p_size >= total_count)
+                if has_next and prefetch:
+                    pending = asyncio.ensure_future(self._fetch_page(service_id, params, p_index + 1, p_size, decode))
 
-        while True:
-            try:
-                page_params = {**params, "pIndex": p_index, "pSize": p_size}
-                data = await self._fetch_raw(service_id, page_params)
+                yield rows
 
-                if not isinstance(data, dict):
-                    logger.warning(f"Unexpected response type: {type(data)}")
+                if not has_next:
                     break
 
-                # Get root key (endpoint name or "RESULT")
-                root_key = next(iter(data.keys()), None)
-                if not root_key:
-                    break
+                p_index += 1
+                if pending is not None:
+                    page = await pending
+                    pending = None
+                else:
+                    page = await self._fetch_page(service_id, params, p_index, p_size, decode)
 
-                # Handle RESULT-only response (INFO-200: no data)
-                if root_key == "RESULT":
-                    logger.debug(f"RESULT-only response: {data.get('RESULT', {})}")
+                if page is None:
                     break
+                rows, total_count = page
+        finally:
+            if pending is not None:
+                _cancel_tasks([pending])
 
-                res_content = data.get(root_key)
+    async def get_columns(
+        self,
+        service_id_or_name: str | Service,
+        params: dict[str, Any] | BaseModel = None,
+        p_size: int = 100,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> dict[str, list[Any]]:
+        """
+        Fetch all pages of data into per-field columns.
 
-                # Validate response structure: should be list with [head, row]
-                if not isinstance(res_content, list) or len(res_content) < 2:
-                    logger.warning(f"Unexpected response structure for {root_key}")
-                    break
+        Pages are decoded as raw dicts and appended straight into column lists,
+        so no intermediate model objects are built.
 
-                # Extract total count from head
-                total_count = 0
-                try:
-                    head = res_content[0].get("head", [])
-                    for h in head:
-                        if "list_total_count" in h:
-                            total_count = int(h["list_total_count"])
-                            break
-                except (KeyError, IndexError, ValueError, TypeError) as e:
-                    logger.debug(f"Could not extract total_count: {e}")
-
-                # Parse rows into models
-                rows = self._parse_response(data, service_id)
-                if not rows:
-                    break
+        Args:
+            service_id_or_name: The API service ID, Service Name, or Service Enum member.
+            params: Query parameters (pIndex/pSize will be managed internally).
+            p_size: Page size for pagination (default: 100).
+            concurrency: Max number of pages fetched at once (see get_all_data).
+            ordered: Keep rows in pIndex order (see get_all_data).
 
-                yield rows
+        Returns:
+            Dictionary of {field_name: values}, ordered like ``APISpec.response_fields``.
+            Empty dict when the API returns no data.
 
-                # Check if we've fetched all data
-                fetched_count = p_index * p_size
-                if total_count and fetched_count >= total_count:
-                    break
+        Example:
+            columns = await client.get_columns(Service.국회의원_발의법률안, {"AGE": "21"}, concurrency=8)
+            frame = pandas.DataFrame(columns)
+        """
+        if HAS_GENERATED_TYPES and isinstance(service_id_or_name, Service):
+            service_id = service_id_or_name.value
+        else:
+            service_id = self._resolve_service_id(service_id_or_name)
+
+        names = await self.load_field_names(service_id)
+        buffer: ColumnBuffer | None = None
+        async for rows in self.get_all_data(
+            service_id, params, p_size=p_size, concurrency=concurrency, ordered=ordered, decode="dict"
+        ):
+            if buffer is None:
+                buffer = ColumnBuffer(names or rows[0].keys())
+            buffer.extend(rows)
+
+        return buffer.to_dict() if buffer is not None else {}
+
+    async def get_new_data(
+        self,
+        service_id_or_name: str | Service,
+        date_field: str,
+        params: dict[str, Any] | BaseModel = None,
+        p_size: int = 100,
+        decode: DecodeMode | None = None,
+        watermarks: WatermarkStore | None = None,
+    ):
+        """
+        Fetch only the rows added since the previous pull, page by page.
+
+        The service must return rows newest first by ``date_field`` (e.g. ``PROPOSE_DT``,
+        ``REG_DATE``, ``INSERTDT``). Paging stops at the first row dated before the stored
+        watermark for this service and parameter set; the first run fetches everything.
+
+        The watermark advances to the newest date seen only after the generator has been
+        consumed to the end, so an interrupted run is simply repeated. Rows dated exactly
+        on the watermark are returned again (day-granular fields can gain rows later that
+        day), so downstream writes should be upserts.
+
+        Args:
+            service_id_or_name: The API service ID, Service Name, or Service Enum member.
+            date_field: Response field the service is sorted by (newest first).
+            params: Query parameters (pIndex/pSize will be managed internally).
+            p_size: Page size for pagination (default: 100).
+            decode: Row type ("model", "construct", "dict" or "tuple").
+                    Defaults to the client's ``decode``.
+            watermarks: Store to read and update. Defaults to the client's store.
+
+        Yields:
+            New rows of each page.
 
-                if len(rows) < p_size:
+        Example:
+            async for bills in client.get_new_data(Service.국회의원_발의법률안, "PROPOSE_DT", {"AGE": "22"}):
+                mirror.upsert(...)
+        """
+        if decode is not None:
+            _check_decode(decode)
+
+        if HAS_GENERATED_TYPES and isinstance(service_id_or_name, Service):
+            service_id = service_id_or_name.value
+        else:
+            service_id = self._resolve_service_id(service_id_or_name)
+
+        if isinstance(params, BaseModel):
+            params = params.model_dump(by_alias=True, exclude_none=True)
+        else:
+            params = dict(params) if params else {}
+
+        store = watermarks or self.watermarks
+        if store is None:
+            store = self.watermarks = WatermarkStore()
+
+        since = store.get(service_id, params, date_field)
+        since_key = date_key(since)
+        newest, newest_key = since, since_key
+        decode_row = None
+
+        p_index = 1
+        while True:
+            page = await self._fetch_page(service_id, params, p_index, p_size, "dict")
+            if page is None:
+                break
+            rows, total_count = page
+
+            fresh = []
+            reached_watermark = False
+            for row in rows:
+                key = date_key(row.get(date_field))
+                if since_key and key and key < since_key:
+                    reached_watermark = True
                     break
+                fresh.append(row)
+                if key > newest_key:
+                    newest, newest_key = row.get(date_field), key
 
-                p_index += 1
+            if fresh:
+                if decode_row is None:
+                    decode_row = self._row_decoder(service_id, decode)
+                yield [decode_row(row) for row in fresh]
 
-            except (KeyError, IndexError, ValueError, TypeError) as e:
-                logger.error(f"Pagination parsing error at page {p_index}: {e}")
+            if reached_watermark or len(rows) < p_size or (total_count and p_index * p_size >= total_count):
                 break
+            p_index += 1
+
+        if newest_key != since_key:
+            logger.debug(f"Advancing {service_id} {date_field} watermark to {newest}")
+            store.set(service_id, params, date_field, str(newest))
+
+    async def stream_rows(
+        self,
+        service_id_or_name: str | Service,
+        params: dict[str, Any] | BaseModel = None,
+        p_size: int = 1000,
+        decode: DecodeMode | None = None,
+    ):
+        """
+        Stream all rows of a service one at a time.
+
+        Each response body is decoded incrementally while it is received: the head
+        (RESULT code and ``list_total_count``) is checked first, then rows are decoded
+        and yielded as soon as they are complete. Peak memory stays around one row
+        instead of the raw body plus the decoded page, which matters for large ``p_size``.
+
+        Unlike get_data / get_all_data, streamed responses bypass the response caches
+        and are not retried (rows may already have been handed to the caller).
+
+        Args:
+            service_id_or_name: The API service ID, Service Name, or Service Enum member.
+            params: Query parameters (pIndex/pSize will be managed internally).
+            p_size: Page size (default: 1000).
+            decode: Row type ("model", "construct", "dict" or "tuple").
+                    Defaults to the client's ``decode``.
+
+        Yields:
+            One row per iteration.
+
+        Example:
+            async for bill in client.stream_rows(Service.국회의원_발의법률안, {"AGE": "21"}):
+                process(bill)
+        """
+        if HAS_GENERATED_TYPES and isinstance(service_id_or_name, Service):
+            service_id = service_id_or_name.value
+        else:
+            service_id = self._resolve_service_id(service_id_or_name)
+
+        if isinstance(params, BaseModel):
+            params = params.model_dump(by_alias=True, exclude_none=True)
+        else:
+            params = dict(params) if params else {}
+
+        if _check_decode(decode or self.decode) == "tuple":
+            # Tuples are ordered by the spec's fields, so make sure they are known
+            await self.load_field_names(service_id)
+        decode_row = self._row_decoder(service_id, decode)
+
+        p_index = 1
+        while True:
+            decoder = RowStreamDecoder()
+            count = 0
+            async for row in self._stream_page(service_id, {**params, "pIndex": p_index, "pSize": p_size}, decoder):
+                yield decode_row(row)
+                count += 1
+
+            total_count = decoder.total_count
+            if count < p_size or (total_count and p_index * p_size >= total_count):
+                break
+            p_index += 1
+
+    async def _stream_page(self, service_id: str, params: dict[str, Any], decoder: RowStreamDecoder):
+        """
+        Internal: request one page and yield its raw row dicts while the body arrives.
+
+        Performs the same endpoint resolution and API error checks as _request_raw.
+        """
+        try:
+            endpoint = await self.get_endpoint(service_id)
+        except SpecParseError as e:
+            logger.error(f"Failed to get endpoint for {service_id}: {e}")
+            raise
+
+        url = f"{self.BASE_URL}/{endpoint}"
+        merged_params = {"KEY": self.api_key, "Type": "json", "pIndex": 1, "pSize": 100, **params}
+
+        try:
+            async with self.session.stream(url, params=merged_params) as response:
+                response.raise_for_status()
+
+                head_checked = False
+                async for text in response.aiter_text():
+                    rows = decoder.feed(text)
+                    if not head_checked and decoder.head is not None:
+                        head_checked = True
+                        self._check_api_error({decoder.root_key: [{"head": decoder.head}]}, endpoint)
+                    for row in rows:
+                        yield row
+
+                rows = decoder.close()
+                if not head_checked and decoder.head is not None:
+                    self._check_api_error({decoder.root_key: [{"head": decoder.head}]}, endpoint)
+                for row in rows:
+                    yield row
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error: {e.response.status_code}")
+            raise AssemblyAPIError(str(e.response.status_code), str(e)) from e
+        except (AssemblyAPIError, SpecParseError):
+            raise
+        except Exception as e:
+            logger.error(f"API request failed: {e}")
+            raise AssemblyAPIError("UNKNOWN", str(e)) from e
+
+    def _row_decoder(self, service_id: str, decode: DecodeMode | None = None) -> Callable[[dict[str, Any]], Any]:
+        """Internal: build a function decoding a single raw row (see _parse_response)."""
+        decode = _check_decode(decode or self.decode)
+
+        if decode == "tuple":
+            names = self.field_names(service_id)
+            if names:
+                return lambda row: tuple(row.get(name) for name in names)
+            return lambda row: tuple(row.values())
+
+        if decode == "dict" or not HAS_GENERATED_TYPES or service_id not in MODEL_MAP:
+            return lambda row: row
+
+        model_cls = MODEL_MAP[service_id]
+
+        def decode_row(row: dict[str, Any]) -> BaseModel:
+            try:
+                if decode == "construct":
+                    return _construct_rows(model_cls, [row])[0]
+                return model_cls.model_validate(row)
+            except Exception as e:
+                raise AssemblyAPIError(
+                    "MODEL_PARSE_ERROR",
+                    f"Failed to parse response into {model_cls.__name__}: {e}",
+                ) from e
+
+        return decode_row
+
+    async def _fetch_pages_concurrently(
+        self,
+        service_id: str,
+        params: dict[str, Any],
+        p_size: int,
+        page_indexes: range,
+        concurrency: int,
+        ordered: bool,
+        decode: DecodeMode | None = None,
+    ):
+        """
+        Internal: fetch the given pages with at most ``concurrency`` requests in flight.
+
+        Yields parsed rows per page, either in pIndex order or as pages complete.
+        Pages still in flight are cancelled if the consumer stops early or a fetch fails.
+        """
+        remaining = iter(page_indexes)
+
+        def schedule() -> asyncio.Task | None:
+            p_index = next(remaining, None)
+            if p_index is None:
+                return None
+            return asyncio.ensure_future(self._fetch_page(service_id, params, p_index, p_size, decode))
+
+        if ordered:
+            window: deque[asyncio.Task] = deque()
+            try:
+                while len(window) < concurrency and (task := schedule()) is not None:
+                    window.append(task)
+                while window:
+                    page = await window.popleft()
+                    if (task := schedule()) is not None:
+                        window.append(task)
+                    if page is not None:
+                        yield page[0]
+            finally:
+                _cancel_tasks(window)
+        else:
+            in_flight: set[asyncio.Task] = set()
+            try:
+                while len(in_flight) < concurrency and (task := schedule()) is not None:
+                    in_flight.add(task)
+                while in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if (next_task := schedule()) is not None:
+                            in_flight.add(next_task)
+                    for task in done:
+                        page = task.result()
+                        if page is not None:
+                            yield page[0]
+            finally:
+                _cancel_tasks(in_flight)
+
+    async def _fetch_page(
+        self,
+        service_id: str,
+        params: dict[str, Any],
+        p_index: int,
+        p_size: int,
+        decode: DecodeMode | None = None,
+    ) -> tuple[list[BaseModel] | list[dict[str, Any]] | list[tuple], int] | None:
+        """
+        Internal: fetch a single page and extract its rows and ``list_total_count``.
+
+        Returns None when the page carries no data (RESULT-only response,
+        unexpected structure or empty rows).
+        """
+        page_params = {**params, "pIndex": p_index, "pSize": p_size}
+        data = await self._fetch_raw(service_id, page_params)
+
+        try:
+            if not isinstance(data, dict):
+                logger.warning(f"Unexpected response type: {type(data)}")
+                return None
+
+            # Get root key (endpoint name or "RESULT")
+            root_key = next(iter(data.keys()), None)
+            if not root_key:
+                return None
+
+            # Handle RESULT-only response (INFO-200: no data)
+            if root_key == "RESULT":
+                logger.debug(f"RESULT-only response: {data.get('RESULT', {})}")
+                return None
+
+            res_content = data.get(root_key)
+
+            # Validate response structure: should be list with [head, row]
+            if not isinstance(res_content, list) or len(res_content) < 2:
+                logger.warning(f"Unexpected response structure for {root_key}")
+                return None
+
+            # Extract total count from head
+            total_count = 0
+            try:
+                head = res_content[0].get("head", [])
+                for h in head:
+                    if "list_total_count" in h:
+                        total_count = int(h["list_total_count"])
+                        break
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                logger.debug(f"Could not extract total_count: {e}")
+
+            # Parse rows into models
+            rows = self._parse_response(data, service_id, decode)
+            if not rows:
+                return None
+
+            return rows, total_count
+
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            logger.error(f"Pagination parsing error at page {p_index}: {e}")
+            return None
 
     def _check_api_error(self, data: dict[str, Any], endpoint: str):
         """Check for API specific error codes."""
@@ -0,0 +1,311 @@
+"""Response caching for raw API results."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Request parameters that never change the response body, or are sent by default
+_IGNORED_PARAMS = {"KEY"}
+_DEFAULT_PARAMS = {"Type": "json", "pIndex": "1", "pSize": "100"}
+
+# Cache hits whose access time is buffered before it is written in one transaction
+_ACCESS_FLUSH_SIZE = 64
+
+
+def canonical_params(params: dict[str, Any] | None) -> dict[str, str]:
+    """
+    Normalize request parameters for use in a cache key.
+
+    Drops the API key, ``None`` values and parameters equal to the client defaults,
+    stringifies values (``21`` and ``"21"`` are the same on the wire) and sorts keys.
+    """
+    result = {}
+    for key, value in (params or {}).items():
+        if key in _IGNORED_PARAMS or value is None:
+            continue
+        value = str(value)
+        if _DEFAULT_PARAMS.get(key) == value:
+            continue
+        result[key] = value
+    return dict(sorted(result.items()))
+
+
+def make_cache_key(service_id: str, params: dict[str, Any] | None) -> str:
+    """Build a stable cache key from a service ID and its request parameters."""
+    query = urlencode(canonical_params(params))
+    return hashlib.sha256(f"{service_id}?{query}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache for raw JSON responses.
+
+    Entries live in a single SQLite file, zlib-compressed and keyed on the service ID
+    plus canonicalized parameters (see ``make_cache_key``). Each service can have its
+    own TTL; the least recently used entries are evicted once the stored size exceeds
+    ``max_bytes``.
+
+    ``get``/``set`` block on disk I/O and (de)compression; async code should use
+    ``aget``/``aset``, which run them in a worker thread. Access times of cache hits
+    are buffered and written in batches (before any eviction, on ``set`` and on
+    ``close``) instead of committing once per hit.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        default_ttl: float | None = 3600.0,
+        ttls: dict[str, float | None] | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            path: SQLite file. If None, uses ``responses.db`` in the user cache directory.
+            default_ttl: Lifetime of an entry in seconds. None means entries never expire.
+            ttls: Per-service overrides of ``default_ttl`` ({service_id: seconds}).
+                  A TTL of 0 disables caching for that service.
+            max_bytes: Upper bound for the total compressed size of stored responses.
+        """
+        if path is None:
+            import platformdirs
+
+            path = Path(platformdirs.user_cache_dir("assembly-api-client")) / "responses.db"
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        # The connection is used from worker threads (aget/aset); one at a time
+        self._lock = threading.RLock()
+        self._pending_access: dict[str, float] = {}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " service_id TEXT NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " data BLOB NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+            self._conn.commit()
+        return self._conn
+
+    def ttl_for(self, service_id: str) -> float | None:
+        """Return the TTL (seconds) that applies to ``service_id``."""
+        return self.ttls.get(service_id, self.default_ttl)
+
+    def get(self, service_id: str, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return the cached response, or None on a miss or expired entry."""
+        ttl = self.ttl_for(service_id)
+        if ttl == 0:
+            return None
+
+        key = make_cache_key(service_id, params)
+        with self._lock:
+            row = self.conn.execute("SELECT created, data FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            created, blob = row
+            now = time.time()
+            if ttl is not None and now - created > ttl:
+                self._delete(key)
+                return None
+
+            try:
+                data = json.loads(zlib.decompress(blob))
+            except (zlib.error, ValueError) as e:
+                logger.warning(f"Dropping corrupt cache entry for {service_id}: {e}")
+                self._delete(key)
+                return None
+
+            self._pending_access[key] = now
+            if len(self._pending_access) >= _ACCESS_FLUSH_SIZE:
+                self.flush()
+        logger.debug(f"Response cache hit for {service_id}")
+        return data
+
+    async def aget(self, service_id: str, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """``get`` run in a worker thread, so the event loop is not blocked."""
+        return await asyncio.to_thread(self.get, service_id, params)
+
+    def _delete(self, key: str) -> None:
+        self._pending_access.pop(key, None)
+        self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self.conn.commit()
+
+    def flush(self) -> None:
+        """Write the buffered access times of cache hits."""
+        with self._lock:
+            if not self._pending_access:
+                return
+            pending = [(accessed, key) for key, accessed in self._pending_access.items()]
+            self._pending_access.clear()
+            self.conn.executemany("UPDATE responses SET accessed = ? WHERE key = ?", pending)
+            self.conn.commit()
+
+    def set(self, service_id: str, params: dict[str, Any] | None, data: dict[str, Any]) -> None:
+        """Store a response and evict old entries if the cache grew too large."""
+        if self.ttl_for(service_id) == 0:
+            return
+
+        blob = zlib.compress(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        if len(blob) > self.max_bytes:
+            return
+
+        key = make_cache_key(service_id, params)
+        with self._lock:
+            # Eviction order depends on the access times, so write the buffered ones first
+            self._pending_access.pop(key, None)
+            self.flush()
+            now = time.time()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, service_id, created, accessed, size, data) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, service_id, now, now, len(blob), blob),
+            )
+            self._evict()
+            self.conn.commit()
+
+    async def aset(self, service_id: str, params: dict[str, Any] | None, data: dict[str, Any]) -> None:
+        """``set`` run in a worker thread, so the event loop is not blocked."""
+        await asyncio.to_thread(self.set, service_id, params, data)
+
+    def _evict(self) -> None:
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        removed = 0
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        logger.debug(f"Evicted {removed} cached responses")
+
+    def clear(self, service_id: str | None = None) -> None:
+        """
+        Remove cached responses.
+        If service_id is provided, removes only that service's entries.
+        """
+        with self._lock:
+            self.flush()
+            if service_id:
+                self.conn.execute("DELETE FROM responses WHERE service_id = ?", (service_id,))
+            else:
+                self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Write pending access times and close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+
+
+class MemoryCache:
+    """
+    Bounded in-memory LRU of raw responses with single-flight request coalescing.
+
+    Concurrent calls for the same (service, params) key share one in-flight fetch
+    instead of each hitting the network. Cached responses are shared objects and
+    must not be mutated; ``AssemblyAPIClient`` hands out copies of their raw rows.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float | None = 300.0):
+        """
+        Args:
+            max_entries: Max responses kept in memory. 0 disables caching but keeps
+                         de-duplication of concurrent identical requests.
+            ttl: Lifetime of an entry in seconds. None means entries never expire.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        service_id: str,
+        params: dict[str, Any] | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached response for the key, joining an identical in-flight
+        request if there is one, otherwise run ``fetch()`` and cache its result.
+        """
+        key = make_cache_key(service_id, params)
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    self._store(key, t.result())
+
+            task.add_done_callback(_done)
+        else:
+            logger.debug(f"Joining in-flight request for {service_id}")
+
+        # Shield so one cancelled caller does not cancel the fetch shared with others
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop all cached responses (in-flight requests are not affected)."""
+        self._entries.clear()
@@ -4,21 +4,35 @@ Command Line Interface for Assembly API Client.
 
 import asyncio
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from .errors import AssemblyAPIError
+from .export import EXPORT_FORMATS, export_service, infer_format
 from .parser import SpecParser
-from .sync import load_service_map, sync_all_services
+from .registry import get_registry
+from .sync import sync_all_services
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger("assembly_client")
 
 app = typer.Typer(help="Assembly API Client CLI")
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """The rich console, created on first use so importing the CLI does not load rich."""
+    from rich.console import Console
+
+    return Console()
 
 
 def get_parser() -> SpecParser:
@@ -31,34 +45,79 @@ def sync(
     api_key: str = typer.Option(..., envvar="ASSEMBLY_API_KEY", help="API Key"),
     limit: Optional[int] = typer.Option(None, help="Limit number of services to sync"),
     force: bool = typer.Option(False, help="Force update master list"),
+    concurrency: int = typer.Option(5, help="Number of specs downloaded at once"),
+    processes: int = typer.Option(0, help="Parse Excel specs in this many worker processes (0: use a thread)"),
+    refresh: bool = typer.Option(False, help="Re-check cached specs: new/changed services and those older than --max-age"),
+    max_age: float = typer.Option(7.0, help="Days a cached spec stays fresh with --refresh"),
 ):
     """
     Synchronize API specifications.
     Downloads the master list and individual service specs.
     """
-    parser = get_parser()
+    console = get_console()
+    if processes > 0:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=processes)
+    else:
+        executor = None
+    parser = SpecParser(executor=executor)
     console.print(f"[bold green]Starting sync...[/bold green] (Cache: {parser.cache_dir})")
 
     async def run_sync():
-        stats = await sync_all_services(api_key=api_key, parser=parser, limit=limit, force_update_list=force)
+        async with parser:
+            stats = await sync_all_services(
+                api_key=api_key,
+                parser=parser,
+                limit=limit,
+                force_update_list=force,
+                concurrency=concurrency,
+                refresh=refresh,
+                max_age=max_age * 24 * 3600,
+            )
         return stats
 
-    stats = asyncio.run(run_sync())
+    try:
+        stats = asyncio.run(run_sync())
+    except AssemblyAPIError as e:
+        console.print(f"[red]Sync aborted, cached master list and specs left untouched: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     console.print("\n[bold]Sync Complete[/bold]")
     console.print(f"Updated: [green]{stats['updated']}[/green]")
+    if refresh:
+        console.print(f"Unchanged: {stats['unchanged']}")
+        console.print(f"Still fresh: {stats['cached']}")
     console.print(f"Failed: [red]{stats['failed']}[/red]")
+    if stats.get("master_diff"):
+        diff = stats["master_diff"]
+        console.print(
+            f"Master list: {len(diff['added'])} added, {len(diff['changed'])} changed, {len(diff['removed'])} removed"
+        )
+
+    slowest = sorted(stats["timings"].items(), key=lambda item: item[1], reverse=True)[:5]
+    if slowest:
+        console.print("Slowest: " + ", ".join(f"{sid} ({seconds:.1f}s)" for sid, seconds in slowest))
 
 
 @app.command("list")
 def list_apis(
-    search: Optional[str] = typer.Option(None, help="Filter by name or ID"),
+    search: Optional[str] = typer.Option(
+        None, help="Ranked search by ID, name, category, organization or description (chosung like ㄱㅎ works)"
+    ),
 ):
     """
     List available APIs from the cached master list.
     """
+    from rich.table import Table
+
+    console = get_console()
     parser = get_parser()
-    service_map = load_service_map(parser.cache_dir)
+    registry = get_registry(parser.cache_dir)
+    service_map = registry.names
 
     if not service_map:
         console.print("[yellow]No APIs found. Run 'sync' first.[/yellow]")
@@ -67,12 +126,18 @@ def list_apis(
     table = Table(title="Available APIs")
     table.add_column("Service ID", style="cyan")
     table.add_column("Name", style="green")
+    table.add_column("Category")
+
+    if search:
+        # Best matches first
+        service_ids = [sid for sid, _ in registry.search(search)]
+    else:
+        service_ids = sorted(service_map)
 
     count = 0
-    for sid, name in sorted(service_map.items()):
-        if search and (search.lower() not in sid.lower() and search.lower() not in name.lower()):
-            continue
-        table.add_row(sid, name)
+    for sid in service_ids:
+        info = registry.info.get(sid)
+        table.add_row(sid, service_map.get(sid, ""), info.category if info else "")
         count += 1
 
     console.print(table)
@@ -84,10 +149,14 @@ def info(service_id: str):
     """
     Show details for a specific API service.
     """
+    from rich.table import Table
+
+    console = get_console()
     parser = get_parser()
 
     async def get_spec():
-        return await parser.parse_spec(service_id)
+        async with parser:
+            return await parser.parse_spec(service_id)
 
     try:
         spec = asyncio.run(get_spec())
@@ -111,5 +180,87 @@ def info(service_id: str):
         console.print(f"[red]Error fetching spec for {service_id}: {e}[/red]")
 
 
+@app.command()
+def export(
+    service: str = typer.Argument(..., help="Service ID or name"),
+    output: Path = typer.Option(..., "--output", "-o", help="Output file"),
+    fmt: Optional[str] = typer.Option(
+        None, "--format", "-f", help="csv, ndjson or parquet (default: from the output file suffix)"
+    ),
+    param: List[str] = typer.Option([], "--param", "-p", help="Query parameter as KEY=VALUE (repeatable)"),
+    page_size: int = typer.Option(1000, help="Rows per request"),
+    concurrency: int = typer.Option(4, help="Max pages fetched at once"),
+    compression: Optional[str] = typer.Option(
+        None, help="gzip for csv/ndjson (default: from .gz suffix); parquet codec, e.g. snappy or zstd"
+    ),
+    api_key: str = typer.Option(..., envvar="ASSEMBLY_API_KEY", help="API Key"),
+):
+    """
+    Export all rows of a service to a CSV, NDJSON or Parquet file.
+    Pages are streamed to disk as they arrive.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    from .api import AssemblyAPIClient
+
+    console = get_console()
+    inferred_fmt, inferred_compression = infer_format(output)
+    fmt = fmt or inferred_fmt
+    if fmt not in EXPORT_FORMATS:
+        console.print(f"[red]Unknown format {fmt!r}. Use --format with one of: {', '.join(EXPORT_FORMATS)}[/red]")
+        raise typer.Exit(1)
+    compression = compression or inferred_compression
+
+    params = {}
+    for item in param:
+        key, sep, value = item.partition("=")
+        if not sep:
+            console.print(f"[red]Invalid --param {item!r}; expected KEY=VALUE[/red]")
+            raise typer.Exit(1)
+        params[key] = value
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[bold]{task.description}"),
+        TextColumn("{task.completed:,} rows"),
+        TextColumn("[cyan]{task.fields[rate]:,.0f} rows/s"),
+        TimeElapsedColumn(),
+        console=console,
+    )
+
+    async def run_export():
+        async with AssemblyAPIClient(api_key=api_key) as client:
+            return await export_service(
+                client,
+                service,
+                output,
+                fmt,
+                params=params,
+                p_size=page_size,
+                concurrency=concurrency,
+                compression=compression,
+                on_progress=on_progress,
+            )
+
+    started = time.monotonic()
+    with progress:
+        task = progress.add_task(f"Exporting {service}", total=None, rate=0.0)
+
+        def on_progress(rows: int):
+            progress.update(task, completed=rows, rate=rows / max(time.monotonic() - started, 1e-9))
+
+        try:
+            total = asyncio.run(run_export())
+        except Exception as e:
+            console.print(f"[red]Export failed: {e}[/red]")
+            raise typer.Exit(1)
+
+    elapsed = time.monotonic() - started
+    if total:
+        console.print(f"Exported [green]{total:,}[/green] rows to {output} ({total / elapsed:,.0f} rows/s)")
+    else:
+        console.print("[yellow]No data returned; nothing written.[/yellow]")
+
+
 if __name__ == "__main__":
     app()
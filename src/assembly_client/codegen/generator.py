@@ -128,3 +128,86 @@ def generate_params_model_code(spec: APISpec) -> str:
         )
 
     return "\n".join(lines)
+
+
+def generate_service_module(spec: APISpec) -> str:
+    """Generate the per-service module holding its response and request parameter models."""
+    body = [generate_model_code(spec), "", generate_params_model_code(spec), ""]
+    return "\n".join(_module_imports("\n".join(body)) + [""] + body)
+
+
+def _module_imports(code: str) -> list[str]:
+    """Import lines for the names ``code`` actually uses (unused imports fail the linter)."""
+    pydantic_names = ["BaseModel"] + (["Field"] if "Field(" in code else [])
+    lines = [f"from pydantic import {', '.join(pydantic_names)}"]
+    if "Union[" in code:
+        lines.append("from typing import Union")
+    return lines
+
+
+def generate_models_init(service_ids: list[str]) -> str:
+    """Generate models/__init__.py, which imports a service module on first attribute access."""
+    lines = [
+        '"""Generated models, one module per service. Classes are imported on first access."""',
+        "import importlib",
+        "",
+        "SERVICE_IDS = (",
+    ]
+    lines.extend(f'    "{service_id}",' for service_id in service_ids)
+    lines.extend(
+        [
+            ")",
+            "_SERVICE_ID_SET = frozenset(SERVICE_IDS)",
+            "",
+            "",
+            "def __getattr__(name):",
+            '    kind, _, service_id = name.partition("_")',
+            '    if kind in ("Model", "Params") and service_id in _SERVICE_ID_SET:',
+            '        module = importlib.import_module(f"{__name__}.{service_id}")',
+            "        return getattr(module, name)",
+            '    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def generate_package_init() -> str:
+    """Generate generated/__init__.py with lazily resolved MODEL_MAP and PARAM_MAP."""
+    lines = [
+        "from ..lazy import LazyModelMap",
+        "from .models import SERVICE_IDS",
+        "from .services import Service",
+        "",
+        '__all__ = ["MODEL_MAP", "PARAM_MAP", "SERVICE_IDS", "Service"]',
+        "",
+        'MODEL_MAP = LazyModelMap(__name__ + ".models", "Model_", SERVICE_IDS)',
+        'PARAM_MAP = LazyModelMap(__name__ + ".models", "Params_", SERVICE_IDS)',
+        "",
+        "",
+        "def __getattr__(name):",
+        "    # Model_<ID> / Params_<ID> used to be re-exported here from a single models module",
+        "    from . import models",
+        "",
+        "    return getattr(models, name)",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_registry_module(entries: list[tuple[str, str, str, str]]) -> str:
+    """
+    Generate generated/registry.py, the frozen service table used when no cache is available.
+
+    Args:
+        entries: (service_id, name, endpoint, category) per service.
+    """
+    lines = [
+        '"""Generated service registry: service ID -> (name, endpoint, category)."""',
+        "",
+        "SERVICES = {",
+    ]
+    for service_id, name, endpoint, category in sorted(entries):
+        lines.append(f"    {service_id!r}: ({name!r}, {endpoint!r}, {category!r}),")
+    lines.extend(["}", ""])
+    return "\n".join(lines)
@@ -0,0 +1,39 @@
+"""Column-oriented accumulation of API rows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class ColumnBuffer:
+    """
+    Per-field column lists filled page by page from raw row dicts.
+
+    Column order is fixed at construction (normally ``APISpec.response_fields``);
+    fields missing from a row are stored as None and unknown keys are ignored.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+        self.columns: dict[str, list[Any]] = {name: [] for name in self.names}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def extend(self, rows: list[dict[str, Any]]) -> None:
+        """Append a page of row dicts, one column at a time."""
+        for name, column in self.columns.items():
+            column.extend([row.get(name) for row in rows])
+        self._length += len(rows)
+
+    def clear(self) -> None:
+        """Drop buffered values, keeping the column layout (used for batched writers)."""
+        for column in self.columns.values():
+            column.clear()
+        self._length = 0
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Return the columns as {field_name: values}."""
+        return self.columns
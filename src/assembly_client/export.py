@@ -0,0 +1,211 @@
+"""Streaming export of service data to CSV, NDJSON and Parquet files."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .columnar import ColumnBuffer
+
+if TYPE_CHECKING:
+    from .api import AssemblyAPIClient
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+
+_SUFFIX_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson", ".parquet": "parquet"}
+
+
+def infer_format(path: Path) -> tuple[str | None, str | None]:
+    """
+    Guess (format, compression) from a file name.
+
+    ``bills.csv.gz`` -> ("csv", "gzip"), ``bills.parquet`` -> ("parquet", None).
+    The format is None when the suffix is not recognized.
+    """
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    compression = None
+    if suffixes and suffixes[-1] == ".gz":
+        compression = "gzip"
+        suffixes = suffixes[:-1]
+    fmt = _SUFFIX_FORMATS.get(suffixes[-1]) if suffixes else None
+    return fmt, compression
+
+
+def _open_text(path: Path, compression: str | None) -> io.TextIOBase:
+    if compression in (None, "none"):
+        return open(path, "w", encoding="utf-8", newline="")
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    raise ValueError(f"Unsupported compression for text output: {compression!r} (use 'gzip' or none)")
+
+
+class ExportWriter(ABC):
+    """Base class for row writers. Rows are raw API dicts; ``columns`` fixes the field order."""
+
+    def __init__(self, path: Path, columns: list[str], compression: str | None = None):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.compression = compression
+
+    @abstractmethod
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        """Append a batch of rows."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the output file."""
+
+
+class CsvWriter(ExportWriter):
+    """CSV with a header row; missing fields become empty cells and unknown keys are dropped."""
+
+    def __init__(self, path: Path, columns: list[str], compression: str | None = None):
+        super().__init__(path, columns, compression)
+        self._file = _open_text(self.path, compression)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows([[row.get(name) for name in self.columns] for row in rows])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class NdjsonWriter(ExportWriter):
+    """One JSON object per line, keys in column order."""
+
+    def __init__(self, path: Path, columns: list[str], compression: str | None = None):
+        super().__init__(path, columns, compression)
+        self._file = _open_text(self.path, compression)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._file.writelines(
+            json.dumps({name: row.get(name) for name in self.columns}, ensure_ascii=False) + "\n" for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(ExportWriter):
+    """
+    Parquet file written in row groups of ``batch_rows``.
+
+    All columns are stored as nullable strings, since the API mixes strings and
+    numbers within a field. ``compression`` defaults to snappy.
+    Requires ``pyarrow`` (``pip install assembly-api-client[parquet]``).
+    """
+
+    def __init__(self, path: Path, columns: list[str], compression: str | None = None, batch_rows: int = 50_000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow: pip install 'assembly-api-client[parquet]'") from e
+
+        super().__init__(path, columns, compression or "snappy")
+        self._pa = pa
+        self._schema = pa.schema([(name, pa.string()) for name in self.columns])
+        self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+        self._buffer = ColumnBuffer(self.columns)
+        self.batch_rows = batch_rows
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not len(self._buffer):
+            return
+        arrays = [
+            self._pa.array([None if v is None else str(v) for v in values], type=self._pa.string())
+            for values in self._buffer.to_dict().values()
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def open_writer(fmt: str, path: Path, columns: list[str], compression: str | None = None) -> ExportWriter:
+    """Create the writer for ``fmt`` (one of EXPORT_FORMATS)."""
+    if fmt == "csv":
+        return CsvWriter(path, columns, compression)
+    if fmt == "ndjson":
+        return NdjsonWriter(path, columns, compression)
+    if fmt == "parquet":
+        return ParquetWriter(path, columns, compression)
+    raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+
+
+async def export_service(
+    client: AssemblyAPIClient,
+    service_id_or_name: str,
+    path: Path,
+    fmt: str,
+    params: dict[str, Any] | None = None,
+    p_size: int = 1000,
+    concurrency: int = 4,
+    compression: str | None = None,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Stream every page of a service into a file.
+
+    Pages are fetched with ``get_all_data(decode="dict", ordered=True)`` and written as they
+    arrive, so memory use is bounded by the fetch window (``concurrency`` pages) rather than
+    the dataset size. Columns follow the spec's ``response_fields``.
+
+    Args:
+        client: Client used to fetch the data.
+        service_id_or_name: The API service ID or Service Name.
+        path: Output file.
+        fmt: "csv", "ndjson" or "parquet".
+        params: Query parameters (pIndex/pSize are managed internally).
+        p_size: Page size.
+        concurrency: Max number of pages fetched at once.
+        compression: "gzip" for CSV/NDJSON; a Parquet codec ("snappy", "zstd", ...) for Parquet.
+        on_progress: Called with the running row count after each page is written.
+
+    Returns:
+        Number of rows written. No file is created when the service returns no data.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+
+    service_id = client._resolve_service_id(service_id_or_name)
+    field_names = await client.load_field_names(service_id)
+    writer: ExportWriter | None = None
+    total = 0
+    try:
+        async for rows in client.get_all_data(
+            service_id, params, p_size=p_size, concurrency=concurrency, ordered=True, decode="dict"
+        ):
+            if not rows:
+                continue
+            if writer is None:
+                columns = field_names or list(rows[0].keys())
+                writer = open_writer(fmt, path, columns, compression)
+            writer.write(rows)
+            total += len(rows)
+            if on_progress is not None:
+                on_progress(total)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    logger.info(f"Exported {total} rows of {service_id} to {path}")
+    return total
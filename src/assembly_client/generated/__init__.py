@@ -1,556 +1,15 @@
+from ..lazy import LazyModelMap
+from .models import SERVICE_IDS
 from .services import Service
-from .models import *
 
-MODEL_MAP = {
-    'O1OS9V000880XH10851': Model_O1OS9V000880XH10851,
-    'OJH286001107IK13829': Model_OJH286001107IK13829,
-    'OOWY4R001216HX11519': Model_OOWY4R001216HX11519,
-    'O6V35E001197UE12021': Model_O6V35E001197UE12021,
-    'OOWY4R001216HX11423': Model_OOWY4R001216HX11423,
-    'OVRSWG000917L610310': Model_OVRSWG000917L610310,
-    'OOWY4R001216HX11496': Model_OOWY4R001216HX11496,
-    'ORL1S4001007HM19790': Model_ORL1S4001007HM19790,
-    'OOWY4R001216HX11497': Model_OOWY4R001216HX11497,
-    'OU9HJK001126JG15339': Model_OU9HJK001126JG15339,
-    'OOWY4R001216HX11429': Model_OOWY4R001216HX11429,
-    'OOWY4R001216HX11526': Model_OOWY4R001216HX11526,
-    'O01TEW000977U011862': Model_O01TEW000977U011862,
-    'OOWY4R001216HX11442': Model_OOWY4R001216HX11442,
-    'OQ68B8001071ZB13418': Model_OQ68B8001071ZB13418,
-    'O2U9RG001168QQ15766': Model_O2U9RG001168QQ15766,
-    'O575RS001118PF15881': Model_O575RS001118PF15881,
-    'OZ2W6L0011539T11384': Model_OZ2W6L0011539T11384,
-    'O9RY2V0011518716129': Model_O9RY2V0011518716129,
-    'OOWY4R001216HX11444': Model_OOWY4R001216HX11444,
-    'OK7XM1000938DS17215': Model_OK7XM1000938DS17215,
-    'OJAMPB0011929O11426': Model_OJAMPB0011929O11426,
-    'O04X68000884BE13083': Model_O04X68000884BE13083,
-    'ONVQB00009257H12418': Model_ONVQB00009257H12418,
-    'O4UN9N000961PS11812': Model_O4UN9N000961PS11812,
-    'OOWY4R001216HX11493': Model_OOWY4R001216HX11493,
-    'OQEXW00012074114927': Model_OQEXW00012074114927,
-    'OG88RA000978S210177': Model_OG88RA000978S210177,
-    'OAUJIX001138TP16525': Model_OAUJIX001138TP16525,
-    'OCROAA001181NA17461': Model_OCROAA001181NA17461,
-    'O2QQLK001176HI14481': Model_O2QQLK001176HI14481,
-    'OOWY4R001216HX11450': Model_OOWY4R001216HX11450,
-    'OVA33G0011172J17084': Model_OVA33G0011172J17084,
-    'OVRNQQ001062CO16787': Model_OVRNQQ001062CO16787,
-    'O93OTI000979JV17987': Model_O93OTI000979JV17987,
-    'OOWY4R001216HX11454': Model_OOWY4R001216HX11454,
-    'OWSSC6001134T516707': Model_OWSSC6001134T516707,
-    'OOWY4R001216HX11419': Model_OOWY4R001216HX11419,
-    'OO1X9P001017YF13038': Model_OO1X9P001017YF13038,
-    'OX4XHR001211RB17826': Model_OX4XHR001211RB17826,
-    'OB61LZ000981FC12253': Model_OB61LZ000981FC12253,
-    'OJ2LTJ001101KO19739': Model_OJ2LTJ001101KO19739,
-    'OF8AJV000972OP11430': Model_OF8AJV000972OP11430,
-    'OCSMEJ000953O916134': Model_OCSMEJ000953O916134,
-    'OOWY4R001216HX11468': Model_OOWY4R001216HX11468,
-    'OGM9FC001165FS12631': Model_OGM9FC001165FS12631,
-    'O2Q4ZT001004PV11014': Model_O2Q4ZT001004PV11014,
-    'O6PTDW000886NN18676': Model_O6PTDW000886NN18676,
-    'ORDPSW001070QH19059': Model_ORDPSW001070QH19059,
-    'OOWY4R001216HX11509': Model_OOWY4R001216HX11509,
-    'O5C2PY001120OH19574': Model_O5C2PY001120OH19574,
-    'O0KGG20011857W15853': Model_O0KGG20011857W15853,
-    'OA8HOU000969OM19602': Model_OA8HOU000969OM19602,
-    'O0UBVR000906UG11689': Model_O0UBVR000906UG11689,
-    'OD0T6I001156CA16296': Model_OD0T6I001156CA16296,
-    'OZN379001174FW17905': Model_OZN379001174FW17905,
-    'OOWY4R001216HX11425': Model_OOWY4R001216HX11425,
-    'OOWY4R001216HX11426': Model_OOWY4R001216HX11426,
-    'OW1R4X0010744X17495': Model_OW1R4X0010744X17495,
-    'O13FRZ001177X318752': Model_O13FRZ001177X318752,
-    'O8XZ8U001160SW12010': Model_O8XZ8U001160SW12010,
-    'OOWY4R001216HX11458': Model_OOWY4R001216HX11458,
-    'OOWY4R001216HX11470': Model_OOWY4R001216HX11470,
-    'OSPS4X001105IL17344': Model_OSPS4X001105IL17344,
-    'OOBAOA001213RL17443': Model_OOBAOA001213RL17443,
-    'OOWY4R001216HX11421': Model_OOWY4R001216HX11421,
-    'OVUY5B0009241I13320': Model_OVUY5B0009241I13320,
-    'OCAJQ4001000LI18751': Model_OCAJQ4001000LI18751,
-    'OITFOE000968XH15981': Model_OITFOE000968XH15981,
-    'O70WYZ000950T211169': Model_O70WYZ000950T211169,
-    'OOWY4R001216HX11433': Model_OOWY4R001216HX11433,
-    'OPP4KM0012097716578': Model_OPP4KM0012097716578,
-    'OFUAJ6001108BJ11284': Model_OFUAJ6001108BJ11284,
-    'OOWY4R001216HX11517': Model_OOWY4R001216HX11517,
-    'OEUJQB0012145514537': Model_OEUJQB0012145514537,
-    'ORMXPX0011135N18074': Model_ORMXPX0011135N18074,
-    'O8685D0008489413266': Model_O8685D0008489413266,
-    'OKBFLN000963SS13091': Model_OKBFLN000963SS13091,
-    'O6MC3G0011698G17444': Model_O6MC3G0011698G17444,
-    'ORMEIR001164VQ17801': Model_ORMEIR001164VQ17801,
-    'OFOEZN001060N312362': Model_OFOEZN001060N312362,
-    'OOWY4R001216HX11508': Model_OOWY4R001216HX11508,
-    'OOWY4R001216HX11446': Model_OOWY4R001216HX11446,
-    'OOWY4R001216HX11415': Model_OOWY4R001216HX11415,
-    'OQ0WH1000975M912523': Model_OQ0WH1000975M912523,
-    'OOWY4R001216HX11451': Model_OOWY4R001216HX11451,
-    'OOWY4R001216HX11422': Model_OOWY4R001216HX11422,
-    'OY18U4001075AG16626': Model_OY18U4001075AG16626,
-    'OOWY4R001216HX11424': Model_OOWY4R001216HX11424,
-    'OOWY4R001216HX11525': Model_OOWY4R001216HX11525,
-    'OET0D9001078G318850': Model_OET0D9001078G318850,
-    'OOWY4R001216HX11520': Model_OOWY4R001216HX11520,
-    'OLI05G0011283N16926': Model_OLI05G0011283N16926,
-    'OOWY4R001216HX11417': Model_OOWY4R001216HX11417,
-    'OOWY4R001216HX11501': Model_OOWY4R001216HX11501,
-    'O6KN2D001106O610167': Model_O6KN2D001106O610167,
-    'OH01G5001175B914429': Model_OH01G5001175B914429,
-    'OTA0YC001127RJ11880': Model_OTA0YC001127RJ11880,
-    'OOWY4R001216HX11513': Model_OOWY4R001216HX11513,
-    'ODFFIG001072OX10139': Model_ODFFIG001072OX10139,
-    'OOWY4R001216HX11431': Model_OOWY4R001216HX11431,
-    'OQG5IZ0011449610187': Model_OQG5IZ0011449610187,
-    'O0TLLI0008796R14875': Model_O0TLLI0008796R14875,
-    'OOWY4R001216HX11514': Model_OOWY4R001216HX11514,
-    'OOWY4R001216HX11420': Model_OOWY4R001216HX11420,
-    'O1O34T000932VG10613': Model_O1O34T000932VG10613,
-    'ON9NSL000857D116126': Model_ON9NSL000857D116126,
-    'OD21030011944P19666': Model_OD21030011944P19666,
-    'OOWY4R001216HX11462': Model_OOWY4R001216HX11462,
-    'OOWY4R001216HX11438': Model_OOWY4R001216HX11438,
-    'OOWY4R001216HX11437': Model_OOWY4R001216HX11437,
-    'O5MSQF0009823A15643': Model_O5MSQF0009823A15643,
-    'OOWY4R001216HX11507': Model_OOWY4R001216HX11507,
-    'OB3OEN0011786012232': Model_OB3OEN0011786012232,
-    'OTSI7L0011705B12017': Model_OTSI7L0011705B12017,
-    'OAFHCY001008NN11647': Model_OAFHCY001008NN11647,
-    'OOWY4R001216HX11445': Model_OOWY4R001216HX11445,
-    'OL39BM000986V214201': Model_OL39BM000986V214201,
-    'OXZDRJ0011169E17589': Model_OXZDRJ0011169E17589,
-    'OOWY4R001216HX11498': Model_OOWY4R001216HX11498,
-    'OOWY4R001216HX11477': Model_OOWY4R001216HX11477,
-    'OOWY4R001216HX11432': Model_OOWY4R001216HX11432,
-    'OEQ77R000942NL11530': Model_OEQ77R000942NL11530,
-    'O2PLAU000882CD18776': Model_O2PLAU000882CD18776,
-    'OOWY4R001216HX11486': Model_OOWY4R001216HX11486,
-    'O5K6OC001166I215604': Model_O5K6OC001166I215604,
-    'O27DU0000960M511942': Model_O27DU0000960M511942,
-    'ODNHIU0010588P19122': Model_ODNHIU0010588P19122,
-    'OOWY4R001216HX11436': Model_OOWY4R001216HX11436,
-    'O7RUVD001183U610140': Model_O7RUVD001183U610140,
-    'OR0YT0001112TD13067': Model_OR0YT0001112TD13067,
-    'OKDE3A001150P113085': Model_OKDE3A001150P113085,
-    'O3VTTM0010223D15681': Model_O3VTTM0010223D15681,
-    'OOWY4R001216HX11523': Model_OOWY4R001216HX11523,
-    'O0MH4O001149BH11948': Model_O0MH4O001149BH11948,
-    'OOWY4R001216HX11418': Model_OOWY4R001216HX11418,
-    'O927U9001135M913005': Model_O927U9001135M913005,
-    'OVW2NU000937WK15521': Model_OVW2NU000937WK15521,
-    'OOWY4R001216HX11440': Model_OOWY4R001216HX11440,
-    'O78HKE0010099W15881': Model_O78HKE0010099W15881,
-    'OP7W8M000944IF15092': Model_OP7W8M000944IF15092,
-    'OB5IBW001180FQ10640': Model_OB5IBW001180FQ10640,
-    'O4BV430009830710440': Model_O4BV430009830710440,
-    'OU8JBT0015343C14378': Model_OU8JBT0015343C14378,
-    'OMYCKJ0011621210030': Model_OMYCKJ0011621210030,
-    'OOWY4R001216HX11512': Model_OOWY4R001216HX11512,
-    'OOWY4R001216HX11492': Model_OOWY4R001216HX11492,
-    'OQ0A0T0011366V19103': Model_OQ0A0T0011366V19103,
-    'OOWY4R001216HX11479': Model_OOWY4R001216HX11479,
-    'OT9767000930ZL12696': Model_OT9767000930ZL12696,
-    'OS46YD0012559515463': Model_OS46YD0012559515463,
-    'OTICJI000959B917394': Model_OTICJI000959B917394,
-    'OOWY4R001216HX11435': Model_OOWY4R001216HX11435,
-    'OJ24FX001003FD16907': Model_OJ24FX001003FD16907,
-    'OLH92R0011733J15777': Model_OLH92R0011733J15777,
-    'OH473Z0011245H13792': Model_OH473Z0011245H13792,
-    'OOWY4R001216HX11475': Model_OOWY4R001216HX11475,
-    'O8FQ4U000888KF14544': Model_O8FQ4U000888KF14544,
-    'O6HDE2001161LX18191': Model_O6HDE2001161LX18191,
-    'OOWY4R001216HX11494': Model_OOWY4R001216HX11494,
-    'OXN4AR0009078I18280': Model_OXN4AR0009078I18280,
-    'OOWY4R001216HX11522': Model_OOWY4R001216HX11522,
-    'OUSZ4M0011845C16071': Model_OUSZ4M0011845C16071,
-    'OM5S9O0009857U12121': Model_OM5S9O0009857U12121,
-    'O8YX0U001110EM14308': Model_O8YX0U001110EM14308,
-    'OY3EE5000956Q913543': Model_OY3EE5000956Q913543,
-    'OOWY4R001216HX11428': Model_OOWY4R001216HX11428,
-    'OMGXFT001182IV12099': Model_OMGXFT001182IV12099,
-    'OOWY4R001216HX11489': Model_OOWY4R001216HX11489,
-    'O71AP8001122ZZ10743': Model_O71AP8001122ZZ10743,
-    'OFJHWN000881T019291': Model_OFJHWN000881T019291,
-    'OR137O001023MZ19321': Model_OR137O001023MZ19321,
-    'O5IUE30009237O13905': Model_O5IUE30009237O13905,
-    'ORNDP7000993P115502': Model_ORNDP7000993P115502,
-    'OOG5NZ000976EC12112': Model_OOG5NZ000976EC12112,
-    'OXJ0OE001002XA11874': Model_OXJ0OE001002XA11874,
-    'O4UTN7000934TV19125': Model_O4UTN7000934TV19125,
-    'OOWY4R001216HX11461': Model_OOWY4R001216HX11461,
-    'OI75DS001208ZW14781': Model_OI75DS001208ZW14781,
-    'OCLLF20008904J19487': Model_OCLLF20008904J19487,
-    'OC9MRL000922KH15936': Model_OC9MRL000922KH15936,
-    'O6MZOL000912ZG15427': Model_O6MZOL000912ZG15427,
-    'OU749A0011256511253': Model_OU749A0011256511253,
-    'OZHI8N000955DZ17739': Model_OZHI8N000955DZ17739,
-    'OOWY4R001216HX11449': Model_OOWY4R001216HX11449,
-    'O84OO9000939BC16536': Model_O84OO9000939BC16536,
-    'OAUD9V000973QN17203': Model_OAUD9V000973QN17203,
-    'O6DY4U000931SN17960': Model_O6DY4U000931SN17960,
-    'ODI720001121MP14647': Model_ODI720001121MP14647,
-    'OR95JZ001114RS11521': Model_OR95JZ001114RS11521,
-    'OOWY4R001216HX11434': Model_OOWY4R001216HX11434,
-    'O9KCDC000980U619570': Model_O9KCDC000980U619570,
-    'OK160H001152I912731': Model_OK160H001152I912731,
-    'OU29AR0009890A11079': Model_OU29AR0009890A11079,
-    'OVDKBQ000915NE11865': Model_OVDKBQ000915NE11865,
-    'O87UNV000897E818234': Model_O87UNV000897E818234,
-    'OHXILX000958DD14523': Model_OHXILX000958DD14523,
-    'OOWY4R001216HX11506': Model_OOWY4R001216HX11506,
-    'O6P4Y5001146KI12348': Model_O6P4Y5001146KI12348,
-    'OBL7NF0011935G18076': Model_OBL7NF0011935G18076,
-    'O610V6000952AV17729': Model_O610V6000952AV17729,
-    'OTUNFG0008834Q19898': Model_OTUNFG0008834Q19898,
-    'OK3DIS001059MR19626': Model_OK3DIS001059MR19626,
-    'O32948001073L213726': Model_O32948001073L213726,
-    'OOWY4R001216HX11491': Model_OOWY4R001216HX11491,
-    'OFZZ1G001167FC10024': Model_OFZZ1G001167FC10024,
-    'OS18DL000970OU13480': Model_OS18DL000970OU13480,
-    'OB1YJN001063U411224': Model_OB1YJN001063U411224,
-    'OBV24T000974AX17644': Model_OBV24T000974AX17644,
-    'OOWY4R001216HX11490': Model_OOWY4R001216HX11490,
-    'OHN9XR001210S614262': Model_OHN9XR001210S614262,
-    'OBX2DO001030E516625': Model_OBX2DO001030E516625,
-    'OZUY2X001061ON17910': Model_OZUY2X001061ON17910,
-    'OAB4WY0009432M10546': Model_OAB4WY0009432M10546,
-    'OAJPOY0010182J19421': Model_OAJPOY0010182J19421,
-    'OUK015001119KD17086': Model_OUK015001119KD17086,
-    'OOWY4R001216HX11472': Model_OOWY4R001216HX11472,
-    'OOWY4R001216HX11473': Model_OOWY4R001216HX11473,
-    'OOWY4R001216HX11510': Model_OOWY4R001216HX11510,
-    'OOWY4R001216HX11460': Model_OOWY4R001216HX11460,
-    'OXJNQM001195IT17281': Model_OXJNQM001195IT17281,
-    'OVDCJU001123OF14595': Model_OVDCJU001123OF14595,
-    'O8D9RF000933S512258': Model_O8D9RF000933S512258,
-    'OSKTB0000948E917810': Model_OSKTB0000948E917810,
-    'OCXHYA000859TX17626': Model_OCXHYA000859TX17626,
-    'O7OLVS0011544713501': Model_O7OLVS0011544713501,
-    'OJUGHY0009848Z17162': Model_OJUGHY0009848Z17162,
-    'O8OFB2000905T918825': Model_O8OFB2000905T918825,
-    'OCFWMF000949MH18411': Model_OCFWMF000949MH18411,
-    'OOWY4R001216HX11441': Model_OOWY4R001216HX11441,
-    'OC0RRQ000852J210654': Model_OC0RRQ000852J210654,
-    'O8WI650012155G10023': Model_O8WI650012155G10023,
-    'OND1KZ0009677M13515': Model_OND1KZ0009677M13515,
-    'OOWY4R001216HX11443': Model_OOWY4R001216HX11443,
-    'OQ50H1000962NX16376': Model_OQ50H1000962NX16376,
-    'O8ZYOF001109VJ11181': Model_O8ZYOF001109VJ11181,
-    'OLFZV7001148O518934': Model_OLFZV7001148O518934,
-    'O4K6HM0012064I15889': Model_O4K6HM0012064I15889,
-    'ORRHLL000916DN12489': Model_ORRHLL000916DN12489,
-    'O4W19G001189TV11044': Model_O4W19G001189TV11044,
-    'OOWY4R001216HX11430': Model_OOWY4R001216HX11430,
-    'OOWY4R001216HX11447': Model_OOWY4R001216HX11447,
-    'OEEG26001115LX11448': Model_OEEG26001115LX11448,
-    'OZY6M30010164K11655': Model_OZY6M30010164K11655,
-    'ORPY580008959U11813': Model_ORPY580008959U11813,
-    'O5UDG0001111CI11346': Model_O5UDG0001111CI11346,
-    'OAIEX00008855613861': Model_OAIEX00008855613861,
-    'OOWY4R001216HX11518': Model_OOWY4R001216HX11518,
-    'OOWY4R001216HX11482': Model_OOWY4R001216HX11482,
-    'OTL4B3000889YI11365': Model_OTL4B3000889YI11365,
-    'O0IS020011724J12768': Model_O0IS020011724J12768,
-    'OOWY4R001216HX11500': Model_OOWY4R001216HX11500,
-    'O6JXFI0011292O12073': Model_O6JXFI0011292O12073,
-    'OKAPKX000929X915616': Model_OKAPKX000929X915616,
-    'O5VQRK0008587911609': Model_O5VQRK0008587911609,
-    'OOWY4R001216HX11495': Model_OOWY4R001216HX11495,
-    'OOWY4R001216HX11471': Model_OOWY4R001216HX11471,
-    'OOWY4R001216HX11521': Model_OOWY4R001216HX11521,
-    'O67B1I001080WL10254': Model_O67B1I001080WL10254,
-    'OOWY4R001216HX11524': Model_OOWY4R001216HX11524,
-    'OHAC6C000892WC13765': Model_OHAC6C000892WC13765,
-    'O8U5BW001076JT16522': Model_O8U5BW001076JT16522,
-    'OOWY4R001216HX11505': Model_OOWY4R001216HX11505,
-    'OFPR4Q001057VP11437': Model_OFPR4Q001057VP11437,
-    'OTM7PV000945R113521': Model_OTM7PV000945R113521,
-    'OPR1MQ000998LC12535': Model_OPR1MQ000998LC12535,
-    'O3VXPE000987AB14703': Model_O3VXPE000987AB14703,
-    'OOWY4R001216HX11511': Model_OOWY4R001216HX11511,
-    'O3YBRH0011715419177': Model_O3YBRH0011715419177,
-    'OWKPDF000891EB10683': Model_OWKPDF000891EB10683,
-    'OOWY4R001216HX11416': Model_OOWY4R001216HX11416,
-    'OOWY4R001216HX11516': Model_OOWY4R001216HX11516,
-    'OOWY4R001216HX11439': Model_OOWY4R001216HX11439,
-    'O7FHUO000928X018370': Model_O7FHUO000928X018370,
-}
+__all__ = ["MODEL_MAP", "PARAM_MAP", "SERVICE_IDS", "Service"]
 
-PARAM_MAP = {
-    'O1OS9V000880XH10851': Params_O1OS9V000880XH10851,
-    'OJH286001107IK13829': Params_OJH286001107IK13829,
-    'OOWY4R001216HX11519': Params_OOWY4R001216HX11519,
-    'O6V35E001197UE12021': Params_O6V35E001197UE12021,
-    'OOWY4R001216HX11423': Params_OOWY4R001216HX11423,
-    'OVRSWG000917L610310': Params_OVRSWG000917L610310,
-    'OOWY4R001216HX11496': Params_OOWY4R001216HX11496,
-    'ORL1S4001007HM19790': Params_ORL1S4001007HM19790,
-    'OOWY4R001216HX11497': Params_OOWY4R001216HX11497,
-    'OU9HJK001126JG15339': Params_OU9HJK001126JG15339,
-    'OOWY4R001216HX11429': Params_OOWY4R001216HX11429,
-    'OOWY4R001216HX11526': Params_OOWY4R001216HX11526,
-    'O01TEW000977U011862': Params_O01TEW000977U011862,
-    'OOWY4R001216HX11442': Params_OOWY4R001216HX11442,
-    'OQ68B8001071ZB13418': Params_OQ68B8001071ZB13418,
-    'O2U9RG001168QQ15766': Params_O2U9RG001168QQ15766,
-    'O575RS001118PF15881': Params_O575RS001118PF15881,
-    'OZ2W6L0011539T11384': Params_OZ2W6L0011539T11384,
-    'O9RY2V0011518716129': Params_O9RY2V0011518716129,
-    'OOWY4R001216HX11444': Params_OOWY4R001216HX11444,
-    'OK7XM1000938DS17215': Params_OK7XM1000938DS17215,
-    'OJAMPB0011929O11426': Params_OJAMPB0011929O11426,
-    'O04X68000884BE13083': Params_O04X68000884BE13083,
-    'ONVQB00009257H12418': Params_ONVQB00009257H12418,
-    'O4UN9N000961PS11812': Params_O4UN9N000961PS11812,
-    'OOWY4R001216HX11493': Params_OOWY4R001216HX11493,
-    'OQEXW00012074114927': Params_OQEXW00012074114927,
-    'OG88RA000978S210177': Params_OG88RA000978S210177,
-    'OAUJIX001138TP16525': Params_OAUJIX001138TP16525,
-    'OCROAA001181NA17461': Params_OCROAA001181NA17461,
-    'O2QQLK001176HI14481': Params_O2QQLK001176HI14481,
-    'OOWY4R001216HX11450': Params_OOWY4R001216HX11450,
-    'OVA33G0011172J17084': Params_OVA33G0011172J17084,
-    'OVRNQQ001062CO16787': Params_OVRNQQ001062CO16787,
-    'O93OTI000979JV17987': Params_O93OTI000979JV17987,
-    'OOWY4R001216HX11454': Params_OOWY4R001216HX11454,
-    'OWSSC6001134T516707': Params_OWSSC6001134T516707,
-    'OOWY4R001216HX11419': Params_OOWY4R001216HX11419,
-    'OO1X9P001017YF13038': Params_OO1X9P001017YF13038,
-    'OX4XHR001211RB17826': Params_OX4XHR001211RB17826,
-    'OB61LZ000981FC12253': Params_OB61LZ000981FC12253,
-    'OJ2LTJ001101KO19739': Params_OJ2LTJ001101KO19739,
-    'OF8AJV000972OP11430': Params_OF8AJV000972OP11430,
-    'OCSMEJ000953O916134': Params_OCSMEJ000953O916134,
-    'OOWY4R001216HX11468': Params_OOWY4R001216HX11468,
-    'OGM9FC001165FS12631': Params_OGM9FC001165FS12631,
-    'O2Q4ZT001004PV11014': Params_O2Q4ZT001004PV11014,
-    'O6PTDW000886NN18676': Params_O6PTDW000886NN18676,
-    'ORDPSW001070QH19059': Params_ORDPSW001070QH19059,
-    'OOWY4R001216HX11509': Params_OOWY4R001216HX11509,
-    'O5C2PY001120OH19574': Params_O5C2PY001120OH19574,
-    'O0KGG20011857W15853': Params_O0KGG20011857W15853,
-    'OA8HOU000969OM19602': Params_OA8HOU000969OM19602,
-    'O0UBVR000906UG11689': Params_O0UBVR000906UG11689,
-    'OD0T6I001156CA16296': Params_OD0T6I001156CA16296,
-    'OZN379001174FW17905': Params_OZN379001174FW17905,
-    'OOWY4R001216HX11425': Params_OOWY4R001216HX11425,
-    'OOWY4R001216HX11426': Params_OOWY4R001216HX11426,
-    'OW1R4X0010744X17495': Params_OW1R4X0010744X17495,
-    'O13FRZ001177X318752': Params_O13FRZ001177X318752,
-    'O8XZ8U001160SW12010': Params_O8XZ8U001160SW12010,
-    'OOWY4R001216HX11458': Params_OOWY4R001216HX11458,
-    'OOWY4R001216HX11470': Params_OOWY4R001216HX11470,
-    'OSPS4X001105IL17344': Params_OSPS4X001105IL17344,
-    'OOBAOA001213RL17443': Params_OOBAOA001213RL17443,
-    'OOWY4R001216HX11421': Params_OOWY4R001216HX11421,
-    'OVUY5B0009241I13320': Params_OVUY5B0009241I13320,
-    'OCAJQ4001000LI18751': Params_OCAJQ4001000LI18751,
-    'OITFOE000968XH15981': Params_OITFOE000968XH15981,
-    'O70WYZ000950T211169': Params_O70WYZ000950T211169,
-    'OOWY4R001216HX11433': Params_OOWY4R001216HX11433,
-    'OPP4KM0012097716578': Params_OPP4KM0012097716578,
-    'OFUAJ6001108BJ11284': Params_OFUAJ6001108BJ11284,
-    'OOWY4R001216HX11517': Params_OOWY4R001216HX11517,
-    'OEUJQB0012145514537': Params_OEUJQB0012145514537,
-    'ORMXPX0011135N18074': Params_ORMXPX0011135N18074,
-    'O8685D0008489413266': Params_O8685D0008489413266,
-    'OKBFLN000963SS13091': Params_OKBFLN000963SS13091,
-    'O6MC3G0011698G17444': Params_O6MC3G0011698G17444,
-    'ORMEIR001164VQ17801': Params_ORMEIR001164VQ17801,
-    'OFOEZN001060N312362': Params_OFOEZN001060N312362,
-    'OOWY4R001216HX11508': Params_OOWY4R001216HX11508,
-    'OOWY4R001216HX11446': Params_OOWY4R001216HX11446,
-    'OOWY4R001216HX11415': Params_OOWY4R001216HX11415,
-    'OQ0WH1000975M912523': Params_OQ0WH1000975M912523,
-    'OOWY4R001216HX11451': Params_OOWY4R001216HX11451,
-    'OOWY4R001216HX11422': Params_OOWY4R001216HX11422,
-    'OY18U4001075AG16626': Params_OY18U4001075AG16626,
-    'OOWY4R001216HX11424': Params_OOWY4R001216HX11424,
-    'OOWY4R001216HX11525': Params_OOWY4R001216HX11525,
-    'OET0D9001078G318850': Params_OET0D9001078G318850,
-    'OOWY4R001216HX11520': Params_OOWY4R001216HX11520,
-    'OLI05G0011283N16926': Params_OLI05G0011283N16926,
-    'OOWY4R001216HX11417': Params_OOWY4R001216HX11417,
-    'OOWY4R001216HX11501': Params_OOWY4R001216HX11501,
-    'O6KN2D001106O610167': Params_O6KN2D001106O610167,
-    'OH01G5001175B914429': Params_OH01G5001175B914429,
-    'OTA0YC001127RJ11880': Params_OTA0YC001127RJ11880,
-    'OOWY4R001216HX11513': Params_OOWY4R001216HX11513,
-    'ODFFIG001072OX10139': Params_ODFFIG001072OX10139,
-    'OOWY4R001216HX11431': Params_OOWY4R001216HX11431,
-    'OQG5IZ0011449610187': Params_OQG5IZ0011449610187,
-    'O0TLLI0008796R14875': Params_O0TLLI0008796R14875,
-    'OOWY4R001216HX11514': Params_OOWY4R001216HX11514,
-    'OOWY4R001216HX11420': Params_OOWY4R001216HX11420,
-    'O1O34T000932VG10613': Params_O1O34T000932VG10613,
-    'ON9NSL000857D116126': Params_ON9NSL000857D116126,
-    'OD21030011944P19666': Params_OD21030011944P19666,
-    'OOWY4R001216HX11462': Params_OOWY4R001216HX11462,
-    'OOWY4R001216HX11438': Params_OOWY4R001216HX11438,
-    'OOWY4R001216HX11437': Params_OOWY4R001216HX11437,
-    'O5MSQF0009823A15643': Params_O5MSQF0009823A15643,
-    'OOWY4R001216HX11507': Params_OOWY4R001216HX11507,
-    'OB3OEN0011786012232': Params_OB3OEN0011786012232,
-    'OTSI7L0011705B12017': Params_OTSI7L0011705B12017,
-    'OAFHCY001008NN11647': Params_OAFHCY001008NN11647,
-    'OOWY4R001216HX11445': Params_OOWY4R001216HX11445,
-    'OL39BM000986V214201': Params_OL39BM000986V214201,
-    'OXZDRJ0011169E17589': Params_OXZDRJ0011169E17589,
-    'OOWY4R001216HX11498': Params_OOWY4R001216HX11498,
-    'OOWY4R001216HX11477': Params_OOWY4R001216HX11477,
-    'OOWY4R001216HX11432': Params_OOWY4R001216HX11432,
-    'OEQ77R000942NL11530': Params_OEQ77R000942NL11530,
-    'O2PLAU000882CD18776': Params_O2PLAU000882CD18776,
-    'OOWY4R001216HX11486': Params_OOWY4R001216HX11486,
-    'O5K6OC001166I215604': Params_O5K6OC001166I215604,
-    'O27DU0000960M511942': Params_O27DU0000960M511942,
-    'ODNHIU0010588P19122': Params_ODNHIU0010588P19122,
-    'OOWY4R001216HX11436': Params_OOWY4R001216HX11436,
-    'O7RUVD001183U610140': Params_O7RUVD001183U610140,
-    'OR0YT0001112TD13067': Params_OR0YT0001112TD13067,
-    'OKDE3A001150P113085': Params_OKDE3A001150P113085,
-    'O3VTTM0010223D15681': Params_O3VTTM0010223D15681,
-    'OOWY4R001216HX11523': Params_OOWY4R001216HX11523,
-    'O0MH4O001149BH11948': Params_O0MH4O001149BH11948,
-    'OOWY4R001216HX11418': Params_OOWY4R001216HX11418,
-    'O927U9001135M913005': Params_O927U9001135M913005,
-    'OVW2NU000937WK15521': Params_OVW2NU000937WK15521,
-    'OOWY4R001216HX11440': Params_OOWY4R001216HX11440,
-    'O78HKE0010099W15881': Params_O78HKE0010099W15881,
-    'OP7W8M000944IF15092': Params_OP7W8M000944IF15092,
-    'OB5IBW001180FQ10640': Params_OB5IBW001180FQ10640,
-    'O4BV430009830710440': Params_O4BV430009830710440,
-    'OU8JBT0015343C14378': Params_OU8JBT0015343C14378,
-    'OMYCKJ0011621210030': Params_OMYCKJ0011621210030,
-    'OOWY4R001216HX11512': Params_OOWY4R001216HX11512,
-    'OOWY4R001216HX11492': Params_OOWY4R001216HX11492,
-    'OQ0A0T0011366V19103': Params_OQ0A0T0011366V19103,
-    'OOWY4R001216HX11479': Params_OOWY4R001216HX11479,
-    'OT9767000930ZL12696': Params_OT9767000930ZL12696,
-    'OS46YD0012559515463': Params_OS46YD0012559515463,
-    'OTICJI000959B917394': Params_OTICJI000959B917394,
-    'OOWY4R001216HX11435': Params_OOWY4R001216HX11435,
-    'OJ24FX001003FD16907': Params_OJ24FX001003FD16907,
-    'OLH92R0011733J15777': Params_OLH92R0011733J15777,
-    'OH473Z0011245H13792': Params_OH473Z0011245H13792,
-    'OOWY4R001216HX11475': Params_OOWY4R001216HX11475,
-    'O8FQ4U000888KF14544': Params_O8FQ4U000888KF14544,
-    'O6HDE2001161LX18191': Params_O6HDE2001161LX18191,
-    'OOWY4R001216HX11494': Params_OOWY4R001216HX11494,
-    'OXN4AR0009078I18280': Params_OXN4AR0009078I18280,
-    'OOWY4R001216HX11522': Params_OOWY4R001216HX11522,
-    'OUSZ4M0011845C16071': Params_OUSZ4M0011845C16071,
-    'OM5S9O0009857U12121': Params_OM5S9O0009857U12121,
-    'O8YX0U001110EM14308': Params_O8YX0U001110EM14308,
-    'OY3EE5000956Q913543': Params_OY3EE5000956Q913543,
-    'OOWY4R001216HX11428': Params_OOWY4R001216HX11428,
-    'OMGXFT001182IV12099': Params_OMGXFT001182IV12099,
-    'OOWY4R001216HX11489': Params_OOWY4R001216HX11489,
-    'O71AP8001122ZZ10743': Params_O71AP8001122ZZ10743,
-    'OFJHWN000881T019291': Params_OFJHWN000881T019291,
-    'OR137O001023MZ19321': Params_OR137O001023MZ19321,
-    'O5IUE30009237O13905': Params_O5IUE30009237O13905,
-    'ORNDP7000993P115502': Params_ORNDP7000993P115502,
-    'OOG5NZ000976EC12112': Params_OOG5NZ000976EC12112,
-    'OXJ0OE001002XA11874': Params_OXJ0OE001002XA11874,
-    'O4UTN7000934TV19125': Params_O4UTN7000934TV19125,
-    'OOWY4R001216HX11461': Params_OOWY4R001216HX11461,
-    'OI75DS001208ZW14781': Params_OI75DS001208ZW14781,
-    'OCLLF20008904J19487': Params_OCLLF20008904J19487,
-    'OC9MRL000922KH15936': Params_OC9MRL000922KH15936,
-    'O6MZOL000912ZG15427': Params_O6MZOL000912ZG15427,
-    'OU749A0011256511253': Params_OU749A0011256511253,
-    'OZHI8N000955DZ17739': Params_OZHI8N000955DZ17739,
-    'OOWY4R001216HX11449': Params_OOWY4R001216HX11449,
-    'O84OO9000939BC16536': Params_O84OO9000939BC16536,
-    'OAUD9V000973QN17203': Params_OAUD9V000973QN17203,
-    'O6DY4U000931SN17960': Params_O6DY4U000931SN17960,
-    'ODI720001121MP14647': Params_ODI720001121MP14647,
-    'OR95JZ001114RS11521': Params_OR95JZ001114RS11521,
-    'OOWY4R001216HX11434': Params_OOWY4R001216HX11434,
-    'O9KCDC000980U619570': Params_O9KCDC000980U619570,
-    'OK160H001152I912731': Params_OK160H001152I912731,
-    'OU29AR0009890A11079': Params_OU29AR0009890A11079,
-    'OVDKBQ000915NE11865': Params_OVDKBQ000915NE11865,
-    'O87UNV000897E818234': Params_O87UNV000897E818234,
-    'OHXILX000958DD14523': Params_OHXILX000958DD14523,
-    'OOWY4R001216HX11506': Params_OOWY4R001216HX11506,
-    'O6P4Y5001146KI12348': Params_O6P4Y5001146KI12348,
-    'OBL7NF0011935G18076': Params_OBL7NF0011935G18076,
-    'O610V6000952AV17729': Params_O610V6000952AV17729,
-    'OTUNFG0008834Q19898': Params_OTUNFG0008834Q19898,
-    'OK3DIS001059MR19626': Params_OK3DIS001059MR19626,
-    'O32948001073L213726': Params_O32948001073L213726,
-    'OOWY4R001216HX11491': Params_OOWY4R001216HX11491,
-    'OFZZ1G001167FC10024': Params_OFZZ1G001167FC10024,
-    'OS18DL000970OU13480': Params_OS18DL000970OU13480,
-    'OB1YJN001063U411224': Params_OB1YJN001063U411224,
-    'OBV24T000974AX17644': Params_OBV24T000974AX17644,
-    'OOWY4R001216HX11490': Params_OOWY4R001216HX11490,
-    'OHN9XR001210S614262': Params_OHN9XR001210S614262,
-    'OBX2DO001030E516625': Params_OBX2DO001030E516625,
-    'OZUY2X001061ON17910': Params_OZUY2X001061ON17910,
-    'OAB4WY0009432M10546': Params_OAB4WY0009432M10546,
-    'OAJPOY0010182J19421': Params_OAJPOY0010182J19421,
-    'OUK015001119KD17086': Params_OUK015001119KD17086,
-    'OOWY4R001216HX11472': Params_OOWY4R001216HX11472,
-    'OOWY4R001216HX11473': Params_OOWY4R001216HX11473,
-    'OOWY4R001216HX11510': Params_OOWY4R001216HX11510,
-    'OOWY4R001216HX11460': Params_OOWY4R001216HX11460,
-    'OXJNQM001195IT17281': Params_OXJNQM001195IT17281,
-    'OVDCJU001123OF14595': Params_OVDCJU001123OF14595,
-    'O8D9RF000933S512258': Params_O8D9RF000933S512258,
-    'OSKTB0000948E917810': Params_OSKTB0000948E917810,
-    'OCXHYA000859TX17626': Params_OCXHYA000859TX17626,
-    'O7OLVS0011544713501': Params_O7OLVS0011544713501,
-    'OJUGHY0009848Z17162': Params_OJUGHY0009848Z17162,
-    'O8OFB2000905T918825': Params_O8OFB2000905T918825,
-    'OCFWMF000949MH18411': Params_OCFWMF000949MH18411,
-    'OOWY4R001216HX11441': Params_OOWY4R001216HX11441,
-    'OC0RRQ000852J210654': Params_OC0RRQ000852J210654,
-    'O8WI650012155G10023': Params_O8WI650012155G10023,
-    'OND1KZ0009677M13515': Params_OND1KZ0009677M13515,
-    'OOWY4R001216HX11443': Params_OOWY4R001216HX11443,
-    'OQ50H1000962NX16376': Params_OQ50H1000962NX16376,
-    'O8ZYOF001109VJ11181': Params_O8ZYOF001109VJ11181,
-    'OLFZV7001148O518934': Params_OLFZV7001148O518934,
-    'O4K6HM0012064I15889': Params_O4K6HM0012064I15889,
-    'ORRHLL000916DN12489': Params_ORRHLL000916DN12489,
-    'O4W19G001189TV11044': Params_O4W19G001189TV11044,
-    'OOWY4R001216HX11430': Params_OOWY4R001216HX11430,
-    'OOWY4R001216HX11447': Params_OOWY4R001216HX11447,
-    'OEEG26001115LX11448': Params_OEEG26001115LX11448,
-    'OZY6M30010164K11655': Params_OZY6M30010164K11655,
-    'ORPY580008959U11813': Params_ORPY580008959U11813,
-    'O5UDG0001111CI11346': Params_O5UDG0001111CI11346,
-    'OAIEX00008855613861': Params_OAIEX00008855613861,
-    'OOWY4R001216HX11518': Params_OOWY4R001216HX11518,
-    'OOWY4R001216HX11482': Params_OOWY4R001216HX11482,
-    'OTL4B3000889YI11365': Params_OTL4B3000889YI11365,
-    'O0IS020011724J12768': Params_O0IS020011724J12768,
-    'OOWY4R001216HX11500': Params_OOWY4R001216HX11500,
-    'O6JXFI0011292O12073': Params_O6JXFI0011292O12073,
-    'OKAPKX000929X915616': Params_OKAPKX000929X915616,
-    'O5VQRK0008587911609': Params_O5VQRK0008587911609,
-    'OOWY4R001216HX11495': Params_OOWY4R001216HX11495,
-    'OOWY4R001216HX11471': Params_OOWY4R001216HX11471,
-    'OOWY4R001216HX11521': Params_OOWY4R001216HX11521,
-    'O67B1I001080WL10254': Params_O67B1I001080WL10254,
-    'OOWY4R001216HX11524': Params_OOWY4R001216HX11524,
-    'OHAC6C000892WC13765': Params_OHAC6C000892WC13765,
-    'O8U5BW001076JT16522': Params_O8U5BW001076JT16522,
-    'OOWY4R001216HX11505': Params_OOWY4R001216HX11505,
-    'OFPR4Q001057VP11437': Params_OFPR4Q001057VP11437,
-    'OTM7PV000945R113521': Params_OTM7PV000945R113521,
-    'OPR1MQ000998LC12535': Params_OPR1MQ000998LC12535,
-    'O3VXPE000987AB14703': Params_O3VXPE000987AB14703,
-    'OOWY4R001216HX11511': Params_OOWY4R001216HX11511,
-    'O3YBRH0011715419177': Params_O3YBRH0011715419177,
-    'OWKPDF000891EB10683': Params_OWKPDF000891EB10683,
-    'OOWY4R001216HX11416': Params_OOWY4R001216HX11416,
-    'OOWY4R001216HX11516': Params_OOWY4R001216HX11516,
-    'OOWY4R001216HX11439': Params_OOWY4R001216HX11439,
-    'O7FHUO000928X018370': Params_O7FHUO000928X018370,
-}
+MODEL_MAP = LazyModelMap(__name__ + ".models", "Model_", SERVICE_IDS)
+PARAM_MAP = LazyModelMap(__name__ + ".models", "Params_", SERVICE_IDS)
+
+
+def __getattr__(name):
+    # Model_<ID> / Params_<ID> used to be re-exported here from a single models module
+    from . import models
+
+    return getattr(models, name)
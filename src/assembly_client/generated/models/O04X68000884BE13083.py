@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O04X68000884BE13083(BaseModel):
+    """Response model for O04X68000884BE13083"""
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    JBTP_NM: Union[str, int, float, None] = Field(None, description="직류", alias="JBTP_NM")
+    ADPT_NOP: Union[str, int, float, None] = Field(None, description="채용인원", alias="ADPT_NOP")
+    CMPT_RT: Union[str, int, float, None] = Field(None, description="경쟁률", alias="CMPT_RT")
+
+class Params_O04X68000884BE13083(BaseModel):
+    """Request parameters for O04X68000884BE13083"""
+    YR: str | None = Field(None, description="연도", alias="YR")
+    JBTP_NM: str | None = Field(None, description="직류", alias="JBTP_NM")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O0KGG20011857W15853(BaseModel):
+    """Response model for O0KGG20011857W15853"""
+    REG_DATE: Union[str, int, float, None] = Field(None, description="발간일", alias="REG_DATE")
+    DEPARTMENT_NAME: Union[str, int, float, None] = Field(None, description="부서명", alias="DEPARTMENT_NAME")
+    ETC_CATE2: Union[str, int, float, None] = Field(None, description="분야", alias="ETC_CATE2")
+    SUBJECT: Union[str, int, float, None] = Field(None, description="보고서명", alias="SUBJECT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 주소", alias="LINK_URL")
+
+class Params_O0KGG20011857W15853(BaseModel):
+    """Request parameters for O0KGG20011857W15853"""
+    DEPARTMENT_NAME: str | None = Field(None, description="부서명", alias="DEPARTMENT_NAME")
+    SUBJECT: str | None = Field(None, description="보고서명", alias="SUBJECT")
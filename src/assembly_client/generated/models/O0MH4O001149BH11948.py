@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O0MH4O001149BH11948(BaseModel):
+    """Response model for O0MH4O001149BH11948"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    PLPT_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="PLPT_NM")
+    SEOUL: Union[str, int, float, None] = Field(None, description="서울", alias="SEOUL")
+    BUSAN: Union[str, int, float, None] = Field(None, description="부산", alias="BUSAN")
+    DEAGU: Union[str, int, float, None] = Field(None, description="대구", alias="DEAGU")
+    INCHUN: Union[str, int, float, None] = Field(None, description="인천", alias="INCHUN")
+    GWANGJU: Union[str, int, float, None] = Field(None, description="광주", alias="GWANGJU")
+    DEAJUN: Union[str, int, float, None] = Field(None, description="대전", alias="DEAJUN")
+    ULSAN: Union[str, int, float, None] = Field(None, description="울산", alias="ULSAN")
+    SEJONG: Union[str, int, float, None] = Field(None, description="세종", alias="SEJONG")
+    GYUNGGI: Union[str, int, float, None] = Field(None, description="경기", alias="GYUNGGI")
+    GANGWON: Union[str, int, float, None] = Field(None, description="강원", alias="GANGWON")
+    CHUNGBUK: Union[str, int, float, None] = Field(None, description="충북", alias="CHUNGBUK")
+    CHUNGNAM: Union[str, int, float, None] = Field(None, description="충남", alias="CHUNGNAM")
+    JUNBUK: Union[str, int, float, None] = Field(None, description="전북", alias="JUNBUK")
+    JUNNAM: Union[str, int, float, None] = Field(None, description="전남", alias="JUNNAM")
+    KYUNGBUK: Union[str, int, float, None] = Field(None, description="경북", alias="KYUNGBUK")
+    KYUNGNAM: Union[str, int, float, None] = Field(None, description="경남", alias="KYUNGNAM")
+    JEJU: Union[str, int, float, None] = Field(None, description="제주", alias="JEJU")
+    TNCFUCT: Union[str, int, float, None] = Field(None, description="통일주체국민회의", alias="TNCFUCT")
+    PRPR: Union[str, int, float, None] = Field(None, description="비례", alias="PRPR")
+    SUM: Union[str, int, float, None] = Field(None, description="합계", alias="SUM")
+    RMK: Union[str, int, float, None] = Field(None, description="비고", alias="RMK")
+
+class Params_O0MH4O001149BH11948(BaseModel):
+    """Request parameters for O0MH4O001149BH11948"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    PLPT_NM: str | None = Field(None, description="정당명", alias="PLPT_NM")
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O0TLLI0008796R14875(BaseModel):
+    """Response model for O0TLLI0008796R14875"""
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    PN: Union[str, int, float, None] = Field(None, description="성명", alias="PN")
+    RTR_DT: Union[str, int, float, None] = Field(None, description="퇴직일", alias="RTR_DT")
+    RTR_THEN_PSIT_NM: Union[str, int, float, None] = Field(None, description="퇴직 시 직위", alias="RTR_THEN_PSIT_NM")
+    GETJOB_INST_NM: Union[str, int, float, None] = Field(None, description="취업기관", alias="GETJOB_INST_NM")
+    GETJOB_DT: Union[str, int, float, None] = Field(None, description="취업일", alias="GETJOB_DT")
+    PSIT_NM: Union[str, int, float, None] = Field(None, description="직위", alias="PSIT_NM")
+
+class Params_O0TLLI0008796R14875(BaseModel):
+    """Request parameters for O0TLLI0008796R14875"""
+    YR: str | None = Field(None, description="연도", alias="YR")
+    PN: str | None = Field(None, description="성명", alias="PN")
+    RTR_THEN_PSIT_NM: str | None = Field(None, description="퇴직 시 직위", alias="RTR_THEN_PSIT_NM")
+    GETJOB_INST_NM: str | None = Field(None, description="취업기관", alias="GETJOB_INST_NM")
+    PSIT_NM: str | None = Field(None, description="직위", alias="PSIT_NM")
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O1O34T000932VG10613(BaseModel):
+    """Response model for O1O34T000932VG10613"""
+    FSCL_YY: Union[str, int, float, None] = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: Union[str, int, float, None] = Field(None, description="집행월", alias="EXE_M")
+    FSCL_NM: Union[str, int, float, None] = Field(None, description="회계명", alias="FSCL_NM")
+    FLD_NM: Union[str, int, float, None] = Field(None, description="분야명", alias="FLD_NM")
+    SECT_NM: Union[str, int, float, None] = Field(None, description="부문명", alias="SECT_NM")
+    PGM_NM: Union[str, int, float, None] = Field(None, description="프로그램명", alias="PGM_NM")
+    ACTV_NM: Union[str, int, float, None] = Field(None, description="단위사업명", alias="ACTV_NM")
+    ANEXP_BDG_CAMT: Union[str, int, float, None] = Field(None, description="예산", alias="ANEXP_BDG_CAMT")
+    EP_AMT: Union[str, int, float, None] = Field(None, description="당월집행액", alias="EP_AMT")
+    THISM_AGGR_EP_AMT: Union[str, int, float, None] = Field(None, description="누계집행액", alias="THISM_AGGR_EP_AMT")
+
+class Params_O1O34T000932VG10613(BaseModel):
+    """Request parameters for O1O34T000932VG10613"""
+    FSCL_YY: str | None = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: str | None = Field(None, description="집행월", alias="EXE_M")
+    FSCL_NM: str | None = Field(None, description="회계명", alias="FSCL_NM")
+    FLD_NM: str | None = Field(None, description="분야명", alias="FLD_NM")
+    SECT_NM: str | None = Field(None, description="부문명", alias="SECT_NM")
+    PGM_NM: str | None = Field(None, description="프로그램명", alias="PGM_NM")
+    ACTV_NM: str | None = Field(None, description="단위사업명", alias="ACTV_NM")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O1OS9V000880XH10851(BaseModel):
+    """Response model for O1OS9V000880XH10851"""
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    FST_DIV_ETC: Union[str, int, float, None] = Field(None, description="구분", alias="FST_DIV_ETC")
+    SND_DIV_ETC: Union[str, int, float, None] = Field(None, description="구분", alias="SND_DIV_ETC")
+    TRD_DIV_ETC: Union[str, int, float, None] = Field(None, description="구분", alias="TRD_DIV_ETC")
+    PYM_EXEAMT: Union[str, int, float, None] = Field(None, description="지급액", alias="PYM_EXEAMT")
+    PYM_MTH: Union[str, int, float, None] = Field(None, description="지급방법", alias="PYM_MTH")
+
+class Params_O1OS9V000880XH10851(BaseModel):
+    """Request parameters for O1OS9V000880XH10851"""
+    YR: str | None = Field(None, description="연도", alias="YR")
+    FST_DIV_ETC: str | None = Field(None, description="구분", alias="FST_DIV_ETC")
+    SND_DIV_ETC: str | None = Field(None, description="구분", alias="SND_DIV_ETC")
+    TRD_DIV_ETC: str | None = Field(None, description="구분", alias="TRD_DIV_ETC")
+    PYM_MTH: str | None = Field(None, description="지급방법", alias="PYM_MTH")
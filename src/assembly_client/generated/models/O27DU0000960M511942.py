@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O27DU0000960M511942(BaseModel):
+    """Response model for O27DU0000960M511942"""
+    MEETING_DATE: Union[str, int, float, None] = Field(None, description="회의일자", alias="MEETING_DATE")
+    MEETING_TIME: Union[str, int, float, None] = Field(None, description="시간", alias="MEETING_TIME")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DEGREE: Union[str, int, float, None] = Field(None, description="차수", alias="DEGREE")
+    TITLE: Union[str, int, float, None] = Field(None, description="구분", alias="TITLE")
+    COMMITTEE_NAME: Union[str, int, float, None] = Field(None, description="위원회 명", alias="COMMITTEE_NAME")
+    LINK_URL2: Union[str, int, float, None] = Field(None, description="상세_URL", alias="LINK_URL2")
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대수", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대수", alias="UNIT_NM")
+    HR_DEPT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="HR_DEPT_CD")
+    ANGUN: Union[str, int, float, None] = Field(None, description="안건", alias="ANGUN")
+
+class Params_O27DU0000960M511942(BaseModel):
+    """Request parameters for O27DU0000960M511942"""
+    MEETING_DATE: str | None = Field(None, description="회의일자", alias="MEETING_DATE")
+    MEETING_TIME: str | None = Field(None, description="시간", alias="MEETING_TIME")
+    SESS: str | None = Field(None, description="회기", alias="SESS")
+    DEGREE: str | None = Field(None, description="차수", alias="DEGREE")
+    TITLE: str | None = Field(None, description="구분", alias="TITLE")
+    COMMITTEE_NAME: str | None = Field(None, description="위원회 명", alias="COMMITTEE_NAME")
+    UNIT_CD: str = Field(..., description="대수", alias="UNIT_CD")
+    HR_DEPT_CD: str | None = Field(None, description="위원회코드", alias="HR_DEPT_CD")
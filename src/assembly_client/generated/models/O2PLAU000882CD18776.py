@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O2PLAU000882CD18776(BaseModel):
+    """Response model for O2PLAU000882CD18776"""
+    CTR_RDT: Union[str, int, float, None] = Field(None, description="계약일자", alias="CTR_RDT")
+    CTR_NM: Union[str, int, float, None] = Field(None, description="계약건명", alias="CTR_NM")
+    CTR_AMT: Union[str, int, float, None] = Field(None, description="계약금액(원)", alias="CTR_AMT")
+    CTR_OJ_NM: Union[str, int, float, None] = Field(None, description="계약상대자", alias="CTR_OJ_NM")
+    CTR_MTH: Union[str, int, float, None] = Field(None, description="계약방법", alias="CTR_MTH")
+
+class Params_O2PLAU000882CD18776(BaseModel):
+    """Request parameters for O2PLAU000882CD18776"""
+    CTR_NM: str | None = Field(None, description="계약건명", alias="CTR_NM")
+    CTR_OJ_NM: str | None = Field(None, description="계약상대자", alias="CTR_OJ_NM")
+    CTR_MTH: str | None = Field(None, description="계약방법", alias="CTR_MTH")
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O2Q4ZT001004PV11014(BaseModel):
+    """Response model for O2Q4ZT001004PV11014"""
+    CMT_DIV_CD: Union[str, int, float, None] = Field(None, description="위원회구분코드", alias="CMT_DIV_CD")
+    CMT_DIV_NM: Union[str, int, float, None] = Field(None, description="위원회구분", alias="CMT_DIV_NM")
+    HR_DEPT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="HR_DEPT_CD")
+    COMMITTEE_NAME: Union[str, int, float, None] = Field(None, description="위원회", alias="COMMITTEE_NAME")
+    HG_NM: Union[str, int, float, None] = Field(None, description="위원장", alias="HG_NM")
+    HG_NM_LIST: Union[str, int, float, None] = Field(None, description="간사", alias="HG_NM_LIST")
+    LIMIT_CNT: Union[str, int, float, None] = Field(None, description="위원정수", alias="LIMIT_CNT")
+    CURR_CNT: Union[str, int, float, None] = Field(None, description="현원", alias="CURR_CNT")
+    POLY99_CNT: Union[str, int, float, None] = Field(None, description="비교섭단체위원수", alias="POLY99_CNT")
+    POLY_CNT: Union[str, int, float, None] = Field(None, description="교섭단체위원수", alias="POLY_CNT")
+
+class Params_O2Q4ZT001004PV11014(BaseModel):
+    """Request parameters for O2Q4ZT001004PV11014"""
+    CMT_DIV_NM: str | None = Field(None, description="위원회구분", alias="CMT_DIV_NM")
+    HR_DEPT_CD: str | None = Field(None, description="위원회코드", alias="HR_DEPT_CD")
+    COMMITTEE_NAME: str | None = Field(None, description="위원회", alias="COMMITTEE_NAME")
+    HG_NM: str | None = Field(None, description="위원장", alias="HG_NM")
+    HG_NM_LIST: str | None = Field(None, description="간사", alias="HG_NM_LIST")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O2U9RG001168QQ15766(BaseModel):
+    """Response model for O2U9RG001168QQ15766"""
+    REG_DATE: Union[str, int, float, None] = Field(None, description="발간일", alias="REG_DATE")
+    DEPARTMENT_NAME: Union[str, int, float, None] = Field(None, description="부서명", alias="DEPARTMENT_NAME")
+    SUBJECT: Union[str, int, float, None] = Field(None, description="보고서명", alias="SUBJECT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 주소", alias="LINK_URL")
+
+class Params_O2U9RG001168QQ15766(BaseModel):
+    """Request parameters for O2U9RG001168QQ15766"""
+    DEPARTMENT_NAME: str | None = Field(None, description="부서명", alias="DEPARTMENT_NAME")
+    SUBJECT: str | None = Field(None, description="보고서명", alias="SUBJECT")
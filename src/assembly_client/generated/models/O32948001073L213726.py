@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O32948001073L213726(BaseModel):
+    """Response model for O32948001073L213726"""
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    BILL_KIND: Union[str, int, float, None] = Field(None, description="의안활동구분", alias="BILL_KIND")
+    PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    VOTE_TCNT: Union[str, int, float, None] = Field(None, description="총투표수", alias="VOTE_TCNT")
+    YES_TCNT: Union[str, int, float, None] = Field(None, description="찬성표수", alias="YES_TCNT")
+    NO_TCNT: Union[str, int, float, None] = Field(None, description="반대수", alias="NO_TCNT")
+    BLANK_TCNT: Union[str, int, float, None] = Field(None, description="기권수", alias="BLANK_TCNT")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    BDG_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="예결위심사_회부일", alias="BDG_SUBMIT_DT")
+    BDG_PRESENT_DT: Union[str, int, float, None] = Field(None, description="예결위심사_상정일", alias="BDG_PRESENT_DT")
+    BDG_PROC_DT: Union[str, int, float, None] = Field(None, description="예결위심사_의결일", alias="BDG_PROC_DT")
+    RGS_PRESENT_DT: Union[str, int, float, None] = Field(None, description="본회의심의_상정일", alias="RGS_PRESENT_DT")
+    RGS_PROC_DT: Union[str, int, float, None] = Field(None, description="본회의심의_의결일", alias="RGS_PROC_DT")
+    CURR_TRANS_DT: Union[str, int, float, None] = Field(None, description="정부이송일", alias="CURR_TRANS_DT")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위원회ID", alias="CURR_COMMITTEE_ID")
+    COMMITTEE_NM: Union[str, int, float, None] = Field(None, description="소관위원회", alias="COMMITTEE_NM")
+
+class Params_O32948001073L213726(BaseModel):
+    """Request parameters for O32948001073L213726"""
+    AGE: str = Field(..., description="대수", alias="AGE")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    PROC_RESULT_CD: str | None = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    PROPOSE_DT: str | None = Field(None, description="제안일", alias="PROPOSE_DT")
+    RGS_PROC_DT: str | None = Field(None, description="본회의심의_의결일", alias="RGS_PROC_DT")
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
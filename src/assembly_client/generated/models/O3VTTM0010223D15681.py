@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O3VTTM0010223D15681(BaseModel):
+    """Response model for O3VTTM0010223D15681"""
+    CT1: Union[str, int, float, None] = Field(None, description="대수", alias="CT1")
+    CT2: Union[str, int, float, None] = Field(None, description="회", alias="CT2")
+    CT3: Union[str, int, float, None] = Field(None, description="차", alias="CT3")
+    TAKING_DATE: Union[str, int, float, None] = Field(None, description="회의일자", alias="TAKING_DATE")
+    TITLE: Union[str, int, float, None] = Field(None, description="회의제목", alias="TITLE")
+    ESSENTIAL_PERSON: Union[str, int, float, None] = Field(None, description="발언자", alias="ESSENTIAL_PERSON")
+    REC_TIME: Union[str, int, float, None] = Field(None, description="재생시간", alias="REC_TIME")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+
+class Params_O3VTTM0010223D15681(BaseModel):
+    """Request parameters for O3VTTM0010223D15681"""
+    CT1: str = Field(..., description="대수", alias="CT1")
+    TAKING_DATE: str = Field(..., description="회의일자", alias="TAKING_DATE")
+    TITLE: str | None = Field(None, description="회의제목", alias="TITLE")
+    ESSENTIAL_PERSON: str | None = Field(None, description="발언자", alias="ESSENTIAL_PERSON")
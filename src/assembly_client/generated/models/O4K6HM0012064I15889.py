@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O4K6HM0012064I15889(BaseModel):
+    """Response model for O4K6HM0012064I15889"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    AGE: Union[str, int, float, None] = Field(None, description="대", alias="AGE")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명(한글)", alias="BILL_NAME")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="제안자", alias="PROPOSER")
+    PROPOSER_KIND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PROPOSER_KIND")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    COMMITTEE_DT: Union[str, int, float, None] = Field(None, description="소관위회부일", alias="COMMITTEE_DT")
+    COMMITTEE_PROC_DT: Union[str, int, float, None] = Field(None, description="위원회심사_처리일", alias="COMMITTEE_PROC_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="의안상세정보_URL", alias="LINK_URL")
+    RST_PROPOSER: Union[str, int, float, None] = Field(None, description="대표발의자", alias="RST_PROPOSER")
+    LAW_PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="법사위처리결과", alias="LAW_PROC_RESULT_CD")
+    LAW_PROC_DT: Union[str, int, float, None] = Field(None, description="법사위처리일", alias="LAW_PROC_DT")
+    LAW_PRESENT_DT: Union[str, int, float, None] = Field(None, description="법사위상정일", alias="LAW_PRESENT_DT")
+    LAW_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="법사위회부일", alias="LAW_SUBMIT_DT")
+    CMT_PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="소관위처리결과", alias="CMT_PROC_RESULT_CD")
+    CMT_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위처리일", alias="CMT_PROC_DT")
+    CMT_PRESENT_DT: Union[str, int, float, None] = Field(None, description="소관위상정일", alias="CMT_PRESENT_DT")
+    RST_MONA_CD: Union[str, int, float, None] = Field(None, description="대표발의자코드", alias="RST_MONA_CD")
+    PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="본회의심의결과", alias="PROC_RESULT_CD")
+    PROC_DT: Union[str, int, float, None] = Field(None, description="의결일", alias="PROC_DT")
+
+class Params_O4K6HM0012064I15889(BaseModel):
+    """Request parameters for O4K6HM0012064I15889"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    AGE: str = Field(..., description="대", alias="AGE")
+    BILL_NAME: str | None = Field(None, description="의안명(한글)", alias="BILL_NAME")
+    PROPOSER: str | None = Field(None, description="제안자", alias="PROPOSER")
+    PROPOSER_KIND: str | None = Field(None, description="제안자구분", alias="PROPOSER_KIND")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    PROC_DT: str | None = Field(None, description="의결일", alias="PROC_DT")
+    PROC_RESULT_CD: str | None = Field(None, description="본회의심의결과", alias="PROC_RESULT_CD")
+    BILL_ID_REF: str | None = Field(None, description="참조의안코드", alias="BILL_ID_REF")
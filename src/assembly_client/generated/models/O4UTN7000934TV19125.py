@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O4UTN7000934TV19125(BaseModel):
+    """Response model for O4UTN7000934TV19125"""
+    V_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="V_TITLE")
+    URL_LINK: Union[str, int, float, None] = Field(None, description="기사 URL", alias="URL_LINK")
+    DATE_LASTMODIFIED: Union[str, int, float, None] = Field(None, description="최종수정일", alias="DATE_LASTMODIFIED")
+    DATE_RELEASED: Union[str, int, float, None] = Field(None, description="기사작성일", alias="DATE_RELEASED")
+    V_BODY: Union[str, int, float, None] = Field(None, description="기사내용", alias="V_BODY")
+
+class Params_O4UTN7000934TV19125(BaseModel):
+    """Request parameters for O4UTN7000934TV19125"""
+    V_TITLE: str | None = Field(None, description="제목", alias="V_TITLE")
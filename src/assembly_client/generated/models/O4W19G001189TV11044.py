@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O4W19G001189TV11044(BaseModel):
+    """Response model for O4W19G001189TV11044"""
+    APPOINT_GRADE: Union[str, int, float, None] = Field(None, description="직위정보", alias="APPOINT_GRADE")
+    APPOINT_NAME: Union[str, int, float, None] = Field(None, description="후보자명", alias="APPOINT_NAME")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위원회", alias="CURR_COMMITTEE")
+    SUBMIT_DT: Union[str, int, float, None] = Field(None, description="소관위 회부일", alias="SUBMIT_DT")
+    PRESENT_DT: Union[str, int, float, None] = Field(None, description="소관위상정일", alias="PRESENT_DT")
+    PROC_DT: Union[str, int, float, None] = Field(None, description="소관위처리일", alias="PROC_DT")
+    PROC_RESULT: Union[str, int, float, None] = Field(None, description="처리결과", alias="PROC_RESULT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="바로가기URL", alias="LINK_URL")
+    MP_BOOK_URL: Union[str, int, float, None] = Field(None, description="청문회실시계획서", alias="MP_BOOK_URL")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위원회ID", alias="CURR_COMMITTEE_ID")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+
+class Params_O4W19G001189TV11044(BaseModel):
+    """Request parameters for O4W19G001189TV11044"""
+    APPOINT_GRADE: str | None = Field(None, description="직위정보", alias="APPOINT_GRADE")
+    APPOINT_NAME: str | None = Field(None, description="후보자명", alias="APPOINT_NAME")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    AGE: str | None = Field(None, description="대수", alias="AGE")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위원회ID", alias="CURR_COMMITTEE_ID")
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
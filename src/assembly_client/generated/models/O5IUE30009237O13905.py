@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O5IUE30009237O13905(BaseModel):
+    """Response model for O5IUE30009237O13905"""
+    RPT_NO: Union[str, int, float, None] = Field(None, description="다운로드", alias="RPT_NO")
+    RPT_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="RPT_TITLE")
+    STND_DT: Union[str, int, float, None] = Field(None, description="기준일자", alias="STND_DT")
+    WRT_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRT_NM")
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대별코드", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대", alias="UNIT_NM")
+    FILE_ID: Union[str, int, float, None] = Field(None, description="파일ID", alias="FILE_ID")
+
+class Params_O5IUE30009237O13905(BaseModel):
+    """Request parameters for O5IUE30009237O13905"""
+    RPT_TITLE: str | None = Field(None, description="제목", alias="RPT_TITLE")
+    STND_DT: str | None = Field(None, description="기준일자", alias="STND_DT")
+    WRT_NM: str | None = Field(None, description="작성자", alias="WRT_NM")
+    UNIT_NM: str | None = Field(None, description="대", alias="UNIT_NM")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O5UDG0001111CI11346(BaseModel):
+    """Response model for O5UDG0001111CI11346"""
+    PDFFILEURL: Union[str, int, float, None] = Field(None, description="PDF파일URL", alias="PDFFILEURL")
+    VIEWERURL: Union[str, int, float, None] = Field(None, description="뷰어URL", alias="VIEWERURL")
+    BOOKNM: Union[str, int, float, None] = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: Union[str, int, float, None] = Field(None, description="등록일자", alias="INSERTDT")
+
+class Params_O5UDG0001111CI11346(BaseModel):
+    """Request parameters for O5UDG0001111CI11346"""
+    BOOKNM: str | None = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: str | None = Field(None, description="등록일자", alias="INSERTDT")
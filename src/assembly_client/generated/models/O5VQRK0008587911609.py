@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O5VQRK0008587911609(BaseModel):
+    """Response model for O5VQRK0008587911609"""
+    YEAR: Union[str, int, float, None] = Field(None, description="연도", alias="YEAR")
+    MAJR: Union[str, int, float, None] = Field(None, description="분야", alias="MAJR")
+    ORG_NM: Union[str, int, float, None] = Field(None, description="단체", alias="ORG_NM")
+    NOR_ENTERATM: Union[str, int, float, None] = Field(None, description="일반수용비(원)", alias="NOR_ENTERATM")
+    BUS_GOATM: Union[str, int, float, None] = Field(None, description="사업추진비(원)", alias="BUS_GOATM")
+    SPE_WORKATM: Union[str, int, float, None] = Field(None, description="특정업무경비(원)", alias="SPE_WORKATM")
+    POLICY_RESRCH_ATM: Union[str, int, float, None] = Field(None, description="정책연구비(원)", alias="POLICY_RESRCH_ATM")
+
+class Params_O5VQRK0008587911609(BaseModel):
+    """Request parameters for O5VQRK0008587911609"""
+    YEAR: str | None = Field(None, description="연도", alias="YEAR")
+    MAJR: str | None = Field(None, description="분야", alias="MAJR")
+    ORG_NM: str | None = Field(None, description="단체", alias="ORG_NM")
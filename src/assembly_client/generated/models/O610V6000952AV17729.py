@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O610V6000952AV17729(BaseModel):
+    """Response model for O610V6000952AV17729"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    DT: Union[str, int, float, None] = Field(None, description="일시", alias="DT")
+    ETC_CHAR11: Union[str, int, float, None] = Field(None, description="장소", alias="ETC_CHAR11")
+    ARTICLE_TEXT: Union[str, int, float, None] = Field(None, description="내용", alias="ARTICLE_TEXT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+    ATTACH_URL: Union[str, int, float, None] = Field(None, description="첨부파일URL", alias="ATTACH_URL")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="구분명", alias="CATEGORY_NM")
+
+class Params_O610V6000952AV17729(BaseModel):
+    """Request parameters for O610V6000952AV17729"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CATEGORY_NM: str | None = Field(None, description="구분명", alias="CATEGORY_NM")
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O67B1I001080WL10254(BaseModel):
+    """Response model for O67B1I001080WL10254"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    LINK: Union[str, int, float, None] = Field(None, description="의원실링크", alias="LINK")
+    DESCRIPTION: Union[str, int, float, None] = Field(None, description="설명", alias="DESCRIPTION")
+    SDATE: Union[str, int, float, None] = Field(None, description="개최일", alias="SDATE")
+    STIME: Union[str, int, float, None] = Field(None, description="개최시간", alias="STIME")
+    NAME: Union[str, int, float, None] = Field(None, description="주최기관", alias="NAME")
+    LOCATION: Union[str, int, float, None] = Field(None, description="개최장소", alias="LOCATION")
+
+class Params_O67B1I001080WL10254(BaseModel):
+    """Request parameters for O67B1I001080WL10254"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    DESCRIPTION: str | None = Field(None, description="설명", alias="DESCRIPTION")
+    SDATE: str | None = Field(None, description="개최일", alias="SDATE")
+    NAME: str | None = Field(None, description="주최기관", alias="NAME")
+    LOCATION: str | None = Field(None, description="개최장소", alias="LOCATION")
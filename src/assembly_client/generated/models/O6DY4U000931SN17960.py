@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O6DY4U000931SN17960(BaseModel):
+    """Response model for O6DY4U000931SN17960"""
+    FSCL_YY: Union[str, int, float, None] = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: Union[str, int, float, None] = Field(None, description="회계월", alias="EXE_M")
+    FSCL_NM: Union[str, int, float, None] = Field(None, description="회계명", alias="FSCL_NM")
+    IKWAN_NM: Union[str, int, float, None] = Field(None, description="수입관명", alias="IKWAN_NM")
+    IHANG_NM: Union[str, int, float, None] = Field(None, description="수입항명", alias="IHANG_NM")
+    IMOK_NM: Union[str, int, float, None] = Field(None, description="수입목명", alias="IMOK_NM")
+    BDG_CAMT: Union[str, int, float, None] = Field(None, description="예산", alias="BDG_CAMT")
+    RC_AMT: Union[str, int, float, None] = Field(None, description="수납본월금액", alias="RC_AMT")
+    RC_AGGR_AMT: Union[str, int, float, None] = Field(None, description="수납누계금액", alias="RC_AGGR_AMT")
+
+class Params_O6DY4U000931SN17960(BaseModel):
+    """Request parameters for O6DY4U000931SN17960"""
+    FSCL_YY: str | None = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: str | None = Field(None, description="회계월", alias="EXE_M")
+    FSCL_NM: str | None = Field(None, description="회계명", alias="FSCL_NM")
+    IKWAN_NM: str | None = Field(None, description="수입관명", alias="IKWAN_NM")
+    IHANG_NM: str | None = Field(None, description="수입항명", alias="IHANG_NM")
+    IMOK_NM: str | None = Field(None, description="수입목명", alias="IMOK_NM")
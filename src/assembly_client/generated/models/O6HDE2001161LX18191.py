@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O6HDE2001161LX18191(BaseModel):
+    """Response model for O6HDE2001161LX18191"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER_NM")
+    CATEGORY_ID: Union[str, int, float, None] = Field(None, description="분류번호", alias="CATEGORY_ID")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="구분", alias="CATEGORY_NM")
+    CREATE_DT: Union[str, int, float, None] = Field(None, description="등록일", alias="CREATE_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+
+class Params_O6HDE2001161LX18191(BaseModel):
+    """Request parameters for O6HDE2001161LX18191"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CATEGORY_ID: str | None = Field(None, description="분류번호", alias="CATEGORY_ID")
+    CATEGORY_NM: str | None = Field(None, description="구분", alias="CATEGORY_NM")
+    CREATE_DT: str | None = Field(None, description="등록일", alias="CREATE_DT")
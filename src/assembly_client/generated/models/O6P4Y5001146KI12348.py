@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O6P4Y5001146KI12348(BaseModel):
+    """Response model for O6P4Y5001146KI12348"""
+    DIV: Union[str, int, float, None] = Field(None, description="구분", alias="DIV")
+    CHM_PN: Union[str, int, float, None] = Field(None, description="성명", alias="CHM_PN")
+    CHM_APTM_YS: Union[str, int, float, None] = Field(None, description="재임기간", alias="CHM_APTM_YS")
+    CHM_RMK: Union[str, int, float, None] = Field(None, description="비고", alias="CHM_RMK")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대", alias="UNIT_NM")
+
+class Params_O6P4Y5001146KI12348(BaseModel):
+    """Request parameters for O6P4Y5001146KI12348"""
+    DIV: str | None = Field(None, description="구분", alias="DIV")
+    CHM_PN: str | None = Field(None, description="성명", alias="CHM_PN")
+    CHM_APTM_YS: str | None = Field(None, description="재임기간", alias="CHM_APTM_YS")
+    UNIT_NM: str | None = Field(None, description="대", alias="UNIT_NM")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O6PTDW000886NN18676(BaseModel):
+    """Response model for O6PTDW000886NN18676"""
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    JGRD_NM: Union[str, int, float, None] = Field(None, description="직급", alias="JGRD_NM")
+    JBTP_NM: Union[str, int, float, None] = Field(None, description="직류", alias="JBTP_NM")
+    ADPT_NOP: Union[str, int, float, None] = Field(None, description="채용인원(명)", alias="ADPT_NOP")
+    CMPT_RT: Union[str, int, float, None] = Field(None, description="경쟁률", alias="CMPT_RT")
+
+class Params_O6PTDW000886NN18676(BaseModel):
+    """Request parameters for O6PTDW000886NN18676"""
+    YR: str | None = Field(None, description="연도", alias="YR")
+    JGRD_NM: str | None = Field(None, description="직급", alias="JGRD_NM")
+    JBTP_NM: str | None = Field(None, description="직류", alias="JBTP_NM")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O70WYZ000950T211169(BaseModel):
+    """Response model for O70WYZ000950T211169"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    DT: Union[str, int, float, None] = Field(None, description="일시", alias="DT")
+    ETC_CHAR11: Union[str, int, float, None] = Field(None, description="장소", alias="ETC_CHAR11")
+    ARTICLE_TEXT: Union[str, int, float, None] = Field(None, description="내용", alias="ARTICLE_TEXT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+
+class Params_O70WYZ000950T211169(BaseModel):
+    """Request parameters for O70WYZ000950T211169"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    DT: str | None = Field(None, description="일시", alias="DT")
+    ETC_CHAR11: str | None = Field(None, description="장소", alias="ETC_CHAR11")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O78HKE0010099W15881(BaseModel):
+    """Response model for O78HKE0010099W15881"""
+    REGDAESU: Union[str, int, float, None] = Field(None, description="대수", alias="REGDAESU")
+    RE_TOPIC_NAME: Union[str, int, float, None] = Field(None, description="분야별", alias="RE_TOPIC_NAME")
+    RE_NAME: Union[str, int, float, None] = Field(None, description="연구단체", alias="RE_NAME")
+    RE_OBJECTIVE: Union[str, int, float, None] = Field(None, description="연구목적", alias="RE_OBJECTIVE")
+    MAIN_MEM: Union[str, int, float, None] = Field(None, description="대표의원", alias="MAIN_MEM")
+    RE_MEM: Union[str, int, float, None] = Field(None, description="연구책임의원", alias="RE_MEM")
+    OBJ_MEM: Union[str, int, float, None] = Field(None, description="구성의원", alias="OBJ_MEM")
+    MEMBER_CNT: Union[str, int, float, None] = Field(None, description="구성인원", alias="MEMBER_CNT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+
+class Params_O78HKE0010099W15881(BaseModel):
+    """Request parameters for O78HKE0010099W15881"""
+    REGDAESU: str = Field(..., description="대수", alias="REGDAESU")
+    RE_TOPIC_NAME: str | None = Field(None, description="분야별", alias="RE_TOPIC_NAME")
+    RE_NAME: str | None = Field(None, description="연구단체", alias="RE_NAME")
+    RE_OBJECTIVE: str | None = Field(None, description="연구목적", alias="RE_OBJECTIVE")
+    MAIN_MEM: str | None = Field(None, description="대표의원", alias="MAIN_MEM")
+    RE_MEM: str | None = Field(None, description="연구책임의원", alias="RE_MEM")
+    OBJ_MEM: str | None = Field(None, description="구성의원", alias="OBJ_MEM")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O7FHUO000928X018370(BaseModel):
+    """Response model for O7FHUO000928X018370"""
+    ORD_NO: Union[str, int, float, None] = Field(None, description="대수", alias="ORD_NO")
+    PLPT_NM: Union[str, int, float, None] = Field(None, description="정당 / 단체", alias="PLPT_NM")
+    NFVP_RT: Union[str, int, float, None] = Field(None, description="득표율", alias="NFVP_RT")
+    PLMST_PSNCNT: Union[str, int, float, None] = Field(None, description="의석수", alias="PLMST_PSNCNT")
+    PRPRR_PSNCNT: Union[str, int, float, None] = Field(None, description="비례대표수", alias="PRPRR_PSNCNT")
+
+class Params_O7FHUO000928X018370(BaseModel):
+    """Request parameters for O7FHUO000928X018370"""
+    ORD_NO: str | None = Field(None, description="대수", alias="ORD_NO")
+    PLPT_NM: str | None = Field(None, description="정당 / 단체", alias="PLPT_NM")
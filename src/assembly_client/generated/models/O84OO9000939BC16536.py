@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O84OO9000939BC16536(BaseModel):
+    """Response model for O84OO9000939BC16536"""
+    TITLE_V: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE_V")
+    USE_YN: Union[str, int, float, None] = Field(None, description="상태", alias="USE_YN")
+    REG_DT_D: Union[str, int, float, None] = Field(None, description="작성일", alias="REG_DT_D")
+    DT: Union[str, int, float, None] = Field(None, description="기간", alias="DT")
+    CONTENT_L: Union[str, int, float, None] = Field(None, description="내용", alias="CONTENT_L")
+    DEPT_NM_V: Union[str, int, float, None] = Field(None, description="의원실", alias="DEPT_NM_V")
+
+class Params_O84OO9000939BC16536(BaseModel):
+    """Request parameters for O84OO9000939BC16536"""
+    TITLE_V: str | None = Field(None, description="제목", alias="TITLE_V")
+    USE_YN: str | None = Field(None, description="상태", alias="USE_YN")
+    REG_DT_D: str | None = Field(None, description="작성일", alias="REG_DT_D")
+    DT: str | None = Field(None, description="기간", alias="DT")
+    CONTENT_L: str | None = Field(None, description="내용", alias="CONTENT_L")
+    DEPT_NM_V: str | None = Field(None, description="의원실", alias="DEPT_NM_V")
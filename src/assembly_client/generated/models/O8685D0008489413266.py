@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8685D0008489413266(BaseModel):
+    """Response model for O8685D0008489413266"""
+    RPT_NO: Union[str, int, float, None] = Field(None, description="다운로드", alias="RPT_NO")
+    YEAR: Union[str, int, float, None] = Field(None, description="년도", alias="YEAR")
+    FILE_ID: Union[str, int, float, None] = Field(None, description="파일ID", alias="FILE_ID")
+    RPT_TITLE: Union[str, int, float, None] = Field(None, description="보고서제목", alias="RPT_TITLE")
+    RG_DE: Union[str, int, float, None] = Field(None, description="등록일", alias="RG_DE")
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대별코드", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대", alias="UNIT_NM")
+    ASBLM_NM: Union[str, int, float, None] = Field(None, description="의원명", alias="ASBLM_NM")
+    QUARTER: Union[str, int, float, None] = Field(None, description="분기", alias="QUARTER")
+    DIV_NM: Union[str, int, float, None] = Field(None, description="구분명", alias="DIV_NM")
+
+class Params_O8685D0008489413266(BaseModel):
+    """Request parameters for O8685D0008489413266"""
+    YEAR: str | None = Field(None, description="년도", alias="YEAR")
+    ASBLM_NM: str | None = Field(None, description="의원명", alias="ASBLM_NM")
+    UNIT_NM: str | None = Field(None, description="대", alias="UNIT_NM")
+    RPT_TITLE: str | None = Field(None, description="보고서제목", alias="RPT_TITLE")
+    UNIT_CD: str = Field(..., description="대별코드", alias="UNIT_CD")
+    QUARTER: str | None = Field(None, description="분기", alias="QUARTER")
+    DIV_NM: str | None = Field(None, description="구분명", alias="DIV_NM")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O87UNV000897E818234(BaseModel):
+    """Response model for O87UNV000897E818234"""
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대별코드", alias="UNIT_CD")
+    PN: Union[str, int, float, None] = Field(None, description="성명", alias="PN")
+    PURP_RSON: Union[str, int, float, None] = Field(None, description="목적사유", alias="PURP_RSON")
+    SCH_DYS: Union[str, int, float, None] = Field(None, description="일정", alias="SCH_DYS")
+    DSTN_NM: Union[str, int, float, None] = Field(None, description="목적지", alias="DSTN_NM")
+    EXPNS_SUPPT_INST_NM: Union[str, int, float, None] = Field(None, description="경비지원기관", alias="EXPNS_SUPPT_INST_NM")
+    REPORT_YN: Union[str, int, float, None] = Field(None, description="결과보고서", alias="REPORT_YN")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대", alias="UNIT_NM")
+
+class Params_O87UNV000897E818234(BaseModel):
+    """Request parameters for O87UNV000897E818234"""
+    UNIT_CD: str | None = Field(None, description="대별코드", alias="UNIT_CD")
+    PN: str | None = Field(None, description="성명", alias="PN")
+    SCH_DYS: str | None = Field(None, description="일정", alias="SCH_DYS")
+    DSTN_NM: str | None = Field(None, description="목적지", alias="DSTN_NM")
+    UNIT_NM: str | None = Field(None, description="대", alias="UNIT_NM")
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8D9RF000933S512258(BaseModel):
+    """Response model for O8D9RF000933S512258"""
+    FSCL_YY: Union[str, int, float, None] = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_DATE: Union[str, int, float, None] = Field(None, description="집행일", alias="EXE_DATE")
+    FSCL_NM: Union[str, int, float, None] = Field(None, description="회계명", alias="FSCL_NM")
+    FLD_NM: Union[str, int, float, None] = Field(None, description="분야명", alias="FLD_NM")
+    SECT_NM: Union[str, int, float, None] = Field(None, description="부문명", alias="SECT_NM")
+    PGM_NM: Union[str, int, float, None] = Field(None, description="프로그램명", alias="PGM_NM")
+    ACTV_NM: Union[str, int, float, None] = Field(None, description="단위사업명", alias="ACTV_NM")
+    SACTV_NM: Union[str, int, float, None] = Field(None, description="세부사업명", alias="SACTV_NM")
+    ANEXP_BDGAMT: Union[str, int, float, None] = Field(None, description="세출예산액", alias="ANEXP_BDGAMT")
+    ANEXP_BDG_CAMT: Union[str, int, float, None] = Field(None, description="세출예산현액", alias="ANEXP_BDG_CAMT")
+    EP_AMT: Union[str, int, float, None] = Field(None, description="지출금액", alias="EP_AMT")
+    THISM_AGGR_EP_AMT: Union[str, int, float, None] = Field(None, description="연간누계지출금액", alias="THISM_AGGR_EP_AMT")
+    THISM_AGGR_EP_NAMT: Union[str, int, float, None] = Field(None, description="당월누계지출순계금액", alias="THISM_AGGR_EP_NAMT")
+
+class Params_O8D9RF000933S512258(BaseModel):
+    """Request parameters for O8D9RF000933S512258"""
+    FSCL_YY: str = Field(..., description="회계년도", alias="FSCL_YY")
+    EXE_DATE: str | None = Field(None, description="집행일", alias="EXE_DATE")
+    FSCL_NM: str | None = Field(None, description="회계명", alias="FSCL_NM")
+    FLD_NM: str | None = Field(None, description="분야명", alias="FLD_NM")
+    SECT_NM: str | None = Field(None, description="부문명", alias="SECT_NM")
+    PGM_NM: str | None = Field(None, description="프로그램명", alias="PGM_NM")
+    ACTV_NM: str | None = Field(None, description="단위사업명", alias="ACTV_NM")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8FQ4U000888KF14544(BaseModel):
+    """Response model for O8FQ4U000888KF14544"""
+    FCLT_NM: Union[str, int, float, None] = Field(None, description="시설물명", alias="FCLT_NM")
+    YY_ARE: Union[str, int, float, None] = Field(None, description="연면적", alias="YY_ARE")
+    ARCTC_ARE: Union[str, int, float, None] = Field(None, description="건축면적", alias="ARCTC_ARE")
+    FLOR_SZ: Union[str, int, float, None] = Field(None, description="층수(지상/지하)", alias="FLOR_SZ")
+    COMPLTN_DYS: Union[str, int, float, None] = Field(None, description="준공년월일", alias="COMPLTN_DYS")
+    RMK: Union[str, int, float, None] = Field(None, description="비고", alias="RMK")
+
+class Params_O8FQ4U000888KF14544(BaseModel):
+    """Request parameters for O8FQ4U000888KF14544"""
+    FCLT_NM: str | None = Field(None, description="시설물명", alias="FCLT_NM")
+    COMPLTN_DYS: str | None = Field(None, description="준공년월일", alias="COMPLTN_DYS")
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8OFB2000905T918825(BaseModel):
+    """Response model for O8OFB2000905T918825"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    SN: Union[str, int, float, None] = Field(None, description="일련번호", alias="SN")
+    DEMD_RSON: Union[str, int, float, None] = Field(None, description="청구사항>청구내용", alias="DEMD_RSON")
+    OPB_FOM_NM: Union[str, int, float, None] = Field(None, description="청구사항>공개형태", alias="OPB_FOM_NM")
+    CHRG_DEPT_NM: Union[str, int, float, None] = Field(None, description="결정내용>담당부서", alias="CHRG_DEPT_NM")
+    DCS_DIV: Union[str, int, float, None] = Field(None, description="결정내용>결정구분", alias="DCS_DIV")
+    OPB_RSON: Union[str, int, float, None] = Field(None, description="결정내용>공개내용", alias="OPB_RSON")
+    CLSD_RSON: Union[str, int, float, None] = Field(None, description="결정내용>비공개(부분공개) 내용 및 사유", alias="CLSD_RSON")
+    DCS_NTC_DT: Union[str, int, float, None] = Field(None, description="결정내용>결정통지일자", alias="DCS_NTC_DT")
+    OPB_DT: Union[str, int, float, None] = Field(None, description="처리사항>공개일자", alias="OPB_DT")
+    OPB_MTH: Union[str, int, float, None] = Field(None, description="처리사항>공개방법", alias="OPB_MTH")
+
+class Params_O8OFB2000905T918825(BaseModel):
+    """Request parameters for O8OFB2000905T918825"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    SN: str | None = Field(None, description="일련번호", alias="SN")
+    DEMD_RSON: str | None = Field(None, description="청구사항>청구내용", alias="DEMD_RSON")
+    OPB_FOM_NM: str | None = Field(None, description="청구사항>공개형태", alias="OPB_FOM_NM")
+    CHRG_DEPT_NM: str | None = Field(None, description="결정내용>담당부서", alias="CHRG_DEPT_NM")
+    DCS_DIV: str | None = Field(None, description="결정내용>결정구분", alias="DCS_DIV")
+    OPB_RSON: str | None = Field(None, description="결정내용>공개내용", alias="OPB_RSON")
+    CLSD_RSON: str | None = Field(None, description="결정내용>비공개(부분공개) 내용 및 사유", alias="CLSD_RSON")
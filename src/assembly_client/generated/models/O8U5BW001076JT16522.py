@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8U5BW001076JT16522(BaseModel):
+    """Response model for O8U5BW001076JT16522"""
+    SEQ: Union[str, int, float, None] = Field(None, description="순번", alias="SEQ")
+    DT: Union[str, int, float, None] = Field(None, description="일자", alias="DT")
+    BILL_KIND: Union[str, int, float, None] = Field(None, description="의안구분", alias="BILL_KIND")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    STAGE: Union[str, int, float, None] = Field(None, description="단계", alias="STAGE")
+    DTL_STAGE: Union[str, int, float, None] = Field(None, description="세부단계", alias="DTL_STAGE")
+    COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위원회", alias="COMMITTEE")
+    ACT_STATUS: Union[str, int, float, None] = Field(None, description="활동상태", alias="ACT_STATUS")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+    COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위원회ID", alias="COMMITTEE_ID")
+
+class Params_O8U5BW001076JT16522(BaseModel):
+    """Request parameters for O8U5BW001076JT16522"""
+    DT: str = Field(..., description="일자", alias="DT")
+    BILL_KIND: str | None = Field(None, description="의안구분", alias="BILL_KIND")
+    AGE: str = Field(..., description="대수", alias="AGE")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: str | None = Field(None, description="의안명", alias="BILL_NM")
+    STAGE: str | None = Field(None, description="단계", alias="STAGE")
+    DTL_STAGE: str | None = Field(None, description="세부단계", alias="DTL_STAGE")
+    COMMITTEE: str | None = Field(None, description="소관위원회", alias="COMMITTEE")
+    ACT_STATUS: str | None = Field(None, description="활동상태", alias="ACT_STATUS")
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    COMMITTEE_ID: str | None = Field(None, description="소관위원회ID", alias="COMMITTEE_ID")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8XZ8U001160SW12010(BaseModel):
+    """Response model for O8XZ8U001160SW12010"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER_NM")
+    CATEGORY_ID: Union[str, int, float, None] = Field(None, description="분류번호", alias="CATEGORY_ID")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="구분", alias="CATEGORY_NM")
+    CREATE_DT: Union[str, int, float, None] = Field(None, description="등록일", alias="CREATE_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+
+class Params_O8XZ8U001160SW12010(BaseModel):
+    """Request parameters for O8XZ8U001160SW12010"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: str | None = Field(None, description="작성자", alias="WRITER_NM")
+    CREATE_DT: str | None = Field(None, description="등록일", alias="CREATE_DT")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O8YX0U001110EM14308(BaseModel):
+    """Response model for O8YX0U001110EM14308"""
+    PDFFILEURL: Union[str, int, float, None] = Field(None, description="PDF파일URL", alias="PDFFILEURL")
+    VIEWERURL: Union[str, int, float, None] = Field(None, description="뷰어URL", alias="VIEWERURL")
+    BOOKNM: Union[str, int, float, None] = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: Union[str, int, float, None] = Field(None, description="등록일자", alias="INSERTDT")
+
+class Params_O8YX0U001110EM14308(BaseModel):
+    """Request parameters for O8YX0U001110EM14308"""
+    BOOKNM: str | None = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: str | None = Field(None, description="등록일자", alias="INSERTDT")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O927U9001135M913005(BaseModel):
+    """Response model for O927U9001135M913005"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    PUBLISHER: Union[str, int, float, None] = Field(None, description="발행처", alias="PUBLISHER")
+    DETAIL_VIEW_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="DETAIL_VIEW_URL")
+    UPDATE_DT: Union[str, int, float, None] = Field(None, description="수정일", alias="UPDATE_DT")
+    PUBLISH_DT: Union[str, int, float, None] = Field(None, description="발행년", alias="PUBLISH_DT")
+
+class Params_O927U9001135M913005(BaseModel):
+    """Request parameters for O927U9001135M913005"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    PUBLISHER: str | None = Field(None, description="발행처", alias="PUBLISHER")
+    UPDATE_DT: str | None = Field(None, description="수정일", alias="UPDATE_DT")
+    PUBLISH_DT: str | None = Field(None, description="발행년", alias="PUBLISH_DT")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_O9RY2V0011518716129(BaseModel):
+    """Response model for O9RY2V0011518716129"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    LCST_FMLAWMKCT: Union[str, int, float, None] = Field(None, description="지역구여성의원수", alias="LCST_FMLAWMKCT")
+    LCST_FMLAWMKNM: Union[str, int, float, None] = Field(None, description="지역구여성의원명", alias="LCST_FMLAWMKNM")
+    NATION_FMLAWMKCT: Union[str, int, float, None] = Field(None, description="전국구여성의원수", alias="NATION_FMLAWMKCT")
+    NATION_FMLAWMKNM: Union[str, int, float, None] = Field(None, description="전국구여성의원명", alias="NATION_FMLAWMKNM")
+    SUM: Union[str, int, float, None] = Field(None, description="합계", alias="SUM")
+    RMK: Union[str, int, float, None] = Field(None, description="비고", alias="RMK")
+
+class Params_O9RY2V0011518716129(BaseModel):
+    """Request parameters for O9RY2V0011518716129"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OAFHCY001008NN11647(BaseModel):
+    """Response model for OAFHCY001008NN11647"""
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="WRITER_NM")
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CREATE_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="CREATE_DT")
+    DEPT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="DEPT_CD")
+
+class Params_OAFHCY001008NN11647(BaseModel):
+    """Request parameters for OAFHCY001008NN11647"""
+    WRITER_NM: str | None = Field(None, description="위원회명", alias="WRITER_NM")
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    DEPT_CD: str | None = Field(None, description="위원회코드", alias="DEPT_CD")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OAJPOY0010182J19421(BaseModel):
+    """Response model for OAJPOY0010182J19421"""
+    HG_NM: Union[str, int, float, None] = Field(None, description="의원이름(한글)", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="의원이름(한자)", alias="HJ_NM")
+    FRTO_DATE: Union[str, int, float, None] = Field(None, description="활동기간", alias="FRTO_DATE")
+    PROFILE_SJ: Union[str, int, float, None] = Field(None, description="의원이력", alias="PROFILE_SJ")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대수코드", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대수", alias="UNIT_NM")
+
+class Params_OAJPOY0010182J19421(BaseModel):
+    """Request parameters for OAJPOY0010182J19421"""
+    HG_NM: str | None = Field(None, description="의원이름(한글)", alias="HG_NM")
+    PROFILE_SJ: str | None = Field(None, description="의원이력", alias="PROFILE_SJ")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
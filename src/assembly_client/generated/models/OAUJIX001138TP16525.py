@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OAUJIX001138TP16525(BaseModel):
+    """Response model for OAUJIX001138TP16525"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="대수", alias="CATEGORY_NM")
+    ETC_CHAR7: Union[str, int, float, None] = Field(None, description="국회의원", alias="ETC_CHAR7")
+    ETC_CHAR12: Union[str, int, float, None] = Field(None, description="개최장소", alias="ETC_CHAR12")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+    ETC_CHAR1: Union[str, int, float, None] = Field(None, description="개최일", alias="ETC_CHAR1")
+    ETC_CHAR2: Union[str, int, float, None] = Field(None, description="개최시", alias="ETC_CHAR2")
+
+class Params_OAUJIX001138TP16525(BaseModel):
+    """Request parameters for OAUJIX001138TP16525"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CATEGORY_NM: str | None = Field(None, description="대수", alias="CATEGORY_NM")
+    ETC_CHAR7: str | None = Field(None, description="국회의원", alias="ETC_CHAR7")
+    ETC_CHAR12: str | None = Field(None, description="개최장소", alias="ETC_CHAR12")
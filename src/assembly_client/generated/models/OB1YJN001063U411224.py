@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OB1YJN001063U411224(BaseModel):
+    """Response model for OB1YJN001063U411224"""
+    COMP_MAIN_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="COMP_MAIN_TITLE")
+    REG_DATE: Union[str, int, float, None] = Field(None, description="등록일자", alias="REG_DATE")
+    COMP_CONTENT: Union[str, int, float, None] = Field(None, description="내용", alias="COMP_CONTENT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기", alias="LINK_URL")
+
+class Params_OB1YJN001063U411224(BaseModel):
+    """Request parameters for OB1YJN001063U411224"""
+    COMP_MAIN_TITLE: str | None = Field(None, description="제목", alias="COMP_MAIN_TITLE")
+    COMP_CONTENT: str | None = Field(None, description="내용", alias="COMP_CONTENT")
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OBL7NF0011935G18076(BaseModel):
+    """Response model for OBL7NF0011935G18076"""
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+    HG_NM: Union[str, int, float, None] = Field(None, description="이름", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="한자명", alias="HJ_NM")
+    ENG_NM: Union[str, int, float, None] = Field(None, description="영문명칭", alias="ENG_NM")
+    BTH_GBN_NM: Union[str, int, float, None] = Field(None, description="음/양력", alias="BTH_GBN_NM")
+    BTH_DATE: Union[str, int, float, None] = Field(None, description="생년월일", alias="BTH_DATE")
+    SEX_GBN_NM: Union[str, int, float, None] = Field(None, description="성별", alias="SEX_GBN_NM")
+    REELE_GBN_NM: Union[str, int, float, None] = Field(None, description="재선", alias="REELE_GBN_NM")
+    UNITS: Union[str, int, float, None] = Field(None, description="당선", alias="UNITS")
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대별코드", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대", alias="UNIT_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="POLY_NM")
+    ORIG_NM: Union[str, int, float, None] = Field(None, description="선거구", alias="ORIG_NM")
+    ELECT_GBN_NM: Union[str, int, float, None] = Field(None, description="선거구구분", alias="ELECT_GBN_NM")
+
+class Params_OBL7NF0011935G18076(BaseModel):
+    """Request parameters for OBL7NF0011935G18076"""
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
+    HG_NM: str | None = Field(None, description="이름", alias="HG_NM")
+    SEX_GBN_NM: str | None = Field(None, description="성별", alias="SEX_GBN_NM")
+    UNIT_CD: str = Field(..., description="대별코드", alias="UNIT_CD")
+    POLY_NM: str | None = Field(None, description="정당명", alias="POLY_NM")
+    ORIG_NM: str | None = Field(None, description="선거구", alias="ORIG_NM")
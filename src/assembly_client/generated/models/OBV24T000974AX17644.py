@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OBV24T000974AX17644(BaseModel):
+    """Response model for OBV24T000974AX17644"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    PROC_DT: Union[str, int, float, None] = Field(None, description="의결일", alias="PROC_DT")
+    COMMITTEE_RESULT: Union[str, int, float, None] = Field(None, description="소관위처리결과", alias="COMMITTEE_RESULT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세정보_URL", alias="LINK_URL")
+    COMMITTEE_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위처리일", alias="COMMITTEE_PROC_DT")
+    CMT_PRESENT_DT: Union[str, int, float, None] = Field(None, description="소관위상정일", alias="CMT_PRESENT_DT")
+    LAW_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="법사위회부일", alias="LAW_SUBMIT_DT")
+    LAW_PRESENT_DT: Union[str, int, float, None] = Field(None, description="법사위상정일", alias="LAW_PRESENT_DT")
+    LAW_PROC_DT: Union[str, int, float, None] = Field(None, description="법사위처리일", alias="LAW_PROC_DT")
+    LAW_PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="법사위처리결과", alias="LAW_PROC_RESULT_CD")
+    COMMITTEE_DT: Union[str, int, float, None] = Field(None, description="소관위회부일", alias="COMMITTEE_DT")
+
+class Params_OBV24T000974AX17644(BaseModel):
+    """Request parameters for OBV24T000974AX17644"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    COMMITTEE_RESULT: str | None = Field(None, description="소관위처리결과", alias="COMMITTEE_RESULT")
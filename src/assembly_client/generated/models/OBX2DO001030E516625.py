@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OBX2DO001030E516625(BaseModel):
+    """Response model for OBX2DO001030E516625"""
+    NUM: Union[str, int, float, None] = Field(None, description="게시물번호", alias="NUM")
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    WRITE_DATE: Union[str, int, float, None] = Field(None, description="작성일", alias="WRITE_DATE")
+    CONTENT: Union[str, int, float, None] = Field(None, description="내용", alias="CONTENT")
+    CONTENT_URL: Union[str, int, float, None] = Field(None, description="상세내용URL", alias="CONTENT_URL")
+    BBS_TITLE: Union[str, int, float, None] = Field(None, description="구분", alias="BBS_TITLE")
+
+class Params_OBX2DO001030E516625(BaseModel):
+    """Request parameters for OBX2DO001030E516625"""
+    NUM: str | None = Field(None, description="게시물번호", alias="NUM")
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    WRITE_DATE: str | None = Field(None, description="작성일", alias="WRITE_DATE")
+    CONTENT: str | None = Field(None, description="내용", alias="CONTENT")
+    BBS_TITLE: str | None = Field(None, description="구분", alias="BBS_TITLE")
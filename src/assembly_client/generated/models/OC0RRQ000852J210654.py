@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OC0RRQ000852J210654(BaseModel):
+    """Response model for OC0RRQ000852J210654"""
+    GUBUN: Union[str, int, float, None] = Field(None, description="구분", alias="GUBUN")
+    YEAR: Union[str, int, float, None] = Field(None, description="연도", alias="YEAR")
+    GROUP_CNT: Union[str, int, float, None] = Field(None, description="단체수(개)", alias="GROUP_CNT")
+
+class Params_OC0RRQ000852J210654(BaseModel):
+    """Request parameters for OC0RRQ000852J210654"""
+    GUBUN: str | None = Field(None, description="구분", alias="GUBUN")
+    YEAR: str | None = Field(None, description="연도", alias="YEAR")
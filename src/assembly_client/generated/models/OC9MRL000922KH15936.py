@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OC9MRL000922KH15936(BaseModel):
+    """Response model for OC9MRL000922KH15936"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    INST_NM: Union[str, int, float, None] = Field(None, description="기관명", alias="INST_NM")
+    BDG_TAMT: Union[str, int, float, None] = Field(None, description="예산총액(천원)", alias="BDG_TAMT")
+
+class Params_OC9MRL000922KH15936(BaseModel):
+    """Request parameters for OC9MRL000922KH15936"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    INST_NM: str | None = Field(None, description="기관명", alias="INST_NM")
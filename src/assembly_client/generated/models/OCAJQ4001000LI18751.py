@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OCAJQ4001000LI18751(BaseModel):
+    """Response model for OCAJQ4001000LI18751"""
+    DEPT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="DEPT_CD")
+    DEPT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="DEPT_NM")
+    JOB_RES_NM: Union[str, int, float, None] = Field(None, description="구성", alias="JOB_RES_NM")
+    HG_NM: Union[str, int, float, None] = Field(None, description="위원명", alias="HG_NM")
+    ORIG_NM: Union[str, int, float, None] = Field(None, description="선거구", alias="ORIG_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="정당", alias="POLY_NM")
+    ASSEM_TEL: Union[str, int, float, None] = Field(None, description="전화번호", alias="ASSEM_TEL")
+    ASSEM_EMAIL: Union[str, int, float, None] = Field(None, description="이메일", alias="ASSEM_EMAIL")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="위원명(한자)", alias="HJ_NM")
+    ROOM_NO: Union[str, int, float, None] = Field(None, description="호실", alias="ROOM_NO")
+    STAFF: Union[str, int, float, None] = Field(None, description="보좌관", alias="STAFF")
+    SECRETARY: Union[str, int, float, None] = Field(None, description="비서관", alias="SECRETARY")
+    SECRETARY2: Union[str, int, float, None] = Field(None, description="비서", alias="SECRETARY2")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+
+class Params_OCAJQ4001000LI18751(BaseModel):
+    """Request parameters for OCAJQ4001000LI18751"""
+    DEPT_CD: str | None = Field(None, description="위원회코드", alias="DEPT_CD")
+    DEPT_NM: str | None = Field(None, description="위원회명", alias="DEPT_NM")
+    JOB_RES_NM: str | None = Field(None, description="구성", alias="JOB_RES_NM")
+    HG_NM: str | None = Field(None, description="위원명", alias="HG_NM")
+    ORIG_NM: str | None = Field(None, description="선거구", alias="ORIG_NM")
+    POLY_NM: str | None = Field(None, description="정당", alias="POLY_NM")
+    ASSEM_TEL: str | None = Field(None, description="전화번호", alias="ASSEM_TEL")
+    ASSEM_EMAIL: str | None = Field(None, description="이메일", alias="ASSEM_EMAIL")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
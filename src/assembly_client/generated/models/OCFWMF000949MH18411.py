@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OCFWMF000949MH18411(BaseModel):
+    """Response model for OCFWMF000949MH18411"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    RE_DT: Union[str, int, float, None] = Field(None, description="관람예약", alias="RE_DT")
+    DT: Union[str, int, float, None] = Field(None, description="일시", alias="DT")
+    ETC_CHAR11: Union[str, int, float, None] = Field(None, description="장소", alias="ETC_CHAR11")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+
+class Params_OCFWMF000949MH18411(BaseModel):
+    """Request parameters for OCFWMF000949MH18411"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    RE_DT: str | None = Field(None, description="관람예약", alias="RE_DT")
+    DT: str | None = Field(None, description="일시", alias="DT")
+    ETC_CHAR11: str | None = Field(None, description="장소", alias="ETC_CHAR11")
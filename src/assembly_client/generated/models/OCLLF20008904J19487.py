@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OCLLF20008904J19487(BaseModel):
+    """Response model for OCLLF20008904J19487"""
+    DIV_NM: Union[str, int, float, None] = Field(None, description="구분", alias="DIV_NM")
+    BLDG_NM: Union[str, int, float, None] = Field(None, description="건물", alias="BLDG_NM")
+    ARE: Union[str, int, float, None] = Field(None, description="면적(㎡)", alias="ARE")
+    FLSP: Union[str, int, float, None] = Field(None, description="면적(평)", alias="FLSP")
+    AMT: Union[str, int, float, None] = Field(None, description="금액", alias="AMT")
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+
+class Params_OCLLF20008904J19487(BaseModel):
+    """Request parameters for OCLLF20008904J19487"""
+    DIV_NM: str | None = Field(None, description="구분", alias="DIV_NM")
+    BLDG_NM: str | None = Field(None, description="건물", alias="BLDG_NM")
+    YR: str | None = Field(None, description="년도", alias="YR")
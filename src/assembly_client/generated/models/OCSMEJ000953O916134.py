@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OCSMEJ000953O916134(BaseModel):
+    """Response model for OCSMEJ000953O916134"""
+    ADD_DISCRIPT: Union[str, int, float, None] = Field(None, description="부제", alias="ADD_DISCRIPT")
+    PRO_TITLE: Union[str, int, float, None] = Field(None, description="방송프로그램", alias="PRO_TITLE")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크", alias="LINK_URL")
+    FORMATION_TIME: Union[str, int, float, None] = Field(None, description="방영시간", alias="FORMATION_TIME")
+    FORMATION_DT: Union[str, int, float, None] = Field(None, description="방영일자", alias="FORMATION_DT")
+
+class Params_OCSMEJ000953O916134(BaseModel):
+    """Request parameters for OCSMEJ000953O916134"""
+    ADD_DISCRIPT: str | None = Field(None, description="부제", alias="ADD_DISCRIPT")
+    PRO_TITLE: str | None = Field(None, description="방송프로그램", alias="PRO_TITLE")
+    FORMATION_TIME: str | None = Field(None, description="방영시간", alias="FORMATION_TIME")
+    FORMATION_DT: str = Field(..., description="방영일자", alias="FORMATION_DT")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OCXHYA000859TX17626(BaseModel):
+    """Response model for OCXHYA000859TX17626"""
+    YEAR: Union[str, int, float, None] = Field(None, description="연도", alias="YEAR")
+    DIV: Union[str, int, float, None] = Field(None, description="구분", alias="DIV")
+    FLD: Union[str, int, float, None] = Field(None, description="분야", alias="FLD")
+    GRP: Union[str, int, float, None] = Field(None, description="단체", alias="GRP")
+    LAWMAKER: Union[str, int, float, None] = Field(None, description="대표의원", alias="LAWMAKER")
+    PRZ_MONEY: Union[str, int, float, None] = Field(None, description="상금액", alias="PRZ_MONEY")
+
+class Params_OCXHYA000859TX17626(BaseModel):
+    """Request parameters for OCXHYA000859TX17626"""
+    YEAR: str | None = Field(None, description="연도", alias="YEAR")
+    DIV: str | None = Field(None, description="구분", alias="DIV")
+    FLD: str | None = Field(None, description="분야", alias="FLD")
+    GRP: str | None = Field(None, description="단체", alias="GRP")
+    LAWMAKER: str | None = Field(None, description="대표의원", alias="LAWMAKER")
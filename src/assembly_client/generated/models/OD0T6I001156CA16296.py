@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OD0T6I001156CA16296(BaseModel):
+    """Response model for OD0T6I001156CA16296"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    SYSATTACH1: Union[str, int, float, None] = Field(None, description="파일링크", alias="SYSATTACH1")
+    REG_DATE: Union[str, int, float, None] = Field(None, description="등록일자", alias="REG_DATE")
+
+class Params_OD0T6I001156CA16296(BaseModel):
+    """Request parameters for OD0T6I001156CA16296"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
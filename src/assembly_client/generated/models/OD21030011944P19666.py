@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OD21030011944P19666(BaseModel):
+    """Response model for OD21030011944P19666"""
+    HG_NM: Union[str, int, float, None] = Field(None, description="의원이름(한글)", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="의원이름(한자)", alias="HJ_NM")
+    FRTO_DATE: Union[str, int, float, None] = Field(None, description="활동기간", alias="FRTO_DATE")
+    PROFILE_SJ: Union[str, int, float, None] = Field(None, description="의원이력", alias="PROFILE_SJ")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+    PROFILE_UNIT_CD: Union[str, int, float, None] = Field(None, description="경력대수코드", alias="PROFILE_UNIT_CD")
+    PROFILE_UNIT_NM: Union[str, int, float, None] = Field(None, description="경력대수", alias="PROFILE_UNIT_NM")
+
+class Params_OD21030011944P19666(BaseModel):
+    """Request parameters for OD21030011944P19666"""
+    HG_NM: str | None = Field(None, description="의원이름(한글)", alias="HG_NM")
+    PROFILE_SJ: str | None = Field(None, description="의원이력", alias="PROFILE_SJ")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
+    PROFILE_UNIT_CD: str = Field(..., description="경력대수코드", alias="PROFILE_UNIT_CD")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ODI720001121MP14647(BaseModel):
+    """Response model for ODI720001121MP14647"""
+    PRDC_YM_NM: Union[str, int, float, None] = Field(None, description="생산년월", alias="PRDC_YM_NM")
+    OPB_FL_NM: Union[str, int, float, None] = Field(None, description="공개파일명", alias="OPB_FL_NM")
+    INST_CD: Union[str, int, float, None] = Field(None, description="기관코드", alias="INST_CD")
+    INST_NM: Union[str, int, float, None] = Field(None, description="기관명", alias="INST_NM")
+    CTGR_CD: Union[str, int, float, None] = Field(None, description="분류항목코드", alias="CTGR_CD")
+    CTGR_NM: Union[str, int, float, None] = Field(None, description="분류항목", alias="CTGR_NM")
+    OPB_FL_PH: Union[str, int, float, None] = Field(None, description="공개파일경로", alias="OPB_FL_PH")
+    FILE_ID: Union[str, int, float, None] = Field(None, description="파일ID", alias="FILE_ID")
+
+class Params_ODI720001121MP14647(BaseModel):
+    """Request parameters for ODI720001121MP14647"""
+    PRDC_YM: str | None = Field(None, description="생산년월", alias="PRDC_YM")
+    OPB_FL_NM: str | None = Field(None, description="공개파일명", alias="OPB_FL_NM")
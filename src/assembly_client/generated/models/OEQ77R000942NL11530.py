@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OEQ77R000942NL11530(BaseModel):
+    """Response model for OEQ77R000942NL11530"""
+    REGDAESU: Union[str, int, float, None] = Field(None, description="대수", alias="REGDAESU")
+    REPORT_TITLE: Union[str, int, float, None] = Field(None, description="보고서명", alias="REPORT_TITLE")
+    YEAR: Union[str, int, float, None] = Field(None, description="연도", alias="YEAR")
+    RE_NAME: Union[str, int, float, None] = Field(None, description="연구단체명", alias="RE_NAME")
+    PDF_DOWN_URL: Union[str, int, float, None] = Field(None, description="", alias="PDF_DOWN_URL")
+    REPORT_CLASSIFICATION_NM: Union[str, int, float, None] = Field(None, description="보고서분류", alias="REPORT_CLASSIFICATION_NM")
+
+class Params_OEQ77R000942NL11530(BaseModel):
+    """Request parameters for OEQ77R000942NL11530"""
+    REGDAESU: str = Field(..., description="대수", alias="REGDAESU")
+    REPORT_TITLE: str | None = Field(None, description="보고서명", alias="REPORT_TITLE")
+    YEAR: str | None = Field(None, description="연도", alias="YEAR")
+    RE_NAME: str | None = Field(None, description="연구단체명", alias="RE_NAME")
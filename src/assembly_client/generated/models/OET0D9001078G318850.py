@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OET0D9001078G318850(BaseModel):
+    """Response model for OET0D9001078G318850"""
+    HG_NM: Union[str, int, float, None] = Field(None, description="이름", alias="HG_NM")
+    T_URL: Union[str, int, float, None] = Field(None, description="트위터 URL", alias="T_URL")
+    F_URL: Union[str, int, float, None] = Field(None, description="페이스북 URL", alias="F_URL")
+    Y_URL: Union[str, int, float, None] = Field(None, description="유튜브 URL", alias="Y_URL")
+    B_URL: Union[str, int, float, None] = Field(None, description="블로그 URL", alias="B_URL")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+
+class Params_OET0D9001078G318850(BaseModel):
+    """Request parameters for OET0D9001078G318850"""
+    HG_NM: str | None = Field(None, description="이름", alias="HG_NM")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
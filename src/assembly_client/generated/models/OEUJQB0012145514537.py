@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OEUJQB0012145514537(BaseModel):
+    """Response model for OEUJQB0012145514537"""
+    UNIT_CD: Union[str, int, float, None] = Field(None, description="대수", alias="UNIT_CD")
+    UNIT_NM: Union[str, int, float, None] = Field(None, description="대수", alias="UNIT_NM")
+    MEETINGSESSION: Union[str, int, float, None] = Field(None, description="회기", alias="MEETINGSESSION")
+    CHA: Union[str, int, float, None] = Field(None, description="차수", alias="CHA")
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    MEETTING_DATE: Union[str, int, float, None] = Field(None, description="일자", alias="MEETTING_DATE")
+    MEETTING_TIME: Union[str, int, float, None] = Field(None, description="일시", alias="MEETTING_TIME")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+
+class Params_OEUJQB0012145514537(BaseModel):
+    """Request parameters for OEUJQB0012145514537"""
+    UNIT_CD: str = Field(..., description="대수", alias="UNIT_CD")
+    MEETINGSESSION: str | None = Field(None, description="회기", alias="MEETINGSESSION")
+    CHA: str | None = Field(None, description="차수", alias="CHA")
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    MEETTING_DATE: str | None = Field(None, description="일자", alias="MEETTING_DATE")
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OF8AJV000972OP11430(BaseModel):
+    """Response model for OF8AJV000972OP11430"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안 ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="법률안명", alias="BILL_NAME")
+    AGE: Union[str, int, float, None] = Field(None, description="대", alias="AGE")
+    PROPOSER_KIND_CD: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PROPOSER_KIND_CD")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="제안자", alias="PROPOSER")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위원회", alias="CURR_COMMITTEE")
+    NOTI_ED_DT: Union[str, int, float, None] = Field(None, description="게시종료일", alias="NOTI_ED_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크주소", alias="LINK_URL")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위ID", alias="CURR_COMMITTEE_ID")
+
+class Params_OF8AJV000972OP11430(BaseModel):
+    """Request parameters for OF8AJV000972OP11430"""
+    BILL_ID: str | None = Field(None, description="의안 ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="법률안명", alias="BILL_NAME")
+    AGE: str = Field(..., description="대", alias="AGE")
+    PROPOSER_KIND_CD: str | None = Field(None, description="제안자구분", alias="PROPOSER_KIND_CD")
+    PROPOSER: str | None = Field(None, description="제안자", alias="PROPOSER")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위원회", alias="CURR_COMMITTEE")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위ID", alias="CURR_COMMITTEE_ID")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OFJHWN000881T019291(BaseModel):
+    """Response model for OFJHWN000881T019291"""
+    CTR_RDT: Union[str, int, float, None] = Field(None, description="계약일자", alias="CTR_RDT")
+    CTR_NM: Union[str, int, float, None] = Field(None, description="계약건명", alias="CTR_NM")
+    CTR_AMT: Union[str, int, float, None] = Field(None, description="계약금액", alias="CTR_AMT")
+    CTR_OJ_NM: Union[str, int, float, None] = Field(None, description="계약상대자", alias="CTR_OJ_NM")
+    CTR_MTH: Union[str, int, float, None] = Field(None, description="계약방법", alias="CTR_MTH")
+    PRVCTRT_RSON: Union[str, int, float, None] = Field(None, description="수의계약사유", alias="PRVCTRT_RSON")
+
+class Params_OFJHWN000881T019291(BaseModel):
+    """Request parameters for OFJHWN000881T019291"""
+    CTR_NM: str | None = Field(None, description="계약건명", alias="CTR_NM")
+    CTR_OJ_NM: str | None = Field(None, description="계약상대자", alias="CTR_OJ_NM")
+    CTR_MTH: str | None = Field(None, description="계약방법", alias="CTR_MTH")
+    PRVCTRT_RSON: str | None = Field(None, description="수의계약사유", alias="PRVCTRT_RSON")
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OG88RA000978S210177(BaseModel):
+    """Response model for OG88RA000978S210177"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="제안자", alias="PROPOSER")
+    PROPOSER_KIND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PROPOSER_KIND")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    COMMITTEE_DT: Union[str, int, float, None] = Field(None, description="소관위회부일", alias="COMMITTEE_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="의안상세정보 URL", alias="LINK_URL")
+    COMMITTEE_RESULT: Union[str, int, float, None] = Field(None, description="소관위처리결과", alias="COMMITTEE_RESULT")
+    COMMITTEE_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위처리일", alias="COMMITTEE_PROC_DT")
+    CMT_PRESENT_DT: Union[str, int, float, None] = Field(None, description="소관위상정일", alias="CMT_PRESENT_DT")
+    LAW_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="법사위회부일", alias="LAW_SUBMIT_DT")
+    LAW_PRESENT_DT: Union[str, int, float, None] = Field(None, description="법사위상정일", alias="LAW_PRESENT_DT")
+
+class Params_OG88RA000978S210177(BaseModel):
+    """Request parameters for OG88RA000978S210177"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    PROPOSER: str | None = Field(None, description="제안자", alias="PROPOSER")
+    PROPOSE_DT: str | None = Field(None, description="제안일", alias="PROPOSE_DT")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위", alias="CURR_COMMITTEE")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OH473Z0011245H13792(BaseModel):
+    """Response model for OH473Z0011245H13792"""
+    PRDC_YM_NM: Union[str, int, float, None] = Field(None, description="생산년월", alias="PRDC_YM_NM")
+    OPB_FL_NM: Union[str, int, float, None] = Field(None, description="공개파일명", alias="OPB_FL_NM")
+    INST_CD: Union[str, int, float, None] = Field(None, description="기관코드", alias="INST_CD")
+    INST_NM: Union[str, int, float, None] = Field(None, description="기관명", alias="INST_NM")
+    OPB_FL_PH: Union[str, int, float, None] = Field(None, description="공개파일경로", alias="OPB_FL_PH")
+    FILE_ID: Union[str, int, float, None] = Field(None, description="첨부파일ID", alias="FILE_ID")
+
+class Params_OH473Z0011245H13792(BaseModel):
+    """Request parameters for OH473Z0011245H13792"""
+    pass
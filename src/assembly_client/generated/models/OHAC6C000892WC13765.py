@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OHAC6C000892WC13765(BaseModel):
+    """Response model for OHAC6C000892WC13765"""
+    ORD_NUM: Union[str, int, float, None] = Field(None, description="대수", alias="ORD_NUM")
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    OPB_DAY: Union[str, int, float, None] = Field(None, description="공개날짜", alias="OPB_DAY")
+    PN: Union[str, int, float, None] = Field(None, description="성명", alias="PN")
+    CCOF_INST_NM: Union[str, int, float, None] = Field(None, description="겸직기관명", alias="CCOF_INST_NM")
+    PSIT_NM: Union[str, int, float, None] = Field(None, description="직위", alias="PSIT_NM")
+    CCOF_PSB_YN_CD: Union[str, int, float, None] = Field(None, description="결정 내용", alias="CCOF_PSB_YN_CD")
+
+class Params_OHAC6C000892WC13765(BaseModel):
+    """Request parameters for OHAC6C000892WC13765"""
+    ORD_NUM: str | None = Field(None, description="대수", alias="ORD_NUM")
+    YR: str | None = Field(None, description="연도", alias="YR")
+    OPB_DAY: str | None = Field(None, description="공개날짜", alias="OPB_DAY")
+    PN: str | None = Field(None, description="성명", alias="PN")
+    CCOF_INST_NM: str | None = Field(None, description="겸직기관명", alias="CCOF_INST_NM")
+    PSIT_NM: str | None = Field(None, description="직위", alias="PSIT_NM")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OHN9XR001210S614262(BaseModel):
+    """Response model for OHN9XR001210S614262"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    PLANNER: Union[str, int, float, None] = Field(None, description="기획자", alias="PLANNER")
+    PANAL: Union[str, int, float, None] = Field(None, description="패널", alias="PANAL")
+    REG_DTTM: Union[str, int, float, None] = Field(None, description="작성일", alias="REG_DTTM")
+    OPEN_DTTM: Union[str, int, float, None] = Field(None, description="개최일", alias="OPEN_DTTM")
+    DIV: Union[str, int, float, None] = Field(None, description="구분", alias="DIV")
+
+class Params_OHN9XR001210S614262(BaseModel):
+    """Request parameters for OHN9XR001210S614262"""
+    pass
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OI75DS001208ZW14781(BaseModel):
+    """Response model for OI75DS001208ZW14781"""
+    USE_START_DT: Union[str, int, float, None] = Field(None, description="일시", alias="USE_START_DT")
+    USER_NM: Union[str, int, float, None] = Field(None, description="사용권자", alias="USER_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="당명", alias="POLY_NM")
+    CONT: Union[str, int, float, None] = Field(None, description="내용", alias="CONT")
+
+class Params_OI75DS001208ZW14781(BaseModel):
+    """Request parameters for OI75DS001208ZW14781"""
+    pass
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OITFOE000968XH15981(BaseModel):
+    """Response model for OITFOE000968XH15981"""
+    EDU_TITLE_NM: Union[str, int, float, None] = Field(None, description="연수명", alias="EDU_TITLE_NM")
+    EDU_OJR: Union[str, int, float, None] = Field(None, description="대상자", alias="EDU_OJR")
+    EDU_PLC_NM: Union[str, int, float, None] = Field(None, description="장소", alias="EDU_PLC_NM")
+    EDU_GUBUN_CD: Union[str, int, float, None] = Field(None, description="교육_대상자_구분코드", alias="EDU_GUBUN_CD")
+    EDU_GUBUN_NM: Union[str, int, float, None] = Field(None, description="대상구분명", alias="EDU_GUBUN_NM")
+    EDU_FXDNOPPL: Union[str, int, float, None] = Field(None, description="정원", alias="EDU_FXDNOPPL")
+    CRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="CRT_DT")
+    EDU_DPSTG_EXPENSE: Union[str, int, float, None] = Field(None, description="연수비", alias="EDU_DPSTG_EXPENSE")
+    EDU_DT: Union[str, int, float, None] = Field(None, description="연수기간", alias="EDU_DT")
+    EDU_APL_DT: Union[str, int, float, None] = Field(None, description="신청기간", alias="EDU_APL_DT")
+    EDU_APL_CNC_DT: Union[str, int, float, None] = Field(None, description="취소가능기간", alias="EDU_APL_CNC_DT")
+
+class Params_OITFOE000968XH15981(BaseModel):
+    """Request parameters for OITFOE000968XH15981"""
+    EDU_TITLE_NM: str | None = Field(None, description="연수명", alias="EDU_TITLE_NM")
+    EDU_OJR: str | None = Field(None, description="대상자", alias="EDU_OJR")
+    EDU_PLC_NM: str | None = Field(None, description="장소", alias="EDU_PLC_NM")
+    EDU_GUBUN_NM: str | None = Field(None, description="대상구분명", alias="EDU_GUBUN_NM")
+    EDU_DT: str | None = Field(None, description="연수기간", alias="EDU_DT")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OJ24FX001003FD16907(BaseModel):
+    """Response model for OJ24FX001003FD16907"""
+    POLY_GROUP_NM: Union[str, int, float, None] = Field(None, description="교섭단체", alias="POLY_GROUP_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="POLY_NM")
+    N1: Union[str, int, float, None] = Field(None, description="지역구", alias="N1")
+    N2: Union[str, int, float, None] = Field(None, description="비례대표", alias="N2")
+    N3: Union[str, int, float, None] = Field(None, description="계", alias="N3")
+    N4: Union[str, int, float, None] = Field(None, description="비고(%)", alias="N4")
+
+class Params_OJ24FX001003FD16907(BaseModel):
+    """Request parameters for OJ24FX001003FD16907"""
+    POLY_GROUP_NM: str | None = Field(None, description="교섭단체", alias="POLY_GROUP_NM")
+    POLY_NM: str | None = Field(None, description="정당명", alias="POLY_NM")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OJ2LTJ001101KO19739(BaseModel):
+    """Response model for OJ2LTJ001101KO19739"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    PUBLISHER: Union[str, int, float, None] = Field(None, description="발행처", alias="PUBLISHER")
+    DETAIL_VIEW_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="DETAIL_VIEW_URL")
+    UPDATE_DT: Union[str, int, float, None] = Field(None, description="수정일", alias="UPDATE_DT")
+    PUBLISH_DT: Union[str, int, float, None] = Field(None, description="발행년", alias="PUBLISH_DT")
+
+class Params_OJ2LTJ001101KO19739(BaseModel):
+    """Request parameters for OJ2LTJ001101KO19739"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    PUBLISHER: str | None = Field(None, description="발행처", alias="PUBLISHER")
+    PUBLISH_DT: str | None = Field(None, description="발행년", alias="PUBLISH_DT")
@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OK7XM1000938DS17215(BaseModel):
+    """Response model for OK7XM1000938DS17215"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="법률안명", alias="BILL_NAME")
+    COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위원회", alias="COMMITTEE")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    PROC_RESULT: Union[str, int, float, None] = Field(None, description="본회의심의결과", alias="PROC_RESULT")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    DETAIL_LINK: Union[str, int, float, None] = Field(None, description="상세페이지", alias="DETAIL_LINK")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="제안자", alias="PROPOSER")
+    MEMBER_LIST: Union[str, int, float, None] = Field(None, description="제안자목록링크", alias="MEMBER_LIST")
+    LAW_PROC_DT: Union[str, int, float, None] = Field(None, description="법사위처리일", alias="LAW_PROC_DT")
+    LAW_PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="법사위처리결과", alias="LAW_PROC_RESULT_CD")
+    RST_MONA_CD: Union[str, int, float, None] = Field(None, description="대표발의자코드", alias="RST_MONA_CD")
+    LAW_PRESENT_DT: Union[str, int, float, None] = Field(None, description="법사위상정일", alias="LAW_PRESENT_DT")
+    LAW_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="법사위회부일", alias="LAW_SUBMIT_DT")
+    CMT_PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="소관위처리결과", alias="CMT_PROC_RESULT_CD")
+    CMT_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위처리일", alias="CMT_PROC_DT")
+    CMT_PRESENT_DT: Union[str, int, float, None] = Field(None, description="소관위상정일", alias="CMT_PRESENT_DT")
+    COMMITTEE_DT: Union[str, int, float, None] = Field(None, description="소관위회부일", alias="COMMITTEE_DT")
+    PROC_DT: Union[str, int, float, None] = Field(None, description="의결일", alias="PROC_DT")
+    COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위원회ID", alias="COMMITTEE_ID")
+    PUBL_MONA_CD: Union[str, int, float, None] = Field(None, description="공동발의자코드", alias="PUBL_MONA_CD")
+    RST_PROPOSER: Union[str, int, float, None] = Field(None, description="대표발의자", alias="RST_PROPOSER")
+    PUBL_PROPOSER: Union[str, int, float, None] = Field(None, description="공동발의자", alias="PUBL_PROPOSER")
+
+class Params_OK7XM1000938DS17215(BaseModel):
+    """Request parameters for OK7XM1000938DS17215"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="법률안명", alias="BILL_NAME")
+    COMMITTEE: str | None = Field(None, description="소관위원회", alias="COMMITTEE")
+    PROC_RESULT: str | None = Field(None, description="본회의심의결과", alias="PROC_RESULT")
+    AGE: str = Field(..., description="대수", alias="AGE")
+    PROPOSER: str | None = Field(None, description="제안자", alias="PROPOSER")
+    COMMITTEE_ID: str | None = Field(None, description="소관위원회ID", alias="COMMITTEE_ID")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OKAPKX000929X915616(BaseModel):
+    """Response model for OKAPKX000929X915616"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SBM: Union[str, int, float, None] = Field(None, description="제출(건)", alias="SBM")
+    DEAL_CN_PSSG: Union[str, int, float, None] = Field(None, description="가결(건)", alias="DEAL_CN_PSSG")
+    DEAL_CN_RJCTN: Union[str, int, float, None] = Field(None, description="부결(건)", alias="DEAL_CN_RJCTN")
+    DEAL_CN_DSU: Union[str, int, float, None] = Field(None, description="폐기(건)", alias="DEAL_CN_DSU")
+    DEAL_CN_WTHD: Union[str, int, float, None] = Field(None, description="철회(건)", alias="DEAL_CN_WTHD")
+    DEAL_CN_GVB: Union[str, int, float, None] = Field(None, description="반려(건)", alias="DEAL_CN_GVB")
+    DEAL_CN_RSVT: Union[str, int, float, None] = Field(None, description="보류(건)", alias="DEAL_CN_RSVT")
+    TERM_EXPR_DSU: Union[str, int, float, None] = Field(None, description="임기만료폐기(건)", alias="TERM_EXPR_DSU")
+
+class Params_OKAPKX000929X915616(BaseModel):
+    """Request parameters for OKAPKX000929X915616"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OKDE3A001150P113085(BaseModel):
+    """Response model for OKDE3A001150P113085"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    DIV: Union[str, int, float, None] = Field(None, description="구분", alias="DIV")
+    NEWELCT: Union[str, int, float, None] = Field(None, description="초선", alias="NEWELCT")
+    TWOTERM: Union[str, int, float, None] = Field(None, description="2선", alias="TWOTERM")
+    THRTERM: Union[str, int, float, None] = Field(None, description="3선", alias="THRTERM")
+    FOURTERM: Union[str, int, float, None] = Field(None, description="4선", alias="FOURTERM")
+    FIVTERM: Union[str, int, float, None] = Field(None, description="5선", alias="FIVTERM")
+    SIXTERM: Union[str, int, float, None] = Field(None, description="6선", alias="SIXTERM")
+    SEVTERM: Union[str, int, float, None] = Field(None, description="7선", alias="SEVTERM")
+    EIGTERM: Union[str, int, float, None] = Field(None, description="8선", alias="EIGTERM")
+    NINTERM: Union[str, int, float, None] = Field(None, description="9선", alias="NINTERM")
+    YEARPECT: Union[str, int, float, None] = Field(None, description="연인원수", alias="YEARPECT")
+
+class Params_OKDE3A001150P113085(BaseModel):
+    """Request parameters for OKDE3A001150P113085"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    DIV: str | None = Field(None, description="구분", alias="DIV")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OLFZV7001148O518934(BaseModel):
+    """Response model for OLFZV7001148O518934"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    GCL_ELEC_DIV: Union[str, int, float, None] = Field(None, description="대별선거구분", alias="GCL_ELEC_DIV")
+    ELEC_DE: Union[str, int, float, None] = Field(None, description="선거일", alias="ELEC_DE")
+    ASBLM_PSNUM: Union[str, int, float, None] = Field(None, description="의원정수", alias="ASBLM_PSNUM")
+    TERM_BG: Union[str, int, float, None] = Field(None, description="임기시작", alias="TERM_BG")
+    TERM_ED: Union[str, int, float, None] = Field(None, description="임기종료", alias="TERM_ED")
+    PROD: Union[str, int, float, None] = Field(None, description="기간", alias="PROD")
+    RMK: Union[str, int, float, None] = Field(None, description="비고", alias="RMK")
+
+class Params_OLFZV7001148O518934(BaseModel):
+    """Request parameters for OLFZV7001148O518934"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    GCL_ELEC_DIV: str | None = Field(None, description="대별선거구분", alias="GCL_ELEC_DIV")
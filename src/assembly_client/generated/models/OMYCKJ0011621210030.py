@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OMYCKJ0011621210030(BaseModel):
+    """Response model for OMYCKJ0011621210030"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER_NM")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="구분", alias="CATEGORY_NM")
+    CREATE_DT: Union[str, int, float, None] = Field(None, description="등록일", alias="CREATE_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+
+class Params_OMYCKJ0011621210030(BaseModel):
+    """Request parameters for OMYCKJ0011621210030"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    CATEGORY_NM: str | None = Field(None, description="구분", alias="CATEGORY_NM")
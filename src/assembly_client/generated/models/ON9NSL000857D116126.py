@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ON9NSL000857D116126(BaseModel):
+    """Response model for ON9NSL000857D116126"""
+    DIV: Union[str, int, float, None] = Field(None, description="구분", alias="DIV")
+    POL_RSC_RPT: Union[str, int, float, None] = Field(None, description="정책연구보고서", alias="POL_RSC_RPT")
+    LEG_INIT: Union[str, int, float, None] = Field(None, description="법안제개정 등 발의", alias="LEG_INIT")
+    SEMINAR: Union[str, int, float, None] = Field(None, description="세미나 공청회등(전시회 포함)", alias="SEMINAR")
+    CONF: Union[str, int, float, None] = Field(None, description="간담회 등(언론보도 포함)", alias="CONF")
+    RESC: Union[str, int, float, None] = Field(None, description="각종조사활동 등", alias="RESC")
+    DIV2: Union[str, int, float, None] = Field(None, description="연도", alias="DIV2")
+
+class Params_ON9NSL000857D116126(BaseModel):
+    """Request parameters for ON9NSL000857D116126"""
+    DIV: str | None = Field(None, description="구분", alias="DIV")
+    POL_RSC_RPT: str | None = Field(None, description="정책연구보고서", alias="POL_RSC_RPT")
+    DIV2: str | None = Field(None, description="연도", alias="DIV2")
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OND1KZ0009677M13515(BaseModel):
+    """Response model for OND1KZ0009677M13515"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    PROC_DT: Union[str, int, float, None] = Field(None, description="처리일", alias="PROC_DT")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="표결결과", alias="PROC_RESULT_CD")
+    BILL_KIND_CD: Union[str, int, float, None] = Field(None, description="의안종류", alias="BILL_KIND_CD")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    MEMBER_TCNT: Union[str, int, float, None] = Field(None, description="재적의원", alias="MEMBER_TCNT")
+    VOTE_TCNT: Union[str, int, float, None] = Field(None, description="총투표수", alias="VOTE_TCNT")
+    YES_TCNT: Union[str, int, float, None] = Field(None, description="찬성", alias="YES_TCNT")
+    NO_TCNT: Union[str, int, float, None] = Field(None, description="반대", alias="NO_TCNT")
+    BLANK_TCNT: Union[str, int, float, None] = Field(None, description="기권", alias="BLANK_TCNT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="의안상세정보 URL", alias="LINK_URL")
+
+class Params_OND1KZ0009677M13515(BaseModel):
+    """Request parameters for OND1KZ0009677M13515"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    PROC_RESULT_CD: str | None = Field(None, description="표결결과", alias="PROC_RESULT_CD")
+    BILL_KIND_CD: str | None = Field(None, description="의안종류", alias="BILL_KIND_CD")
+    AGE: str = Field(..., description="대수", alias="AGE")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ONVQB00009257H12418(BaseModel):
+    """Response model for ONVQB00009257H12418"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    INST_NM: Union[str, int, float, None] = Field(None, description="기관명", alias="INST_NM")
+    BDG_TAMT: Union[str, int, float, None] = Field(None, description="예산총액", alias="BDG_TAMT")
+
+class Params_ONVQB00009257H12418(BaseModel):
+    """Request parameters for ONVQB00009257H12418"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    INST_NM: str | None = Field(None, description="기관명", alias="INST_NM")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OO1X9P001017YF13038(BaseModel):
+    """Response model for OO1X9P001017YF13038"""
+    CONFER_NUM: Union[str, int, float, None] = Field(None, description="회의번호", alias="CONFER_NUM")
+    TITLE: Union[str, int, float, None] = Field(None, description="회의명", alias="TITLE")
+    CLASS_NAME: Union[str, int, float, None] = Field(None, description="회의종류명", alias="CLASS_NAME")
+    DAE_NUM: Union[str, int, float, None] = Field(None, description="대수", alias="DAE_NUM")
+    CONF_DATE: Union[str, int, float, None] = Field(None, description="회의날짜", alias="CONF_DATE")
+    SUB_NAME: Union[str, int, float, None] = Field(None, description="안건명", alias="SUB_NAME")
+    VOD_LINK_URL: Union[str, int, float, None] = Field(None, description="영상회의록 링크", alias="VOD_LINK_URL")
+    CONF_LINK_URL: Union[str, int, float, None] = Field(None, description="요약정보 팝업", alias="CONF_LINK_URL")
+    PDF_LINK_URL: Union[str, int, float, None] = Field(None, description="PDF파일 링크", alias="PDF_LINK_URL")
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+
+class Params_OO1X9P001017YF13038(BaseModel):
+    """Request parameters for OO1X9P001017YF13038"""
+    TITLE: str | None = Field(None, description="회의명", alias="TITLE")
+    CLASS_NAME: str | None = Field(None, description="회의종류명", alias="CLASS_NAME")
+    DAE_NUM: str = Field(..., description="대수", alias="DAE_NUM")
+    CONF_DATE: str = Field(..., description="회의날짜", alias="CONF_DATE")
+    SUB_NUM: str | None = Field(None, description="안건번호", alias="SUB_NUM")
+    SUB_NAME: str | None = Field(None, description="안건명", alias="SUB_NAME")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11415(BaseModel):
+    """Response model for OOWY4R001216HX11415"""
+    SCH_KIND: Union[str, int, float, None] = Field(None, description="일정종류", alias="SCH_KIND")
+    SCH_CN: Union[str, int, float, None] = Field(None, description="일정내용", alias="SCH_CN")
+    SCH_DT: Union[str, int, float, None] = Field(None, description="일자", alias="SCH_DT")
+    SCH_TM: Union[str, int, float, None] = Field(None, description="시간", alias="SCH_TM")
+    CONF_DIV: Union[str, int, float, None] = Field(None, description="회의구분", alias="CONF_DIV")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CONF_SESS: Union[str, int, float, None] = Field(None, description="회의회기", alias="CONF_SESS")
+    CONF_DGR: Union[str, int, float, None] = Field(None, description="회의차수", alias="CONF_DGR")
+
+class Params_OOWY4R001216HX11415(BaseModel):
+    """Request parameters for OOWY4R001216HX11415"""
+    NAAS_CD: str = Field(..., description="국회의원코드", alias="NAAS_CD")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11418(BaseModel):
+    """Response model for OOWY4R001216HX11418"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    RGS_PRSNT_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 상정일", alias="RGS_PRSNT_DT")
+    RGS_RSLN_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 의결일", alias="RGS_RSLN_DT")
+    HWP_DWLD_URL: Union[str, int, float, None] = Field(None, description="PDF 다운 URL", alias="HWP_DWLD_URL")
+    PDF_DWLD_URL: Union[str, int, float, None] = Field(None, description="HWP 다운 URL", alias="PDF_DWLD_URL")
+
+class Params_OOWY4R001216HX11418(BaseModel):
+    """Request parameters for OOWY4R001216HX11418"""
+    BILL_NM: str | None = Field(None, description="의안명", alias="BILL_NM")
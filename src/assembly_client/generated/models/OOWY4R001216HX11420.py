@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11420(BaseModel):
+    """Response model for OOWY4R001216HX11420"""
+    BRDI_TTL: Union[str, int, float, None] = Field(None, description="게시물 제목", alias="BRDI_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11420(BaseModel):
+    """Request parameters for OOWY4R001216HX11420"""
+    BRDI_TTL: str | None = Field(None, description="게시물 제목", alias="BRDI_TTL")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11421(BaseModel):
+    """Response model for OOWY4R001216HX11421"""
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    UNCS_CNT: Union[str, int, float, None] = Field(None, description="위헌 개수", alias="UNCS_CNT")
+    CLAW_MIS_CNT: Union[str, int, float, None] = Field(None, description="헌법 불일치 개수", alias="CLAW_MIS_CNT")
+    OVER_CLAW_MIS_CNT: Union[str, int, float, None] = Field(None, description="헌법 불일치 개정시한 경과 개수", alias="OVER_CLAW_MIS_CNT")
+
+class Params_OOWY4R001216HX11421(BaseModel):
+    """Request parameters for OOWY4R001216HX11421"""
+    pass
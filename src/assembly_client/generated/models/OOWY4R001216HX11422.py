@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11422(BaseModel):
+    """Response model for OOWY4R001216HX11422"""
+    REV_LAW_SITU_TTLL: Union[str, int, float, None] = Field(None, description="개정대상법률현황제목", alias="REV_LAW_SITU_TTLL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일자", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11422(BaseModel):
+    """Request parameters for OOWY4R001216HX11422"""
+    REV_LAW_SITU_TTLL: str | None = Field(None, description="개정대상법률현황제목", alias="REV_LAW_SITU_TTLL")
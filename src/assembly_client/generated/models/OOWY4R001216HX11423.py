@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11423(BaseModel):
+    """Response model for OOWY4R001216HX11423"""
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CONF_NM: Union[str, int, float, None] = Field(None, description="회의명", alias="CONF_NM")
+    LBRD_STAT: Union[str, int, float, None] = Field(None, description="생중계상태", alias="LBRD_STAT")
+
+class Params_OOWY4R001216HX11423(BaseModel):
+    """Request parameters for OOWY4R001216HX11423"""
+    pass
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11424(BaseModel):
+    """Response model for OOWY4R001216HX11424"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    CONF_DT: Union[str, int, float, None] = Field(None, description="회의일자", alias="CONF_DT")
+    CONF_PTM: Union[str, int, float, None] = Field(None, description="회의시간", alias="CONF_PTM")
+    CONF_NM: Union[str, int, float, None] = Field(None, description="회의명", alias="CONF_NM")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11424(BaseModel):
+    """Request parameters for OOWY4R001216HX11424"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    CONF_DT: str | None = Field(None, description="회의일자", alias="CONF_DT")
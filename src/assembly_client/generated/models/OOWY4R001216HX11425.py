@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11425(BaseModel):
+    """Response model for OOWY4R001216HX11425"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    PTT_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="PTT_NO")
+    PTT_TTL: Union[str, int, float, None] = Field(None, description="청원제목", alias="PTT_TTL")
+    PTTR_NM: Union[str, int, float, None] = Field(None, description="청원자명", alias="PTTR_NM")
+    INTD_ASBLM_NM: Union[str, int, float, None] = Field(None, description="소개의원명", alias="INTD_ASBLM_NM")
+    RCP_DT: Union[str, int, float, None] = Field(None, description="접수일자", alias="RCP_DT")
+    JRCMIT_CMMT_DT: Union[str, int, float, None] = Field(None, description="소관위원회회부일", alias="JRCMIT_CMMT_DT")
+    JRCMIT_NM: Union[str, int, float, None] = Field(None, description="소관위원회명", alias="JRCMIT_NM")
+    RSLN_DT: Union[str, int, float, None] = Field(None, description="의결일자", alias="RSLN_DT")
+    RSLN_RSLT: Union[str, int, float, None] = Field(None, description="의결결과", alias="RSLN_RSLT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11425(BaseModel):
+    """Request parameters for OOWY4R001216HX11425"""
+    NAAS_CD: str = Field(..., description="국회의원코드", alias="NAAS_CD")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11429(BaseModel):
+    """Response model for OOWY4R001216HX11429"""
+    ARTC_TTL: Union[str, int, float, None] = Field(None, description="행사제목", alias="ARTC_TTL")
+    AVDV_START_DT: Union[str, int, float, None] = Field(None, description="행사 시작 일자", alias="AVDV_START_DT")
+    AVDV_END_DT: Union[str, int, float, None] = Field(None, description="행사 종료 일자", alias="AVDV_END_DT")
+    PLC_NM: Union[str, int, float, None] = Field(None, description="장소명", alias="PLC_NM")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11429(BaseModel):
+    """Request parameters for OOWY4R001216HX11429"""
+    ARTC_TTL: str | None = Field(None, description="행사제목", alias="ARTC_TTL")
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11430(BaseModel):
+    """Response model for OOWY4R001216HX11430"""
+    PBLM_TTL: Union[str, int, float, None] = Field(None, description="발간물 제목", alias="PBLM_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11430(BaseModel):
+    """Request parameters for OOWY4R001216HX11430"""
+    PBLM_TTL: str | None = Field(None, description="발간물 제목", alias="PBLM_TTL")
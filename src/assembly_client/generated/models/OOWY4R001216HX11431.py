@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11431(BaseModel):
+    """Response model for OOWY4R001216HX11431"""
+    SCH_DT: Union[str, int, float, None] = Field(None, description="일자", alias="SCH_DT")
+    SCH_TM: Union[str, int, float, None] = Field(None, description="시간", alias="SCH_TM")
+    CHM_DIV: Union[str, int, float, None] = Field(None, description="의장단구분(의장, 부의장 구분)", alias="CHM_DIV")
+    SCH_CN: Union[str, int, float, None] = Field(None, description="일정내용", alias="SCH_CN")
+
+class Params_OOWY4R001216HX11431(BaseModel):
+    """Request parameters for OOWY4R001216HX11431"""
+    SCH_DT: str | None = Field(None, description="일자", alias="SCH_DT")
+    CHM_DIV: str | None = Field(None, description="의장단구분(의장, 부의장 구분)", alias="CHM_DIV")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11432(BaseModel):
+    """Response model for OOWY4R001216HX11432"""
+    PBLM_TTL: Union[str, int, float, None] = Field(None, description="발간물 제목", alias="PBLM_TTL")
+    WRT_DEPT: Union[str, int, float, None] = Field(None, description="작성부서", alias="WRT_DEPT")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11432(BaseModel):
+    """Request parameters for OOWY4R001216HX11432"""
+    PBLM_TTL: str | None = Field(None, description="발간물 제목", alias="PBLM_TTL")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11434(BaseModel):
+    """Response model for OOWY4R001216HX11434"""
+    CHM_DIV: Union[str, int, float, None] = Field(None, description="의장단구분 (의장, 부의장 구분)", alias="CHM_DIV")
+    ARTC_TTL: Union[str, int, float, None] = Field(None, description="보도자료 제목", alias="ARTC_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일자", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11434(BaseModel):
+    """Request parameters for OOWY4R001216HX11434"""
+    CHM_DIV: str | None = Field(None, description="의장단구분 (의장, 부의장 구분)", alias="CHM_DIV")
+    ARTC_TTL: str | None = Field(None, description="보도자료 제목", alias="ARTC_TTL")
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11436(BaseModel):
+    """Response model for OOWY4R001216HX11436"""
+    DPLM_WORD: Union[str, int, float, None] = Field(None, description="의회외교 단어", alias="DPLM_WORD")
+    DPLM_WORD_EN: Union[str, int, float, None] = Field(None, description="의회외교 영문단어", alias="DPLM_WORD_EN")
+
+class Params_OOWY4R001216HX11436(BaseModel):
+    """Request parameters for OOWY4R001216HX11436"""
+    DPLM_WORD: str | None = Field(None, description="의회외교 단어", alias="DPLM_WORD")
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11438(BaseModel):
+    """Response model for OOWY4R001216HX11438"""
+    DPLM_TRD_TTL: Union[str, int, float, None] = Field(None, description="의회외교 동향 제목", alias="DPLM_TRD_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일자", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11438(BaseModel):
+    """Request parameters for OOWY4R001216HX11438"""
+    DPLM_TRD_TTL: str | None = Field(None, description="의회외교 동향 제목", alias="DPLM_TRD_TTL")
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11439(BaseModel):
+    """Response model for OOWY4R001216HX11439"""
+    NAAS_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="NAAS_CD")
+    NAAS_NM: Union[str, int, float, None] = Field(None, description="국회의원명", alias="NAAS_NM")
+    NAAS_CH_NM: Union[str, int, float, None] = Field(None, description="국회의원한자명", alias="NAAS_CH_NM")
+    NAAS_EN_NM: Union[str, int, float, None] = Field(None, description="국회의원영문명", alias="NAAS_EN_NM")
+    BIRDY_DIV_CD: Union[str, int, float, None] = Field(None, description="생일구분코드", alias="BIRDY_DIV_CD")
+    BIRDY_DT: Union[str, int, float, None] = Field(None, description="생일일자", alias="BIRDY_DT")
+    DTY_NM: Union[str, int, float, None] = Field(None, description="직책명", alias="DTY_NM")
+    PLPT_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="PLPT_NM")
+    ELECD_NM: Union[str, int, float, None] = Field(None, description="선거구명", alias="ELECD_NM")
+    ELECD_DIV_NM: Union[str, int, float, None] = Field(None, description="선거구구분명", alias="ELECD_DIV_NM")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    BLNG_CMIT_NM: Union[str, int, float, None] = Field(None, description="소속위원회명", alias="BLNG_CMIT_NM")
+    RLCT_DIV_NM: Union[str, int, float, None] = Field(None, description="재선구분명", alias="RLCT_DIV_NM")
+    GTELT_ERACO: Union[str, int, float, None] = Field(None, description="당선대수", alias="GTELT_ERACO")
+    NTR_DIV: Union[str, int, float, None] = Field(None, description="성별", alias="NTR_DIV")
+    NAAS_TEL_NO: Union[str, int, float, None] = Field(None, description="전화번호", alias="NAAS_TEL_NO")
+    NAAS_EMAIL_ADDR: Union[str, int, float, None] = Field(None, description="국회의원이메일주소", alias="NAAS_EMAIL_ADDR")
+    NAAS_HP_URL: Union[str, int, float, None] = Field(None, description="국회의원홈페이지URL", alias="NAAS_HP_URL")
+    AIDE_NM: Union[str, int, float, None] = Field(None, description="보좌관", alias="AIDE_NM")
+    CHF_SCRT_NM: Union[str, int, float, None] = Field(None, description="비서관", alias="CHF_SCRT_NM")
+    SCRT_NM: Union[str, int, float, None] = Field(None, description="비서", alias="SCRT_NM")
+    BRF_HST: Union[str, int, float, None] = Field(None, description="약력", alias="BRF_HST")
+    OFFM_RNUM_NO: Union[str, int, float, None] = Field(None, description="사무실 호실", alias="OFFM_RNUM_NO")
+    NAAS_PIC: Union[str, int, float, None] = Field(None, description="국회의원사진", alias="NAAS_PIC")
+
+class Params_OOWY4R001216HX11439(BaseModel):
+    """Request parameters for OOWY4R001216HX11439"""
+    NAAS_CD: str | None = Field(None, description="국회의원코드", alias="NAAS_CD")
+    NAAS_NM: str | None = Field(None, description="국회의원명", alias="NAAS_NM")
+    PLPT_NM: str | None = Field(None, description="정당명", alias="PLPT_NM")
+    BLNG_CMIT_NM: str | None = Field(None, description="소속위원회명", alias="BLNG_CMIT_NM")
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11440(BaseModel):
+    """Response model for OOWY4R001216HX11440"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_KND: Union[str, int, float, None] = Field(None, description="의안종류", alias="BILL_KND")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PPSR_KND")
+    PPSR_NM: Union[str, int, float, None] = Field(None, description="제안자명", alias="PPSR_NM")
+    PPSL_SESS: Union[str, int, float, None] = Field(None, description="제안회기", alias="PPSL_SESS")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    JRCMIT_NM: Union[str, int, float, None] = Field(None, description="소관위원회명", alias="JRCMIT_NM")
+    JRCMIT_CMMT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 회부일", alias="JRCMIT_CMMT_DT")
+    JRCMIT_PRSNT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 상정일", alias="JRCMIT_PRSNT_DT")
+    JRCMIT_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위원회 처리일", alias="JRCMIT_PROC_DT")
+    JRCMIT_PROC_RSLT: Union[str, int, float, None] = Field(None, description="소관위원회 처리결과", alias="JRCMIT_PROC_RSLT")
+    LAW_CMMT_DT: Union[str, int, float, None] = Field(None, description="법사위 체계자구심사 회부일", alias="LAW_CMMT_DT")
+    LAW_PRSNT_DT: Union[str, int, float, None] = Field(None, description="법사위 체계자구심사 상정일", alias="LAW_PRSNT_DT")
+    LAW_PROC_DT: Union[str, int, float, None] = Field(None, description="법사위 체계자구심사 처리일", alias="LAW_PROC_DT")
+    LAW_PROC_RSLT: Union[str, int, float, None] = Field(None, description="법사위 체계자구심사 처리결과", alias="LAW_PROC_RSLT")
+    RGS_PRSNT_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 상정일", alias="RGS_PRSNT_DT")
+    RGS_RSLN_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 의결일", alias="RGS_RSLN_DT")
+    RGS_CONF_NM: Union[str, int, float, None] = Field(None, description="본회의 심의 회의명", alias="RGS_CONF_NM")
+    RGS_CONF_RSLT: Union[str, int, float, None] = Field(None, description="본회의 심의결과", alias="RGS_CONF_RSLT")
+    GVRN_TRSF_DT: Union[str, int, float, None] = Field(None, description="정부 이송일", alias="GVRN_TRSF_DT")
+    PROM_LAW_NM: Union[str, int, float, None] = Field(None, description="공포 법률명", alias="PROM_LAW_NM")
+    PROM_DT: Union[str, int, float, None] = Field(None, description="공포일", alias="PROM_DT")
+    PROM_NO: Union[str, int, float, None] = Field(None, description="공포번호", alias="PROM_NO")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11440(BaseModel):
+    """Request parameters for OOWY4R001216HX11440"""
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: str = Field(..., description="의안번호", alias="BILL_NO")
+    BILL_KND: str | None = Field(None, description="의안종류", alias="BILL_KND")
+    BILL_NM: str | None = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KND: str | None = Field(None, description="제안자구분", alias="PPSR_KND")
+    PPSL_DT: str | None = Field(None, description="제안일", alias="PPSL_DT")
+    JRCMIT_NM: str | None = Field(None, description="소관위원회명", alias="JRCMIT_NM")
+    RGS_CONF_RSLT: str | None = Field(None, description="본회의 심의결과", alias="RGS_CONF_RSLT")
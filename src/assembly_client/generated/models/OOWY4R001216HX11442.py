@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11442(BaseModel):
+    """Response model for OOWY4R001216HX11442"""
+    FR_LAW_REV_TTL: Union[str, int, float, None] = Field(None, description="해외주요법률 제개정 제목", alias="FR_LAW_REV_TTL")
+    WRT_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRT_NM")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일자", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11442(BaseModel):
+    """Request parameters for OOWY4R001216HX11442"""
+    FR_LAW_REV_TTL: str | None = Field(None, description="해외주요법률 제개정 제목", alias="FR_LAW_REV_TTL")
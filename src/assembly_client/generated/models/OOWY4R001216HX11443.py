@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11443(BaseModel):
+    """Response model for OOWY4R001216HX11443"""
+    MTR_DIV: Union[str, int, float, None] = Field(None, description="발간자료구분", alias="MTR_DIV")
+    MTR_TTL: Union[str, int, float, None] = Field(None, description="발간자료제목", alias="MTR_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11443(BaseModel):
+    """Request parameters for OOWY4R001216HX11443"""
+    MTR_DIV: str | None = Field(None, description="발간자료구분", alias="MTR_DIV")
+    MTR_TTL: str | None = Field(None, description="발간자료제목", alias="MTR_TTL")
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11444(BaseModel):
+    """Response model for OOWY4R001216HX11444"""
+    MN_ACTV_TTL: Union[str, int, float, None] = Field(None, description="주요동정 제목", alias="MN_ACTV_TTL")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일자", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11444(BaseModel):
+    """Request parameters for OOWY4R001216HX11444"""
+    MN_ACTV_TTL: str | None = Field(None, description="주요동정 제목", alias="MN_ACTV_TTL")
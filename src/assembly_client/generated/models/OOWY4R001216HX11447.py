@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11447(BaseModel):
+    """Response model for OOWY4R001216HX11447"""
+    NAAS_EN_NM: Union[str, int, float, None] = Field(None, description="국회의원 영문명", alias="NAAS_EN_NM")
+    NTR_DIV: Union[str, int, float, None] = Field(None, description="성별", alias="NTR_DIV")
+    BTH_GBN_NM: Union[str, int, float, None] = Field(None, description="생일구분코드", alias="BTH_GBN_NM")
+    BIRDY_DT: Union[str, int, float, None] = Field(None, description="생일일자", alias="BIRDY_DT")
+    PLPT_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="PLPT_NM")
+    ELECD_NM: Union[str, int, float, None] = Field(None, description="선거구명", alias="ELECD_NM")
+    ELECD_DIV_NM: Union[str, int, float, None] = Field(None, description="선거구구분명", alias="ELECD_DIV_NM")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CMIT_DTY_NM: Union[str, int, float, None] = Field(None, description="위원회 직책명", alias="CMIT_DTY_NM")
+    BLNG_CMIT_NM: Union[str, int, float, None] = Field(None, description="소속위원회명", alias="BLNG_CMIT_NM")
+    RLCT_DIV_NM: Union[str, int, float, None] = Field(None, description="재선구분명", alias="RLCT_DIV_NM")
+    GTELT_TMS: Union[str, int, float, None] = Field(None, description="당선횟수", alias="GTELT_TMS")
+    NAAS_TEL_NO: Union[str, int, float, None] = Field(None, description="국회의원전화번호", alias="NAAS_TEL_NO")
+    NAAS_EMAIL_ADDR: Union[str, int, float, None] = Field(None, description="국회의원이메일주소", alias="NAAS_EMAIL_ADDR")
+    NAAS_HP_URL: Union[str, int, float, None] = Field(None, description="국회의원홈페이지URL", alias="NAAS_HP_URL")
+
+class Params_OOWY4R001216HX11447(BaseModel):
+    """Request parameters for OOWY4R001216HX11447"""
+    NAAS_EN_NM: str | None = Field(None, description="국회의원 영문명", alias="NAAS_EN_NM")
+    NAAS_CD: str | None = Field(None, description="국회의원 코드", alias="NAAS_CD")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11449(BaseModel):
+    """Response model for OOWY4R001216HX11449"""
+    CMIT_DIV_CD: Union[str, int, float, None] = Field(None, description="위원회구분코드", alias="CMIT_DIV_CD")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CRMN_NM: Union[str, int, float, None] = Field(None, description="위원장명", alias="CRMN_NM")
+    CMTM_PSNUM: Union[str, int, float, None] = Field(None, description="위원회 의원정수", alias="CMTM_PSNUM")
+    CMTM_CNT: Union[str, int, float, None] = Field(None, description="현위원수", alias="CMTM_CNT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11449(BaseModel):
+    """Request parameters for OOWY4R001216HX11449"""
+    CMIT_DIV_CD: str | None = Field(None, description="위원회구분코드", alias="CMIT_DIV_CD")
+    CMIT_NM: str | None = Field(None, description="위원회명", alias="CMIT_NM")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11450(BaseModel):
+    """Response model for OOWY4R001216HX11450"""
+    MTR_DIV: Union[str, int, float, None] = Field(None, description="발간자료구분", alias="MTR_DIV")
+    MTR_TTL: Union[str, int, float, None] = Field(None, description="발간자료제목", alias="MTR_TTL")
+    PUBLCO_NM: Union[str, int, float, None] = Field(None, description="출판사", alias="PUBLCO_NM")
+    PUBLCO_YEAR: Union[str, int, float, None] = Field(None, description="출판년도", alias="PUBLCO_YEAR")
+    AUT_NM: Union[str, int, float, None] = Field(None, description="담당자", alias="AUT_NM")
+    FRUM_PANL_NM: Union[str, int, float, None] = Field(None, description="미래포럼 패널", alias="FRUM_PANL_NM")
+    FRUM_OPB_DT: Union[str, int, float, None] = Field(None, description="미래포럼 개최일", alias="FRUM_OPB_DT")
+    WRT_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="WRT_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11450(BaseModel):
+    """Request parameters for OOWY4R001216HX11450"""
+    MTR_DIV: str | None = Field(None, description="발간자료구분", alias="MTR_DIV")
+    MTR_TTL: str | None = Field(None, description="발간자료제목", alias="MTR_TTL")
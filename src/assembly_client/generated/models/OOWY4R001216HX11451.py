@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11451(BaseModel):
+    """Response model for OOWY4R001216HX11451"""
+    CONF_SCH_DIV: Union[str, int, float, None] = Field(None, description="회의일정 구분", alias="CONF_SCH_DIV")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    SCH_DT: Union[str, int, float, None] = Field(None, description="일자", alias="SCH_DT")
+    SCH_TM: Union[str, int, float, None] = Field(None, description="시간", alias="SCH_TM")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+
+class Params_OOWY4R001216HX11451(BaseModel):
+    """Request parameters for OOWY4R001216HX11451"""
+    CONF_SCH_DIV: str | None = Field(None, description="회의일정 구분", alias="CONF_SCH_DIV")
+    SCH_DT: str | None = Field(None, description="일자", alias="SCH_DT")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11458(BaseModel):
+    """Response model for OOWY4R001216HX11458"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_KIND: Union[str, int, float, None] = Field(None, description="의안 종류", alias="BILL_KIND")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KIND: Union[str, int, float, None] = Field(None, description="제안자 구분", alias="PPSR_KIND")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    PROC_RSLT: Union[str, int, float, None] = Field(None, description="처리결과", alias="PROC_RSLT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11458(BaseModel):
+    """Request parameters for OOWY4R001216HX11458"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
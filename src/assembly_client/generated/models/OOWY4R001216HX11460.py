@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11460(BaseModel):
+    """Response model for OOWY4R001216HX11460"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    PPSR_KIND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PPSR_KIND")
+    PPSR_CN: Union[str, int, float, None] = Field(None, description="제안자설명", alias="PPSR_CN")
+    PPSR_POLY_NM: Union[str, int, float, None] = Field(None, description="제안자정당명", alias="PPSR_POLY_NM")
+    PPSR_NM: Union[str, int, float, None] = Field(None, description="제안자명", alias="PPSR_NM")
+    PPSR_CH_NM: Union[str, int, float, None] = Field(None, description="제안자한자명", alias="PPSR_CH_NM")
+    REP_DIV: Union[str, int, float, None] = Field(None, description="대표발의 구분", alias="REP_DIV")
+
+class Params_OOWY4R001216HX11460(BaseModel):
+    """Request parameters for OOWY4R001216HX11460"""
+    BILL_ID: str = Field(..., description="의안ID", alias="BILL_ID")
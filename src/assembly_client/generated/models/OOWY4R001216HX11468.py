@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11468(BaseModel):
+    """Response model for OOWY4R001216HX11468"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KIND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PPSR_KIND")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    BDG_CMIT_NM: Union[str, int, float, None] = Field(None, description="예결위심사 위원회명", alias="BDG_CMIT_NM")
+    BDG_CMMT_DT: Union[str, int, float, None] = Field(None, description="예결위심사 회부일", alias="BDG_CMMT_DT")
+    BDG_PRSNT_DT: Union[str, int, float, None] = Field(None, description="예결위심사 상정일", alias="BDG_PRSNT_DT")
+    BDG_RSLN_DT: Union[str, int, float, None] = Field(None, description="예결위심사 의결일", alias="BDG_RSLN_DT")
+    BDG_PROC_RSLT: Union[str, int, float, None] = Field(None, description="예결위심사 처리결과", alias="BDG_PROC_RSLT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11468(BaseModel):
+    """Request parameters for OOWY4R001216HX11468"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11470(BaseModel):
+    """Response model for OOWY4R001216HX11470"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    SESS_BG_DT: Union[str, int, float, None] = Field(None, description="회기시작일", alias="SESS_BG_DT")
+    SESS_ED_DT: Union[str, int, float, None] = Field(None, description="회기종료일", alias="SESS_ED_DT")
+
+class Params_OOWY4R001216HX11470(BaseModel):
+    """Request parameters for OOWY4R001216HX11470"""
+    pass
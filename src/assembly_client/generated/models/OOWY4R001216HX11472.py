@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11472(BaseModel):
+    """Response model for OOWY4R001216HX11472"""
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    RCP_CNT: Union[str, int, float, None] = Field(None, description="접수건수", alias="RCP_CNT")
+    PROC_CNT: Union[str, int, float, None] = Field(None, description="처리건수", alias="PROC_CNT")
+    RSVT_CNT: Union[str, int, float, None] = Field(None, description="보류건수", alias="RSVT_CNT")
+
+class Params_OOWY4R001216HX11472(BaseModel):
+    """Request parameters for OOWY4R001216HX11472"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
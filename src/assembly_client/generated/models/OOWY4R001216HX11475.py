@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11475(BaseModel):
+    """Response model for OOWY4R001216HX11475"""
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    RCP_CNT: Union[str, int, float, None] = Field(None, description="헌법개정안건수", alias="RCP_CNT")
+    PROC_CNT: Union[str, int, float, None] = Field(None, description="예산안건수", alias="PROC_CNT")
+    REFT_SUBT: Union[str, int, float, None] = Field(None, description="동의안건수", alias="REFT_SUBT")
+    OBIL_PSSG_CNT: Union[str, int, float, None] = Field(None, description="결산건수", alias="OBIL_PSSG_CNT")
+    AMND_PSSG_CNT: Union[str, int, float, None] = Field(None, description="법률안의원발의건수", alias="AMND_PSSG_CNT")
+    ALTPL_REFT_CNT: Union[str, int, float, None] = Field(None, description="법률안정부발의건수", alias="ALTPL_REFT_CNT")
+    AMND_REFT_CNT: Union[str, int, float, None] = Field(None, description="법률안합계", alias="AMND_REFT_CNT")
+    UN_REFT_SUBT: Union[str, int, float, None] = Field(None, description="의원징계건수", alias="UN_REFT_SUBT")
+    RJCTN_CNT: Union[str, int, float, None] = Field(None, description="결의안건수", alias="RJCTN_CNT")
+    DSU_CNT: Union[str, int, float, None] = Field(None, description="건의안건수", alias="DSU_CNT")
+    WTHD_CNT: Union[str, int, float, None] = Field(None, description="규칙안건수", alias="WTHD_CNT")
+    GVB_CNT: Union[str, int, float, None] = Field(None, description="선출안건수", alias="GVB_CNT")
+    ETC_CNT: Union[str, int, float, None] = Field(None, description="중요동의건수", alias="ETC_CNT")
+    RSVT_CNT: Union[str, int, float, None] = Field(None, description="의원자격심사건수", alias="RSVT_CNT")
+
+class Params_OOWY4R001216HX11475(BaseModel):
+    """Request parameters for OOWY4R001216HX11475"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11477(BaseModel):
+    """Response model for OOWY4R001216HX11477"""
+    PRPSR_DIV_NM: Union[str, int, float, None] = Field(None, description="발의자구분명", alias="PRPSR_DIV_NM")
+    RCP_CNT: Union[str, int, float, None] = Field(None, description="접수건수", alias="RCP_CNT")
+    PROC_CNT: Union[str, int, float, None] = Field(None, description="처리건수", alias="PROC_CNT")
+    REFT_SUBT: Union[str, int, float, None] = Field(None, description="반영소계", alias="REFT_SUBT")
+    OBIL_PSSG_CNT: Union[str, int, float, None] = Field(None, description="원안가결건수", alias="OBIL_PSSG_CNT")
+    AMND_PSSG_CNT: Union[str, int, float, None] = Field(None, description="수정안가결건수", alias="AMND_PSSG_CNT")
+    ALTPL_REFT_CNT: Union[str, int, float, None] = Field(None, description="대안반영건수", alias="ALTPL_REFT_CNT")
+    AMND_REFT_CNT: Union[str, int, float, None] = Field(None, description="수정안반영건수", alias="AMND_REFT_CNT")
+    UN_REFT_SUBT: Union[str, int, float, None] = Field(None, description="미반영소계", alias="UN_REFT_SUBT")
+    RJCTN_CNT: Union[str, int, float, None] = Field(None, description="부결건수", alias="RJCTN_CNT")
+    DSU_CNT: Union[str, int, float, None] = Field(None, description="폐기건수", alias="DSU_CNT")
+    WTHD_CNT: Union[str, int, float, None] = Field(None, description="철회건수", alias="WTHD_CNT")
+    GVB_CNT: Union[str, int, float, None] = Field(None, description="반려건수", alias="GVB_CNT")
+    ETC_CNT: Union[str, int, float, None] = Field(None, description="기타건수", alias="ETC_CNT")
+    RSVT_CNT: Union[str, int, float, None] = Field(None, description="보류건수", alias="RSVT_CNT")
+
+class Params_OOWY4R001216HX11477(BaseModel):
+    """Request parameters for OOWY4R001216HX11477"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
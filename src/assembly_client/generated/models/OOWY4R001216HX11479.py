@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11479(BaseModel):
+    """Response model for OOWY4R001216HX11479"""
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CONSTI_RFBIL_CNT: Union[str, int, float, None] = Field(None, description="헌법개정안건수", alias="CONSTI_RFBIL_CNT")
+    DRFBD_CNT: Union[str, int, float, None] = Field(None, description="예산안건수", alias="DRFBD_CNT")
+    STL_CNT: Union[str, int, float, None] = Field(None, description="결산건수", alias="STL_CNT")
+    LGSLB_ASBLM_PRPSR_CNT: Union[str, int, float, None] = Field(None, description="법률안의원발의건수", alias="LGSLB_ASBLM_PRPSR_CNT")
+    LGSLB_GVRN_PRPSR_CNT: Union[str, int, float, None] = Field(None, description="법률안정부발의건수", alias="LGSLB_GVRN_PRPSR_CNT")
+    LGSLB_SUM: Union[str, int, float, None] = Field(None, description="법률안합계", alias="LGSLB_SUM")
+    AGMB_CNT: Union[str, int, float, None] = Field(None, description="동의안건수", alias="AGMB_CNT")
+    RSLNB_CNT: Union[str, int, float, None] = Field(None, description="결의안건수", alias="RSLNB_CNT")
+    PRPSTB_CNT: Union[str, int, float, None] = Field(None, description="건의안건수", alias="PRPSTB_CNT")
+    RULB_CNT: Union[str, int, float, None] = Field(None, description="규칙안 건수", alias="RULB_CNT")
+    ELCTB_CNT: Union[str, int, float, None] = Field(None, description="선출안 건수", alias="ELCTB_CNT")
+    IMPT_AGM_CNT: Union[str, int, float, None] = Field(None, description="중요동의 건수", alias="IMPT_AGM_CNT")
+    CMTM_DSCP_CNT: Union[str, int, float, None] = Field(None, description="의원징계 건수", alias="CMTM_DSCP_CNT")
+    CMTM_QLF_INSC_CNT: Union[str, int, float, None] = Field(None, description="의원자격심사 건수", alias="CMTM_QLF_INSC_CNT")
+    ETC_CNT: Union[str, int, float, None] = Field(None, description="기타건수", alias="ETC_CNT")
+    CMIT_BY_SUM: Union[str, int, float, None] = Field(None, description="위원회별합계", alias="CMIT_BY_SUM")
+
+class Params_OOWY4R001216HX11479(BaseModel):
+    """Request parameters for OOWY4R001216HX11479"""
+    pass
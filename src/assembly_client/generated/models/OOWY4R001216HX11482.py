@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11482(BaseModel):
+    """Response model for OOWY4R001216HX11482"""
+    CITZN_AGM_CNT: Union[str, int, float, None] = Field(None, description="국민동의건수", alias="CITZN_AGM_CNT")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+    INTD_ASBLM_NM: Union[str, int, float, None] = Field(None, description="소개의원명", alias="INTD_ASBLM_NM")
+    RCP_DT: Union[str, int, float, None] = Field(None, description="접수일", alias="RCP_DT")
+    PTT_ID: Union[str, int, float, None] = Field(None, description="청원ID", alias="PTT_ID")
+    PTT_NM: Union[str, int, float, None] = Field(None, description="청원명", alias="PTT_NM")
+    PTT_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="PTT_NO")
+    PTTR_NM: Union[str, int, float, None] = Field(None, description="청원자명", alias="PTTR_NM")
+    PTT_KIND: Union[str, int, float, None] = Field(None, description="청원종류", alias="PTT_KIND")
+
+class Params_OOWY4R001216HX11482(BaseModel):
+    """Request parameters for OOWY4R001216HX11482"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11486(BaseModel):
+    """Response model for OOWY4R001216HX11486"""
+    PTT_ID: Union[str, int, float, None] = Field(None, description="청원ID", alias="PTT_ID")
+    PTT_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="PTT_NO")
+    PTTR_NM: Union[str, int, float, None] = Field(None, description="청원자명", alias="PTTR_NM")
+    REP_DIV: Union[str, int, float, None] = Field(None, description="대표구분", alias="REP_DIV")
+    INTD_ASBLM_NM: Union[str, int, float, None] = Field(None, description="소개의원명", alias="INTD_ASBLM_NM")
+
+class Params_OOWY4R001216HX11486(BaseModel):
+    """Request parameters for OOWY4R001216HX11486"""
+    PTT_ID: str = Field(..., description="청원ID", alias="PTT_ID")
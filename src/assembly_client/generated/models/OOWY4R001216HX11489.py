@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11489(BaseModel):
+    """Response model for OOWY4R001216HX11489"""
+    PTT_ID: Union[str, int, float, None] = Field(None, description="청원ID", alias="PTT_ID")
+    PTT_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="PTT_NO")
+    PTT_NM: Union[str, int, float, None] = Field(None, description="청원명", alias="PTT_NM")
+    PTT_KIND: Union[str, int, float, None] = Field(None, description="청원종류", alias="PTT_KIND")
+    PTTR_NM: Union[str, int, float, None] = Field(None, description="청원자명", alias="PTTR_NM")
+    INTD_ASBLM_NM: Union[str, int, float, None] = Field(None, description="소개의원명", alias="INTD_ASBLM_NM")
+    CITZN_AGM_CNT: Union[str, int, float, None] = Field(None, description="국민동의건수", alias="CITZN_AGM_CNT")
+    RCP_DT: Union[str, int, float, None] = Field(None, description="접수일", alias="RCP_DT")
+    JRCMIT_NM: Union[str, int, float, None] = Field(None, description="소관위원회명", alias="JRCMIT_NM")
+    JRCMIT_CMMT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 회부일", alias="JRCMIT_CMMT_DT")
+    JRCMIT_PRSNT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 상정일", alias="JRCMIT_PRSNT_DT")
+    JRCMIT_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위원회 처리일", alias="JRCMIT_PROC_DT")
+    JRCMIT_PROC_RSLT: Union[str, int, float, None] = Field(None, description="소관위원회 처리결과", alias="JRCMIT_PROC_RSLT")
+    RGS_PRSNT_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 상정일", alias="RGS_PRSNT_DT")
+    RGS_RSLN_DT: Union[str, int, float, None] = Field(None, description="본회의 심의 의결일", alias="RGS_RSLN_DT")
+    RGS_CONF_NM: Union[str, int, float, None] = Field(None, description="본회의 심의 회의명", alias="RGS_CONF_NM")
+    RGS_CONF_RSLT: Union[str, int, float, None] = Field(None, description="본회의 심의결과", alias="RGS_CONF_RSLT")
+    GVRN_TRSF_DT: Union[str, int, float, None] = Field(None, description="정부 이송일", alias="GVRN_TRSF_DT")
+    GVRN_OC_NM: Union[str, int, float, None] = Field(None, description="정부 부처명", alias="GVRN_OC_NM")
+    GVRN_RSLT_DT: Union[str, int, float, None] = Field(None, description="정부처리결과 보고일", alias="GVRN_RSLT_DT")
+    PROC_NTC_DT: Union[str, int, float, None] = Field(None, description="처리 통지일", alias="PROC_NTC_DT")
+    ACHV_RATIO: Union[str, int, float, None] = Field(None, description="달성도", alias="ACHV_RATIO")
+
+class Params_OOWY4R001216HX11489(BaseModel):
+    """Request parameters for OOWY4R001216HX11489"""
+    PTT_ID: str = Field(..., description="청원ID", alias="PTT_ID")
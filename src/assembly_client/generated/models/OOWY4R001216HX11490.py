@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11490(BaseModel):
+    """Response model for OOWY4R001216HX11490"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    PTT_ID: Union[str, int, float, None] = Field(None, description="청원ID", alias="PTT_ID")
+    PTT_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="PTT_NO")
+    PTT_NM: Union[str, int, float, None] = Field(None, description="청원명", alias="PTT_NM")
+    PTT_KIND: Union[str, int, float, None] = Field(None, description="청원종류", alias="PTT_KIND")
+    PTTR_NM: Union[str, int, float, None] = Field(None, description="청원자명", alias="PTTR_NM")
+    INTD_ASBLM_NM: Union[str, int, float, None] = Field(None, description="소개의원명", alias="INTD_ASBLM_NM")
+    CITZN_AGM_CNT: Union[str, int, float, None] = Field(None, description="국민동의건수", alias="CITZN_AGM_CNT")
+    RCP_DT: Union[str, int, float, None] = Field(None, description="접수일", alias="RCP_DT")
+    JRCMIT_NM: Union[str, int, float, None] = Field(None, description="소관위원회명", alias="JRCMIT_NM")
+    JRCMIT_CMMT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 회부일", alias="JRCMIT_CMMT_DT")
+    JRCMIT_PRSNT_DT: Union[str, int, float, None] = Field(None, description="소관위원회 상정일", alias="JRCMIT_PRSNT_DT")
+    JRCMIT_PROC_DT: Union[str, int, float, None] = Field(None, description="소관위원회 처리일", alias="JRCMIT_PROC_DT")
+    JRCMIT_PROC_RSLT: Union[str, int, float, None] = Field(None, description="소관위원회 처리결과", alias="JRCMIT_PROC_RSLT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11490(BaseModel):
+    """Request parameters for OOWY4R001216HX11490"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
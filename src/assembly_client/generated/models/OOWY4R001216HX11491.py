@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11491(BaseModel):
+    """Response model for OOWY4R001216HX11491"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    RPT_TTL: Union[str, int, float, None] = Field(None, description="보고서제목명", alias="RPT_TTL")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    SBM_INST_NM: Union[str, int, float, None] = Field(None, description="제출기관명", alias="SBM_INST_NM")
+    RCP_DT: Union[str, int, float, None] = Field(None, description="접수일", alias="RCP_DT")
+    TRSF_DT: Union[str, int, float, None] = Field(None, description="이송일", alias="TRSF_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11491(BaseModel):
+    """Request parameters for OOWY4R001216HX11491"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    CMIT_NM: str | None = Field(None, description="위원회명", alias="CMIT_NM")
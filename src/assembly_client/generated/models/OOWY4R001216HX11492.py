@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11492(BaseModel):
+    """Response model for OOWY4R001216HX11492"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR: Union[str, int, float, None] = Field(None, description="제안자", alias="PPSR")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    JRCMIT_CONF_NM: Union[str, int, float, None] = Field(None, description="소관위원회 심사 회의명", alias="JRCMIT_CONF_NM")
+    JRCMIT_CONF_DT: Union[str, int, float, None] = Field(None, description="소관위원회 심사 회의일", alias="JRCMIT_CONF_DT")
+    JRCMIT_CONF_RSLT: Union[str, int, float, None] = Field(None, description="소관위원회 심사 회의결과", alias="JRCMIT_CONF_RSLT")
+
+class Params_OOWY4R001216HX11492(BaseModel):
+    """Request parameters for OOWY4R001216HX11492"""
+    BILL_ID: str = Field(..., description="의안ID", alias="BILL_ID")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11494(BaseModel):
+    """Response model for OOWY4R001216HX11494"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KIND: Union[str, int, float, None] = Field(None, description="제안자구분", alias="PPSR_KIND")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    ADCMIT_NM: Union[str, int, float, None] = Field(None, description="예비심사 위원회명", alias="ADCMIT_NM")
+    ADCMIT_CMMT_DT: Union[str, int, float, None] = Field(None, description="예비심사 회부일", alias="ADCMIT_CMMT_DT")
+    ADCMIT_PRSNT_DT: Union[str, int, float, None] = Field(None, description="예비심사 상정일", alias="ADCMIT_PRSNT_DT")
+    ADCMIT_PROC_DT: Union[str, int, float, None] = Field(None, description="예비심사 의결일", alias="ADCMIT_PROC_DT")
+    ADCMIT_PROC_RSLT: Union[str, int, float, None] = Field(None, description="예비심사 결과", alias="ADCMIT_PROC_RSLT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11494(BaseModel):
+    """Request parameters for OOWY4R001216HX11494"""
+    BILL_ID: str = Field(..., description="의안ID", alias="BILL_ID")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11495(BaseModel):
+    """Response model for OOWY4R001216HX11495"""
+    BDG_CONF_RSLT: Union[str, int, float, None] = Field(None, description="종합심사 회의결과", alias="BDG_CONF_RSLT")
+    BDG_CONF_DT: Union[str, int, float, None] = Field(None, description="종합심사 회의일", alias="BDG_CONF_DT")
+    BDG_CONF_NM: Union[str, int, float, None] = Field(None, description="종합심사 회의명", alias="BDG_CONF_NM")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PPSL_DT")
+    PPSR: Union[str, int, float, None] = Field(None, description="제안자", alias="PPSR")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+
+class Params_OOWY4R001216HX11495(BaseModel):
+    """Request parameters for OOWY4R001216HX11495"""
+    BILL_ID: str = Field(..., description="의안ID", alias="BILL_ID")
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11496(BaseModel):
+    """Response model for OOWY4R001216HX11496"""
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    RCP_CNT: Union[str, int, float, None] = Field(None, description="접수 건수", alias="RCP_CNT")
+    ACP_CNT: Union[str, int, float, None] = Field(None, description="채택 건수", alias="ACP_CNT")
+    NOT_SUBMIT_CNT: Union[str, int, float, None] = Field(None, description="본회의불부의 건수", alias="NOT_SUBMIT_CNT")
+    WTHD_CNT: Union[str, int, float, None] = Field(None, description="철회 건수", alias="WTHD_CNT")
+    DSU_CNT: Union[str, int, float, None] = Field(None, description="폐기 건수", alias="DSU_CNT")
+    REFT_SUBT: Union[str, int, float, None] = Field(None, description="처리건수 소계", alias="REFT_SUBT")
+    NOT_FINISH_CNT: Union[str, int, float, None] = Field(None, description="계류 건수", alias="NOT_FINISH_CNT")
+
+class Params_OOWY4R001216HX11496(BaseModel):
+    """Request parameters for OOWY4R001216HX11496"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
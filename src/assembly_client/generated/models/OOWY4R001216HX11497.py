@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11497(BaseModel):
+    """Response model for OOWY4R001216HX11497"""
+    RPT_YR: Union[str, int, float, None] = Field(None, description="보고서 년도", alias="RPT_YR")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    RPT_TTL: Union[str, int, float, None] = Field(None, description="보고서 제목", alias="RPT_TTL")
+    PDF_DWLD_URL: Union[str, int, float, None] = Field(None, description="PDF 다운 URL", alias="PDF_DWLD_URL")
+    HWP_DWLD_URL: Union[str, int, float, None] = Field(None, description="HWP 다운 URL", alias="HWP_DWLD_URL")
+
+class Params_OOWY4R001216HX11497(BaseModel):
+    """Request parameters for OOWY4R001216HX11497"""
+    RPT_YR: str | None = Field(None, description="보고서 년도", alias="RPT_YR")
+    RPT_TTL: str | None = Field(None, description="보고서 제목", alias="RPT_TTL")
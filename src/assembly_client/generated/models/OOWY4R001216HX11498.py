@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11498(BaseModel):
+    """Response model for OOWY4R001216HX11498"""
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    PPSR_KIND_NM: Union[str, int, float, None] = Field(None, description="제안자구분명", alias="PPSR_KIND_NM")
+    PPSL_DT: Union[str, int, float, None] = Field(None, description="제안일자", alias="PPSL_DT")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    MSESS_RSLN_DT: Union[str, int, float, None] = Field(None, description="본회의의결일자", alias="MSESS_RSLN_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11498(BaseModel):
+    """Request parameters for OOWY4R001216HX11498"""
+    BILL_NM: str | None = Field(None, description="의안명", alias="BILL_NM")
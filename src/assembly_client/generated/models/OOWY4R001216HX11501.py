@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11501(BaseModel):
+    """Response model for OOWY4R001216HX11501"""
+    NAAS_NM: Union[str, int, float, None] = Field(None, description="국회의원명", alias="NAAS_NM")
+    EV_TTL: Union[str, int, float, None] = Field(None, description="행사 제목", alias="EV_TTL")
+    EV_DTM: Union[str, int, float, None] = Field(None, description="행사 일시", alias="EV_DTM")
+    EV_PLC: Union[str, int, float, None] = Field(None, description="행사 장소", alias="EV_PLC")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11501(BaseModel):
+    """Request parameters for OOWY4R001216HX11501"""
+    pass
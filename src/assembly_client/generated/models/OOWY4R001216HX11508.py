@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11508(BaseModel):
+    """Response model for OOWY4R001216HX11508"""
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    CONF_DT: Union[str, int, float, None] = Field(None, description="회의일자", alias="CONF_DT")
+    CONF_KND: Union[str, int, float, None] = Field(None, description="회의종류", alias="CONF_KND")
+    CMIT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="CMIT_CD")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    DOWN_URL: Union[str, int, float, None] = Field(None, description="다운로드 URL", alias="DOWN_URL")
+
+class Params_OOWY4R001216HX11508(BaseModel):
+    """Request parameters for OOWY4R001216HX11508"""
+    ERACO: str = Field(..., description="대수", alias="ERACO")
+    CMIT_CD: str | None = Field(None, description="위원회코드", alias="CMIT_CD")
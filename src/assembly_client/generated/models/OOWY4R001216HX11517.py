@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11517(BaseModel):
+    """Response model for OOWY4R001216HX11517"""
+    CONF_KND: Union[str, int, float, None] = Field(None, description="회의종류", alias="CONF_KND")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    CONF_DT: Union[str, int, float, None] = Field(None, description="회의일자", alias="CONF_DT")
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    FILE_KND: Union[str, int, float, None] = Field(None, description="파일종류", alias="FILE_KND")
+    FILE_CN: Union[str, int, float, None] = Field(None, description="파일설명", alias="FILE_CN")
+    DOWN_URL: Union[str, int, float, None] = Field(None, description="다운URL", alias="DOWN_URL")
+
+class Params_OOWY4R001216HX11517(BaseModel):
+    """Request parameters for OOWY4R001216HX11517"""
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
+    CONF_ID: str | None = Field(None, description="회의ID", alias="CONF_ID")
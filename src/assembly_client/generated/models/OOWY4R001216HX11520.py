@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11520(BaseModel):
+    """Response model for OOWY4R001216HX11520"""
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    CONF_DT: Union[str, int, float, None] = Field(None, description="회의일자", alias="CONF_DT")
+    CONF_KND: Union[str, int, float, None] = Field(None, description="회의종류", alias="CONF_KND")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    SB_CMIT_NM: Union[str, int, float, None] = Field(None, description="소위원회명", alias="SB_CMIT_NM")
+    CONF_PLC: Union[str, int, float, None] = Field(None, description="회의장소", alias="CONF_PLC")
+    BG_PTM: Union[str, int, float, None] = Field(None, description="시작시간", alias="BG_PTM")
+    ED_PTM: Union[str, int, float, None] = Field(None, description="종료시간", alias="ED_PTM")
+    CONF_PTM: Union[str, int, float, None] = Field(None, description="회의시간", alias="CONF_PTM")
+    HR_HRG_YN: Union[str, int, float, None] = Field(None, description="인사청문회여부", alias="HR_HRG_YN")
+    PBHRG_YN: Union[str, int, float, None] = Field(None, description="공청회여부", alias="PBHRG_YN")
+    HRG_YN: Union[str, int, float, None] = Field(None, description="청문회여부", alias="HRG_YN")
+    SITG_YN: Union[str, int, float, None] = Field(None, description="연석회의여부", alias="SITG_YN")
+    RMND_SPH_YN: Union[str, int, float, None] = Field(None, description="대통령위임연설여부", alias="RMND_SPH_YN")
+    RDJM_SPH_YN: Union[str, int, float, None] = Field(None, description="대통령시정연설여부", alias="RDJM_SPH_YN")
+    FRNGUS_SPH_YN: Union[str, int, float, None] = Field(None, description="외빈연설여부", alias="FRNGUS_SPH_YN")
+    DOWN_URL: Union[str, int, float, None] = Field(None, description="다운로드 URL", alias="DOWN_URL")
+
+class Params_OOWY4R001216HX11520(BaseModel):
+    """Request parameters for OOWY4R001216HX11520"""
+    CONF_ID: str = Field(..., description="회의ID", alias="CONF_ID")
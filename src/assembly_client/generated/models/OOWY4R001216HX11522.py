@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11522(BaseModel):
+    """Response model for OOWY4R001216HX11522"""
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    FILE_CN: Union[str, int, float, None] = Field(None, description="파일설명", alias="FILE_CN")
+    DOWN_URL: Union[str, int, float, None] = Field(None, description="다운URL", alias="DOWN_URL")
+
+class Params_OOWY4R001216HX11522(BaseModel):
+    """Request parameters for OOWY4R001216HX11522"""
+    CONF_ID: str | None = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: str | None = Field(None, description="대수", alias="ERACO")
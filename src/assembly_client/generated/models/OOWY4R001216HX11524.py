@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11524(BaseModel):
+    """Response model for OOWY4R001216HX11524"""
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    BLL_NO: Union[str, int, float, None] = Field(None, description="안건 번호", alias="BLL_NO")
+    BLL_NM: Union[str, int, float, None] = Field(None, description="안건명", alias="BLL_NM")
+    BLL_LV: Union[str, int, float, None] = Field(None, description="안건 레벨", alias="BLL_LV")
+
+class Params_OOWY4R001216HX11524(BaseModel):
+    """Request parameters for OOWY4R001216HX11524"""
+    CONF_ID: str = Field(..., description="회의ID", alias="CONF_ID")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11525(BaseModel):
+    """Response model for OOWY4R001216HX11525"""
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안 ID", alias="BILL_ID")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크 URL", alias="LINK_URL")
+
+class Params_OOWY4R001216HX11525(BaseModel):
+    """Request parameters for OOWY4R001216HX11525"""
+    CONF_ID: str | None = Field(None, description="회의ID", alias="CONF_ID")
+    BILL_ID: str | None = Field(None, description="의안 ID", alias="BILL_ID")
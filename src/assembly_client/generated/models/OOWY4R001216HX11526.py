@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OOWY4R001216HX11526(BaseModel):
+    """Response model for OOWY4R001216HX11526"""
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안 ID", alias="BILL_ID")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    CONF_KND: Union[str, int, float, None] = Field(None, description="회의 종류", alias="CONF_KND")
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의 ID", alias="CONF_ID")
+    ERACO: Union[str, int, float, None] = Field(None, description="대수", alias="ERACO")
+    SESS: Union[str, int, float, None] = Field(None, description="회기", alias="SESS")
+    DGR: Union[str, int, float, None] = Field(None, description="차수", alias="DGR")
+    CONF_DT: Union[str, int, float, None] = Field(None, description="회의일자", alias="CONF_DT")
+    DOWN_URL: Union[str, int, float, None] = Field(None, description="다운URL", alias="DOWN_URL")
+
+class Params_OOWY4R001216HX11526(BaseModel):
+    """Request parameters for OOWY4R001216HX11526"""
+    BILL_ID: str = Field(..., description="의안 ID", alias="BILL_ID")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OP7W8M000944IF15092(BaseModel):
+    """Response model for OP7W8M000944IF15092"""
+    NOTICE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="NOTICE_TITLE")
+    DEPT_NAME: Union[str, int, float, None] = Field(None, description="부서명", alias="DEPT_NAME")
+    WRITE_DATE: Union[str, int, float, None] = Field(None, description="작성일", alias="WRITE_DATE")
+    NOTICE_NM: Union[str, int, float, None] = Field(None, description="구분명", alias="NOTICE_NM")
+    CONTENT: Union[str, int, float, None] = Field(None, description="내용", alias="CONTENT")
+    PDF_FILE_URL: Union[str, int, float, None] = Field(None, description="PDF첨부파일경로", alias="PDF_FILE_URL")
+    ATTACH_FILE_URL: Union[str, int, float, None] = Field(None, description="첨부파일경로", alias="ATTACH_FILE_URL")
+
+class Params_OP7W8M000944IF15092(BaseModel):
+    """Request parameters for OP7W8M000944IF15092"""
+    NOTICE_TITLE: str | None = Field(None, description="제목", alias="NOTICE_TITLE")
+    DEPT_NAME: str | None = Field(None, description="부서명", alias="DEPT_NAME")
+    WRITE_DATE: str | None = Field(None, description="작성일", alias="WRITE_DATE")
+    CONTENT: str | None = Field(None, description="내용", alias="CONTENT")
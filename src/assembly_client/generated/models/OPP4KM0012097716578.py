@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OPP4KM0012097716578(BaseModel):
+    """Response model for OPP4KM0012097716578"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    CHIEF_RESRCH: Union[str, int, float, None] = Field(None, description="연구 책임자", alias="CHIEF_RESRCH")
+    REG_DTTM: Union[str, int, float, None] = Field(None, description="작성일", alias="REG_DTTM")
+    DETAIL_URL: Union[str, int, float, None] = Field(None, description="상세 URL", alias="DETAIL_URL")
+
+class Params_OPP4KM0012097716578(BaseModel):
+    """Request parameters for OPP4KM0012097716578"""
+    pass
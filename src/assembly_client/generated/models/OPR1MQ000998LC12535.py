@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OPR1MQ000998LC12535(BaseModel):
+    """Response model for OPR1MQ000998LC12535"""
+    HG_NM: Union[str, int, float, None] = Field(None, description="의원", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="한자명", alias="HJ_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="정당", alias="POLY_NM")
+    ORIG_NM: Union[str, int, float, None] = Field(None, description="선거구", alias="ORIG_NM")
+    MEMBER_NO: Union[str, int, float, None] = Field(None, description="의원번호", alias="MEMBER_NO")
+    POLY_CD: Union[str, int, float, None] = Field(None, description="소속정당코드", alias="POLY_CD")
+    ORIG_CD: Union[str, int, float, None] = Field(None, description="선거구코드", alias="ORIG_CD")
+    VOTE_DATE: Union[str, int, float, None] = Field(None, description="의결일자", alias="VOTE_DATE")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    LAW_TITLE: Union[str, int, float, None] = Field(None, description="법률명", alias="LAW_TITLE")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위원회", alias="CURR_COMMITTEE")
+    RESULT_VOTE_MOD: Union[str, int, float, None] = Field(None, description="표결결과", alias="RESULT_VOTE_MOD")
+    DEPT_CD: Union[str, int, float, None] = Field(None, description="부서코드(사용안함)", alias="DEPT_CD")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    DISP_ORDER: Union[str, int, float, None] = Field(None, description="표시정렬순서", alias="DISP_ORDER")
+    BILL_URL: Union[str, int, float, None] = Field(None, description="의안URL", alias="BILL_URL")
+    BILL_NAME_URL: Union[str, int, float, None] = Field(None, description="의안링크", alias="BILL_NAME_URL")
+    SESSION_CD: Union[str, int, float, None] = Field(None, description="회기", alias="SESSION_CD")
+    CURRENTS_CD: Union[str, int, float, None] = Field(None, description="차수", alias="CURRENTS_CD")
+    AGE: Union[str, int, float, None] = Field(None, description="대", alias="AGE")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+
+class Params_OPR1MQ000998LC12535(BaseModel):
+    """Request parameters for OPR1MQ000998LC12535"""
+    HG_NM: str | None = Field(None, description="의원", alias="HG_NM")
+    POLY_NM: str | None = Field(None, description="정당", alias="POLY_NM")
+    MEMBER_NO: str | None = Field(None, description="의원번호", alias="MEMBER_NO")
+    VOTE_DATE: str | None = Field(None, description="의결일자", alias="VOTE_DATE")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: str | None = Field(None, description="의안명", alias="BILL_NAME")
+    BILL_ID: str = Field(..., description="의안ID", alias="BILL_ID")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위원회", alias="CURR_COMMITTEE")
+    RESULT_VOTE_MOD: str | None = Field(None, description="표결결과", alias="RESULT_VOTE_MOD")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
+    AGE: str = Field(..., description="대", alias="AGE")
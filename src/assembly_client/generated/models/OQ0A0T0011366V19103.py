@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OQ0A0T0011366V19103(BaseModel):
+    """Response model for OQ0A0T0011366V19103"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    SEMINAR_DIV_CODE: Union[str, int, float, None] = Field(None, description="구분", alias="SEMINAR_DIV_CODE")
+    HOST_DT: Union[str, int, float, None] = Field(None, description="개최일시", alias="HOST_DT")
+    HOST_PLACE_NAME: Union[str, int, float, None] = Field(None, description="장소", alias="HOST_PLACE_NAME")
+    HOST_INS_NAME: Union[str, int, float, None] = Field(None, description="주최", alias="HOST_INS_NAME")
+    ATTENDANCE_NAME1: Union[str, int, float, None] = Field(None, description="발제자", alias="ATTENDANCE_NAME1")
+    ATTENDANCE_NAME2: Union[str, int, float, None] = Field(None, description="토론자", alias="ATTENDANCE_NAME2")
+    DETAIL_VIEW_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="DETAIL_VIEW_URL")
+
+class Params_OQ0A0T0011366V19103(BaseModel):
+    """Request parameters for OQ0A0T0011366V19103"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    HOST_DT: str = Field(..., description="개최일시", alias="HOST_DT")
+    HOST_INS_NAME: str | None = Field(None, description="주최", alias="HOST_INS_NAME")
+    ATTENDANCE_NAME1: str | None = Field(None, description="발제자", alias="ATTENDANCE_NAME1")
+    ATTENDANCE_NAME2: str | None = Field(None, description="토론자", alias="ATTENDANCE_NAME2")
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OQ50H1000962NX16376(BaseModel):
+    """Response model for OQ50H1000962NX16376"""
+    BILL_NO: Union[str, int, float, None] = Field(None, description="청원번호", alias="BILL_NO")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    AGE: Union[str, int, float, None] = Field(None, description="대", alias="AGE")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="청원명", alias="BILL_NAME")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="청원인", alias="PROPOSER")
+    APPROVER: Union[str, int, float, None] = Field(None, description="소개의원", alias="APPROVER")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="접수일자", alias="PROPOSE_DT")
+    PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: Union[str, int, float, None] = Field(None, description="소관위", alias="CURR_COMMITTEE")
+    COMMITTEE_DT: Union[str, int, float, None] = Field(None, description="위원회회부일", alias="COMMITTEE_DT")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+
+class Params_OQ50H1000962NX16376(BaseModel):
+    """Request parameters for OQ50H1000962NX16376"""
+    BILL_NO: str | None = Field(None, description="청원번호", alias="BILL_NO")
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    AGE: str = Field(..., description="대", alias="AGE")
+    BILL_NAME: str | None = Field(None, description="청원명", alias="BILL_NAME")
+    PROPOSER: str | None = Field(None, description="청원인", alias="PROPOSER")
+    APPROVER: str | None = Field(None, description="소개의원", alias="APPROVER")
+    PROC_RESULT_CD: str | None = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위코드", alias="CURR_COMMITTEE_ID")
+    CURR_COMMITTEE: str | None = Field(None, description="소관위", alias="CURR_COMMITTEE")
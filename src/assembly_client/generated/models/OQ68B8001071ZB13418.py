@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OQ68B8001071ZB13418(BaseModel):
+    """Response model for OQ68B8001071ZB13418"""
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NM")
+    BILL_KIND: Union[str, int, float, None] = Field(None, description="의안활동구분", alias="BILL_KIND")
+    PROPOSER: Union[str, int, float, None] = Field(None, description="제안자", alias="PROPOSER")
+    COMMITTEE_NM: Union[str, int, float, None] = Field(None, description="소관위원회", alias="COMMITTEE_NM")
+    PROC_RESULT_CD: Union[str, int, float, None] = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    VOTE_TCNT: Union[str, int, float, None] = Field(None, description="총투표수", alias="VOTE_TCNT")
+    YES_TCNT: Union[str, int, float, None] = Field(None, description="찬성", alias="YES_TCNT")
+    NO_TCNT: Union[str, int, float, None] = Field(None, description="반대", alias="NO_TCNT")
+    BLANK_TCNT: Union[str, int, float, None] = Field(None, description="기권", alias="BLANK_TCNT")
+    PROPOSE_DT: Union[str, int, float, None] = Field(None, description="제안일", alias="PROPOSE_DT")
+    COMMITTEE_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="위원회심사_회부일", alias="COMMITTEE_SUBMIT_DT")
+    COMMITTEE_PRESENT_DT: Union[str, int, float, None] = Field(None, description="위원회심사_상정일", alias="COMMITTEE_PRESENT_DT")
+    COMMITTEE_PROC_DT: Union[str, int, float, None] = Field(None, description="위원회심사_의결일", alias="COMMITTEE_PROC_DT")
+    LAW_SUBMIT_DT: Union[str, int, float, None] = Field(None, description="법사위체계자구심사_회부일", alias="LAW_SUBMIT_DT")
+    LAW_PRESENT_DT: Union[str, int, float, None] = Field(None, description="법사위체계자구심사_상정일", alias="LAW_PRESENT_DT")
+    LAW_PROC_DT: Union[str, int, float, None] = Field(None, description="법사위체계자구심사_의결일", alias="LAW_PROC_DT")
+    RGS_PRESENT_DT: Union[str, int, float, None] = Field(None, description="본회의심의_상정일", alias="RGS_PRESENT_DT")
+    RGS_PROC_DT: Union[str, int, float, None] = Field(None, description="본회의심의_의결일", alias="RGS_PROC_DT")
+    CURR_TRANS_DT: Union[str, int, float, None] = Field(None, description="정부이송일", alias="CURR_TRANS_DT")
+    ANNOUNCE_DT: Union[str, int, float, None] = Field(None, description="공포일", alias="ANNOUNCE_DT")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="링크URL", alias="LINK_URL")
+    CURR_COMMITTEE_ID: Union[str, int, float, None] = Field(None, description="소관위원회ID", alias="CURR_COMMITTEE_ID")
+
+class Params_OQ68B8001071ZB13418(BaseModel):
+    """Request parameters for OQ68B8001071ZB13418"""
+    AGE: str = Field(..., description="대수", alias="AGE")
+    BILL_NO: str | None = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NM: str | None = Field(None, description="의안명", alias="BILL_NM")
+    PROPOSER: str | None = Field(None, description="제안자", alias="PROPOSER")
+    COMMITTEE_NM: str | None = Field(None, description="소관위원회", alias="COMMITTEE_NM")
+    PROC_RESULT_CD: str | None = Field(None, description="의결결과", alias="PROC_RESULT_CD")
+    PROPOSE_DT: str | None = Field(None, description="제안일", alias="PROPOSE_DT")
+    RGS_PROC_DT: str | None = Field(None, description="본회의심의_의결일", alias="RGS_PROC_DT")
+    CURR_TRANS_DT: str | None = Field(None, description="정부이송일", alias="CURR_TRANS_DT")
+    ANNOUNCE_DT: str | None = Field(None, description="공포일", alias="ANNOUNCE_DT")
+    BILL_ID: str | None = Field(None, description="의안ID", alias="BILL_ID")
+    CURR_COMMITTEE_ID: str | None = Field(None, description="소관위원회ID", alias="CURR_COMMITTEE_ID")
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OQEXW00012074114927(BaseModel):
+    """Response model for OQEXW00012074114927"""
+    DATA_SEQCE_NO: Union[str, int, float, None] = Field(None, description="데이터수집번호", alias="DATA_SEQCE_NO")
+    DATAID: Union[str, int, float, None] = Field(None, description="데이터ID", alias="DATAID")
+    PDFFILENM: Union[str, int, float, None] = Field(None, description="다운로드", alias="PDFFILENM")
+    PDFFILEURL: Union[str, int, float, None] = Field(None, description="PDF파일URL", alias="PDFFILEURL")
+    DIRECTVIEW: Union[str, int, float, None] = Field(None, description="바로보기", alias="DIRECTVIEW")
+    VIEWERURL: Union[str, int, float, None] = Field(None, description="뷰어URL", alias="VIEWERURL")
+    DIVNM: Union[str, int, float, None] = Field(None, description="구분명", alias="DIVNM")
+    DIVCD: Union[str, int, float, None] = Field(None, description="구분코드", alias="DIVCD")
+    BOOKNM: Union[str, int, float, None] = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: Union[str, int, float, None] = Field(None, description="등록일자", alias="INSERTDT")
+
+class Params_OQEXW00012074114927(BaseModel):
+    """Request parameters for OQEXW00012074114927"""
+    BOOKNM: str | None = Field(None, description="자료명", alias="BOOKNM")
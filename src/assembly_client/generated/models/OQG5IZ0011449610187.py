@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OQG5IZ0011449610187(BaseModel):
+    """Response model for OQG5IZ0011449610187"""
+    DAESU: Union[str, int, float, None] = Field(None, description="대수", alias="DAESU")
+    DAE: Union[str, int, float, None] = Field(None, description="대별 및 소속정당(단체)", alias="DAE")
+    DAE_NM: Union[str, int, float, None] = Field(None, description="대별", alias="DAE_NM")
+    NAME: Union[str, int, float, None] = Field(None, description="이름", alias="NAME")
+    NAME_HAN: Union[str, int, float, None] = Field(None, description="이름(한자)", alias="NAME_HAN")
+    JA: Union[str, int, float, None] = Field(None, description="자", alias="JA")
+    HO: Union[str, int, float, None] = Field(None, description="호", alias="HO")
+    BIRTH: Union[str, int, float, None] = Field(None, description="생년월일", alias="BIRTH")
+    BON: Union[str, int, float, None] = Field(None, description="본관", alias="BON")
+    POSI: Union[str, int, float, None] = Field(None, description="출생지", alias="POSI")
+    HAK: Union[str, int, float, None] = Field(None, description="학력 및 경력", alias="HAK")
+    HOBBY: Union[str, int, float, None] = Field(None, description="종교 및 취미", alias="HOBBY")
+    BOOK: Union[str, int, float, None] = Field(None, description="저서", alias="BOOK")
+    SANG: Union[str, int, float, None] = Field(None, description="상훈", alias="SANG")
+    DEAD: Union[str, int, float, None] = Field(None, description="기타정보(사망일)", alias="DEAD")
+    URL: Union[str, int, float, None] = Field(None, description="회원정보 확인 헌정회 홈페이지 URL", alias="URL")
+
+class Params_OQG5IZ0011449610187(BaseModel):
+    """Request parameters for OQG5IZ0011449610187"""
+    DAESU: str = Field(..., description="대수", alias="DAESU")
+    DAE: str | None = Field(None, description="대별 및 소속정당(단체)", alias="DAE")
+    DAE_NM: str | None = Field(None, description="대별", alias="DAE_NM")
+    NAME: str | None = Field(None, description="이름", alias="NAME")
+    BIRTH: str | None = Field(None, description="생년월일", alias="BIRTH")
+    BON: str | None = Field(None, description="본관", alias="BON")
+    POSI: str | None = Field(None, description="출생지", alias="POSI")
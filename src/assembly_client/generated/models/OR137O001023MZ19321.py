@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OR137O001023MZ19321(BaseModel):
+    """Response model for OR137O001023MZ19321"""
+    CONFER_NUM: Union[str, int, float, None] = Field(None, description="회의번호", alias="CONFER_NUM")
+    TITLE: Union[str, int, float, None] = Field(None, description="회의명", alias="TITLE")
+    CLASS_NAME: Union[str, int, float, None] = Field(None, description="회의종류명", alias="CLASS_NAME")
+    DAE_NUM: Union[str, int, float, None] = Field(None, description="대수", alias="DAE_NUM")
+    COMM_NAME: Union[str, int, float, None] = Field(None, description="위원회명", alias="COMM_NAME")
+    VODCOMM_CODE: Union[str, int, float, None] = Field(None, description="영상회의록", alias="VODCOMM_CODE")
+    CONF_DATE: Union[str, int, float, None] = Field(None, description="회의날짜", alias="CONF_DATE")
+    SUB_NAME: Union[str, int, float, None] = Field(None, description="안건명", alias="SUB_NAME")
+    VOD_LINK_URL: Union[str, int, float, None] = Field(None, description="영상회의록 링크", alias="VOD_LINK_URL")
+    CONF_LINK_URL: Union[str, int, float, None] = Field(None, description="요약정보 팝업", alias="CONF_LINK_URL")
+    PDF_LINK_URL: Union[str, int, float, None] = Field(None, description="PDF파일 링크", alias="PDF_LINK_URL")
+    PDF_FILE_ID: Union[str, int, float, None] = Field(None, description="회의록", alias="PDF_FILE_ID")
+    DEPT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="DEPT_CD")
+    CONF_ID: Union[str, int, float, None] = Field(None, description="회의ID", alias="CONF_ID")
+
+class Params_OR137O001023MZ19321(BaseModel):
+    """Request parameters for OR137O001023MZ19321"""
+    TITLE: str | None = Field(None, description="회의명", alias="TITLE")
+    CLASS_NAME: str | None = Field(None, description="회의종류명", alias="CLASS_NAME")
+    DAE_NUM: str = Field(..., description="대수", alias="DAE_NUM")
+    COMM_NAME: str | None = Field(None, description="위원회명", alias="COMM_NAME")
+    CONF_DATE: str = Field(..., description="회의날짜", alias="CONF_DATE")
+    SUB_NAME: str | None = Field(None, description="안건명", alias="SUB_NAME")
+    DEPT_CD: str | None = Field(None, description="위원회코드", alias="DEPT_CD")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ORL1S4001007HM19790(BaseModel):
+    """Response model for ORL1S4001007HM19790"""
+    BLNG_INST_NM: Union[str, int, float, None] = Field(None, description="소속기관명", alias="BLNG_INST_NM")
+    BRDI_SJ: Union[str, int, float, None] = Field(None, description="제목", alias="BRDI_SJ")
+    BRDI_CN: Union[str, int, float, None] = Field(None, description="내용", alias="BRDI_CN")
+    RDT: Union[str, int, float, None] = Field(None, description="작성일자", alias="RDT")
+    HOME_URL: Union[str, int, float, None] = Field(None, description="바로가기URL", alias="HOME_URL")
+
+class Params_ORL1S4001007HM19790(BaseModel):
+    """Request parameters for ORL1S4001007HM19790"""
+    BLNG_INST_NM: str | None = Field(None, description="소속기관명", alias="BLNG_INST_NM")
+    BRDI_SJ: str | None = Field(None, description="제목", alias="BRDI_SJ")
+    BRDI_CN: str | None = Field(None, description="내용", alias="BRDI_CN")
+    RDT: str | None = Field(None, description="작성일자", alias="RDT")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ORPY580008959U11813(BaseModel):
+    """Response model for ORPY580008959U11813"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    BZ_NM: Union[str, int, float, None] = Field(None, description="사업명", alias="BZ_NM")
+    BDG_TAMT: Union[str, int, float, None] = Field(None, description="예산총액(원)", alias="BDG_TAMT")
+
+class Params_ORPY580008959U11813(BaseModel):
+    """Request parameters for ORPY580008959U11813"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    BZ_NM: str | None = Field(None, description="사업명", alias="BZ_NM")
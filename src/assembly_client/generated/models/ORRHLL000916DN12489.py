@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_ORRHLL000916DN12489(BaseModel):
+    """Response model for ORRHLL000916DN12489"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    INST_CD: Union[str, int, float, None] = Field(None, description="기관", alias="INST_CD")
+    SN: Union[str, int, float, None] = Field(None, description="일련번호", alias="SN")
+    IND_NM: Union[str, int, float, None] = Field(None, description="사건명", alias="IND_NM")
+    RSLN_DT: Union[str, int, float, None] = Field(None, description="의결(재결)일", alias="RSLN_DT")
+    OJ_DEMD_PN: Union[str, int, float, None] = Field(None, description="피청구인", alias="OJ_DEMD_PN")
+    ORDG_RSON: Union[str, int, float, None] = Field(None, description="주문내용", alias="ORDG_RSON")
+    DEMD_MEAN: Union[str, int, float, None] = Field(None, description="청구취지", alias="DEMD_MEAN")
+    JUD_RSLT_MTH: Union[str, int, float, None] = Field(None, description="이유(심판결과요지)", alias="JUD_RSLT_MTH")
+
+class Params_ORRHLL000916DN12489(BaseModel):
+    """Request parameters for ORRHLL000916DN12489"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    INST_CD: str | None = Field(None, description="기관", alias="INST_CD")
+    SN: str | None = Field(None, description="일련번호", alias="SN")
+    IND_NM: str | None = Field(None, description="사건명", alias="IND_NM")
+    RSLN_DT: str | None = Field(None, description="의결(재결)일", alias="RSLN_DT")
+    OJ_DEMD_PN: str | None = Field(None, description="피청구인", alias="OJ_DEMD_PN")
+    ORDG_RSON: str | None = Field(None, description="주문내용", alias="ORDG_RSON")
+    DEMD_MEAN: str | None = Field(None, description="청구취지", alias="DEMD_MEAN")
+    JUD_RSLT_MTH: str | None = Field(None, description="이유(심판결과요지)", alias="JUD_RSLT_MTH")
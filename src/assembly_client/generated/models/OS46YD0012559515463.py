@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OS46YD0012559515463(BaseModel):
+    """Response model for OS46YD0012559515463"""
+    BILL_NO: Union[str, int, float, None] = Field(None, description="의안번호", alias="BILL_NO")
+    BILL_NAME: Union[str, int, float, None] = Field(None, description="의안명", alias="BILL_NAME")
+    BILL_ID: Union[str, int, float, None] = Field(None, description="의안ID", alias="BILL_ID")
+    SUMMARY: Union[str, int, float, None] = Field(None, description="주요내용", alias="SUMMARY")
+    AGE: Union[str, int, float, None] = Field(None, description="대수", alias="AGE")
+
+class Params_OS46YD0012559515463(BaseModel):
+    """Request parameters for OS46YD0012559515463"""
+    BILL_NO: str = Field(..., description="의안번호", alias="BILL_NO")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OT9767000930ZL12696(BaseModel):
+    """Response model for OT9767000930ZL12696"""
+    FSCL_YY: Union[str, int, float, None] = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: Union[str, int, float, None] = Field(None, description="회계월", alias="EXE_M")
+    FSCL_NM: Union[str, int, float, None] = Field(None, description="회계명", alias="FSCL_NM")
+    IKWAN_NM: Union[str, int, float, None] = Field(None, description="수입관명", alias="IKWAN_NM")
+    IHANG_NM: Union[str, int, float, None] = Field(None, description="수입항명", alias="IHANG_NM")
+    BDG_AMT: Union[str, int, float, None] = Field(None, description="예산금액", alias="BDG_AMT")
+    RC_AGGR_AMT: Union[str, int, float, None] = Field(None, description="수납누계금액", alias="RC_AGGR_AMT")
+    RC_AMT: Union[str, int, float, None] = Field(None, description="당월수납금액", alias="RC_AMT")
+
+class Params_OT9767000930ZL12696(BaseModel):
+    """Request parameters for OT9767000930ZL12696"""
+    FSCL_YY: str | None = Field(None, description="회계년도", alias="FSCL_YY")
+    EXE_M: str | None = Field(None, description="회계월", alias="EXE_M")
+    FSCL_NM: str | None = Field(None, description="회계명", alias="FSCL_NM")
+    IKWAN_NM: str | None = Field(None, description="수입관명", alias="IKWAN_NM")
+    IHANG_NM: str | None = Field(None, description="수입항명", alias="IHANG_NM")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OTL4B3000889YI11365(BaseModel):
+    """Response model for OTL4B3000889YI11365"""
+    ARE: Union[str, int, float, None] = Field(None, description="수량", alias="ARE")
+    AMT: Union[str, int, float, None] = Field(None, description="금액(원)", alias="AMT")
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    DIV_NM: Union[str, int, float, None] = Field(None, description="구분", alias="DIV_NM")
+
+class Params_OTL4B3000889YI11365(BaseModel):
+    """Request parameters for OTL4B3000889YI11365"""
+    DIV_NM: str | None = Field(None, description="구분", alias="DIV_NM")
+    YR: str | None = Field(None, description="년도", alias="YR")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OTM7PV000945R113521(BaseModel):
+    """Response model for OTM7PV000945R113521"""
+    CONTENTS: Union[str, int, float, None] = Field(None, description="내용", alias="CONTENTS")
+    SCHEDULEDATE: Union[str, int, float, None] = Field(None, description="날짜", alias="SCHEDULEDATE")
+    SCHEDULETIME: Union[str, int, float, None] = Field(None, description="시간", alias="SCHEDULETIME")
+
+class Params_OTM7PV000945R113521(BaseModel):
+    """Request parameters for OTM7PV000945R113521"""
+    CONTENTS: str | None = Field(None, description="내용", alias="CONTENTS")
+    SCHEDULEDATE: str | None = Field(None, description="날짜", alias="SCHEDULEDATE")
+    SCHEDULETIME: str | None = Field(None, description="시간", alias="SCHEDULETIME")
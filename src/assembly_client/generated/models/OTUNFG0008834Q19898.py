@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OTUNFG0008834Q19898(BaseModel):
+    """Response model for OTUNFG0008834Q19898"""
+    YR: Union[str, int, float, None] = Field(None, description="연도", alias="YR")
+    JBTP_NM: Union[str, int, float, None] = Field(None, description="직류", alias="JBTP_NM")
+    ADPT_NOP: Union[str, int, float, None] = Field(None, description="채용인원", alias="ADPT_NOP")
+    CMPT_RT: Union[str, int, float, None] = Field(None, description="경쟁률", alias="CMPT_RT")
+
+class Params_OTUNFG0008834Q19898(BaseModel):
+    """Request parameters for OTUNFG0008834Q19898"""
+    YR: str | None = Field(None, description="연도", alias="YR")
+    JBTP_NM: str | None = Field(None, description="직류", alias="JBTP_NM")
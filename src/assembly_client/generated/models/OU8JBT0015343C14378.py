@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OU8JBT0015343C14378(BaseModel):
+    """Response model for OU8JBT0015343C14378"""
+    TH: Union[str, int, float, None] = Field(None, description="대수", alias="TH")
+    CLASS_ID: Union[str, int, float, None] = Field(None, description="회의종류", alias="CLASS_ID")
+    CLASS_NM: Union[str, int, float, None] = Field(None, description="회의종류명", alias="CLASS_NM")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="위원회명", alias="CMIT_NM")
+    CMIT_CD: Union[str, int, float, None] = Field(None, description="위원회코드", alias="CMIT_CD")
+    SUB_CMIT_CD: Union[str, int, float, None] = Field(None, description="소위원회코드", alias="SUB_CMIT_CD")
+    SUB_CMIT_NM: Union[str, int, float, None] = Field(None, description="소위원회명", alias="SUB_CMIT_NM")
+
+class Params_OU8JBT0015343C14378(BaseModel):
+    """Request parameters for OU8JBT0015343C14378"""
+    TH: str | None = Field(None, description="대수", alias="TH")
+    CLASS_ID: str | None = Field(None, description="회의종류", alias="CLASS_ID")
+    CMIT_NM: str | None = Field(None, description="위원회명", alias="CMIT_NM")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OVA33G0011172J17084(BaseModel):
+    """Response model for OVA33G0011172J17084"""
+    PDFFILEURL: Union[str, int, float, None] = Field(None, description="PDF파일URL", alias="PDFFILEURL")
+    VIEWERURL: Union[str, int, float, None] = Field(None, description="뷰어URL", alias="VIEWERURL")
+    BOOKNM: Union[str, int, float, None] = Field(None, description="자료명", alias="BOOKNM")
+    INSERTDT: Union[str, int, float, None] = Field(None, description="등록일자", alias="INSERTDT")
+
+class Params_OVA33G0011172J17084(BaseModel):
+    """Request parameters for OVA33G0011172J17084"""
+    BOOKNM: str | None = Field(None, description="자료명", alias="BOOKNM")
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OVDKBQ000915NE11865(BaseModel):
+    """Response model for OVDKBQ000915NE11865"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    INST_CD: Union[str, int, float, None] = Field(None, description="기관", alias="INST_CD")
+    SN: Union[str, int, float, None] = Field(None, description="일련번호", alias="SN")
+    IND_NM: Union[str, int, float, None] = Field(None, description="사건명", alias="IND_NM")
+    APL_DT: Union[str, int, float, None] = Field(None, description="신청일", alias="APL_DT")
+    ORDG_RSON: Union[str, int, float, None] = Field(None, description="주문내용", alias="ORDG_RSON")
+    APL_MEAN: Union[str, int, float, None] = Field(None, description="신청취지", alias="APL_MEAN")
+    DEAL_RSLT_MTH: Union[str, int, float, None] = Field(None, description="이유(처리결과요지)", alias="DEAL_RSLT_MTH")
+
+class Params_OVDKBQ000915NE11865(BaseModel):
+    """Request parameters for OVDKBQ000915NE11865"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    INST_CD: str | None = Field(None, description="기관", alias="INST_CD")
+    SN: str | None = Field(None, description="일련번호", alias="SN")
+    IND_NM: str | None = Field(None, description="사건명", alias="IND_NM")
+    ORDG_RSON: str | None = Field(None, description="주문내용", alias="ORDG_RSON")
+    APL_MEAN: str | None = Field(None, description="신청취지", alias="APL_MEAN")
+    DEAL_RSLT_MTH: str | None = Field(None, description="이유(처리결과요지)", alias="DEAL_RSLT_MTH")
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OVRSWG000917L610310(BaseModel):
+    """Response model for OVRSWG000917L610310"""
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+    INST_CD: Union[str, int, float, None] = Field(None, description="기관", alias="INST_CD")
+    SN: Union[str, int, float, None] = Field(None, description="일련번호", alias="SN")
+    IND_NM: Union[str, int, float, None] = Field(None, description="사건명", alias="IND_NM")
+    RSLT_DT: Union[str, int, float, None] = Field(None, description="판결일", alias="RSLT_DT")
+    OJ_PN: Union[str, int, float, None] = Field(None, description="피고", alias="OJ_PN")
+    ORDG_RSON: Union[str, int, float, None] = Field(None, description="주문내용", alias="ORDG_RSON")
+    DEMD_MEAN: Union[str, int, float, None] = Field(None, description="청구취지", alias="DEMD_MEAN")
+    RSLT_MTH: Union[str, int, float, None] = Field(None, description="이유(판결요지)", alias="RSLT_MTH")
+
+class Params_OVRSWG000917L610310(BaseModel):
+    """Request parameters for OVRSWG000917L610310"""
+    YR: str | None = Field(None, description="년도", alias="YR")
+    INST_CD: str | None = Field(None, description="기관", alias="INST_CD")
+    SN: str | None = Field(None, description="일련번호", alias="SN")
+    IND_NM: str | None = Field(None, description="사건명", alias="IND_NM")
+    RSLT_DT: str | None = Field(None, description="판결일", alias="RSLT_DT")
+    OJ_PN: str | None = Field(None, description="피고", alias="OJ_PN")
+    ORDG_RSON: str | None = Field(None, description="주문내용", alias="ORDG_RSON")
+    DEMD_MEAN: str | None = Field(None, description="청구취지", alias="DEMD_MEAN")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OVW2NU000937WK15521(BaseModel):
+    """Response model for OVW2NU000937WK15521"""
+    DAE_NUM: Union[str, int, float, None] = Field(None, description="대수", alias="DAE_NUM")
+    SES_NUM: Union[str, int, float, None] = Field(None, description="회기", alias="SES_NUM")
+    DEGREE_NUM: Union[str, int, float, None] = Field(None, description="차수", alias="DEGREE_NUM")
+    COMM_NAME: Union[str, int, float, None] = Field(None, description="위원회", alias="COMM_NAME")
+    CONF_DATE: Union[str, int, float, None] = Field(None, description="회의일", alias="CONF_DATE")
+    BILL_URL: Union[str, int, float, None] = Field(None, description="안건보기", alias="BILL_URL")
+    CLASS_NAME: Union[str, int, float, None] = Field(None, description="회의종류", alias="CLASS_NAME")
+
+class Params_OVW2NU000937WK15521(BaseModel):
+    """Request parameters for OVW2NU000937WK15521"""
+    DAE_NUM: str = Field(..., description="대수", alias="DAE_NUM")
+    SES_NUM: str | None = Field(None, description="회기", alias="SES_NUM")
+    DEGREE_NUM: str | None = Field(None, description="차수", alias="DEGREE_NUM")
+    COMM_NAME: str | None = Field(None, description="위원회", alias="COMM_NAME")
+    CONF_DATE: str | None = Field(None, description="회의일", alias="CONF_DATE")
+    CLASS_NAME: str | None = Field(None, description="회의종류", alias="CLASS_NAME")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OWKPDF000891EB10683(BaseModel):
+    """Response model for OWKPDF000891EB10683"""
+    DIV_NM: Union[str, int, float, None] = Field(None, description="구분", alias="DIV_NM")
+    ADDR: Union[str, int, float, None] = Field(None, description="주소", alias="ADDR")
+    ARE: Union[str, int, float, None] = Field(None, description="면적(㎡)", alias="ARE")
+    FLSP: Union[str, int, float, None] = Field(None, description="면적(평)", alias="FLSP")
+    AMT: Union[str, int, float, None] = Field(None, description="금액", alias="AMT")
+    YR: Union[str, int, float, None] = Field(None, description="년도", alias="YR")
+
+class Params_OWKPDF000891EB10683(BaseModel):
+    """Request parameters for OWKPDF000891EB10683"""
+    DIV_NM: str | None = Field(None, description="구분", alias="DIV_NM")
+    ADDR: str | None = Field(None, description="주소", alias="ADDR")
+    YR: str | None = Field(None, description="년도", alias="YR")
@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OWSSC6001134T516707(BaseModel):
+    """Response model for OWSSC6001134T516707"""
+    HG_NM: Union[str, int, float, None] = Field(None, description="이름", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="한자명", alias="HJ_NM")
+    ENG_NM: Union[str, int, float, None] = Field(None, description="영문명칭", alias="ENG_NM")
+    BTH_GBN_NM: Union[str, int, float, None] = Field(None, description="음/양력", alias="BTH_GBN_NM")
+    BTH_DATE: Union[str, int, float, None] = Field(None, description="생년월일", alias="BTH_DATE")
+    JOB_RES_NM: Union[str, int, float, None] = Field(None, description="직책명", alias="JOB_RES_NM")
+    POLY_NM: Union[str, int, float, None] = Field(None, description="정당명", alias="POLY_NM")
+    ORIG_NM: Union[str, int, float, None] = Field(None, description="선거구", alias="ORIG_NM")
+    ELECT_GBN_NM: Union[str, int, float, None] = Field(None, description="선거구구분", alias="ELECT_GBN_NM")
+    CMIT_NM: Union[str, int, float, None] = Field(None, description="대표 위원회", alias="CMIT_NM")
+    CMITS: Union[str, int, float, None] = Field(None, description="소속 위원회 목록", alias="CMITS")
+    REELE_GBN_NM: Union[str, int, float, None] = Field(None, description="재선", alias="REELE_GBN_NM")
+    UNITS: Union[str, int, float, None] = Field(None, description="당선", alias="UNITS")
+    SEX_GBN_NM: Union[str, int, float, None] = Field(None, description="성별", alias="SEX_GBN_NM")
+    TEL_NO: Union[str, int, float, None] = Field(None, description="전화번호", alias="TEL_NO")
+    E_MAIL: Union[str, int, float, None] = Field(None, description="이메일", alias="E_MAIL")
+    HOMEPAGE: Union[str, int, float, None] = Field(None, description="홈페이지", alias="HOMEPAGE")
+    STAFF: Union[str, int, float, None] = Field(None, description="보좌관", alias="STAFF")
+    SECRETARY: Union[str, int, float, None] = Field(None, description="선임비서관", alias="SECRETARY")
+    SECRETARY2: Union[str, int, float, None] = Field(None, description="비서관", alias="SECRETARY2")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+    MEM_TITLE: Union[str, int, float, None] = Field(None, description="약력", alias="MEM_TITLE")
+    ASSEM_ADDR: Union[str, int, float, None] = Field(None, description="사무실 호실", alias="ASSEM_ADDR")
+
+class Params_OWSSC6001134T516707(BaseModel):
+    """Request parameters for OWSSC6001134T516707"""
+    HG_NM: str | None = Field(None, description="이름", alias="HG_NM")
+    POLY_NM: str | None = Field(None, description="정당명", alias="POLY_NM")
+    ORIG_NM: str | None = Field(None, description="선거구", alias="ORIG_NM")
+    CMITS: str | None = Field(None, description="소속 위원회 목록", alias="CMITS")
+    SEX_GBN_NM: str | None = Field(None, description="성별", alias="SEX_GBN_NM")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OX4XHR001211RB17826(BaseModel):
+    """Response model for OX4XHR001211RB17826"""
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    WRITER: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER")
+    REG_DTTM: Union[str, int, float, None] = Field(None, description="작성일", alias="REG_DTTM")
+    DETAIL_URL: Union[str, int, float, None] = Field(None, description="상세 URL", alias="DETAIL_URL")
+
+class Params_OX4XHR001211RB17826(BaseModel):
+    """Request parameters for OX4XHR001211RB17826"""
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    WRITER: str | None = Field(None, description="작성자", alias="WRITER")
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OXJNQM001195IT17281(BaseModel):
+    """Response model for OXJNQM001195IT17281"""
+    PROFILE_CD: Union[str, int, float, None] = Field(None, description="구분코드", alias="PROFILE_CD")
+    PROFILE_NM: Union[str, int, float, None] = Field(None, description="구분", alias="PROFILE_NM")
+    HG_NM: Union[str, int, float, None] = Field(None, description="의원이름(한글)", alias="HG_NM")
+    HJ_NM: Union[str, int, float, None] = Field(None, description="의원이름(한자)", alias="HJ_NM")
+    FRTO_DATE: Union[str, int, float, None] = Field(None, description="활동기간", alias="FRTO_DATE")
+    PROFILE_SJ: Union[str, int, float, None] = Field(None, description="위원회 경력", alias="PROFILE_SJ")
+    MONA_CD: Union[str, int, float, None] = Field(None, description="국회의원코드", alias="MONA_CD")
+    PROFILE_UNIT_CD: Union[str, int, float, None] = Field(None, description="경력대수코드", alias="PROFILE_UNIT_CD")
+    PROFILE_UNIT_NM: Union[str, int, float, None] = Field(None, description="경력대수", alias="PROFILE_UNIT_NM")
+
+class Params_OXJNQM001195IT17281(BaseModel):
+    """Request parameters for OXJNQM001195IT17281"""
+    HG_NM: str | None = Field(None, description="의원이름(한글)", alias="HG_NM")
+    MONA_CD: str | None = Field(None, description="국회의원코드", alias="MONA_CD")
+    PROFILE_UNIT_CD: str = Field(..., description="경력대수코드", alias="PROFILE_UNIT_CD")
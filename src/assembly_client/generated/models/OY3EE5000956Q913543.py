@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OY3EE5000956Q913543(BaseModel):
+    """Response model for OY3EE5000956Q913543"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER_NM")
+    UPDATE_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="UPDATE_DT")
+
+class Params_OY3EE5000956Q913543(BaseModel):
+    """Request parameters for OY3EE5000956Q913543"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: str | None = Field(None, description="작성자", alias="WRITER_NM")
+    UPDATE_DT: str | None = Field(None, description="작성일", alias="UPDATE_DT")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OZHI8N000955DZ17739(BaseModel):
+    """Response model for OZHI8N000955DZ17739"""
+    ARTICLE_TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: Union[str, int, float, None] = Field(None, description="작성자", alias="WRITER_NM")
+    CATEGORY_NM: Union[str, int, float, None] = Field(None, description="구분2", alias="CATEGORY_NM")
+    UPDATE_DT: Union[str, int, float, None] = Field(None, description="작성일", alias="UPDATE_DT")
+    MASTER_NM: Union[str, int, float, None] = Field(None, description="구분1", alias="MASTER_NM")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="상세보기URL", alias="LINK_URL")
+
+class Params_OZHI8N000955DZ17739(BaseModel):
+    """Request parameters for OZHI8N000955DZ17739"""
+    ARTICLE_TITLE: str | None = Field(None, description="제목", alias="ARTICLE_TITLE")
+    WRITER_NM: str | None = Field(None, description="작성자", alias="WRITER_NM")
+    UPDATE_DT: str | None = Field(None, description="작성일", alias="UPDATE_DT")
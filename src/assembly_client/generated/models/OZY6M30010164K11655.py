@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Union
+
+class Model_OZY6M30010164K11655(BaseModel):
+    """Response model for OZY6M30010164K11655"""
+    TAKING_DATE: Union[str, int, float, None] = Field(None, description="회견일", alias="TAKING_DATE")
+    OPEN_TIME: Union[str, int, float, None] = Field(None, description="회견시각", alias="OPEN_TIME")
+    TITLE: Union[str, int, float, None] = Field(None, description="제목", alias="TITLE")
+    PERSON: Union[str, int, float, None] = Field(None, description="발언자", alias="PERSON")
+    REC_TIME: Union[str, int, float, None] = Field(None, description="재생시간", alias="REC_TIME")
+    LINK_URL: Union[str, int, float, None] = Field(None, description="영상 바로보기", alias="LINK_URL")
+
+class Params_OZY6M30010164K11655(BaseModel):
+    """Request parameters for OZY6M30010164K11655"""
+    TAKING_DATE: str = Field(..., description="회견일", alias="TAKING_DATE")
+    TITLE: str | None = Field(None, description="제목", alias="TITLE")
+    PERSON: str | None = Field(None, description="발언자", alias="PERSON")
@@ -0,0 +1,288 @@
+"""Generated models, one module per service. Classes are imported on first access."""
+import importlib
+
+SERVICE_IDS = (
+    "O1OS9V000880XH10851",
+    "OJH286001107IK13829",
+    "OOWY4R001216HX11519",
+    "O6V35E001197UE12021",
+    "OOWY4R001216HX11423",
+    "OVRSWG000917L610310",
+    "OOWY4R001216HX11496",
+    "ORL1S4001007HM19790",
+    "OOWY4R001216HX11497",
+    "OU9HJK001126JG15339",
+    "OOWY4R001216HX11429",
+    "OOWY4R001216HX11526",
+    "O01TEW000977U011862",
+    "OOWY4R001216HX11442",
+    "OQ68B8001071ZB13418",
+    "O2U9RG001168QQ15766",
+    "O575RS001118PF15881",
+    "OZ2W6L0011539T11384",
+    "O9RY2V0011518716129",
+    "OOWY4R001216HX11444",
+    "OK7XM1000938DS17215",
+    "OJAMPB0011929O11426",
+    "O04X68000884BE13083",
+    "ONVQB00009257H12418",
+    "O4UN9N000961PS11812",
+    "OOWY4R001216HX11493",
+    "OQEXW00012074114927",
+    "OG88RA000978S210177",
+    "OAUJIX001138TP16525",
+    "OCROAA001181NA17461",
+    "O2QQLK001176HI14481",
+    "OOWY4R001216HX11450",
+    "OVA33G0011172J17084",
+    "OVRNQQ001062CO16787",
+    "O93OTI000979JV17987",
+    "OOWY4R001216HX11454",
+    "OWSSC6001134T516707",
+    "OOWY4R001216HX11419",
+    "OO1X9P001017YF13038",
+    "OX4XHR001211RB17826",
+    "OB61LZ000981FC12253",
+    "OJ2LTJ001101KO19739",
+    "OF8AJV000972OP11430",
+    "OCSMEJ000953O916134",
+    "OOWY4R001216HX11468",
+    "OGM9FC001165FS12631",
+    "O2Q4ZT001004PV11014",
+    "O6PTDW000886NN18676",
+    "ORDPSW001070QH19059",
+    "OOWY4R001216HX11509",
+    "O5C2PY001120OH19574",
+    "O0KGG20011857W15853",
+    "OA8HOU000969OM19602",
+    "O0UBVR000906UG11689",
+    "OD0T6I001156CA16296",
+    "OZN379001174FW17905",
+    "OOWY4R001216HX11425",
+    "OOWY4R001216HX11426",
+    "OW1R4X0010744X17495",
+    "O13FRZ001177X318752",
+    "O8XZ8U001160SW12010",
+    "OOWY4R001216HX11458",
+    "OOWY4R001216HX11470",
+    "OSPS4X001105IL17344",
+    "OOBAOA001213RL17443",
+    "OOWY4R001216HX11421",
+    "OVUY5B0009241I13320",
+    "OCAJQ4001000LI18751",
+    "OITFOE000968XH15981",
+    "O70WYZ000950T211169",
+    "OOWY4R001216HX11433",
+    "OPP4KM0012097716578",
+    "OFUAJ6001108BJ11284",
+    "OOWY4R001216HX11517",
+    "OEUJQB0012145514537",
+    "ORMXPX0011135N18074",
+    "O8685D0008489413266",
+    "OKBFLN000963SS13091",
+    "O6MC3G0011698G17444",
+    "ORMEIR001164VQ17801",
+    "OFOEZN001060N312362",
+    "OOWY4R001216HX11508",
+    "OOWY4R001216HX11446",
+    "OOWY4R001216HX11415",
+    "OQ0WH1000975M912523",
+    "OOWY4R001216HX11451",
+    "OOWY4R001216HX11422",
+    "OY18U4001075AG16626",
+    "OOWY4R001216HX11424",
+    "OOWY4R001216HX11525",
+    "OET0D9001078G318850",
+    "OOWY4R001216HX11520",
+    "OLI05G0011283N16926",
+    "OOWY4R001216HX11417",
+    "OOWY4R001216HX11501",
+    "O6KN2D001106O610167",
+    "OH01G5001175B914429",
+    "OTA0YC001127RJ11880",
+    "OOWY4R001216HX11513",
+    "ODFFIG001072OX10139",
+    "OOWY4R001216HX11431",
+    "OQG5IZ0011449610187",
+    "O0TLLI0008796R14875",
+    "OOWY4R001216HX11514",
+    "OOWY4R001216HX11420",
+    "O1O34T000932VG10613",
+    "ON9NSL000857D116126",
+    "OD21030011944P19666",
+    "OOWY4R001216HX11462",
+    "OOWY4R001216HX11438",
+    "OOWY4R001216HX11437",
+    "O5MSQF0009823A15643",
+    "OOWY4R001216HX11507",
+    "OB3OEN0011786012232",
+    "OTSI7L0011705B12017",
+    "OAFHCY001008NN11647",
+    "OOWY4R001216HX11445",
+    "OL39BM000986V214201",
+    "OXZDRJ0011169E17589",
+    "OOWY4R001216HX11498",
+    "OOWY4R001216HX11477",
+    "OOWY4R001216HX11432",
+    "OEQ77R000942NL11530",
+    "O2PLAU000882CD18776",
+    "OOWY4R001216HX11486",
+    "O5K6OC001166I215604",
+    "O27DU0000960M511942",
+    "ODNHIU0010588P19122",
+    "OOWY4R001216HX11436",
+    "O7RUVD001183U610140",
+    "OR0YT0001112TD13067",
+    "OKDE3A001150P113085",
+    "O3VTTM0010223D15681",
+    "OOWY4R001216HX11523",
+    "O0MH4O001149BH11948",
+    "OOWY4R001216HX11418",
+    "O927U9001135M913005",
+    "OVW2NU000937WK15521",
+    "OOWY4R001216HX11440",
+    "O78HKE0010099W15881",
+    "OP7W8M000944IF15092",
+    "OB5IBW001180FQ10640",
+    "O4BV430009830710440",
+    "OU8JBT0015343C14378",
+    "OMYCKJ0011621210030",
+    "OOWY4R001216HX11512",
+    "OOWY4R001216HX11492",
+    "OQ0A0T0011366V19103",
+    "OOWY4R001216HX11479",
+    "OT9767000930ZL12696",
+    "OS46YD0012559515463",
+    "OTICJI000959B917394",
+    "OOWY4R001216HX11435",
+    "OJ24FX001003FD16907",
+    "OLH92R0011733J15777",
+    "OH473Z0011245H13792",
+    "OOWY4R001216HX11475",
+    "O8FQ4U000888KF14544",
+    "O6HDE2001161LX18191",
+    "OOWY4R001216HX11494",
+    "OXN4AR0009078I18280",
+    "OOWY4R001216HX11522",
+    "OUSZ4M0011845C16071",
+    "OM5S9O0009857U12121",
+    "O8YX0U001110EM14308",
+    "OY3EE5000956Q913543",
+    "OOWY4R001216HX11428",
+    "OMGXFT001182IV12099",
+    "OOWY4R001216HX11489",
+    "O71AP8001122ZZ10743",
+    "OFJHWN000881T019291",
+    "OR137O001023MZ19321",
+    "O5IUE30009237O13905",
+    "ORNDP7000993P115502",
+    "OOG5NZ000976EC12112",
+    "OXJ0OE001002XA11874",
+    "O4UTN7000934TV19125",
+    "OOWY4R001216HX11461",
+    "OI75DS001208ZW14781",
+    "OCLLF20008904J19487",
+    "OC9MRL000922KH15936",
+    "O6MZOL000912ZG15427",
+    "OU749A0011256511253",
+    "OZHI8N000955DZ17739",
+    "OOWY4R001216HX11449",
+    "O84OO9000939BC16536",
+    "OAUD9V000973QN17203",
+    "O6DY4U000931SN17960",
+    "ODI720001121MP14647",
+    "OR95JZ001114RS11521",
+    "OOWY4R001216HX11434",
+    "O9KCDC000980U619570",
+    "OK160H001152I912731",
+    "OU29AR0009890A11079",
+    "OVDKBQ000915NE11865",
+    "O87UNV000897E818234",
+    "OHXILX000958DD14523",
+    "OOWY4R001216HX11506",
+    "O6P4Y5001146KI12348",
+    "OBL7NF0011935G18076",
+    "O610V6000952AV17729",
+    "OTUNFG0008834Q19898",
+    "OK3DIS001059MR19626",
+    "O32948001073L213726",
+    "OOWY4R001216HX11491",
+    "OFZZ1G001167FC10024",
+    "OS18DL000970OU13480",
+    "OB1YJN001063U411224",
+    "OBV24T000974AX17644",
+    "OOWY4R001216HX11490",
+    "OHN9XR001210S614262",
+    "OBX2DO001030E516625",
+    "OZUY2X001061ON17910",
+    "OAB4WY0009432M10546",
+    "OAJPOY0010182J19421",
+    "OUK015001119KD17086",
+    "OOWY4R001216HX11472",
+    "OOWY4R001216HX11473",
+    "OOWY4R001216HX11510",
+    "OOWY4R001216HX11460",
+    "OXJNQM001195IT17281",
+    "OVDCJU001123OF14595",
+    "O8D9RF000933S512258",
+    "OSKTB0000948E917810",
+    "OCXHYA000859TX17626",
+    "O7OLVS0011544713501",
+    "OJUGHY0009848Z17162",
+    "O8OFB2000905T918825",
+    "OCFWMF000949MH18411",
+    "OOWY4R001216HX11441",
+    "OC0RRQ000852J210654",
+    "O8WI650012155G10023",
+    "OND1KZ0009677M13515",
+    "OOWY4R001216HX11443",
+    "OQ50H1000962NX16376",
+    "O8ZYOF001109VJ11181",
+    "OLFZV7001148O518934",
+    "O4K6HM0012064I15889",
+    "ORRHLL000916DN12489",
+    "O4W19G001189TV11044",
+    "OOWY4R001216HX11430",
+    "OOWY4R001216HX11447",
+    "OEEG26001115LX11448",
+    "OZY6M30010164K11655",
+    "ORPY580008959U11813",
+    "O5UDG0001111CI11346",
+    "OAIEX00008855613861",
+    "OOWY4R001216HX11518",
+    "OOWY4R001216HX11482",
+    "OTL4B3000889YI11365",
+    "O0IS020011724J12768",
+    "OOWY4R001216HX11500",
+    "O6JXFI0011292O12073",
+    "OKAPKX000929X915616",
+    "O5VQRK0008587911609",
+    "OOWY4R001216HX11495",
+    "OOWY4R001216HX11471",
+    "OOWY4R001216HX11521",
+    "O67B1I001080WL10254",
+    "OOWY4R001216HX11524",
+    "OHAC6C000892WC13765",
+    "O8U5BW001076JT16522",
+    "OOWY4R001216HX11505",
+    "OFPR4Q001057VP11437",
+    "OTM7PV000945R113521",
+    "OPR1MQ000998LC12535",
+    "O3VXPE000987AB14703",
+    "OOWY4R001216HX11511",
+    "O3YBRH0011715419177",
+    "OWKPDF000891EB10683",
+    "OOWY4R001216HX11416",
+    "OOWY4R001216HX11516",
+    "OOWY4R001216HX11439",
+    "O7FHUO000928X018370",
+)
+_SERVICE_ID_SET = frozenset(SERVICE_IDS)
+
+
+def __getattr__(name):
+    kind, _, service_id = name.partition("_")
+    if kind in ("Model", "Params") and service_id in _SERVICE_ID_SET:
+        module = importlib.import_module(f"{__name__}.{service_id}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,51 @@
+"""Lazy access to generated per-service model classes."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable, Iterator, Mapping
+
+
+class LazyModelMap(Mapping):
+    """
+    Read-only mapping of service ID -> generated model class.
+
+    Each service's module is imported the first time its class is looked up, so a
+    process that touches two services only builds those two models. Membership
+    checks and iteration never import anything.
+    """
+
+    def __init__(self, package: str, prefix: str, service_ids: Iterable[str]):
+        """
+        Args:
+            package: Dotted name of the package holding one module per service ID.
+            prefix: Class name prefix inside each module (e.g. "Model_" or "Params_").
+            service_ids: All service IDs available in ``package``.
+        """
+        self._package = package
+        self._prefix = prefix
+        self._service_ids = tuple(service_ids)
+        self._known = frozenset(self._service_ids)
+        self._loaded: dict[str, type] = {}
+
+    def __getitem__(self, service_id: str) -> type:
+        cls = self._loaded.get(service_id)
+        if cls is None:
+            if service_id not in self._known:
+                raise KeyError(service_id)
+            module = importlib.import_module(f"{self._package}.{service_id}")
+            cls = getattr(module, f"{self._prefix}{service_id}")
+            self._loaded[service_id] = cls
+        return cls
+
+    def __contains__(self, service_id: object) -> bool:
+        return service_id in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._service_ids)
+
+    def __len__(self) -> int:
+        return len(self._service_ids)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._package!r}, {self._prefix!r}, {len(self)} services, {len(self._loaded)} loaded)"
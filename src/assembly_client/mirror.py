@@ -0,0 +1,227 @@
+"""Local SQLite mirror of service data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import AssemblyAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Columns indexed by default when a service has them (frequent dashboard filters / joins)
+COMMON_INDEX_COLUMNS = ("BILL_ID", "ERACO", "CONF_ID")
+
+ROW_KEY_COLUMN = "_row_key"
+MIRRORED_AT_COLUMN = "_mirrored_at"
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _sql_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+class SQLiteMirror:
+    """
+    Mirrors services into tables of a local SQLite database.
+
+    Each service gets one table named after its service ID, with a TEXT column per
+    ``APISpec.response_fields`` entry (the field description is kept as a comment in
+    the table definition). Rows are upserted on ``_row_key``, a hash of the key columns
+    (or of the whole row when no key is given), so re-mirroring replaces rows instead
+    of duplicating them. Columns listed in ``index_columns`` get an index when present.
+
+    Example:
+        with SQLiteMirror("assembly.db") as mirror:
+            await mirror_service(client, Service.국회의원_발의법률안, mirror, {"AGE": "21"}, key_columns=["BILL_ID"])
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        batch_rows: int = 5000,
+        index_columns: Iterable[str] | None = COMMON_INDEX_COLUMNS,
+    ):
+        """
+        Args:
+            path: SQLite database file (created if missing).
+            batch_rows: Rows per executemany() batch; each upsert call runs in one transaction.
+            index_columns: Columns to index when a table has them. None or () disables indexing.
+        """
+        self.path = Path(path)
+        self.batch_rows = batch_rows
+        self.index_columns = tuple(index_columns or ())
+        self._conn: sqlite3.Connection | None = None
+        self._tables: dict[str, tuple[list[str], list[str]]] = {}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def ensure_table(
+        self,
+        table: str,
+        columns: Sequence[str],
+        key_columns: Sequence[str] | None = None,
+        descriptions: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Create ``table`` (or add columns missing from an existing one) and its indexes.
+
+        Args:
+            table: Table name, normally the service ID.
+            columns: Data columns in spec order.
+            key_columns: Columns identifying a row. None means the whole row is the key.
+            descriptions: Optional {column: description} stored as comments in the schema.
+        """
+        columns = list(dict.fromkeys(columns))
+        key_columns = list(key_columns or [])
+        unknown = [name for name in key_columns if name not in columns]
+        if unknown:
+            raise ValueError(f"Key columns {unknown} are not fields of {table}")
+        descriptions = descriptions or {}
+
+        existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({_quote(table)})")}
+        with self.conn:
+            if not existing:
+                definitions = [f"{_quote(ROW_KEY_COLUMN)} TEXT PRIMARY KEY", f"{_quote(MIRRORED_AT_COLUMN)} REAL"]
+                for name in columns:
+                    comment = " ".join(str(descriptions.get(name, "")).split()).replace("*/", "* /")
+                    definitions.append(f"{_quote(name)} TEXT" + (f" /* {comment} */" if comment else ""))
+                self.conn.execute(f"CREATE TABLE {_quote(table)} (\n  " + ",\n  ".join(definitions) + "\n)")
+            else:
+                for name in columns:
+                    if name not in existing:
+                        logger.info(f"Adding column {name} to mirror table {table}")
+                        self.conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(name)} TEXT")
+
+            for name in self.index_columns:
+                if name in columns:
+                    self.conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table}_{name}')} ON {_quote(table)} ({_quote(name)})"
+                    )
+
+        self._tables[table] = (columns, key_columns or columns)
+
+    def has_table(self, table: str) -> bool:
+        """Whether ``ensure_table`` has been called for ``table`` on this mirror."""
+        return table in self._tables
+
+    def upsert(self, table: str, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert or replace rows (raw API dicts) in batches inside one transaction.
+
+        Returns:
+            Number of rows written.
+        """
+        if table not in self._tables:
+            raise KeyError(f"Unknown mirror table {table!r}; call ensure_table() first")
+        if not rows:
+            return 0
+
+        columns, key_columns = self._tables[table]
+        names = [ROW_KEY_COLUMN, MIRRORED_AT_COLUMN, *columns]
+        updates = ", ".join(f"{_quote(name)} = excluded.{_quote(name)}" for name in names[1:])
+        sql = (
+            f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, names))}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT({_quote(ROW_KEY_COLUMN)}) DO UPDATE SET {updates}"
+        )
+
+        now = time.time()
+        with self.conn:
+            for start in range(0, len(rows), self.batch_rows):
+                batch = []
+                for row in rows[start : start + self.batch_rows]:
+                    key = json.dumps([row.get(name) for name in key_columns], ensure_ascii=False, default=str)
+                    values = [_sql_value(row.get(name)) for name in columns]
+                    batch.append((hashlib.sha1(key.encode("utf-8")).hexdigest(), now, *values))
+                self.conn.executemany(sql, batch)
+        return len(rows)
+
+    def count(self, table: str) -> int:
+        """Number of rows mirrored in ``table``."""
+        return self.conn.execute(f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+async def mirror_service(
+    client: AssemblyAPIClient,
+    service_id_or_name: str,
+    mirror: SQLiteMirror,
+    params: dict[str, Any] | None = None,
+    key_columns: Sequence[str] | None = None,
+    p_size: int = 1000,
+    concurrency: int = 4,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Pull every page of a service into its mirror table.
+
+    The table schema comes from the service's cached ``APISpec.response_fields``
+    (falling back to the keys of the first row when the spec lists no fields).
+    Each page is upserted in its own transaction as it arrives.
+
+    Args:
+        client: Client used to fetch the data.
+        service_id_or_name: The API service ID or Service Name.
+        mirror: Target database.
+        params: Query parameters (pIndex/pSize are managed internally).
+        key_columns: Columns identifying a row (e.g. ["BILL_ID"]). None means the whole row.
+        p_size: Page size.
+        concurrency: Max number of pages fetched at once.
+        on_progress: Called with the running row count after each page is written.
+
+    Returns:
+        Number of rows written.
+    """
+    service_id = client._resolve_service_id(service_id_or_name)
+
+    spec = await client.get_spec(service_id)
+    fields = spec.response_fields
+    if fields:
+        mirror.ensure_table(service_id, [f.name for f in fields], key_columns, {f.name: f.description for f in fields})
+
+    total = 0
+    async for rows in client.get_all_data(
+        service_id, params, p_size=p_size, concurrency=concurrency, ordered=False, decode="dict"
+    ):
+        if not rows:
+            continue
+        if not mirror.has_table(service_id):
+            mirror.ensure_table(service_id, list(rows[0].keys()), key_columns)
+        total += mirror.upsert(service_id, rows)
+        if on_progress is not None:
+            on_progress(total)
+
+    logger.info(f"Mirrored {total} rows of {service_id} into {mirror.path}")
+    return total
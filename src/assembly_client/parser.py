@@ -3,20 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+import re
+import time
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import httpx
-import openpyxl
-import platformdirs
 
 from .errors import SpecParseError
+from .registry import get_registry
+from .session import AssemblySession
+from .spec_store import FETCH_TIME_INDEX, INF_SEQ_INDEX, JsonSpecStore, SpecStore
+from .transport import TransportConfig
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 logger = logging.getLogger(__name__)
 
 
+def default_cache_dir() -> Path:
+    """Default spec cache directory (e.g. ~/.cache/assembly-api-client/specs); not created here."""
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("assembly-api-client")) / "specs"
+
+
 @dataclass
 class APIParameter:
     """Represents a single API parameter."""
@@ -80,21 +98,52 @@ class SpecParser:
         b"PK\x07\x08",  # Spanned ZIP archive
     ]
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        transport: TransportConfig | None = None,
+        session: AssemblySession | None = None,
+        executor: Executor | None = None,
+        store: SpecStore | None = None,
+    ):
         """
         Initialize the spec parser.
 
         Args:
             cache_dir: Directory to cache parsed JSON specs.
                        If None, uses user cache directory (e.g., ~/.cache/assembly-api-client/specs).
+            transport: HTTP settings used for spec downloads. If None, uses TransportConfig defaults.
+                       Ignored when ``session`` is given.
+            session: Shared HTTP session. If None, the parser creates its own;
+                     call ``aclose()`` (or use ``async with``) to release it.
+            executor: Where Excel workbooks are parsed. If None, a worker thread is used.
+                      Pass a ``ProcessPoolExecutor`` to parse on several cores during bulk
+                      syncs; the caller owns (and shuts down) the executor.
+            store: Backend holding parsed specs. If None, uses one JSON file per service
+                   in ``cache_dir``. ``SQLiteSpecStore`` keeps all specs in a single file.
         """
-        if cache_dir is None:
-            cache_base = Path(platformdirs.user_cache_dir("assembly-api-client"))
-            self.cache_dir = cache_base / "specs"
-        else:
-            self.cache_dir = cache_dir
+        self._owns_session = session is None
+        self.session = session or AssemblySession(transport)
+        self.transport = self.session.transport
+        self.executor = executor
+
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or JsonSpecStore(self.cache_dir)
+        self.inf_seq_index = self.store.index(INF_SEQ_INDEX, int)
+        self.fetch_times = self.store.index(FETCH_TIME_INDEX, float)
+
+    async def aclose(self) -> None:
+        """Close the HTTP session (only if this parser created it)."""
+        if self._owns_session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     def _is_valid_excel_file(self, content: bytes) -> bool:
         """
@@ -123,45 +172,44 @@ class SpecParser:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                try:
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    raise SpecParseError(
-                        f"Failed to download spec for {service_id}: {exc.response.status_code}"
-                    ) from exc
-
-                content = response.content
-                if len(content) < 100:
-                    raise SpecParseError(f"Downloaded content too small: {len(content)} bytes")
-
-                if not self._is_valid_excel_file(content):
-                    # Provide diagnostic information
-                    preview = content[:200].decode("utf-8", errors="replace")
-                    is_html = content.startswith(b"<!DOCTYPE") or content.startswith(b"<html")
-
-                    error_msg = f"Downloaded content for {service_id} is not a valid Excel file."
-                    if is_html:
-                        error_msg += (
-                            f"\n\nThe server returned an HTML page instead of an Excel file. "
-                            f"This usually means:\n"
-                            f"1. The service ID '{service_id}' is invalid or not found\n"
-                            f"2. The infSeq parameter ({inf_seq}) is incorrect\n"
-                            f"3. The public data portal's spec download endpoint has changed\n\n"
-                            f"Content preview: {preview[:100]}..."
-                        )
-                    else:
-                        error_msg += (
-                            f"\n\nContent starts with: {content[:50]!r}\n"
-                            f"Expected Excel magic numbers (ZIP format): PK\\x03\\x04\n"
-                            f"This may indicate a temporary server error or API change."
-                        )
-
-                    raise SpecParseError(error_msg)
-
-                logger.info(f"Downloaded spec for {service_id} ({len(content)} bytes)")
-                return content
+            response = await self.session.get(url, headers=headers)
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                raise SpecParseError(
+                    f"Failed to download spec for {service_id}: {exc.response.status_code}"
+                ) from exc
+
+            content = response.content
+            if len(content) < 100:
+                raise SpecParseError(f"Downloaded content too small: {len(content)} bytes")
+
+            if not self._is_valid_excel_file(content):
+                # Provide diagnostic information
+                preview = content[:200].decode("utf-8", errors="replace")
+                is_html = content.startswith(b"<!DOCTYPE") or content.startswith(b"<html")
+
+                error_msg = f"Downloaded content for {service_id} is not a valid Excel file."
+                if is_html:
+                    error_msg += (
+                        f"\n\nThe server returned an HTML page instead of an Excel file. "
+                        f"This usually means:\n"
+                        f"1. The service ID '{service_id}' is invalid or not found\n"
+                        f"2. The infSeq parameter ({inf_seq}) is incorrect\n"
+                        f"3. The public data portal's spec download endpoint has changed\n\n"
+                        f"Content preview: {preview[:100]}..."
+                    )
+                else:
+                    error_msg += (
+                        f"\n\nContent starts with: {content[:50]!r}\n"
+                        f"Expected Excel magic numbers (ZIP format): PK\\x03\\x04\n"
+                        f"This may indicate a temporary server error or API change."
+                    )
+
+                raise SpecParseError(error_msg)
+
+            logger.info(f"Downloaded spec for {service_id} ({len(content)} bytes)")
+            return content
 
         except httpx.HTTPError as e:
             raise SpecParseError(f"Network error downloading spec for {service_id}: {e}") from e
@@ -169,256 +217,372 @@ class SpecParser:
     async def parse_spec(self, service_id: str, inf_seq: int = 2) -> APISpec:
         """
         Get API specification.
-        1. Checks if JSON spec exists in cache.
-        2. If not, downloads Excel to memory, parses it, saves JSON to cache, and returns it.
+        1. Checks if the spec exists in the spec store.
+        2. If not, downloads Excel to memory, parses it, saves it to the store, and returns it.
 
-        Note: If download fails with the provided infSeq value, automatically retries with 
-        other infSeq values (1-5) as a fallback.
+        Note: The infSeq that worked for this service before (else ``inf_seq``) is tried first.
+        If that fails, the other infSeq values (1-5) are probed concurrently and the first
+        valid workbook wins; the working value is remembered for next time.
+        """
+        spec, _ = await self.fetch_spec(service_id, inf_seq)
+        return spec
+
+    def cached_spec(self, service_id: str) -> APISpec | None:
+        """The spec in the spec store, or None if it is missing or unreadable (never downloads)."""
+        data = self.store.get(service_id)
+        if data is None:
+            return None
+        try:
+            return APISpec.from_dict(data)
+        except Exception as e:
+            logger.warning(f"Failed to load cached spec for {service_id}: {e}")
+            return None
+
+    async def fetch_spec(
+        self, service_id: str, inf_seq: int = 2, max_age: float | None = None
+    ) -> tuple[APISpec, str]:
         """
-        json_file = self.cache_dir / f"{service_id}.json"
+        Get API specification, re-checking the source once the cached copy is older than ``max_age``.
+
+        Each stored spec carries the SHA-256 of the workbook it was parsed from; download
+        times are kept apart in ``fetch_times``. When a re-downloaded workbook has the same
+        hash, parsing is skipped and only the fetch time is recorded (the stored spec is
+        not rewritten).
+
+        Args:
+            service_id: The API service ID.
+            inf_seq: infSeq to try first when nothing is known about the service.
+            max_age: Seconds a cached spec stays fresh. None means cached specs are always
+                     used (like parse_spec); 0 forces a re-check.
 
+        Returns:
+            (spec, status) where status is "cached", "unchanged" or "updated".
+        """
         # 1. Try Cache
-        if json_file.exists():
+        data = self.store.get(service_id)
+        cached = None
+        if data is not None:
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    logger.debug(f"Loaded spec for {service_id} from cache")
-                    return APISpec.from_dict(data)
+                cached = APISpec.from_dict(data)
             except Exception as e:
                 logger.warning(f"Failed to load cached spec for {service_id}, re-downloading: {e}")
 
-        # 2. Download and Parse (Stream Processing with automatic fallback)
-        excel_content = None
-        
-        # Try a range of infSeq values as some services use non-standard ones (1, 2, 3...)
-        attempt_seqs = [inf_seq] + [s for s in self.DEFAULT_INF_SEQ_ORDER if s != inf_seq]
-        last_error = None
-
-        for seq in attempt_seqs:
-            try:
-                excel_content = await self._download_excel_bytes(service_id, seq)
-                logger.info(f"Successfully downloaded spec for {service_id} using infSeq={seq}")
-                break
-            except SpecParseError as e:
-                last_error = e
-                logger.debug(f"Failed to download spec for {service_id} with infSeq={seq}: {e}")
-                continue
-
-        if excel_content is None:
-            raise SpecParseError(
-                f"Failed to download spec for {service_id} after trying infSeq values {attempt_seqs}.\n"
-                f"Last error: {last_error}"
-            )
-
-        def _parse_sync(content: bytes):
-            import re
-            from io import BytesIO
-
-            try:
-                wb = openpyxl.load_workbook(BytesIO(content))
-                ws = wb["Sheet1"]
-
-                # Extract endpoint URL
-                endpoint_url = self._extract_endpoint_url(ws)
-                if not endpoint_url:
-                    raise SpecParseError(f"Could not find endpoint URL in spec for {service_id}")
-
-                endpoint = endpoint_url.split("/")[-1]
+        if cached is not None:
+            # Specs without a recorded fetch time count as stale
+            age = time.time() - (self.fetch_times.get(service_id) or 0)
+            if max_age is None or age <= max_age:
+                logger.debug(f"Loaded spec for {service_id} from cache")
+                return cached, "cached"
+
+        # 2. Download and compare with the cached workbook
+        excel_content, used_seq = await self._download_spec_workbook(service_id, inf_seq)
+        content_hash = hashlib.sha256(excel_content).hexdigest()
+
+        if cached is not None and data.get("content_hash") == content_hash:
+            logger.debug(f"Spec workbook for {service_id} unchanged")
+            await asyncio.to_thread(self._save_fetch, service_id, None, used_seq)
+            return cached, "unchanged"
+
+        # 3. Parse
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            spec = await loop.run_in_executor(self.executor, parse_spec_workbook, service_id, excel_content)
+        else:
+            spec = await asyncio.to_thread(parse_spec_workbook, service_id, excel_content)
 
-                # Extract parameters
-                basic_params = []
-                request_params = []
-                response_fields = []
+        # Save to the spec store (file/database writes stay off the event loop)
+        await asyncio.to_thread(
+            self._save_fetch, service_id, {**spec.to_dict(), "content_hash": content_hash}, used_seq
+        )
+        return spec, "updated"
 
-                in_basic_section = False
-                in_request_section = False
-                in_response_section = False
+    def _save_fetch(self, service_id: str, data: dict[str, Any] | None, inf_seq: int) -> None:
+        """
+        Internal: store a freshly parsed spec (if any), the infSeq that worked and the
+        fetch time. Runs in a worker thread so no store write happens on the event loop.
+        """
+        if data is not None:
+            self.store.put(service_id, data)
+        if self.inf_seq_index.get(service_id) != inf_seq:
+            self.inf_seq_index.set(service_id, inf_seq)
+        self.fetch_times.set(service_id, time.time())
 
-                for row in ws.iter_rows(min_row=1, values_only=True):
-                    if not row or not any(row):
-                        continue
+    async def _download_spec_workbook(self, service_id: str, inf_seq: int = 2) -> tuple[bytes, int]:
+        """
+        Internal: download the spec workbook, trying the remembered infSeq first and
+        probing the other candidates concurrently on failure.
 
-                    first_cell = str(row[0]) if row[0] else ""
+        Returns the workbook bytes and the infSeq that produced them.
+        """
+        known_seq = self.inf_seq_index.get(service_id)
+        first_seq = known_seq or inf_seq
+        attempt_seqs = [first_seq] + [s for s in [inf_seq, *self.DEFAULT_INF_SEQ_ORDER] if s != first_seq]
+        attempt_seqs = list(dict.fromkeys(attempt_seqs))
 
-                    if "기본인자" in first_cell:
-                        in_basic_section = True
-                        in_request_section = False
-                        in_response_section = False
-                        continue
-                    elif "요청인자" in first_cell:
-                        in_basic_section = False
-                        in_request_section = True
-                        in_response_section = False
-                        continue
-                    elif "출력값" in first_cell or "출력명" in first_cell:
-                        in_basic_section = False
-                        in_request_section = False
-                        in_response_section = True
-                        continue
+        try:
+            excel_content = await self._download_excel_bytes(service_id, first_seq)
+            used_seq = first_seq
+        except SpecParseError as e:
+            logger.debug(f"Failed to download spec for {service_id} with infSeq={first_seq}: {e}")
+            used_seq, excel_content, last_error = await self._probe_inf_seqs(service_id, attempt_seqs[1:])
+            if excel_content is None:
+                raise SpecParseError(
+                    f"Failed to download spec for {service_id} after trying infSeq values {attempt_seqs}.\n"
+                    f"Last error: {last_error or e}"
+                ) from None
+
+        logger.info(f"Successfully downloaded spec for {service_id} using infSeq={used_seq}")
+        return excel_content, used_seq
+
+    async def _probe_inf_seqs(
+        self, service_id: str, inf_seqs: list[int]
+    ) -> tuple[int | None, bytes | None, Exception | None]:
+        """
+        Internal: download the spec with all ``inf_seqs`` at once and keep the first valid workbook.
 
-                    if (in_basic_section or in_request_section or in_response_section) and len(row) >= 3 and row[1]:
-                        # For response fields, row[1] might be the field name or description depending on format
-                        # Standard format: Name | Type | Description
-
-                        type_str = str(row[1])
-
-                        # Basic/Request params have "필수"/"선택" in type
-                        is_param = "필수" in type_str or "선택" in type_str
-
-                        if in_response_section:
-                            # Heuristic to find the Field Name (English) and Description (Korean)
-                            # Common formats:
-                            # 1. Name | Description | Type
-                            # 2. No | Name | Description | Type
-                            # 3. No | Description | Name | Type
-
-                            # Skip header rows
-                            if (
-                                "출력" in str(row[0])
-                                or "설명" in str(row[0])
-                                or "No" in str(row[0])
-                                or "순번" in str(row[0])
-                            ):
-                                continue
-
-                            # Find the column that looks like an English Key (uppercase, underscores)
-                            field_name = ""
-                            description = ""
-                            found_key = False
-
-                            for cell in row:
-                                if not cell:
-                                    continue
-                                s = str(cell).strip()
-                                # Check if it looks like an API Key (e.g. BILL_ID, AGE, etc)
-                                # Must be mostly ASCII, maybe uppercase, no Korean
-                                if re.match(r"^[A-Z0-9_]+$", s) and not re.search(r"[가-힣]", s):
-                                    # Avoid numbers like "1", "1.0" unless they are the only thing?
-                                    # But "1" is likely a sequence number.
-                                    # Let's assume keys are at least 2 chars or contain letters?
-                                    # Some keys might be "ID".
-                                    if s.replace(".", "").isdigit():
-                                        continue
-
-                                    field_name = s
-                                    found_key = True
-                                    break
-
-                            if found_key:
-                                # Description is usually the cell with Korean
-                                for cell in row:
-                                    if not cell:
-                                        continue
-                                    s = str(cell).strip()
-                                    if re.search(r"[가-힣]", s):
-                                        description = s
-                                        break
-
-                                    # Fallback logic
-                                    pass
-
-                                # Skip standard error/info codes
-                                if field_name in ["ERROR", "INFO", "CODE", "MESSAGE"]:
-                                    continue
-
-                                param = APIParameter(
-                                    name=field_name,
-                                    type="String",  # Default to String as type info is often messy
-                                    required=False,
-                                    description=description,
-                                )
-                                response_fields.append(param)
-
-                        elif is_param:
-                            param = APIParameter(
-                                name=str(row[0]),
-                                type=type_str,
-                                required="필수" in type_str,
-                                description=str(row[2]) if len(row) > 2 and row[2] else "",
-                            )
-                            if in_basic_section:
-                                basic_params.append(param)
-                            else:
-                                request_params.append(param)
-
-                spec = APISpec(
-                    service_id=service_id,
-                    endpoint=endpoint,
-                    endpoint_url=endpoint_url,
-                    basic_params=basic_params,
-                    request_params=request_params,
-                    response_fields=response_fields,
-                )
+        Returns (infSeq, content, None) on success or (None, None, last_error) if all fail.
+        The remaining downloads are cancelled as soon as one succeeds.
+        """
+        if not inf_seqs:
+            return None, None, None
 
-                # Save to JSON cache
-                self.save_spec_json(spec, self.cache_dir)
-                return spec
+        async def attempt(seq: int) -> tuple[int, bytes]:
+            return seq, await self._download_excel_bytes(service_id, seq)
 
+        tasks = [asyncio.ensure_future(attempt(seq)) for seq in inf_seqs]
+        last_error = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    seq, content = await next_done
+                    return seq, content, None
+                except SpecParseError as e:
+                    last_error = e
+                    logger.debug(f"Failed to download spec for {service_id} while probing infSeq: {e}")
+            return None, None, last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def load_cached_specs(self) -> dict[str, APISpec]:
+        """Return every stored spec as {service_id: APISpec} (one bulk read with ``SQLiteSpecStore``)."""
+        specs = {}
+        for sid, data in self.store.load_all().items():
+            try:
+                specs[sid] = APISpec.from_dict(data)
             except Exception as e:
-                raise SpecParseError(f"Failed to parse spec for {service_id}: {e}") from e
-
-        return await asyncio.to_thread(_parse_sync, excel_content)
+                logger.warning(f"Skipping unreadable cached spec for {sid}: {e}")
+        return specs
 
     def clear_cache(self, service_id: str | None = None) -> None:
         """
-        Remove cached JSON spec.
+        Remove cached specs.
         If service_id is provided, removes only that spec.
-        If None, removes all specs in the cache directory.
+        If None, removes everything cached: all specs, the cached master list
+        (``all_apis.json``) and the remembered infSeq values and fetch times.
         """
         if service_id:
-            json_file = self.cache_dir / f"{service_id}.json"
-            if json_file.exists():
-                json_file.unlink()
-                logger.debug(f"Cleared cache for {service_id}")
+            self.store.delete(service_id)
+            logger.debug(f"Cleared cache for {service_id}")
         else:
-            for json_file in self.cache_dir.glob("*.json"):
-                json_file.unlink()
+            self.store.clear()
+            self.inf_seq_index.clear()
+            self.fetch_times.clear()
+            (self.cache_dir / "all_apis.json").unlink(missing_ok=True)
             logger.debug("Cleared all cache")
 
-    def _extract_endpoint_url(self, worksheet) -> str | None:
-        """
-        Extract endpoint URL from worksheet.
 
-        Args:
-            worksheet: openpyxl worksheet object
-
-        Returns:
-            Endpoint URL or None if not found
-        """
-        for row in worksheet.iter_rows(min_row=1, max_row=50, max_col=1):
-            cell = row[0]
-            if cell.value and "요청주소" in str(cell.value):
-                # Next row should contain the URL
-                next_row_value = worksheet.cell(cell.row + 1, 1).value
-                if next_row_value and "https://" in str(next_row_value):
-                    url = str(next_row_value).strip().replace("- ", "")
-                    return url
-        return None
+# The "요청주소" label is looked for in this many leading rows; the URL is on the next row
+ENDPOINT_LABEL_MAX_ROW = 50
 
 
-def load_service_map(cache_dir: Path) -> dict[str, str]:
-    """Load service ID to Name mapping from cached master list."""
-    service_map = {}
-    master_file = cache_dir / "all_apis.json"
+def parse_spec_workbook(service_id: str, content: bytes) -> APISpec:
+    """
+    Parse a downloaded Excel specification into an APISpec.
 
-    if not master_file.exists():
-        return {}
+    A plain module-level function so it can run in a worker process
+    (see ``SpecParser(executor=...)``); it does no I/O besides reading ``content``.
+    Rows are streamed by the native reader in ``xlsx``; openpyxl (read-only mode)
+    is only used when the workbook layout is not understood by it.
+    """
+    # Only needed when a spec is actually downloaded, not on the data path
+    from .xlsx import XlsxFormatError, iter_sheet_rows
 
     try:
-        with open(master_file, encoding="utf-8") as f:
-            data = json.load(f)
-            if "OPENSRVAPI" in data:
-                for item in data["OPENSRVAPI"]:
-                    if "row" in item:
-                        for row in item["row"]:
-                            inf_id = row.get("INF_ID")
-                            inf_nm = row.get("INF_NM")
-                            if inf_id and inf_nm:
-                                service_map[inf_id] = inf_nm
+        try:
+            return _spec_from_rows(service_id, iter_sheet_rows(content, "Sheet1"))
+        except XlsxFormatError as e:
+            logger.debug(f"Native xlsx reader failed for {service_id} ({e}); falling back to openpyxl")
+
+        import openpyxl
+
+        wb = openpyxl.load_workbook(BytesIO(content), read_only=True)
+        try:
+            ws = wb["Sheet1"]
+            # Some exported sheets carry a wrong <dimension>; don't let it truncate rows
+            ws.reset_dimensions()
+            return _spec_from_rows(service_id, ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
     except Exception as e:
-        logger.error(f"Failed to load master list {master_file}: {e}")
+        raise SpecParseError(f"Failed to parse spec for {service_id}: {e}") from e
+
 
-    return service_map
+def _spec_from_rows(service_id: str, rows: Iterable[tuple]) -> APISpec:
+    """
+    Build an APISpec from worksheet rows (tuples of cell values) in a single pass.
+
+    Picks up the endpoint URL (row after the "요청주소" label) and the 기본인자 /
+    요청인자 / 출력값 sections as the rows go by.
+    """
+    endpoint_url = None
+    url_on_this_row = False
+
+    # Extract parameters
+    basic_params = []
+    request_params = []
+    response_fields = []
+
+    in_basic_section = False
+    in_request_section = False
+    in_response_section = False
+
+    for row_number, row in enumerate(rows, start=1):
+        first_value = row[0] if row else None
+        if endpoint_url is None:
+            if url_on_this_row and first_value and "https://" in str(first_value):
+                endpoint_url = str(first_value).strip().replace("- ", "")
+            url_on_this_row = (
+                row_number <= ENDPOINT_LABEL_MAX_ROW and first_value is not None and "요청주소" in str(first_value)
+            )
+
+        if not row or not any(row):
+            continue
+
+        # Streaming readers trim trailing empty cells; pad like a full worksheet row
+        if len(row) < 3:
+            row = tuple(row) + (None,) * (3 - len(row))
+
+        first_cell = str(row[0]) if row[0] else ""
+
+        if "기본인자" in first_cell:
+            in_basic_section = True
+            in_request_section = False
+            in_response_section = False
+            continue
+        elif "요청인자" in first_cell:
+            in_basic_section = False
+            in_request_section = True
+            in_response_section = False
+            continue
+        elif "출력값" in first_cell or "출력명" in first_cell:
+            in_basic_section = False
+            in_request_section = False
+            in_response_section = True
+            continue
+
+        if (in_basic_section or in_request_section or in_response_section) and len(row) >= 3 and row[1]:
+            # For response fields, row[1] might be the field name or description depending on format
+            # Standard format: Name | Type | Description
+
+            type_str = str(row[1])
+
+            # Basic/Request params have "필수"/"선택" in type
+            is_param = "필수" in type_str or "선택" in type_str
+
+            if in_response_section:
+                # Heuristic to find the Field Name (English) and Description (Korean)
+                # Common formats:
+                # 1. Name | Description | Type
+                # 2. No | Name | Description | Type
+                # 3. No | Description | Name | Type
+
+                # Skip header rows
+                if (
+                    "출력" in str(row[0])
+                    or "설명" in str(row[0])
+                    or "No" in str(row[0])
+                    or "순번" in str(row[0])
+                ):
+                    continue
+
+                # Find the column that looks like an English Key (uppercase, underscores)
+                field_name = ""
+                description = ""
+                found_key = False
+
+                for cell in row:
+                    if not cell:
+                        continue
+                    s = str(cell).strip()
+                    # Check if it looks like an API Key (e.g. BILL_ID, AGE, etc)
+                    # Must be mostly ASCII, maybe uppercase, no Korean
+                    if re.match(r"^[A-Z0-9_]+$", s) and not re.search(r"[가-힣]", s):
+                        # Avoid numbers like "1", "1.0" unless they are the only thing?
+                        # But "1" is likely a sequence number.
+                        # Let's assume keys are at least 2 chars or contain letters?
+                        # Some keys might be "ID".
+                        if s.replace(".", "").isdigit():
+                            continue
+
+                        field_name = s
+                        found_key = True
+                        break
+
+                if found_key:
+                    # Description is usually the cell with Korean
+                    for cell in row:
+                        if not cell:
+                            continue
+                        s = str(cell).strip()
+                        if re.search(r"[가-힣]", s):
+                            description = s
+                            break
+
+                        # Fallback logic
+                        pass
+
+                    # Skip standard error/info codes
+                    if field_name in ["ERROR", "INFO", "CODE", "MESSAGE"]:
+                        continue
+
+                    param = APIParameter(
+                        name=field_name,
+                        type="String",  # Default to String as type info is often messy
+                        required=False,
+                        description=description,
+                    )
+                    response_fields.append(param)
+
+            elif is_param:
+                param = APIParameter(
+                    name=str(row[0]),
+                    type=type_str,
+                    required="필수" in type_str,
+                    description=str(row[2]) if len(row) > 2 and row[2] else "",
+                )
+                if in_basic_section:
+                    basic_params.append(param)
+                else:
+                    request_params.append(param)
+
+    if not endpoint_url:
+        raise SpecParseError(f"Could not find endpoint URL in spec for {service_id}")
+
+    return APISpec(
+        service_id=service_id,
+        endpoint=endpoint_url.split("/")[-1],
+        endpoint_url=endpoint_url,
+        basic_params=basic_params,
+        request_params=request_params,
+        response_fields=response_fields,
+    )
+
+
+def load_service_map(cache_dir: Path) -> dict[str, str]:
+    """Load service ID to Name mapping from cached master list."""
+    return dict(get_registry(cache_dir).names)
 
 
 def load_service_metadata(cache_dir: Path) -> dict[str, dict[str, str]]:
@@ -432,29 +596,4 @@ def load_service_metadata(cache_dir: Path) -> dict[str, dict[str, str]]:
         - organization: Organization (ORG_NM)
         - endpoint: Service URL (SRV_URL)
     """
-    service_metadata = {}
-    master_file = cache_dir / "all_apis.json"
-
-    if not master_file.exists():
-        return {}
-
-    try:
-        with open(master_file, encoding="utf-8") as f:
-            data = json.load(f)
-            if "OPENSRVAPI" in data:
-                for item in data["OPENSRVAPI"]:
-                    if "row" in item:
-                        for row in item["row"]:
-                            inf_id = row.get("INF_ID")
-                            if inf_id:
-                                service_metadata[inf_id] = {
-                                    "name": row.get("INF_NM", ""),
-                                    "description": row.get("INF_EXP", ""),
-                                    "category": row.get("CATE_NM", ""),
-                                    "organization": row.get("ORG_NM", ""),
-                                    "endpoint": row.get("SRV_URL", ""),
-                                }
-    except Exception as e:
-        logger.error(f"Failed to load service metadata {master_file}: {e}")
-
-    return service_metadata
+    return {sid: dict(entry) for sid, entry in get_registry(cache_dir).metadata.items()}
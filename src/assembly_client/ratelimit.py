@@ -0,0 +1,103 @@
+"""Client-side rate limiting for requests to open.assembly.go.kr."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; every request
+    takes one token and waits when the bucket is empty. ``pause()`` blocks all
+    callers for a given time (used to honor ``Retry-After``).
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Args:
+            rate: Sustained requests per second.
+            burst: Max requests allowed back-to-back. Defaults to ``max(1, int(rate))``.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        if self.capacity < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` and drop the accumulated burst."""
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._blocked_until)
+
+
+def retry_after_delay(response: httpx.Response | None, max_delay: float | None = None) -> float | None:
+    """
+    Read the ``Retry-After`` header of a response as a delay in seconds.
+
+    Supports both the delta-seconds and HTTP-date forms. Returns None if the header is
+    absent or malformed. With ``max_delay`` the delay is clamped to that many seconds.
+    """
+    delay = _parse_retry_after(response)
+    if delay is not None and max_delay is not None:
+        delay = min(delay, max_delay)
+    return delay
+
+
+def _parse_retry_after(response: httpx.Response | None) -> float | None:
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring malformed Retry-After header: {value!r}")
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,185 @@
+"""Process-wide registry of the services listed in the cached master list."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from .search import ServiceSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceInfo(NamedTuple):
+    """Master list entry of one service."""
+
+    name: str
+    description: str
+    category: str
+    organization: str
+    endpoint: str
+
+
+class ServiceRegistry:
+    """
+    ID/name lookups and metadata from ``all_apis.json``, parsed once and shared.
+
+    The file is re-read only when its modification time or size changes, so looking
+    the registry up for every new client costs a single ``stat()``. The exposed
+    mappings are read-only views; a reload replaces them rather than mutating them.
+    """
+
+    def __init__(self, master_file: Path):
+        self.master_file = master_file
+        self._lock = threading.Lock()
+        self._signature: tuple[int, int] | None = None
+        self._names: MappingProxyType[str, str] = MappingProxyType({})
+        self._ids: MappingProxyType[str, str] = MappingProxyType({})
+        self._info: MappingProxyType[str, ServiceInfo] = MappingProxyType({})
+        self._metadata: MappingProxyType[str, dict[str, str]] | None = None
+        self._search_index: ServiceSearchIndex | None = None
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.master_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> ServiceRegistry:
+        """Reload the master list if the file changed since the last load."""
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return self
+        with self._lock:
+            if signature != self._signature:
+                self._load(signature)
+        return self
+
+    def _load(self, signature: tuple[int, int] | None) -> None:
+        names: dict[str, str] = {}
+        info: dict[str, ServiceInfo] = {}
+        if signature is not None:
+            try:
+                with open(self.master_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                for item in data.get("OPENSRVAPI", []):
+                    for row in item.get("row", []):
+                        inf_id = row.get("INF_ID")
+                        if not inf_id:
+                            continue
+                        inf_nm = row.get("INF_NM")
+                        if inf_nm:
+                            names[inf_id] = inf_nm
+                        info[inf_id] = ServiceInfo(
+                            inf_nm or "",
+                            row.get("INF_EXP", ""),
+                            row.get("CATE_NM", ""),
+                            row.get("ORG_NM", ""),
+                            row.get("SRV_URL", ""),
+                        )
+            except Exception as e:
+                logger.error(f"Failed to load master list {self.master_file}: {e}")
+
+        self._names = MappingProxyType(names)
+        self._ids = MappingProxyType({name: sid for sid, name in names.items()})
+        self._info = MappingProxyType(info)
+        self._metadata = None
+        self._search_index = None
+        self._signature = signature
+
+    @property
+    def names(self) -> MappingProxyType[str, str]:
+        """Service ID -> name."""
+        return self._names
+
+    @property
+    def ids(self) -> MappingProxyType[str, str]:
+        """Service name -> ID."""
+        return self._ids
+
+    @property
+    def info(self) -> MappingProxyType[str, ServiceInfo]:
+        """Service ID -> ``ServiceInfo``."""
+        return self._info
+
+    @property
+    def metadata(self) -> MappingProxyType[str, dict[str, str]]:
+        """Service ID -> metadata dict (see ``load_service_metadata``), built on first access."""
+        metadata = self._metadata
+        if metadata is None:
+            metadata = MappingProxyType({sid: entry._asdict() for sid, entry in self._info.items()})
+            self._metadata = metadata
+        return metadata
+
+    @property
+    def search_index(self) -> ServiceSearchIndex:
+        """Ranked search index over the services, built on first access."""
+        index = self._search_index
+        if index is None:
+            from .search import ServiceSearchIndex
+
+            index = ServiceSearchIndex(self._info)
+            self._search_index = index
+        return index
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[str, float]]:
+        """Ranked matches for ``query``, see ``ServiceSearchIndex.search``."""
+        return self.search_index.search(query, limit)
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+
+_registries: dict[Path, ServiceRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(cache_dir: Path) -> ServiceRegistry:
+    """Return the shared, up-to-date registry for a spec cache directory."""
+    master_file = Path(cache_dir).resolve() / "all_apis.json"
+    registry = _registries.get(master_file)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(master_file, ServiceRegistry(master_file))
+    return registry.refresh()
+
+
+@lru_cache(maxsize=1)
+def baked_services() -> Mapping[str, tuple[str, str, str]]:
+    """
+    The service table generated by codegen (``generated/registry.py``):
+    {service_id: (name, endpoint, category)}. Empty if it has not been generated.
+    """
+    try:
+        from .generated.registry import SERVICES
+    except ImportError:
+        return MappingProxyType({})
+    return MappingProxyType(SERVICES)
+
+
+@lru_cache(maxsize=1)
+def _baked_name_index() -> dict[str, str]:
+    from .search import normalize
+
+    return {normalize(name): sid for sid, (name, _, _) in baked_services().items() if name}
+
+
+def baked_endpoint(service_id: str) -> str | None:
+    """Endpoint of a service from the generated table, or None if it is not listed."""
+    entry = baked_services().get(service_id)
+    return entry[1] if entry and entry[1] else None
+
+
+def baked_service_id(name: str) -> str | None:
+    """Service ID for a name from the generated table (spaces and underscores are ignored)."""
+    from .search import normalize
+
+    return _baked_name_index().get(normalize(name))
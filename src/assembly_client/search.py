@@ -0,0 +1,158 @@
+"""Ranked service search over the master list (n-gram inverted index, chosung aware)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .registry import ServiceInfo
+
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+# Initial consonants in syllable order (compatibility jamo, as typed on a keyboard)
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+
+# Score of a match in each field; prefix and exact matches are boosted
+FIELD_WEIGHTS = {"id": 4.0, "name": 3.0, "category": 1.5, "organization": 1.0, "description": 0.5}
+PREFIX_BOOST = 2.0
+EXACT_BOOST = 4.0
+
+
+def normalize(text: str | None) -> str:
+    """Lowercase and drop whitespace and underscores ("국회의원_발의법률안" == "국회의원 발의법률안")."""
+    if not text:
+        return ""
+    return "".join(ch for ch in text.lower() if not ch.isspace() and ch != "_")
+
+
+def chosung(text: str) -> str:
+    """Replace every Hangul syllable by its initial consonant ("국회" -> "ㄱㅎ"); other characters are kept."""
+    return "".join(
+        _CHOSUNG[(ord(ch) - _HANGUL_FIRST) // 588] if _HANGUL_FIRST <= ord(ch) <= _HANGUL_LAST else ch
+        for ch in text
+    )
+
+
+def has_chosung(text: str) -> bool:
+    """Whether ``text`` contains a bare initial consonant, i.e. should be matched on chosung."""
+    return any(ch in _CHOSUNG_SET for ch in text)
+
+
+def ngrams(text: str) -> set[str]:
+    """Unigrams and bigrams of an already normalized string."""
+    grams = set(text)
+    grams.update(text[i : i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(text: str) -> set[str]:
+    """The grams a candidate must contain to hold ``text`` as a substring."""
+    if len(text) == 1:
+        return {text}
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class ServiceSearchIndex:
+    """
+    Inverted index over service IDs, names, categories, organizations and descriptions.
+
+    Every field is split into unigrams and bigrams; a query is answered by intersecting
+    the posting sets of its grams (smallest first) and then scoring only the surviving
+    candidates, so lookups do not scan the whole master list. Queries containing bare
+    initial consonants ("ㄱㅎㅇㅇ") are matched against the chosung form of the names.
+    """
+
+    def __init__(self, services: Mapping[str, ServiceInfo]):
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._fields: list[dict[str, str]] = []
+        self._chosung: list[str] = []
+        self._postings: dict[str, set[int]] = {}
+        self._chosung_postings: dict[str, set[int]] = {}
+
+        for doc, (sid, info) in enumerate(services.items()):
+            fields = {
+                "id": normalize(sid),
+                "name": normalize(info.name),
+                "category": normalize(info.category),
+                "organization": normalize(info.organization),
+                "description": normalize(info.description),
+            }
+            self._ids.append(sid)
+            self._names.append(info.name)
+            self._fields.append(fields)
+            self._chosung.append(chosung(fields["name"]))
+            for gram in set().union(*(ngrams(value) for value in fields.values())):
+                self._postings.setdefault(gram, set()).add(doc)
+            for gram in ngrams(self._chosung[-1]):
+                self._chosung_postings.setdefault(gram, set()).add(doc)
+
+    @classmethod
+    def from_names(cls, service_map: Mapping[str, str]) -> ServiceSearchIndex:
+        """Index a plain {service_id: name} map (no metadata)."""
+        from .registry import ServiceInfo
+
+        return cls({sid: ServiceInfo(name, "", "", "", "") for sid, name in service_map.items()})
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def _candidates(postings: dict[str, set[int]], grams: Iterable[str]) -> set[int]:
+        sets = sorted((postings.get(gram, set()) for gram in grams), key=len)
+        if not sets:
+            return set()
+        result = set(sets[0])
+        for other in sets[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    @staticmethod
+    def _field_score(value: str, query: str, weight: float) -> float:
+        if not value or query not in value:
+            return 0.0
+        if value == query:
+            return weight * EXACT_BOOST
+        if value.startswith(query):
+            return weight * PREFIX_BOOST
+        return weight
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[str, float]]:
+        """
+        Find services matching ``query``.
+
+        Args:
+            query: Substring of an ID, name, category, organization or description
+                   (case, whitespace and underscores are ignored), or the initial
+                   consonants of a name.
+            limit: Maximum number of results. None returns all matches.
+
+        Returns:
+            [(service_id, score), ...] best match first (ties ordered by name).
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        scores: dict[int, float] = {}
+        if has_chosung(query):
+            pattern = chosung(query)
+            for doc in self._candidates(self._chosung_postings, _query_grams(pattern)):
+                score = self._field_score(self._chosung[doc], pattern, FIELD_WEIGHTS["name"])
+                if score:
+                    scores[doc] = score
+        else:
+            for doc in self._candidates(self._postings, _query_grams(query)):
+                fields = self._fields[doc]
+                score = sum(self._field_score(fields[name], query, weight) for name, weight in FIELD_WEIGHTS.items())
+                if score:
+                    scores[doc] = score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._names[item[0]], self._ids[item[0]]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self._ids[doc], score) for doc, score in ranked]
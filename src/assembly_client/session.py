@@ -0,0 +1,94 @@
+"""Shared HTTP session for the API client, spec parser and sync."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from .ratelimit import TokenBucket, retry_after_delay
+from .transport import TransportConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AssemblySession:
+    """
+    A single pooled ``httpx.AsyncClient`` shared by every subsystem that talks to
+    open.assembly.go.kr (``AssemblyAPIClient``, ``SpecParser`` and ``sync``).
+
+    The underlying client is created on first use and lives until ``aclose()``.
+    Every request first takes a token from the session's rate limiter (if any), and a
+    ``429``/``503`` response carrying ``Retry-After`` pauses the limiter for all callers.
+    Whoever creates the session owns it; components that receive a session
+    through their constructor never close it.
+
+    Example:
+        async with AssemblySession() as session:
+            parser = SpecParser(session=session)
+            client = AssemblyAPIClient(session=session, spec_parser=parser)
+            await sync_all_services(api_key, parser)
+            rows = await client.get_data(Service.국회의원_발의법률안, params={"AGE": "21"})
+    """
+
+    def __init__(self, transport: TransportConfig | None = None, limiter: TokenBucket | None = None):
+        """
+        Args:
+            transport: Connection pool / timeout / HTTP/2 settings. If None, uses TransportConfig defaults.
+            limiter: Rate limiter to use. If None, one is built from ``transport.rate_limit``
+                     (no limiting when that is unset). Pass the same limiter to several
+                     sessions to share one budget between them.
+        """
+        self.transport = transport or TransportConfig()
+        if limiter is None and self.transport.rate_limit:
+            limiter = TokenBucket(self.transport.rate_limit, self.transport.rate_burst)
+        self.limiter = limiter
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying ``httpx.AsyncClient`` (created on first access)."""
+        if self._client is None:
+            self._client = self.transport.create_client()
+        return self._client
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request through the shared connection pool, respecting the rate limit."""
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+        response = await self.client.get(url, **kwargs)
+        self._handle_retry_after(response)
+        return response
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Send a streaming GET request; the body is read incrementally by the caller."""
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+        async with self.client.stream("GET", url, **kwargs) as response:
+            self._handle_retry_after(response)
+            yield response
+
+    def _handle_retry_after(self, response: httpx.Response) -> None:
+        if self.limiter is not None and response.status_code in (429, 503):
+            delay = retry_after_delay(response, self.transport.max_retry_after)
+            if delay is not None:
+                logger.warning(f"Server asked to retry after {delay:.1f}s; pausing requests")
+                self.limiter.pause(delay)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client. The session may be reused afterwards."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.debug("Closed shared HTTP session")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,331 @@
+"""Storage backends for parsed API specifications."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Per-service indexes kept alongside the specs (see ``SpecStore.index``)
+INF_SEQ_INDEX = "inf_seq"
+FETCH_TIME_INDEX = "fetched_at"
+
+# Files in the spec cache directory that are not specs
+_NON_SPEC_FILES = {"all_apis.json", f"{INF_SEQ_INDEX}.json", f"{FETCH_TIME_INDEX}.json"}
+
+
+class SpecIndex(ABC):
+    """Small ``{service_id: value}`` mapping kept by a ``SpecStore`` next to the specs."""
+
+    @abstractmethod
+    def get(self, service_id: str) -> Any:
+        """Return the value for ``service_id``, or None."""
+
+    @abstractmethod
+    def set(self, service_id: str, value: Any) -> None:
+        """Store (or overwrite) the value for ``service_id``."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class SpecStore(ABC):
+    """
+    Key-value store of spec dicts (``APISpec.to_dict()``) keyed by service ID.
+
+    Backends only deal in plain dicts; ``SpecParser`` converts to and from ``APISpec``.
+    """
+
+    @abstractmethod
+    def get(self, service_id: str) -> dict[str, Any] | None:
+        """Return the stored spec, or None if missing or unreadable."""
+
+    @abstractmethod
+    def put(self, service_id: str, data: dict[str, Any]) -> None:
+        """Store (or overwrite) one spec."""
+
+    @abstractmethod
+    def delete(self, service_id: str) -> None:
+        """Remove one spec (no error if missing)."""
+
+    @abstractmethod
+    def service_ids(self) -> set[str]:
+        """IDs of all stored specs."""
+
+    @abstractmethod
+    def index(self, name: str, convert: Callable[[Any], Any] = lambda v: v) -> SpecIndex:
+        """
+        Return the named per-service index kept with this store.
+
+        ``SpecParser`` uses ``INF_SEQ_INDEX`` (working ``infSeq`` per service, ``int``) and
+        ``FETCH_TIME_INDEX`` (last workbook download, unix time as ``float``). Stored values
+        are passed through ``convert`` when read back.
+        """
+
+    def load_all(self) -> dict[str, dict[str, Any]]:
+        """Return every stored spec as {service_id: spec dict}."""
+        return {sid: data for sid in self.service_ids() if (data := self.get(sid)) is not None}
+
+    def replace_all(self, specs: Mapping[str, dict[str, Any]]) -> None:
+        """Replace the whole store content with ``specs``."""
+        self.clear()
+        for sid, data in specs.items():
+            self.put(sid, data)
+
+    def retain(self, service_ids: Iterable[str]) -> int:
+        """Delete every spec not in ``service_ids``; return the number removed."""
+        keep = set(service_ids)
+        removed = 0
+        for sid in self.service_ids() - keep:
+            logger.info(f"Removing orphaned spec cache: {sid}")
+            self.delete(sid)
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all specs."""
+        for sid in self.service_ids():
+            self.delete(sid)
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class JsonSpecStore(SpecStore):
+    """One pretty-printed ``<service_id>.json`` file per spec (the original cache layout)."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _path(self, service_id: str) -> Path:
+        return self.cache_dir / f"{service_id}.json"
+
+    def get(self, service_id: str) -> dict[str, Any] | None:
+        path = self._path(service_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load cached spec for {service_id}: {e}")
+            return None
+
+    def put(self, service_id: str, data: dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._path(service_id), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def delete(self, service_id: str) -> None:
+        try:
+            self._path(service_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove spec {service_id}: {e}")
+
+    def service_ids(self) -> set[str]:
+        return {p.stem for p in self.cache_dir.glob("*.json") if p.name not in _NON_SPEC_FILES}
+
+    def index(self, name: str, convert: Callable[[Any], Any] = lambda v: v) -> SpecIndex:
+        return JsonSpecIndex(self.cache_dir / f"{name}.json", convert)
+
+
+class SQLiteSpecStore(SpecStore):
+    """
+    All specs in a single SQLite file (compact JSON per row, indexed by service ID).
+
+    ``load_all`` is a single query and ``replace_all`` swaps the content in one
+    transaction, so readers never see a half-written set of specs. Indexes live in a
+    ``spec_index`` table of the same database. The connection may
+    be used from worker threads (``SpecParser`` writes specs off the event loop);
+    a lock serializes access to it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Database file, e.g. ``<cache_dir>/specs.db``.
+        """
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS specs (service_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS spec_index"
+                " (name TEXT NOT NULL, service_id TEXT NOT NULL, value, PRIMARY KEY (name, service_id))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _dumps(data: dict[str, Any]) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def get(self, service_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM specs WHERE service_id = ?", (service_id,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            logger.warning(f"Failed to load stored spec for {service_id}: {e}")
+            return None
+
+    def put(self, service_id: str, data: dict[str, Any]) -> None:
+        text = self._dumps(data)
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO specs (service_id, data) VALUES (?, ?)", (service_id, text))
+
+    def delete(self, service_id: str) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM specs WHERE service_id = ?", (service_id,))
+
+    def service_ids(self) -> set[str]:
+        with self._lock:
+            return {row[0] for row in self.conn.execute("SELECT service_id FROM specs")}
+
+    def index(self, name: str, convert: Callable[[Any], Any] = lambda v: v) -> SpecIndex:
+        return SQLiteSpecIndex(self, name, convert)
+
+    def load_all(self) -> dict[str, dict[str, Any]]:
+        specs = {}
+        with self._lock:
+            rows = self.conn.execute("SELECT service_id, data FROM specs").fetchall()
+        for sid, text in rows:
+            try:
+                specs[sid] = json.loads(text)
+            except ValueError as e:
+                logger.warning(f"Failed to load stored spec for {sid}: {e}")
+        return specs
+
+    def replace_all(self, specs: Mapping[str, dict[str, Any]]) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM specs")
+            self.conn.executemany(
+                "INSERT INTO specs (service_id, data) VALUES (?, ?)",
+                [(sid, self._dumps(data)) for sid, data in specs.items()],
+            )
+
+    def retain(self, service_ids: Iterable[str]) -> int:
+        keep = set(service_ids)
+        orphans = [(sid,) for sid in self.service_ids() - keep]
+        if orphans:
+            with self._lock, self.conn:
+                self.conn.executemany("DELETE FROM specs WHERE service_id = ?", orphans)
+        return len(orphans)
+
+    def clear(self) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM specs")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @classmethod
+    def from_json_dir(cls, path: Path, cache_dir: Path) -> SQLiteSpecStore:
+        """Create (or refresh) a SQLite store from an existing per-file JSON cache, indexes included."""
+        store = cls(path)
+        json_store = JsonSpecStore(cache_dir)
+        store.replace_all(json_store.load_all())
+        for name in (INF_SEQ_INDEX, FETCH_TIME_INDEX):
+            target = store.index(name)
+            for sid, value in JsonSpecIndex(cache_dir / f"{name}.json").entries.items():
+                target.set(sid, value)
+        return store
+
+
+class JsonSpecIndex(SpecIndex):
+    """
+    Small ``{service_id: value}`` JSON file next to the spec cache.
+
+    Loaded on first use and rewritten atomically whenever a value changes.
+    """
+
+    def __init__(self, path: Path, convert: Callable[[Any], Any] = lambda v: v):
+        self.path = path
+        self._convert = convert
+        self._entries: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> dict[str, Any]:
+        if self._entries is None:
+            entries = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        entries = {str(k): self._convert(v) for k, v in json.load(f).items()}
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"Ignoring unreadable index {self.path}: {e}")
+            self._entries = entries
+        return self._entries
+
+    def get(self, service_id: str) -> Any:
+        return self.entries.get(service_id)
+
+    def set(self, service_id: str, value: Any) -> None:
+        with self._lock:
+            if self.entries.get(service_id) == value:
+                return
+            self.entries[service_id] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self.path.unlink(missing_ok=True)
+
+
+class SQLiteSpecIndex(SpecIndex):
+    """One named index stored in the ``spec_index`` table of a ``SQLiteSpecStore``."""
+
+    def __init__(self, store: SQLiteSpecStore, name: str, convert: Callable[[Any], Any] = lambda v: v):
+        self.store = store
+        self.name = name
+        self._convert = convert
+
+    def get(self, service_id: str) -> Any:
+        with self.store._lock:
+            row = self.store.conn.execute(
+                "SELECT value FROM spec_index WHERE name = ? AND service_id = ?", (self.name, service_id)
+            ).fetchone()
+        return None if row is None else self._convert(row[0])
+
+    def set(self, service_id: str, value: Any) -> None:
+        with self.store._lock, self.store.conn:
+            self.store.conn.execute(
+                "INSERT OR REPLACE INTO spec_index (name, service_id, value) VALUES (?, ?, ?)",
+                (self.name, service_id, value),
+            )
+
+    def clear(self) -> None:
+        with self.store._lock, self.store.conn:
+            self.store.conn.execute("DELETE FROM spec_index WHERE name = ?", (self.name,))
@@ -0,0 +1,87 @@
+"""Client state (spec parser, service registry, parsed specs) that can be shared between clients."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .parser import APISpec, SpecParser, default_cache_dir
+from .registry import ServiceRegistry, get_registry
+from .session import AssemblySession
+
+
+class ClientState:
+    """
+    The parts of ``AssemblyAPIClient`` that are expensive to build and safe to share.
+
+    Nothing is created up front: the spec parser (which creates the cache directory)
+    and the master list registry are built on first use. Build one state at startup,
+    optionally ``preload()`` it, and hand it to every short-lived client so creating
+    a client does no I/O at all.
+
+    Example:
+        session = AssemblySession()
+        state = ClientState(session=session).preload()
+
+        async def handler(request):
+            client = AssemblyAPIClient(session=session, state=state)
+            return await client.get_data(Service.국회의원_발의법률안, params={"AGE": "22"})
+    """
+
+    def __init__(
+        self,
+        spec_parser: SpecParser | None = None,
+        session: AssemblySession | None = None,
+        cache_dir: Path | None = None,
+    ):
+        """
+        Args:
+            spec_parser: Parser to use. If None, one is created on first use.
+            session: HTTP session for the parser created on first use. If None, that parser
+                     creates its own. Ignored when ``spec_parser`` is given.
+            cache_dir: Spec cache directory for the parser created on first use.
+                       Ignored when ``spec_parser`` is given.
+        """
+        self._spec_parser = spec_parser
+        self._session = session
+        self._cache_dir = cache_dir
+        self._registry: ServiceRegistry | None = None
+        self.parsed_specs: dict[str, APISpec] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        """Spec cache directory (known without creating the parser)."""
+        if self._spec_parser is not None:
+            return self._spec_parser.cache_dir
+        return self._cache_dir if self._cache_dir is not None else default_cache_dir()
+
+    @property
+    def spec_parser(self) -> SpecParser:
+        if self._spec_parser is None:
+            self._spec_parser = SpecParser(cache_dir=self._cache_dir, session=self._session)
+        return self._spec_parser
+
+    @spec_parser.setter
+    def spec_parser(self, value: SpecParser) -> None:
+        self._spec_parser = value
+        self._registry = None
+
+    @property
+    def registry(self) -> ServiceRegistry:
+        """Master list registry of ``cache_dir``, reloaded whenever ``all_apis.json`` changed."""
+        if self._registry is None:
+            self._registry = get_registry(self.cache_dir)
+            return self._registry
+        return self._registry.refresh()
+
+    def cached_spec(self, service_id: str) -> APISpec | None:
+        """The spec of ``service_id`` in the spec store, without downloading it."""
+        if self._spec_parser is None and not self.cache_dir.exists():
+            # Nothing can be cached yet; do not create the parser (and its directory) for it
+            return None
+        return self.spec_parser.cached_spec(service_id)
+
+    def preload(self) -> ClientState:
+        """Load the master list and every cached spec now instead of on first use."""
+        self.registry.refresh()
+        self.parsed_specs.update(self.spec_parser.load_cached_specs())
+        return self
@@ -0,0 +1,180 @@
+"""Incremental decoding of Assembly API JSON responses."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _NeedMore(Exception):
+    """Raised internally when the buffer ends in the middle of a token."""
+
+
+class RowStreamDecoder:
+    """
+    Push parser for the API's JSON envelope::
+
+        {"<endpoint>": [{"head": [{"list_total_count": N}, {"RESULT": {...}}]}, {"row": [{...}, ...]}]}
+
+    Text is fed in chunks as it arrives. ``head`` (and ``total_count`` / ``result``) become
+    available as soon as the head element is complete, and rows are returned one by one,
+    so the full body and decoded tree are never held at once. A RESULT-only body
+    (``{"RESULT": {...}}``) is also supported.
+    """
+
+    # Keep the consumed prefix of the buffer around until it grows past this size
+    _COMPACT_AT = 1 << 16
+
+    def __init__(self):
+        self.root_key: str | None = None
+        self.head: list[dict[str, Any]] | None = None
+        self.result: dict[str, Any] | None = None
+        self.total_count: int | None = None
+
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._closed = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Add a chunk of the body; return the rows completed by it."""
+        self._buf += text
+        return self._drain()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal the end of the body; return any remaining rows."""
+        self._closed = True
+        rows = self._drain()
+        if not self.done:
+            raise ValueError(f"Truncated JSON response (stopped in state {self._state!r})")
+        if _WS.match(self._buf, self._pos).end() != len(self._buf):
+            raise ValueError("Unexpected data after JSON response")
+        return rows
+
+    # -- tokenizer helpers (each raises _NeedMore instead of consuming partial input) --
+
+    def _skip_ws(self, pos: int) -> int:
+        pos = _WS.match(self._buf, pos).end()
+        if pos >= len(self._buf):
+            raise _NeedMore
+        return pos
+
+    def _expect(self, pos: int, char: str) -> int:
+        pos = self._skip_ws(pos)
+        if self._buf[pos] != char:
+            raise ValueError(f"Expected {char!r} at offset {pos}, got {self._buf[pos]!r}")
+        return pos + 1
+
+    def _value(self, pos: int) -> tuple[Any, int]:
+        pos = self._skip_ws(pos)
+        try:
+            value, end = _DECODER.raw_decode(self._buf, pos)
+        except json.JSONDecodeError as e:
+            if self._closed:
+                raise ValueError(f"Invalid or truncated JSON response: {e}") from e
+            raise _NeedMore from None
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(self._buf) and not self._closed and not isinstance(value, (dict, list, str)):
+            raise _NeedMore
+        return value, end
+
+    def _key(self, pos: int) -> tuple[str, int]:
+        pos = self._skip_ws(pos)
+        if self._buf[pos] != '"':
+            raise ValueError(f"Expected object key at offset {pos}")
+        key, pos = self._value(pos)
+        pos = self._expect(pos, ":")
+        return key, pos
+
+    # -- state machine --
+
+    def _drain(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        try:
+            while self._state != "done":
+                self._step(rows)
+        except _NeedMore:
+            pass
+
+        if self._pos >= self._COMPACT_AT:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        return rows
+
+    def _step(self, rows: list[dict[str, Any]]) -> None:
+        state = self._state
+        pos = self._skip_ws(self._pos) if state != "start" else self._pos
+        char = self._buf[pos] if state != "start" else None
+
+        if state == "start":
+            self._pos = self._expect(pos, "{")
+            self._state = "root"
+
+        elif state == "root":
+            if char == "}":
+                self._pos, self._state = pos + 1, "done"
+            elif char == ",":
+                self._pos = pos + 1
+            else:
+                key, pos = self._key(pos)
+                pos = self._skip_ws(pos)
+                if key != "RESULT" and self._buf[pos] == "[":
+                    self.root_key = key
+                    self._pos, self._state = pos + 1, "elements"
+                else:
+                    value, self._pos = self._value(pos)
+                    if key == "RESULT":
+                        self.result = value
+
+        elif state == "elements":
+            if char == "]":
+                self._pos, self._state = pos + 1, "root"
+            elif char == ",":
+                self._pos = pos + 1
+            else:
+                self._pos, self._state = self._expect(pos, "{"), "element"
+
+        elif state == "element":
+            if char == "}":
+                self._pos, self._state = pos + 1, "elements"
+            elif char == ",":
+                self._pos = pos + 1
+            else:
+                key, pos = self._key(pos)
+                pos = self._skip_ws(pos)
+                if key == "row" and self._buf[pos] == "[":
+                    self._pos, self._state = pos + 1, "rows"
+                else:
+                    value, self._pos = self._value(pos)
+                    if key == "head":
+                        self._set_head(value)
+
+        elif state == "rows":
+            if char == "]":
+                self._pos, self._state = pos + 1, "element"
+            elif char == ",":
+                self._pos = pos + 1
+            else:
+                row, self._pos = self._value(pos)
+                rows.append(row)
+
+    def _set_head(self, head: Any) -> None:
+        self.head = head if isinstance(head, list) else []
+        for item in self.head:
+            if not isinstance(item, dict):
+                continue
+            if "list_total_count" in item:
+                try:
+                    self.total_count = int(item["list_total_count"])
+                except (TypeError, ValueError):
+                    pass
+            if "RESULT" in item:
+                self.result = item["RESULT"]
@@ -5,21 +5,39 @@ Module to synchronize API specifications.
 import asyncio
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import httpx
+from typing import Any, Dict, List, Optional
 
+from .errors import APIRequestError, AssemblyAPIError
 from .parser import SpecParser, load_service_map
+from .session import AssemblySession
+from .spec_store import JsonSpecStore, SpecStore
 
 logger = logging.getLogger(__name__)
 
 MASTER_LIST_SERVICE_ID = "OOBAOA001213RL17443"
 BASE_URL = "https://open.assembly.go.kr/portal/openapi"
 
+# How long a spec stays fresh during `sync --refresh` (seconds)
+DEFAULT_REFRESH_MAX_AGE = 7 * 24 * 3600
+
+
+async def fetch_master_list(
+    api_key: str, parser: SpecParser, session: Optional[AssemblySession] = None
+) -> List[Dict]:
+    """
+    Fetch the complete list of APIs from the master service.
+
+    Pages are requested through ``session`` (defaults to the parser's session),
+    so the spec bootstrap and the master list share warm connections.
 
-async def fetch_master_list(api_key: str, parser: SpecParser) -> List[Dict]:
-    """Fetch the complete list of APIs from the master service."""
+    Raises:
+        AssemblyAPIError: If a page fails or fewer rows than ``list_total_count``
+            arrive. A partial list is never returned, since callers save it and
+            prune the specs of every service missing from it.
+    """
+    session = session or parser.session
 
     # 1. Bootstrap: Get the endpoint for the Master List Service
     try:
@@ -42,55 +60,57 @@ async def fetch_master_list(api_key: str, parser: SpecParser) -> List[Dict]:
     p_size = 100
     total_count = None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        while True:
-            url = f"{BASE_URL}/{master_endpoint}"
-            params = {
-                "KEY": api_key,
-                "Type": "json",
-                "pIndex": p_index,
-                "pSize": p_size,
-            }
-
-            try:
-                logger.debug(f"Fetching master list page {p_index}...")
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                if master_endpoint in data:
-                    service_data = data[master_endpoint]
-                    
-                    # Get total count on first page
-                    if total_count is None and service_data:
-                        head = service_data[0].get("head", [])
-                        for h in head:
-                            if "list_total_count" in h:
-                                total_count = h["list_total_count"]
-                                break
-                    
-                    # Structure: [ {head}, {row: []} ]
-                    if len(service_data) > 1 and "row" in service_data[1]:
-                        rows = service_data[1]["row"]
-                        all_rows.extend(rows)
-
-                        # Finish if we've collected everything or no more rows returned
-                        if total_count and len(all_rows) >= total_count:
-                            break
-                        if len(rows) < p_size:
+    while True:
+        url = f"{BASE_URL}/{master_endpoint}"
+        params = {
+            "KEY": api_key,
+            "Type": "json",
+            "pIndex": p_index,
+            "pSize": p_size,
+        }
+
+        try:
+            logger.debug(f"Fetching master list page {p_index}...")
+            response = await session.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            if master_endpoint in data:
+                service_data = data[master_endpoint]
+                
+                # Get total count on first page
+                if total_count is None and service_data:
+                    head = service_data[0].get("head", [])
+                    for h in head:
+                        if "list_total_count" in h:
+                            total_count = h["list_total_count"]
                             break
-                        p_index += 1
-                    else:
-                        break  # No more data
+                
+                # Structure: [ {head}, {row: []} ]
+                if len(service_data) > 1 and "row" in service_data[1]:
+                    rows = service_data[1]["row"]
+                    all_rows.extend(rows)
+
+                    # Finish if we've collected everything or no more rows returned
+                    if total_count and len(all_rows) >= total_count:
+                        break
+                    if len(rows) < p_size:
+                        break
+                    p_index += 1
                 else:
-                    # Check for error in response
-                    if "RESULT" in data:
-                        logger.error(f"API Error: {data['RESULT']}")
-                    break
+                    break  # No more data
+            else:
+                result = data.get("RESULT", {})
+                raise APIRequestError(result.get("CODE", "UNKNOWN"), result.get("MESSAGE", "No master list data"))
 
-            except Exception as e:
-                logger.error(f"Failed to fetch master list page {p_index}: {e}")
-                break
+        except Exception as e:
+            logger.error(f"Failed to fetch master list page {p_index}: {e}")
+            if isinstance(e, AssemblyAPIError):
+                raise
+            raise AssemblyAPIError(f"Failed to fetch master list page {p_index}: {e}") from e
+
+    if not all_rows or (total_count and len(all_rows) < total_count):
+        raise AssemblyAPIError(f"Incomplete master list: got {len(all_rows)} of {total_count} rows")
 
     return all_rows
 
@@ -116,95 +136,170 @@ def save_master_list(rows: List[Dict], cache_dir: Path):
     logger.info(f"Saved {len(rows)} APIs to {output_file}")
 
 
-def cleanup_orphaned_specs(cache_dir: Path, active_service_ids: set[str]):
-    """Remove cached spec files that are no longer in the active service list."""
-    # Always keep the master list and the bootstrapper spec
-    protected_files = {"all_apis.json", f"{MASTER_LIST_SERVICE_ID}.json"}
-    
-    removed_count = 0
-    for json_file in cache_dir.glob("*.json"):
-        if json_file.name in protected_files:
-            continue
-            
-        service_id = json_file.stem
-        if service_id not in active_service_ids:
-            try:
-                logger.info(f"Removing orphaned spec cache: {json_file.name}")
-                json_file.unlink()
-                removed_count += 1
-            except OSError as e:
-                logger.error(f"Failed to remove orphaned spec {json_file.name}: {e}")
-            
+def load_master_rows(cache_dir: Path) -> List[Dict]:
+    """Load the raw rows of the cached master list (empty if there is none)."""
+    master_file = cache_dir / "all_apis.json"
+    if not master_file.exists():
+        return []
+    try:
+        with open(master_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return [row for item in data.get("OPENSRVAPI", []) for row in item.get("row", [])]
+    except Exception as e:
+        logger.warning(f"Failed to read cached master list: {e}")
+        return []
+
+
+def diff_master_lists(old_rows: List[Dict], new_rows: List[Dict]) -> Dict[str, List[str]]:
+    """
+    Compare two master lists by INF_ID.
+
+    Returns:
+        {"added": [...], "changed": [...], "removed": [...]} service IDs, where "changed"
+        means any field of the service's master list row differs.
+    """
+    old = {row["INF_ID"]: row for row in old_rows if row.get("INF_ID")}
+    new = {row["INF_ID"]: row for row in new_rows if row.get("INF_ID")}
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "changed": sorted(sid for sid in new.keys() & old.keys() if new[sid] != old[sid]),
+        "removed": sorted(old.keys() - new.keys()),
+    }
+
+
+def cleanup_orphaned_specs(cache_dir: Path, active_service_ids: set[str], store: Optional[SpecStore] = None) -> int:
+    """
+    Remove cached specs that are no longer in the active service list.
+
+    Works on ``store`` if given, otherwise on the per-file JSON cache in ``cache_dir``.
+    The master list service's own spec is always kept.
+    """
+    store = store or JsonSpecStore(cache_dir)
+    removed_count = store.retain(set(active_service_ids) | {MASTER_LIST_SERVICE_ID})
     if removed_count > 0:
-        logger.info(f"Cleaned up {removed_count} orphaned spec files.")
+        logger.info(f"Cleaned up {removed_count} orphaned specs.")
+    return removed_count
 
 
-async def sync_service(parser: SpecParser, service_id: str, service_name: str | None = None) -> str:
+async def sync_service(
+    parser: SpecParser, service_id: str, service_name: str | None = None, max_age: Optional[float] = None
+) -> str:
     """
     Sync a single service by parsing its spec (downloads if not cached).
-    Returns status: 'updated', 'failed'
+
+    With ``max_age`` the cached spec is re-checked once it is older than that many
+    seconds (see ``SpecParser.fetch_spec``).
+
+    Returns status: 'updated', 'failed', and with ``max_age`` also 'unchanged' or 'cached'
     """
     try:
-        await parser.parse_spec(service_id)
-        return "updated"
+        if max_age is None:
+            await parser.parse_spec(service_id)
+            return "updated"
+        _, status = await parser.fetch_spec(service_id, max_age=max_age)
+        return status
     except Exception as e:
         logger.error(f"Failed to sync {service_id} ({service_name}): {e}")
         return "failed"
 
 
 async def sync_all_services(
-    api_key: str, parser: SpecParser, limit: Optional[int] = None, force_update_list: bool = False
-) -> Dict[str, int]:
+    api_key: str,
+    parser: SpecParser,
+    limit: Optional[int] = None,
+    force_update_list: bool = False,
+    concurrency: int = 5,
+    refresh: bool = False,
+    max_age: float = DEFAULT_REFRESH_MAX_AGE,
+) -> Dict[str, Any]:
     """
     Sync all services found in the master list.
 
+    Services are handed to a fixed pool of ``concurrency`` workers, each taking the
+    next service as soon as its current one finishes, so a slow download or infSeq
+    retry only ever occupies one slot.
+
     Args:
         api_key: API Key for fetching master list.
         parser: SpecParser instance.
         limit: Max number of services to sync.
-        force_update_list: Whether to force re-downloading the master list.
+        force_update_list: Whether to force re-downloading the master list. If the
+                           download fails or is incomplete, the error propagates
+                           before the cached list is overwritten or any spec pruned.
+        concurrency: Number of services synced at once.
+        refresh: Re-download the master list and re-check cached specs: services that are
+                 new or whose master list entry changed are always checked, the rest once
+                 their spec is older than ``max_age``. Unchanged workbooks (same content
+                 hash) are not re-parsed.
+        max_age: Freshness window in seconds used with ``refresh``.
 
     Returns:
-        Stats dict with 'updated' and 'failed' counts.
+        Stats dict with 'updated', 'unchanged', 'cached' and 'failed' counts, 'timings'
+        ({service_id: seconds} for every service attempted) and, with ``refresh``,
+        'master_diff' (see ``diff_master_lists``).
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
 
     # 1. Update Master List if needed
     master_file = parser.cache_dir / "all_apis.json"
-    if force_update_list or not master_file.exists():
+    master_diff = None
+    if refresh or force_update_list or not master_file.exists():
+        old_rows = load_master_rows(parser.cache_dir)
         logger.info("Fetching master list...")
         rows = await fetch_master_list(api_key, parser)
         save_master_list(rows, parser.cache_dir)
+        master_diff = diff_master_lists(old_rows, rows)
+        logger.info(
+            f"Master list: {len(master_diff['added'])} added, {len(master_diff['changed'])} changed, "
+            f"{len(master_diff['removed'])} removed"
+        )
 
     # 2. Load Services
     service_map = load_service_map(parser.cache_dir)
     service_ids = sorted(service_map.keys())
 
     # Cleanup orphaned specs before starting sync
-    cleanup_orphaned_specs(parser.cache_dir, set(service_ids))
+    cleanup_orphaned_specs(parser.cache_dir, set(service_ids), parser.store)
 
     if limit:
         service_ids = service_ids[:limit]
 
     logger.info(f"Starting sync for {len(service_ids)} services...")
 
-    stats = {"updated": 0, "failed": 0}
-
-    # Process in chunks
-    chunk_size = 5
-    for i in range(0, len(service_ids), chunk_size):
-        chunk = service_ids[i : i + chunk_size]
-        tasks = [sync_service(parser, sid, service_map.get(sid)) for sid in chunk]
+    stats: Dict[str, Any] = {"updated": 0, "unchanged": 0, "cached": 0, "failed": 0, "timings": {}}
+    if refresh:
+        stats["master_diff"] = master_diff
+    # With refresh, new or changed services are always re-checked; the rest honour max_age
+    must_check = set(master_diff["added"] + master_diff["changed"]) if refresh else set()
+    queue: asyncio.Queue = asyncio.Queue()
+    for sid in service_ids:
+        queue.put_nowait(sid)
+    total = len(service_ids)
+    completed = 0
+
+    async def worker():
+        nonlocal completed
+        while True:
+            try:
+                sid = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            started = time.perf_counter()
+            try:
+                service_max_age = (0 if sid in must_check else max_age) if refresh else None
+                result = await sync_service(parser, sid, service_map.get(sid), service_max_age)
+            except Exception as e:
+                logger.error(f"Failed to sync {sid}: {e}")
+                result = "failed"
+            stats["timings"][sid] = time.perf_counter() - started
+            stats[result if result in ("updated", "unchanged", "cached") else "failed"] += 1
 
-        for result in results:
-            if isinstance(result, Exception):
-                stats["failed"] += 1
-            elif result == "updated":
-                stats["updated"] += 1
-            else:
-                stats["failed"] += 1
+            completed += 1
+            if completed % concurrency == 0 or completed == total:
+                logger.info(f"Progress: {completed}/{total}")
 
-        logger.info(f"Progress: {min(i + chunk_size, len(service_ids))}/{len(service_ids)}")
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
 
     return stats
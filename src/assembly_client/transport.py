@@ -0,0 +1,61 @@
+"""HTTP transport configuration shared by the client, spec parser and sync."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass
+class TransportConfig:
+    """
+    Connection pool, keep-alive, timeout and HTTP/2 settings for httpx clients.
+
+    The defaults match the previous hard-coded behaviour (30s timeouts, httpx default pool).
+    HTTP/2 requires the optional ``h2`` package (``pip install assembly-api-client[http2]``).
+
+    ``rate_limit`` (requests per second) and ``rate_burst`` enable a client-side token
+    bucket shared by every request sent through the same ``AssemblySession``.
+    ``max_retry_after`` caps how long a server's ``Retry-After`` may stall requests
+    (seconds, None for no cap).
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = 30.0
+    read_timeout: float | None = 30.0
+    write_timeout: float | None = 30.0
+    pool_timeout: float | None = 30.0
+    http2: bool = False
+    follow_redirects: bool = True
+    rate_limit: float | None = None
+    rate_burst: int | None = None
+    max_retry_after: float | None = 60.0
+
+    def limits(self) -> httpx.Limits:
+        """Build the httpx pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Build the per-phase httpx timeout."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def create_client(self) -> httpx.AsyncClient:
+        """Create a new ``httpx.AsyncClient`` using these settings."""
+        return httpx.AsyncClient(
+            limits=self.limits(),
+            timeout=self.timeout(),
+            http2=self.http2,
+            follow_redirects=self.follow_redirects,
+        )
@@ -0,0 +1,114 @@
+"""Persistent watermarks for incremental pulls of date-ordered services."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from .cache import canonical_params
+
+logger = logging.getLogger(__name__)
+
+_DIGIT_RUNS = re.compile(r"\d+")
+# YYYYMMDDHHMMSS
+_DATE_KEY_WIDTH = 14
+
+
+def date_key(value: Any) -> str:
+    """
+    Normalize a date/datetime field value for comparison.
+
+    The API formats dates inconsistently ("2024-05-30", "20240530", "2024.5.3",
+    "2024.05.30 10:00"). Values become a fixed-width, zero-padded YYYYMMDDHHMMSS key:
+    separated components are padded to two digits each and missing trailing parts
+    count as zero, so keys of different precision compare correctly as strings.
+    Returns "" for empty values.
+    """
+    if value is None:
+        return ""
+    runs = _DIGIT_RUNS.findall(str(value))
+    if not runs:
+        return ""
+    # A leading compact run ("20240530") already carries zero-padded components
+    key = runs[0] if len(runs[0]) > 4 else runs[0].zfill(4)
+    for run in runs[1:]:
+        if len(key) >= _DATE_KEY_WIDTH:
+            break
+        key += run.zfill(2)
+    return key[:_DATE_KEY_WIDTH].ljust(_DATE_KEY_WIDTH, "0")
+
+
+def watermark_key(service_id: str, params: dict[str, Any] | None) -> str:
+    """Store key for a service and parameter set (pagination and the API key are ignored)."""
+    params = {k: v for k, v in (params or {}).items() if k not in ("pIndex", "pSize")}
+    return f"{service_id}?{urlencode(canonical_params(params))}"
+
+
+class WatermarkStore:
+    """
+    Newest date seen per (service, parameter set), kept in a small JSON file.
+
+    Entries look like ``{"field": "PROPOSE_DT", "value": "2024-05-30", "updated": <unix time>}``.
+    The file is rewritten atomically on every update.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Args:
+            path: JSON file. If None, uses ``watermarks.json`` in the user cache directory.
+        """
+        if path is None:
+            import platformdirs
+
+            path = Path(platformdirs.user_cache_dir("assembly-api-client")) / "watermarks.json"
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable watermark file {self.path}: {e}")
+        return self._entries
+
+    def get(self, service_id: str, params: dict[str, Any] | None, field: str) -> str | None:
+        """Return the stored watermark, or None if there is none for this field."""
+        entry = self.entries.get(watermark_key(service_id, params))
+        if entry is None or entry.get("field") != field:
+            return None
+        return entry.get("value")
+
+    def set(self, service_id: str, params: dict[str, Any] | None, field: str, value: str) -> None:
+        """Store a new watermark and persist the file."""
+        self.entries[watermark_key(service_id, params)] = {"field": field, "value": value, "updated": time.time()}
+        self._save()
+
+    def clear(self, service_id: str | None = None) -> None:
+        """
+        Remove watermarks.
+        If service_id is provided, removes only that service's entries.
+        """
+        if service_id:
+            prefix = f"{service_id}?"
+            self._entries = {k: v for k, v in self.entries.items() if not k.startswith(prefix)}
+        else:
+            self._entries = {}
+        self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
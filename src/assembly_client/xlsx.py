@@ -0,0 +1,176 @@
+"""Minimal streaming reader for the cell values of simple .xlsx worksheets."""
+
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterator
+from io import BytesIO
+from typing import Any
+from xml.etree import ElementTree as ET
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d*)")
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+class XlsxFormatError(ValueError):
+    """Raised when a workbook does not have the layout the native reader understands."""
+
+
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _column_index(ref: str) -> int:
+    """0-based column index of a cell reference such as ``"AB12"``."""
+    match = _CELL_REF.match(ref)
+    if not match:
+        raise XlsxFormatError(f"Bad cell reference {ref!r}")
+    index = 0
+    for char in match.group(1):
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _text(elem: ET.Element) -> str:
+    """Concatenated ``<t>`` text of a string item, skipping phonetic (``<rPh>``) runs."""
+    parts = []
+    for child in elem:
+        name = _local(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            parts.extend(t.text or "" for t in child if _local(t.tag) == "t")
+    return "".join(parts)
+
+
+def _sheet_path(archive: zipfile.ZipFile, sheet_name: str) -> str:
+    """Resolve a sheet name to its part inside the archive via workbook.xml and its rels."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    rel_id = None
+    for elem in workbook.iter():
+        if _local(elem.tag) == "sheet" and elem.get("name") == sheet_name:
+            rel_id = elem.get(_REL_NS)
+            break
+    if rel_id is None:
+        raise XlsxFormatError(f"Worksheet {sheet_name!r} not found")
+
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels:
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    raise XlsxFormatError(f"No relationship {rel_id!r} for worksheet {sheet_name!r}")
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    try:
+        source = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings = []
+    with source:
+        for _, elem in ET.iterparse(source):
+            if _local(elem.tag) == "si":
+                strings.append(_text(elem))
+                elem.clear()
+    return strings
+
+
+def _cell_value(cell: ET.Element, shared: list[str]) -> Any:
+    kind = cell.get("t", "n")
+    if kind == "inlineStr":
+        for child in cell:
+            if _local(child.tag) == "is":
+                return _text(child)
+        return None
+
+    raw = None
+    for child in cell:
+        name = _local(child.tag)
+        if name == "f" and child.text:
+            # Like openpyxl without data_only: formulas are returned, not cached values
+            return "=" + child.text
+        if name == "v":
+            raw = child.text
+    if raw is None:
+        return None
+
+    if kind == "s":
+        return shared[int(raw)]
+    if kind in ("str", "e"):
+        return raw
+    if kind == "b":
+        return raw == "1"
+    if kind == "n":
+        return float(raw) if "." in raw or "E" in raw or "e" in raw else int(raw)
+    raise XlsxFormatError(f"Unsupported cell type {kind!r}")
+
+
+def iter_sheet_rows(content: bytes, sheet_name: str = "Sheet1") -> Iterator[tuple[Any, ...]]:
+    """
+    Yield the cell values of a worksheet row by row, like openpyxl's
+    ``iter_rows(values_only=True)`` in read-only mode.
+
+    Only values are read (no styles, so date-formatted numbers stay numbers).
+    Like a fully loaded openpyxl worksheet, every row (including missing ones) is
+    padded with None to the sheet width, taken from the ``<dimension>`` element;
+    if that is missing or too small, the widest row seen so far is used instead.
+    Raises XlsxFormatError for anything the reader does not understand; callers
+    are expected to fall back to openpyxl then.
+    """
+    try:
+        archive = zipfile.ZipFile(BytesIO(content))
+    except zipfile.BadZipFile as e:
+        raise XlsxFormatError(str(e)) from e
+
+    with archive:
+        try:
+            path = _sheet_path(archive, sheet_name)
+            shared = _shared_strings(archive)
+            source = archive.open(path)
+        except (KeyError, ET.ParseError) as e:
+            raise XlsxFormatError(str(e)) from e
+
+        with source:
+            next_row = 1
+            width = 0
+            try:
+                for _, elem in ET.iterparse(source):
+                    tag = _local(elem.tag)
+                    if tag == "dimension":
+                        # e.g. "A1:C16"; the <dimension> element precedes the rows
+                        last = elem.get("ref", "").rsplit(":", 1)[-1]
+                        width = _column_index(last) + 1 if last else 0
+                        continue
+                    if tag != "row":
+                        continue
+
+                    row_number = int(elem.get("r", next_row))
+                    while next_row < row_number:
+                        yield (None,) * width
+                        next_row += 1
+
+                    values: dict[int, Any] = {}
+                    position = 0
+                    for cell in elem:
+                        if _local(cell.tag) != "c":
+                            continue
+                        ref = cell.get("r")
+                        position = _column_index(ref) if ref else position
+                        values[position] = _cell_value(cell, shared)
+                        position += 1
+                    elem.clear()
+
+                    if values:
+                        width = max(width, max(values) + 1)
+                    yield tuple(values.get(i) for i in range(width))
+                    next_row = row_number + 1
+            except (ET.ParseError, IndexError, ValueError) as e:
+                if isinstance(e, XlsxFormatError):
+                    raise
+                raise XlsxFormatError(str(e)) from e
@@ -0,0 +1,26 @@
+"""Shared test fixtures."""
+
+import sys
+import types
+
+import pytest
+
+from assembly_client.generated import Service
+from assembly_client.registry import _baked_name_index, baked_services
+
+BAKED_SERVICES = {
+    Service.국회의원_발의법률안.value: ("국회의원 발의법률안", "nzmimeepazxkubdpn", "의안"),
+}
+
+
+@pytest.fixture
+def baked_table(monkeypatch):
+    """Install a small generated service table (generated/registry.py) for the test."""
+    module = types.ModuleType("assembly_client.generated.registry")
+    module.SERVICES = dict(BAKED_SERVICES)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    baked_services.cache_clear()
+    _baked_name_index.cache_clear()
+    yield module.SERVICES
+    baked_services.cache_clear()
+    _baked_name_index.cache_clear()
@@ -0,0 +1,233 @@
+"""Tests for the on-disk and in-memory response caches."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.cache import MemoryCache, ResponseCache, canonical_params, make_cache_key
+
+SAMPLE = {
+    "test_endpoint": [
+        {"head": [{"list_total_count": 1}, {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}]},
+        {"row": [{"HG_NM": "홍길동"}]},
+    ]
+}
+
+
+def test_canonical_params_ignores_key_defaults_and_order():
+    assert canonical_params({"KEY": "secret", "pIndex": 1, "pSize": 100, "Type": "json", "AGE": 21}) == {"AGE": "21"}
+    assert make_cache_key("SVC", {"B": "2", "A": "1", "KEY": "x"}) == make_cache_key("SVC", {"A": 1, "B": 2})
+    assert make_cache_key("SVC", {"AGE": "21"}) != make_cache_key("SVC", {"AGE": "22"})
+    assert make_cache_key("SVC", {"pIndex": 2}) != make_cache_key("SVC", None)
+    assert make_cache_key("SVC", {"AGE": None}) == make_cache_key("SVC", {})
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    assert cache.get("SVC", {"AGE": "21"}) is None
+
+    cache.set("SVC", {"AGE": "21"}, SAMPLE)
+    assert cache.get("SVC", {"AGE": 21, "KEY": "other"}) == SAMPLE
+
+    # Persisted across instances
+    cache.close()
+    assert ResponseCache(tmp_path / "responses.db").get("SVC", {"AGE": "21"}) == SAMPLE
+
+
+def test_cache_ttl(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db", default_ttl=60, ttls={"FAST": 0, "FOREVER": None})
+    cache.set("SVC", None, SAMPLE)
+    cache.set("FAST", None, SAMPLE)
+    cache.set("FOREVER", None, SAMPLE)
+    cache.conn.execute("UPDATE responses SET created = ?", (time.time() - 3600,))
+
+    assert cache.get("SVC", None) is None
+    assert cache.get("FAST", None) is None
+    assert cache.get("FOREVER", None) == SAMPLE
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    cache.set("SVC", {"pIndex": 1}, SAMPLE)
+    entry_size = cache.conn.execute("SELECT size FROM responses").fetchone()[0]
+    cache.max_bytes = entry_size * 2
+
+    cache.set("SVC", {"pIndex": 2}, SAMPLE)
+    # Make page 2 the least recently used entry
+    key = make_cache_key("SVC", {"pIndex": 2})
+    cache.conn.execute("UPDATE responses SET accessed = accessed - 10 WHERE key = ?", (key,))
+    cache.set("SVC", {"pIndex": 3}, SAMPLE)
+
+    assert cache.get("SVC", {"pIndex": 1}) == SAMPLE
+    assert cache.get("SVC", {"pIndex": 2}) is None
+    assert cache.get("SVC", {"pIndex": 3}) == SAMPLE
+
+
+def test_cache_hits_defer_access_time_writes(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    cache.set("SVC", {"pIndex": 1}, SAMPLE)
+    entry_size = cache.conn.execute("SELECT size FROM responses").fetchone()[0]
+    cache.max_bytes = entry_size * 2
+    cache.set("SVC", {"pIndex": 2}, SAMPLE)
+    # Page 1 starts out as the least recently used entry
+    key = make_cache_key("SVC", {"pIndex": 1})
+    cache.conn.execute("UPDATE responses SET accessed = accessed - 10 WHERE key = ?", (key,))
+    cache.conn.commit()
+    stale = cache.conn.execute("SELECT accessed FROM responses WHERE key = ?", (key,)).fetchone()[0]
+
+    assert cache.get("SVC", {"pIndex": 1}) == SAMPLE
+    assert cache.conn.execute("SELECT accessed FROM responses WHERE key = ?", (key,)).fetchone()[0] == stale
+
+    # The buffered hit is written before eviction, so page 2 is evicted instead
+    cache.set("SVC", {"pIndex": 3}, SAMPLE)
+    assert cache.get("SVC", {"pIndex": 1}) == SAMPLE
+    assert cache.get("SVC", {"pIndex": 2}) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_async_access_runs_off_the_event_loop(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    threads = []
+    get, set_ = cache.get, cache.set
+    cache.get = lambda *args: threads.append(threading.get_ident()) or get(*args)
+    cache.set = lambda *args: threads.append(threading.get_ident()) or set_(*args)
+
+    await cache.aset("SVC", None, SAMPLE)
+    assert await cache.aget("SVC", None) == SAMPLE
+    cache.close()
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+def test_cache_clear(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    cache.set("A", None, SAMPLE)
+    cache.set("B", None, SAMPLE)
+
+    cache.clear("A")
+    assert cache.get("A", None) is None
+    assert cache.get("B", None) == SAMPLE
+
+    cache.clear()
+    assert cache.get("B", None) is None
+
+
+@pytest.mark.asyncio
+async def test_client_serves_repeated_requests_from_cache(tmp_path):
+    client = AssemblyAPIClient(api_key="test_key", cache=ResponseCache(tmp_path / "responses.db"))
+    client._request_raw = AsyncMock(return_value=SAMPLE)
+
+    first = await client._fetch_raw("SVC", {"AGE": "21", "pIndex": 1})
+    second = await client._fetch_raw("SVC", {"AGE": "21"})
+
+    assert first == second == SAMPLE
+    client._request_raw.assert_awaited_once()
+    await client.close()
+
+
+# --- In-memory LRU / single-flight ---
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_coalesces_concurrent_requests():
+    cache = MemoryCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return SAMPLE
+
+    results = await asyncio.gather(*(cache.get_or_fetch("SVC", {"AGE": "21"}, fetch) for _ in range(10)))
+
+    assert calls == 1
+    assert all(r is SAMPLE for r in results)
+    # Subsequent calls are served from memory
+    assert await cache.get_or_fetch("SVC", {"AGE": 21}, fetch) is SAMPLE
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_does_not_store_failures():
+    cache = MemoryCache()
+    fetch = AsyncMock(side_effect=[RuntimeError("boom"), SAMPLE])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("SVC", None, fetch)
+    assert await cache.get_or_fetch("SVC", None, fetch) == SAMPLE
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_lru_and_expires():
+    cache = MemoryCache(max_entries=2)
+    for page in (1, 2, 3):
+        await cache.get_or_fetch("SVC", {"pIndex": page}, AsyncMock(return_value=page))
+    assert len(cache) == 2
+
+    fetch = AsyncMock(return_value="fresh")
+    assert await cache.get_or_fetch("SVC", {"pIndex": 1}, fetch) == "fresh"
+    assert await cache.get_or_fetch("SVC", {"pIndex": 3}, fetch) == 3
+
+    expiring = MemoryCache(ttl=0.01)
+    await expiring.get_or_fetch("SVC", None, AsyncMock(return_value="old"))
+    await asyncio.sleep(0.02)
+    assert await expiring.get_or_fetch("SVC", None, AsyncMock(return_value="new")) == "new"
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_survives_cancelled_caller():
+    cache = MemoryCache()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return SAMPLE
+
+    first = asyncio.ensure_future(cache.get_or_fetch("SVC", None, fetch))
+    second = asyncio.ensure_future(cache.get_or_fetch("SVC", None, fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second is SAMPLE
+
+
+@pytest.mark.asyncio
+async def test_client_deduplicates_identical_get_data_calls():
+    client = AssemblyAPIClient(api_key="test_key", memory_cache=MemoryCache())
+
+    async def request_raw(service_id, params=None, fmt="json"):
+        await asyncio.sleep(0.01)
+        return {"test_endpoint": [{"head": [{"list_total_count": 1}]}, {"row": [{"HG_NM": "홍길동"}]}]}
+
+    client._request_raw = AsyncMock(side_effect=request_raw)
+    client._resolve_service_id = lambda x: x
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        results = await asyncio.gather(*(client.get_data("SVC", {"AGE": "21"}) for _ in range(5)))
+
+    assert all(r == [{"HG_NM": "홍길동"}] for r in results)
+    client._request_raw.assert_awaited_once()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mutating_dict_rows_does_not_corrupt_memory_cache():
+    client = AssemblyAPIClient(api_key="test_key", memory_cache=MemoryCache(), decode="dict")
+    client._request_raw = AsyncMock(
+        return_value={"test_endpoint": [{"head": [{"list_total_count": 1}]}, {"row": [{"HG_NM": "홍길동"}]}]}
+    )
+    client._resolve_service_id = lambda x: x
+
+    first = await client.get_data("SVC", {"AGE": "21"})
+    first[0]["HG_NM"] = "changed"
+    second = await client.get_data("SVC", {"AGE": "21"})
+
+    assert second == [{"HG_NM": "홍길동"}]
+    client._request_raw.assert_awaited_once()
+    await client.close()
@@ -146,3 +146,68 @@ async def test_get_data_without_generated_types_returns_dicts(mock_env):
 
     assert isinstance(result, list)
     assert result[0] == {"data": "value"}
+
+
+# --- Decode modes ---
+
+
+DECODE_RESPONSE = {
+    "test_endpoint": [
+        {"head": [{"RESULT": {"CODE": "INFO-000", "MESSAGE": "Success"}}]},
+        {"row": [{"AGE": "30", "HG_NM": "김민석"}, {"HG_NM": "이영희", "EXTRA": "x"}]},
+    ]
+}
+
+
+@pytest.mark.asyncio
+async def test_get_data_decode_dict(mock_env):
+    client = _make_client_with_mock(mock_env, DECODE_RESPONSE)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", True), \
+         patch("assembly_client.api.MODEL_MAP", FAKE_MODEL_MAP):
+        result = await client.get_data("TEST_SVC_ID", decode="dict")
+
+    assert result == DECODE_RESPONSE["test_endpoint"][1]["row"]
+
+
+@pytest.mark.asyncio
+async def test_get_data_decode_construct_skips_validation(mock_env):
+    client = _make_client_with_mock(mock_env, DECODE_RESPONSE)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", True), \
+         patch("assembly_client.api.MODEL_MAP", FAKE_MODEL_MAP):
+        result = await client.get_data("TEST_SVC_ID", decode="construct")
+
+    assert isinstance(result[0], FakeModel)
+    assert result[0].HG_NM == "김민석"
+    assert result[1].AGE is None
+    assert result[1].model_fields_set == {"HG_NM"}
+    assert result[0].model_dump() == {"HG_NM": "김민석", "AGE": "30"}
+
+
+@pytest.mark.asyncio
+async def test_get_data_decode_tuple_follows_field_order(mock_env):
+    client = _make_client_with_mock(mock_env, DECODE_RESPONSE)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", True), \
+         patch("assembly_client.api.MODEL_MAP", FAKE_MODEL_MAP):
+        assert client.field_names("TEST_SVC_ID") == ["HG_NM", "AGE"]
+        result = await client.get_data("TEST_SVC_ID", decode="tuple")
+
+    assert result == [("김민석", "30"), ("이영희", None)]
+
+
+@pytest.mark.asyncio
+async def test_client_level_decode_default(mock_env):
+    client = _make_client_with_mock(mock_env, DECODE_RESPONSE)
+    client.decode = "dict"
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", True), \
+         patch("assembly_client.api.MODEL_MAP", FAKE_MODEL_MAP):
+        assert isinstance((await client.get_data("TEST_SVC_ID"))[0], dict)
+        assert isinstance((await client.get_data("TEST_SVC_ID", decode="model"))[0], FakeModel)
+
+
+def test_invalid_decode_mode(mock_env):
+    with pytest.raises(ValueError):
+        AssemblyAPIClient(decode="fast")
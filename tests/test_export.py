@@ -0,0 +1,125 @@
+"""Tests for streaming export to CSV / NDJSON / Parquet."""
+
+import csv
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assembly_client.export import ExportWriter, export_service, infer_format, open_writer
+
+ROWS = [{"BILL_ID": f"B{i}", "BILL_NAME": f"법안{i}", "AGE": "21", "EXTRA": i} for i in range(5)]
+
+
+def _fake_client(pages, field_names=("BILL_NAME", "BILL_ID", "AGE")):
+    client = MagicMock()
+    client._resolve_service_id = MagicMock(side_effect=lambda x: x)
+    client.load_field_names = AsyncMock(return_value=list(field_names))
+
+    async def get_all_data(service_id, params=None, **kwargs):
+        client.get_all_data_kwargs = kwargs
+        for page in pages:
+            yield page
+
+    client.get_all_data = get_all_data
+    return client
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("bills.csv", ("csv", None)),
+        ("bills.CSV.gz", ("csv", "gzip")),
+        ("bills.jsonl", ("ndjson", None)),
+        ("bills.ndjson.gz", ("ndjson", "gzip")),
+        ("bills.parquet", ("parquet", None)),
+        ("bills.txt", (None, None)),
+    ],
+)
+def test_infer_format(name, expected):
+    assert infer_format(name) == expected
+
+
+@pytest.mark.asyncio
+async def test_export_csv_uses_spec_column_order(tmp_path):
+    path = tmp_path / "bills.csv"
+    client = _fake_client([ROWS[:2], ROWS[2:]])
+    progress = []
+
+    total = await export_service(client, "SVC", path, "csv", concurrency=3, on_progress=progress.append)
+
+    assert total == 5
+    assert progress == [2, 5]
+    assert client.get_all_data_kwargs["decode"] == "dict"
+    assert client.get_all_data_kwargs["concurrency"] == 3
+
+    with open(path, encoding="utf-8", newline="") as f:
+        lines = list(csv.reader(f))
+    assert lines[0] == ["BILL_NAME", "BILL_ID", "AGE"]
+    assert lines[1] == ["법안0", "B0", "21"]
+    assert len(lines) == 6
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_gzip(tmp_path):
+    path = tmp_path / "bills.ndjson.gz"
+    client = _fake_client([ROWS])
+
+    await export_service(client, "SVC", path, "ndjson", compression="gzip")
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 5
+    assert list(records[0]) == ["BILL_NAME", "BILL_ID", "AGE"]
+    assert records[4]["BILL_ID"] == "B4"
+
+
+@pytest.mark.asyncio
+async def test_export_falls_back_to_row_keys_without_spec(tmp_path):
+    path = tmp_path / "bills.csv"
+    client = _fake_client([ROWS[:1]], field_names=())
+
+    await export_service(client, "SVC", path, "csv")
+
+    with open(path, encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f))
+    assert header == ["BILL_ID", "BILL_NAME", "AGE", "EXTRA"]
+
+
+@pytest.mark.asyncio
+async def test_export_no_data_writes_nothing(tmp_path):
+    path = tmp_path / "bills.csv"
+
+    assert await export_service(_fake_client([]), "SVC", path, "csv") == 0
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_export_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="Unknown export format"):
+        await export_service(_fake_client([ROWS]), "SVC", tmp_path / "x.xml", "xml")
+
+
+def test_parquet_writer_batches(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "bills.parquet"
+
+    writer = open_writer("parquet", path, ["BILL_ID", "EXTRA"])
+    writer.batch_rows = 2
+    writer.write(ROWS[:3])
+    writer.write(ROWS[3:])
+    writer.close()
+
+    table = pq.read_table(path)
+    assert table.column_names == ["BILL_ID", "EXTRA"]
+    assert table.column("EXTRA").to_pylist() == ["0", "1", "2", "3", "4"]
+
+
+def test_export_writer_requires_write_and_close(tmp_path):
+    class Incomplete(ExportWriter):
+        def write(self, rows):
+            pass
+
+    with pytest.raises(TypeError, match="close"):
+        Incomplete(tmp_path / "out.csv", ["A"])
@@ -1,11 +1,15 @@
 """Tests for get_all_data async generator method."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from pydantic import BaseModel, Field
 
 from assembly_client.api import AssemblyAPIClient
+from assembly_client.errors import SpecParseError
+from assembly_client.parser import APIParameter, APISpec
 
 
 @pytest.fixture
@@ -18,6 +22,7 @@ def client():
         c.name_to_id = {}
         c.parsed_specs = {}
         c._resolve_service_id = MagicMock(side_effect=lambda x: x)
+        c.get_spec = AsyncMock(side_effect=SpecParseError("no spec"))
         return c
 
 
@@ -213,3 +218,179 @@ async def test_get_all_data_pydantic_multiple_pages(client):
     assert len(rows_collected) == 3
     assert all(isinstance(r, PaginationModel) for r in rows_collected)
     assert call_count == 2
+
+
+# --- Concurrent pagination ---
+
+
+def _paged_fetch(total, calls):
+    """Build a fake _fetch_raw serving `total` rows split by pIndex/pSize."""
+
+    async def mock_fetch_raw(service_id, params, **kwargs):
+        p_index, p_size = params["pIndex"], params["pSize"]
+        calls.append(p_index)
+        # Later pages answer faster so completion order differs from page order
+        await asyncio.sleep(0.01 / p_index)
+        start = (p_index - 1) * p_size
+        return {
+            "test_endpoint": [
+                {"head": [{"list_total_count": total}]},
+                {"row": [{"id": i} for i in range(start, min(start + p_size, total))]},
+            ]
+        }
+
+    return mock_fetch_raw
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_concurrent_ordered(client):
+    """Concurrent fan-out yields every page in pIndex order."""
+    calls = []
+    client._fetch_raw = _paged_fetch(95, calls)
+
+    pages = []
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        async for rows in client.get_all_data("test_service", p_size=10, concurrency=4):
+            pages.append([r["id"] for r in rows])
+
+    assert [r for page in pages for r in page] == list(range(95))
+    assert sorted(calls) == list(range(1, 11))
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_concurrent_as_completed(client):
+    """ordered=False yields pages as they complete, covering every row once."""
+    calls = []
+    client._fetch_raw = _paged_fetch(50, calls)
+
+    pages = []
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        async for rows in client.get_all_data("test_service", p_size=10, concurrency=4, ordered=False):
+            pages.append(rows[0]["id"])
+
+    assert pages[0] == 0
+    assert pages != sorted(pages)
+    assert sorted(pages) == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_prefetches_next_page(client):
+    """The next page is requested before the consumer finishes the current one."""
+    calls = []
+    client._fetch_raw = _paged_fetch(30, calls)
+
+    seen_calls = []
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        async for rows in client.get_all_data("test_service", p_size=10, prefetch=True):
+            await asyncio.sleep(0.05)
+            seen_calls.append(list(calls))
+
+    assert seen_calls[0] == [1, 2]
+    assert calls == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_does_not_prefetch_by_default(client):
+    """Without prefetch, stopping after the first page costs a single request."""
+    calls = []
+    client._fetch_raw = _paged_fetch(30, calls)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        gen = client.get_all_data("test_service", p_size=10)
+        async for _ in gen:
+            await asyncio.sleep(0.05)
+            break
+        await gen.aclose()
+
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_early_exit_cancels_pending(client):
+    """Breaking out of the loop does not leave page requests running."""
+    calls = []
+    client._fetch_raw = _paged_fetch(1000, calls)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        gen = client.get_all_data("test_service", p_size=10, concurrency=5)
+        async for _ in gen:
+            break
+        await gen.aclose()
+
+    await asyncio.sleep(0.05)
+    assert len(calls) <= 6
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_invalid_concurrency(client):
+    with pytest.raises(ValueError):
+        async for _ in client.get_all_data("test_service", concurrency=0):
+            pass
+
+
+# --- Columnar results ---
+
+
+@pytest.mark.asyncio
+async def test_get_columns_accumulates_pages(client):
+    calls = []
+    client._fetch_raw = _paged_fetch(25, calls)
+    client.field_names = MagicMock(return_value=["id", "missing"])
+
+    columns = await client.get_columns("test_service", p_size=10, concurrency=3)
+
+    assert list(columns) == ["id", "missing"]
+    assert columns["id"] == list(range(25))
+    assert columns["missing"] == [None] * 25
+
+
+@pytest.mark.asyncio
+async def test_get_columns_without_spec_uses_row_keys(client):
+    client._fetch_raw = AsyncMock(return_value={
+        "test_endpoint": [
+            {"head": [{"list_total_count": 2}]},
+            {"row": [{"b": 1, "a": 2}, {"b": 3, "a": 4}]}
+        ]
+    })
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        columns = await client.get_columns("test_service")
+
+    assert columns == {"b": [1, 3], "a": [2, 4]}
+
+
+@pytest.mark.asyncio
+async def test_get_columns_loads_spec_for_field_order(client):
+    client._fetch_raw = AsyncMock(return_value={
+        "test_endpoint": [
+            {"head": [{"list_total_count": 2}]},
+            {"row": [{"b": 1, "a": 2}, {"b": 3, "a": 4}]}
+        ]
+    })
+    spec = APISpec(
+        service_id="test_service",
+        endpoint="test_endpoint",
+        endpoint_url="https://open.assembly.go.kr/portal/openapi/test_endpoint",
+        basic_params=[],
+        request_params=[],
+        response_fields=[APIParameter(name, "string", False, name) for name in ("a", "b")],
+    )
+
+    async def get_spec(service_id):
+        client.parsed_specs[service_id] = spec
+        return spec
+
+    client.get_spec = AsyncMock(side_effect=get_spec)
+
+    with patch("assembly_client.api.HAS_GENERATED_TYPES", False):
+        columns = await client.get_columns("test_service")
+
+    client.get_spec.assert_awaited_once_with("test_service")
+    assert list(columns) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_get_columns_no_data(client):
+    client._fetch_raw = AsyncMock(return_value={"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}})
+
+    assert await client.get_columns("test_service") == {}
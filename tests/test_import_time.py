@@ -0,0 +1,46 @@
+"""Import-time guards: the data path must not load the heavy optional dependencies."""
+
+import json
+import subprocess
+import sys
+
+# Only needed for spec downloads, the CLI or exports
+HEAVY_MODULES = ("openpyxl", "rich", "typer", "pyarrow", "sqlite3", "platformdirs", "multiprocessing")
+
+# Budget for importing assembly_client.api on top of its own dependencies (seconds)
+API_IMPORT_BUDGET = 0.25
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+def _loaded_heavy_modules(module: str) -> list[str]:
+    code = (
+        f"import json, sys; import {module}; "
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r}))))"
+    )
+    return json.loads(_run(code))
+
+
+def test_api_import_skips_heavy_modules():
+    assert _loaded_heavy_modules("assembly_client.api") == []
+
+
+def test_cli_import_skips_rich():
+    assert "rich" not in _loaded_heavy_modules("assembly_client.cli")
+
+
+def test_api_import_time():
+    code = (
+        "import time\n"
+        "import httpx, tenacity\n"
+        "from pydantic import BaseModel, TypeAdapter\n"
+        "started = time.perf_counter()\n"
+        "import assembly_client.api\n"
+        "print(time.perf_counter() - started)\n"
+    )
+    # Best of three fresh interpreters, to keep the check stable on busy machines
+    elapsed = min(float(_run(code)) for _ in range(3))
+
+    assert elapsed < API_IMPORT_BUDGET, f"import assembly_client.api took {elapsed:.3f}s"
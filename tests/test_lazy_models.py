@@ -0,0 +1,82 @@
+"""Tests for lazy, per-service loading of generated models."""
+
+import subprocess
+import sys
+
+from pydantic import BaseModel
+
+from assembly_client.generated import MODEL_MAP, PARAM_MAP, Service
+from assembly_client.lazy import LazyModelMap
+
+
+def _loaded_model_modules(code: str) -> list[str]:
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('assembly_client.generated.models.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_importing_client_loads_no_models():
+    assert _loaded_model_modules("import assembly_client.api") == []
+
+
+def test_lookup_loads_only_requested_services():
+    loaded = _loaded_model_modules(
+        "from assembly_client.generated import MODEL_MAP, PARAM_MAP\n"
+        "MODEL_MAP['OK7XM1000938DS17215']\n"
+        "PARAM_MAP['OK7XM1000938DS17215']\n"
+        "MODEL_MAP['OWSSC6001134T516707']\n"
+        "'OO1X9P001017YF13038' in MODEL_MAP\n"
+    )
+    assert sorted(loaded) == [
+        "assembly_client.generated.models.OK7XM1000938DS17215",
+        "assembly_client.generated.models.OWSSC6001134T516707",
+    ]
+
+
+def test_model_maps_cover_every_service():
+    assert len(MODEL_MAP) == len(PARAM_MAP) == len(Service)
+    assert set(MODEL_MAP) == {s.value for s in Service}
+
+    model_cls = MODEL_MAP[Service.국회의원_발의법률안.value]
+    assert issubclass(model_cls, BaseModel)
+    assert model_cls.__name__ == f"Model_{Service.국회의원_발의법률안.value}"
+    assert MODEL_MAP[Service.국회의원_발의법률안.value] is model_cls
+
+
+def test_legacy_attribute_access():
+    from assembly_client import generated
+    from assembly_client.generated.models import Params_OK7XM1000938DS17215
+
+    assert generated.Model_OK7XM1000938DS17215 is MODEL_MAP["OK7XM1000938DS17215"]
+    assert Params_OK7XM1000938DS17215 is PARAM_MAP["OK7XM1000938DS17215"]
+
+
+def test_lazy_model_map_unknown_key():
+    mapping = LazyModelMap("assembly_client.generated.models", "Model_", ["OK7XM1000938DS17215"])
+    assert "UNKNOWN" not in mapping
+    assert mapping.get("UNKNOWN") is None
+
+
+def test_generated_service_module_imports_only_used_names():
+    from assembly_client.codegen.generator import generate_service_module
+    from assembly_client.parser import APIParameter, APISpec
+
+    spec = APISpec(
+        service_id="S1",
+        endpoint="ep",
+        endpoint_url="https://open.assembly.go.kr/portal/openapi/ep",
+        basic_params=[],
+        request_params=[APIParameter("AGE", "STRING", False, "대수")],
+        response_fields=[],
+    )
+    code = generate_service_module(spec)
+
+    assert "from pydantic import BaseModel, Field\n" in code
+    assert "typing" not in code
+    namespace = {}
+    exec(code, namespace)
+    assert namespace["Params_S1"]().AGE is None
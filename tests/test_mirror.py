@@ -0,0 +1,119 @@
+"""Tests for the SQLite mirror sink."""
+
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assembly_client.mirror import SQLiteMirror, mirror_service
+from assembly_client.parser import APIParameter, APISpec
+
+FIELDS = [
+    APIParameter(name="BILL_ID", type="String", required=False, description="의안ID"),
+    APIParameter(name="BILL_NAME", type="String", required=False, description="법률안명"),
+    APIParameter(name="AGE", type="String", required=False, description="대수"),
+]
+
+
+def _spec(fields=FIELDS):
+    return APISpec(
+        service_id="SVC",
+        endpoint="test_endpoint",
+        endpoint_url="https://open.assembly.go.kr/portal/openapi/test_endpoint",
+        basic_params=[],
+        request_params=[],
+        response_fields=fields,
+    )
+
+
+def _fake_client(pages, spec=None):
+    client = MagicMock()
+    client._resolve_service_id = MagicMock(side_effect=lambda x: x)
+    client.get_spec = AsyncMock(return_value=spec or _spec(fields=[]))
+
+    async def get_all_data(service_id, params=None, **kwargs):
+        for page in pages:
+            yield page
+
+    client.get_all_data = get_all_data
+    return client
+
+
+def test_schema_and_indexes(tmp_path):
+    with SQLiteMirror(tmp_path / "m.db") as mirror:
+        mirror.ensure_table("SVC", ["BILL_ID", "BILL_NAME", "AGE"], descriptions={"BILL_ID": "의안ID"})
+        columns = [row[1] for row in mirror.conn.execute('PRAGMA table_info("SVC")')]
+        indexes = [row[1] for row in mirror.conn.execute('PRAGMA index_list("SVC")')]
+        sql = mirror.conn.execute("SELECT sql FROM sqlite_master WHERE name = 'SVC'").fetchone()[0]
+
+    assert columns == ["_row_key", "_mirrored_at", "BILL_ID", "BILL_NAME", "AGE"]
+    assert "idx_SVC_BILL_ID" in indexes
+    assert "/* 의안ID */" in sql
+
+
+def test_upsert_replaces_rows_with_same_key(tmp_path):
+    with SQLiteMirror(tmp_path / "m.db", batch_rows=2) as mirror:
+        mirror.ensure_table("SVC", ["BILL_ID", "BILL_NAME"], key_columns=["BILL_ID"])
+        mirror.upsert("SVC", [{"BILL_ID": f"B{i}", "BILL_NAME": "old"} for i in range(5)])
+        mirror.upsert("SVC", [{"BILL_ID": "B1", "BILL_NAME": "new"}])
+
+        assert mirror.count("SVC") == 5
+        name = mirror.conn.execute('SELECT BILL_NAME FROM "SVC" WHERE BILL_ID = ?', ("B1",)).fetchone()[0]
+        assert name == "new"
+
+
+def test_upsert_without_key_deduplicates_identical_rows(tmp_path):
+    with SQLiteMirror(tmp_path / "m.db") as mirror:
+        mirror.ensure_table("SVC", ["A", "B"])
+        mirror.upsert("SVC", [{"A": "1", "B": "x"}, {"A": "1", "B": "x"}, {"A": "1", "B": "y"}])
+        assert mirror.count("SVC") == 2
+
+
+def test_existing_table_gains_new_columns(tmp_path):
+    path = tmp_path / "m.db"
+    with SQLiteMirror(path) as mirror:
+        mirror.ensure_table("SVC", ["A"])
+        mirror.upsert("SVC", [{"A": "1"}])
+    with SQLiteMirror(path) as mirror:
+        mirror.ensure_table("SVC", ["A", "B"])
+        mirror.upsert("SVC", [{"A": "2", "B": "x"}])
+        assert mirror.count("SVC") == 2
+
+
+def test_unknown_key_column(tmp_path):
+    with SQLiteMirror(tmp_path / "m.db") as mirror:
+        with pytest.raises(ValueError, match="Key columns"):
+            mirror.ensure_table("SVC", ["A"], key_columns=["BILL_ID"])
+
+
+@pytest.mark.asyncio
+async def test_mirror_service_uses_spec_schema(tmp_path):
+    path = tmp_path / "m.db"
+    pages = [
+        [{"BILL_ID": "B1", "BILL_NAME": "법안1", "AGE": "21", "EXTRA": "ignored"}],
+        [{"BILL_ID": "B2", "BILL_NAME": "법안2", "AGE": "21"}],
+    ]
+    progress = []
+
+    with SQLiteMirror(path) as mirror:
+        total = await mirror_service(
+            _fake_client(pages, _spec()), "SVC", mirror, key_columns=["BILL_ID"], on_progress=progress.append
+        )
+
+    assert total == 2
+    assert progress == [1, 2]
+    conn = sqlite3.connect(path)
+    assert conn.execute('SELECT BILL_ID, BILL_NAME FROM "SVC" ORDER BY BILL_ID').fetchall() == [
+        ("B1", "법안1"),
+        ("B2", "법안2"),
+    ]
+    columns = [row[1] for row in conn.execute('PRAGMA table_info("SVC")')]
+    assert "EXTRA" not in columns
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_mirror_service_without_spec_fields(tmp_path):
+    with SQLiteMirror(tmp_path / "m.db") as mirror:
+        await mirror_service(_fake_client([[{"X": "1", "Y": "2"}]]), "SVC", mirror)
+        assert mirror.count("SVC") == 1
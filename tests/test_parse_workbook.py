@@ -0,0 +1,218 @@
+"""Offline tests for Excel spec parsing (synthetic workbooks, no network)."""
+
+import asyncio
+import json
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from unittest.mock import AsyncMock
+
+import openpyxl
+import pytest
+
+from assembly_client.errors import SpecParseError
+from assembly_client.parser import SpecParser, _spec_from_rows, parse_spec_workbook
+
+ENDPOINT_URL = "https://open.assembly.go.kr/portal/openapi/nzmimeepazxkubdpn"
+
+
+def make_workbook(rows) -> bytes:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    for row in rows:
+        ws.append(list(row))
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+SPEC_ROWS = [
+    ("국회의원 발의법률안",),
+    ("요청주소",),
+    (f"- {ENDPOINT_URL}",),
+    ("기본인자",),
+    ("변수명", "타입", "변수 설명"),
+    ("KEY", "STRING(필수)", "인증키"),
+    ("Type", "STRING(필수)", "호출 문서(xml, json)"),
+    ("요청인자",),
+    ("변수명", "타입", "변수 설명"),
+    ("AGE", "STRING(필수)", "대수"),
+    ("BILL_NAME", "STRING(선택)", "법률안명"),
+    ("출력값",),
+    ("No", "출력명", "출력설명"),
+    (1, "BILL_ID", "의안ID"),
+    (2, "BILL_NAME", "법률안명"),
+    (3, "PROPOSE_DT", "제안일"),
+]
+
+
+def test_parse_spec_workbook():
+    spec = parse_spec_workbook("TEST_SVC", make_workbook(SPEC_ROWS))
+
+    assert spec.endpoint_url == ENDPOINT_URL
+    assert spec.endpoint == "nzmimeepazxkubdpn"
+    assert [p.name for p in spec.basic_params] == ["KEY", "Type"]
+    assert [(p.name, p.required) for p in spec.request_params] == [("AGE", True), ("BILL_NAME", False)]
+    assert [(f.name, f.description) for f in spec.response_fields] == [
+        ("BILL_ID", "의안ID"),
+        ("BILL_NAME", "법률안명"),
+        ("PROPOSE_DT", "제안일"),
+    ]
+
+
+def test_parse_spec_workbook_without_endpoint():
+    with pytest.raises(SpecParseError, match="endpoint URL"):
+        parse_spec_workbook("TEST_SVC", make_workbook([("기본인자",)]))
+
+
+def test_endpoint_label_without_url_is_skipped():
+    rows = [("요청주소",), ("(준비중)",), ("요청주소",), (ENDPOINT_URL,)] + SPEC_ROWS[3:]
+    assert parse_spec_workbook("TEST_SVC", make_workbook(rows)).endpoint_url == ENDPOINT_URL
+
+
+def test_endpoint_label_only_searched_near_top():
+    rows = [("설명",)] * 60 + [("요청주소",), (ENDPOINT_URL,)]
+    with pytest.raises(SpecParseError, match="endpoint URL"):
+        parse_spec_workbook("TEST_SVC", make_workbook(rows))
+
+
+def test_parse_spec_workbook_ignores_stale_dimension():
+    content = make_workbook(SPEC_ROWS)
+    # Rewrite the sheet's <dimension> to claim only A1 is used
+    source = zipfile.ZipFile(BytesIO(content))
+    out = BytesIO()
+    with zipfile.ZipFile(out, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+            target.writestr(item, data)
+
+    spec = parse_spec_workbook("TEST_SVC", out.getvalue())
+    assert len(spec.response_fields) == 3
+
+
+def test_rows_with_empty_trailing_cells_are_kept():
+    rows = [(r[0], r[1]) if r[0] in ("AGE", 1) else r for r in SPEC_ROWS]
+    content = make_workbook(rows)
+
+    spec = parse_spec_workbook("TEST_SVC", content)
+
+    # Same result as parsing the padded rows of a fully loaded worksheet
+    ws = openpyxl.load_workbook(BytesIO(content))["Sheet1"]
+    baseline = _spec_from_rows("TEST_SVC", ws.iter_rows(values_only=True))
+    assert spec == baseline
+    assert [(p.name, p.description) for p in spec.request_params] == [("AGE", ""), ("BILL_NAME", "법률안명")]
+    assert [f.name for f in spec.response_fields] == ["BILL_ID", "BILL_NAME", "PROPOSE_DT"]
+
+
+@pytest.mark.asyncio
+async def test_parse_spec_in_process_pool(tmp_path):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        parser = SpecParser(cache_dir=tmp_path, executor=pool)
+        parser._download_excel_bytes = AsyncMock(return_value=make_workbook(SPEC_ROWS))
+
+        spec = await parser.parse_spec("TEST_SVC")
+
+    assert spec.endpoint == "nzmimeepazxkubdpn"
+    # The JSON cache is written by the parent process
+    with open(tmp_path / "TEST_SVC.json", encoding="utf-8") as f:
+        assert json.load(f)["endpoint"] == "nzmimeepazxkubdpn"
+
+
+def _download_mock(valid, delays=None):
+    """Fake _download_excel_bytes: only infSeq values in ``valid`` return a workbook."""
+    calls = []
+    content = make_workbook(SPEC_ROWS)
+
+    async def download(service_id, inf_seq=2):
+        calls.append(inf_seq)
+        await asyncio.sleep((delays or {}).get(inf_seq, 0))
+        if inf_seq not in valid:
+            raise SpecParseError(f"not a valid Excel file (infSeq={inf_seq})")
+        return content
+
+    return download, calls
+
+
+@pytest.mark.asyncio
+async def test_known_inf_seq_is_tried_first(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser.inf_seq_index.set("TEST_SVC", 4)
+    parser._download_excel_bytes, calls = _download_mock(valid={4})
+
+    await parser.parse_spec("TEST_SVC")
+
+    assert calls == [4]
+
+
+@pytest.mark.asyncio
+async def test_inf_seq_probed_concurrently_and_remembered(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser._download_excel_bytes, calls = _download_mock(valid={3, 5}, delays={3: 0.2, 5: 0.01})
+
+    spec = await parser.parse_spec("TEST_SVC")
+
+    assert spec.endpoint == "nzmimeepazxkubdpn"
+    assert calls[0] == 2
+    assert sorted(calls[1:]) == [1, 3, 4, 5]
+    # The fastest valid candidate wins and is persisted for the next refresh
+    assert SpecParser(cache_dir=tmp_path).inf_seq_index.get("TEST_SVC") == 5
+
+
+@pytest.mark.asyncio
+async def test_inf_seq_probe_all_fail(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser._download_excel_bytes, calls = _download_mock(valid=set())
+
+    with pytest.raises(SpecParseError, match="after trying infSeq values"):
+        await parser.parse_spec("TEST_SVC")
+    assert sorted(calls) == [1, 2, 3, 4, 5]
+    assert parser.inf_seq_index.get("TEST_SVC") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_spec_skips_parse_for_unchanged_workbook(tmp_path, monkeypatch):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser._download_excel_bytes, calls = _download_mock(valid={2})
+
+    _, status = await parser.fetch_spec("TEST_SVC", max_age=0)
+    assert status == "updated"
+    assert parser.store.get("TEST_SVC")["content_hash"]
+
+    def fail_parse(*args):
+        raise AssertionError("unchanged workbook must not be re-parsed")
+
+    def fail_put(*args):
+        raise AssertionError("unchanged spec must not be rewritten")
+
+    first_fetch = parser.fetch_times.get("TEST_SVC")
+    monkeypatch.setattr("assembly_client.parser.parse_spec_workbook", fail_parse)
+    monkeypatch.setattr(parser.store, "put", fail_put)
+    spec, status = await parser.fetch_spec("TEST_SVC", max_age=0)
+
+    assert status == "unchanged"
+    assert spec.endpoint == "nzmimeepazxkubdpn"
+    assert calls == [2, 2]
+    assert parser.fetch_times.get("TEST_SVC") >= first_fetch
+    assert SpecParser(cache_dir=tmp_path).fetch_times.get("TEST_SVC") is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_spec_max_age(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser._download_excel_bytes, calls = _download_mock(valid={2})
+
+    await parser.fetch_spec("TEST_SVC")
+    _, status = await parser.fetch_spec("TEST_SVC", max_age=3600)
+    assert status == "cached"
+    assert calls == [2]
+
+    # Specs without a recorded fetch time count as stale
+    (tmp_path / "fetched_at.json").unlink()
+    parser = SpecParser(cache_dir=tmp_path)
+    parser._download_excel_bytes = _download_mock(valid={2})[0]
+    _, status = await parser.fetch_spec("TEST_SVC", max_age=3600)
+    assert status == "unchanged"
@@ -0,0 +1,148 @@
+"""Tests for the client-side rate limiter and Retry-After handling."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.errors import AssemblyAPIError, SpecParseError
+from assembly_client.ratelimit import TokenBucket, retry_after_delay
+from assembly_client.session import AssemblySession
+from assembly_client.transport import TransportConfig
+
+
+def _response(status_code, headers=None, json=None):
+    request = httpx.Request("GET", "https://open.assembly.go.kr/portal/openapi/test_endpoint")
+    return httpx.Response(status_code, headers=headers, json=json, request=request)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_limits():
+    bucket = TokenBucket(rate=50, burst=5)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+    for _ in range(5):
+        await bucket.acquire()
+    # 5 extra tokens at 50/s need ~0.1s
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_callers():
+    bucket = TokenBucket(rate=1000, burst=10)
+    bucket.pause(0.1)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_retry_after_delay_parsing():
+    assert retry_after_delay(_response(429, headers={"Retry-After": "3"})) == 3.0
+    assert retry_after_delay(_response(429)) is None
+    assert retry_after_delay(_response(429, headers={"Retry-After": "soon"})) is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = retry_after_delay(_response(429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}))
+    assert 25 <= delay <= 30
+
+
+def test_session_builds_limiter_from_transport():
+    assert AssemblySession().limiter is None
+
+    session = AssemblySession(TransportConfig(rate_limit=5, rate_burst=2))
+    assert session.limiter.rate == 5
+    assert session.limiter.capacity == 2
+
+
+@pytest.mark.asyncio
+async def test_session_pauses_limiter_on_retry_after():
+    session = AssemblySession(TransportConfig(rate_limit=100))
+    session.client.get = AsyncMock(return_value=_response(429, headers={"Retry-After": "0.1"}))
+
+    await session.get("https://example.test")
+
+    start = time.monotonic()
+    await session.limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fetch_raw_retries_throttled_request():
+    client = AssemblyAPIClient(api_key="test_key", transport=TransportConfig(rate_limit=100))
+    client.get_endpoint = AsyncMock(return_value="test_endpoint")
+    ok = {"test_endpoint": [{"head": [{"RESULT": {"CODE": "INFO-000", "MESSAGE": "OK"}}]}, {"row": []}]}
+    client.client.get = AsyncMock(
+        side_effect=[_response(429, headers={"Retry-After": "0"}), _response(200, json=ok)]
+    )
+
+    data = await client._fetch_raw("TEST_ID")
+
+    assert data == ok
+    assert client.client.get.await_count == 2
+    await client.close()
+
+
+def test_retry_after_delay_is_clamped():
+    assert retry_after_delay(_response(429, headers={"Retry-After": "3600"}), max_delay=60) == 60.0
+    assert retry_after_delay(_response(429, headers={"Retry-After": "3"}), max_delay=60) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_capped_by_transport():
+    client = AssemblyAPIClient(api_key="test_key", transport=TransportConfig(rate_limit=100, max_retry_after=0))
+    client.get_endpoint = AsyncMock(return_value="test_endpoint")
+    ok = {"test_endpoint": [{"head": [{"RESULT": {"CODE": "INFO-000", "MESSAGE": "OK"}}]}, {"row": []}]}
+    client.client.get = AsyncMock(
+        side_effect=[_response(429, headers={"Retry-After": "3600"}), _response(200, json=ok)]
+    )
+
+    started = time.monotonic()
+    data = await client._fetch_raw("TEST_ID")
+
+    assert data == ok
+    assert time.monotonic() - started < 1.0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_spec_download_failure_is_not_retried():
+    client = AssemblyAPIClient(api_key="test_key")
+    cause = httpx.ConnectError("no route")
+    error = SpecParseError("download failed", cause)
+    error.__cause__ = cause
+    client.get_endpoint = AsyncMock(side_effect=error)
+
+    with pytest.raises(SpecParseError):
+        await client._fetch_raw("TEST_ID")
+
+    client.get_endpoint.assert_awaited_once()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise_the_api_error():
+    client = AssemblyAPIClient(api_key="test_key", transport=TransportConfig(max_retry_after=0))
+    client.get_endpoint = AsyncMock(return_value="test_endpoint")
+    client.client.get = AsyncMock(return_value=_response(503, headers={"Retry-After": "0"}))
+
+    with pytest.raises(AssemblyAPIError) as excinfo:
+        await client._fetch_raw("TEST_ID")
+
+    assert excinfo.value.message == "503"
+    assert client.client.get.await_count == 3
+    await client.close()
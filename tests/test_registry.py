@@ -0,0 +1,147 @@
+"""Tests for the process-wide service registry."""
+
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.codegen.generator import generate_registry_module
+from assembly_client.errors import SpecParseError
+from assembly_client.generated import Service
+from assembly_client.parser import SpecParser, load_service_map, load_service_metadata
+from assembly_client.registry import (
+    ServiceInfo,
+    _baked_name_index,
+    baked_endpoint,
+    baked_service_id,
+    baked_services,
+    get_registry,
+)
+from assembly_client.sync import save_master_list
+
+ROWS = [
+    {"INF_ID": "S1", "INF_NM": "국회의원 발의법률안", "CATE_NM": "의안", "SRV_URL": "https://example/s1"},
+    {"INF_ID": "S2", "INF_NM": "본회의 일정", "INF_EXP": "일정", "ORG_NM": "국회사무처"},
+    {"INF_ID": "S3"},
+]
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_registry_lookups(tmp_path):
+    save_master_list(ROWS, tmp_path)
+    registry = get_registry(tmp_path)
+
+    assert dict(registry.names) == {"S1": "국회의원 발의법률안", "S2": "본회의 일정"}
+    assert registry.ids["본회의 일정"] == "S2"
+    assert registry.info["S2"] == ServiceInfo("본회의 일정", "일정", "", "국회사무처", "")
+    assert registry.metadata["S3"]["name"] == ""
+    assert len(registry) == 3
+    with pytest.raises(TypeError):
+        registry.names["S9"] = "x"
+
+
+def test_registry_is_shared_and_parsed_once(tmp_path, monkeypatch):
+    save_master_list(ROWS, tmp_path)
+    registry = get_registry(tmp_path)
+    loads = []
+    original = registry._load
+    monkeypatch.setattr(registry, "_load", lambda signature: loads.append(signature) or original(signature))
+
+    clients = [AssemblyAPIClient(api_key="k", spec_parser=SpecParser(cache_dir=tmp_path)) for _ in range(3)]
+
+    assert loads == []
+    assert get_registry(tmp_path) is registry
+    assert all(c.registry is registry for c in clients)
+    assert all(c.service_map == dict(registry.names) for c in clients)
+    assert clients[0]._resolve_service_id("본회의 일정") == "S2"
+    assert loads == []
+
+
+def test_client_maps_are_modifiable_copies(tmp_path):
+    save_master_list(ROWS, tmp_path)
+    client = AssemblyAPIClient(api_key="k", spec_parser=SpecParser(cache_dir=tmp_path))
+
+    service_map = client.service_map
+    service_map["S9"] = "x"
+    client.name_to_id.pop("본회의 일정")
+    client.service_metadata["S2"]["name"] = "changed"
+
+    assert "S9" not in client.service_map
+    assert client._resolve_service_id("본회의 일정") == "S2"
+    assert client.service_metadata["S2"]["name"] == "본회의 일정"
+
+
+def test_registry_reloads_when_file_changes(tmp_path):
+    save_master_list(ROWS, tmp_path)
+    registry = get_registry(tmp_path)
+    assert "S4" not in registry.names
+
+    save_master_list(ROWS + [{"INF_ID": "S4", "INF_NM": "위원회 현황"}], tmp_path)
+    _bump_mtime(tmp_path / "all_apis.json")
+
+    assert get_registry(tmp_path).names["S4"] == "위원회 현황"
+    assert load_service_map(tmp_path)["S4"] == "위원회 현황"
+    assert load_service_metadata(tmp_path)["S4"]["name"] == "위원회 현황"
+
+
+def test_registry_without_master_list(tmp_path):
+    registry = get_registry(tmp_path / "missing")
+
+    assert dict(registry.names) == {}
+    assert load_service_map(tmp_path / "missing") == {}
+
+
+def test_generate_registry_module():
+    code = generate_registry_module([("S2", "본회의 일정", "ep2", "일정"), ("S1", "의안 '목록'", "ep1", "")])
+    namespace = {}
+    exec(code, namespace)
+
+    assert namespace["SERVICES"] == {"S1": ("의안 '목록'", "ep1", ""), "S2": ("본회의 일정", "ep2", "일정")}
+    assert code.index("'S1'") < code.index("'S2'")
+
+
+def test_baked_lookups(baked_table):
+    assert baked_endpoint(Service.국회의원_발의법률안) == "nzmimeepazxkubdpn"
+    assert baked_endpoint("UNKNOWN") is None
+    assert baked_service_id("국회의원 발의법률안") == Service.국회의원_발의법률안.value
+
+
+def test_baked_table_has_an_endpoint_for_every_service():
+    pytest.importorskip("assembly_client.generated.registry", reason="run_codegen.py has not generated the table")
+    services = baked_services()
+    assert not [member for member in Service if not services.get(member.value, ("", "", ""))[1]]
+
+
+def test_missing_baked_table_is_empty(monkeypatch):
+    # A None entry makes the import fail, as if codegen never wrote the table
+    monkeypatch.setitem(sys.modules, "assembly_client.generated.registry", None)
+    baked_services.cache_clear()
+    _baked_name_index.cache_clear()
+    try:
+        assert baked_endpoint(Service.국회의원_발의법률안) is None
+        assert baked_service_id("국회의원 발의법률안") is None
+    finally:
+        baked_services.cache_clear()
+        _baked_name_index.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_client_resolves_without_cache_or_network(tmp_path, baked_table):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser.parse_spec = AsyncMock(side_effect=SpecParseError("no network"))
+    client = AssemblyAPIClient(api_key="k", spec_parser=parser)
+
+    assert client._resolve_service_id("국회의원_발의법률안") == Service.국회의원_발의법률안.value
+    assert await client.get_endpoint(Service.국회의원_발의법률안) == "nzmimeepazxkubdpn"
+    parser.parse_spec.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+    # Services missing from the generated table still go through the spec parser
+    with pytest.raises(SpecParseError):
+        await client.get_endpoint("UNKNOWN_SERVICE")
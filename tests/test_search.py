@@ -0,0 +1,93 @@
+"""Tests for ranked service search."""
+
+import time
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.parser import SpecParser
+from assembly_client.registry import ServiceInfo
+from assembly_client.search import ServiceSearchIndex, chosung, normalize
+from assembly_client.sync import save_master_list
+
+SERVICES = {
+    "NZMIMEEPAZXKUBDPN": ServiceInfo("국회의원 발의법률안", "의원이 발의한 법률안 목록", "의안", "국회사무처", ""),
+    "NWVRQWXYAOTZFTUYO": ServiceInfo("국회의원 인적사항", "국회의원 기본 정보", "국회의원", "국회사무처", ""),
+    "NEKCAIRYAJNOGTCQW": ServiceInfo("본회의 회의록", "본회의 발의 안건 회의록", "회의록", "국회도서관", ""),
+    "OOWY4R001216HX11439": ServiceInfo("위원회 현황", "상임위원회 목록", "위원회", "국회사무처", ""),
+}
+
+
+def test_normalize_and_chosung():
+    assert normalize("국회의원_발의 법률안") == "국회의원발의법률안"
+    assert chosung("국회의원 A") == "ㄱㅎㅇㅇ A"
+
+
+def test_name_matches_rank_above_description_matches():
+    index = ServiceSearchIndex(SERVICES)
+
+    results = [sid for sid, _ in index.search("발의")]
+
+    assert results == ["NZMIMEEPAZXKUBDPN", "NEKCAIRYAJNOGTCQW"]
+
+
+def test_prefix_and_exact_matches_are_boosted():
+    index = ServiceSearchIndex(SERVICES)
+
+    scores = dict(index.search("국회의원"))
+    assert scores["NZMIMEEPAZXKUBDPN"] > 0
+    # Exact category match outranks a plain name prefix match
+    assert index.search("국회의원")[0][0] == "NWVRQWXYAOTZFTUYO"
+    assert [sid for sid, _ in index.search("nzmimeepazxkubdpn", limit=1)] == ["NZMIMEEPAZXKUBDPN"]
+
+
+def test_search_other_fields():
+    index = ServiceSearchIndex(SERVICES)
+
+    assert [sid for sid, _ in index.search("국회도서관")] == ["NEKCAIRYAJNOGTCQW"]
+    assert [sid for sid, _ in index.search("상임")] == ["OOWY4R001216HX11439"]
+    assert len(index.search("회")) == 4
+    assert index.search("없는서비스") == []
+    assert index.search("  ") == []
+
+
+def test_chosung_search():
+    index = ServiceSearchIndex(SERVICES)
+
+    # Equal prefix matches are ordered by name
+    assert [sid for sid, _ in index.search("ㄱㅎㅇㅇ")] == ["NZMIMEEPAZXKUBDPN", "NWVRQWXYAOTZFTUYO"]
+    assert [sid for sid, _ in index.search("ㅂㅎㅇ")] == ["NEKCAIRYAJNOGTCQW"]
+    # Mixed syllables and consonants are compared on chosung
+    assert [sid for sid, _ in index.search("위ㅇㅎ")] == ["OOWY4R001216HX11439"]
+
+
+def test_lookup_is_fast_on_a_large_list():
+    services = {f"SVC{i:05d}": ServiceInfo(f"서비스 {i} 국회 목록", "설명", "분류", "기관", "") for i in range(2000)}
+    index = ServiceSearchIndex(services)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        index.search("SVC01234")
+    elapsed = (time.perf_counter() - started) / 100
+
+    assert index.search("svc01234")[0][0] == "SVC01234"
+    assert elapsed < 0.005
+
+
+def test_client_search_services(tmp_path):
+    save_master_list(
+        [
+            {"INF_ID": sid, "INF_NM": info.name, "INF_EXP": info.description, "CATE_NM": info.category}
+            for sid, info in SERVICES.items()
+        ],
+        tmp_path,
+    )
+    client = AssemblyAPIClient(api_key="k", spec_parser=SpecParser(cache_dir=tmp_path))
+
+    assert client.search_services("발의") == {
+        "NZMIMEEPAZXKUBDPN": "국회의원 발의법률안",
+        "NEKCAIRYAJNOGTCQW": "본회의 회의록",
+    }
+    assert list(client.search_services("ㄱㅎㅇㅇ", limit=1)) == ["NZMIMEEPAZXKUBDPN"]
+
+    # A service map supplied directly is searched by name and ID
+    client.service_map = {"X1": "위원회 현황"}
+    assert client.search_services("위원") == {"X1": "위원회 현황"}
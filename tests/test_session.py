@@ -0,0 +1,82 @@
+"""Tests for the shared HTTP session."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.parser import SpecParser
+from assembly_client.session import AssemblySession
+from assembly_client.sync import fetch_master_list
+
+
+@pytest.mark.asyncio
+async def test_session_client_is_created_once():
+    session = AssemblySession()
+    first = session.client
+    assert session.client is first
+    await session.aclose()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_and_parser_share_session(tmp_path):
+    async with AssemblySession() as session:
+        parser = SpecParser(cache_dir=tmp_path, session=session)
+        client = AssemblyAPIClient(api_key="test_key", spec_parser=parser, session=session)
+
+        assert client.session is session
+        assert client.client is session.client
+        assert parser.session is session
+
+        # Closing a borrowed session is left to its owner
+        await client.close()
+        await parser.aclose()
+        assert not session.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_default_client_shares_session_with_its_parser():
+    client = AssemblyAPIClient(api_key="test_key")
+    assert client.spec_parser.session is client.session
+
+    http_client = client.client
+    await client.close()
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_spec_download_uses_session(tmp_path):
+    session = AssemblySession()
+    response = MagicMock()
+    response.content = b"PK\x03\x04" + b"\x00" * 200
+    response.raise_for_status = MagicMock()
+    session.get = AsyncMock(return_value=response)
+
+    parser = SpecParser(cache_dir=tmp_path, session=session)
+    content = await parser._download_excel_bytes("TEST_ID", 2)
+
+    assert content == response.content
+    session.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_master_list_uses_parser_session(tmp_path):
+    session = AssemblySession()
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "master_endpoint": [
+            {"head": [{"list_total_count": 1}]},
+            {"row": [{"INF_ID": "TEST_ID", "INF_NM": "Test"}]},
+        ]
+    }
+    session.get = AsyncMock(return_value=response)
+
+    parser = SpecParser(cache_dir=tmp_path, session=session)
+    parser.parse_spec = AsyncMock(return_value=MagicMock(endpoint="master_endpoint"))
+
+    rows = await fetch_master_list("test_key", parser)
+
+    assert rows == [{"INF_ID": "TEST_ID", "INF_NM": "Test"}]
+    session.get.assert_awaited_once()
@@ -0,0 +1,154 @@
+"""Tests for the spec store backends."""
+
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.parser import APIParameter, APISpec, SpecParser
+from assembly_client.spec_store import JsonSpecStore, SpecStore, SQLiteSpecStore
+from assembly_client.sync import MASTER_LIST_SERVICE_ID, cleanup_orphaned_specs, save_master_list
+
+
+def _spec(service_id):
+    return APISpec(
+        service_id=service_id,
+        endpoint=f"ep_{service_id.lower()}",
+        endpoint_url=f"https://open.assembly.go.kr/portal/openapi/ep_{service_id.lower()}",
+        basic_params=[],
+        request_params=[APIParameter(name="AGE", type="STRING(필수)", required=True, description="대수")],
+        response_fields=[APIParameter(name="BILL_ID", type="String", required=False, description="의안ID")],
+    )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        yield JsonSpecStore(tmp_path)
+    else:
+        s = SQLiteSpecStore(tmp_path / "specs.db")
+        yield s
+        s.close()
+
+
+def test_put_get_delete(store):
+    store.put("S1", _spec("S1").to_dict())
+
+    assert APISpec.from_dict(store.get("S1")) == _spec("S1")
+    assert store.get("MISSING") is None
+
+    store.delete("S1")
+    store.delete("S1")
+    assert store.get("S1") is None
+
+
+def test_load_all_and_replace_all(store):
+    store.put("OLD", _spec("OLD").to_dict())
+    store.replace_all({sid: _spec(sid).to_dict() for sid in ("S1", "S2")})
+
+    assert set(store.load_all()) == {"S1", "S2"}
+    assert store.service_ids() == {"S1", "S2"}
+
+
+def test_retain_removes_orphans(store):
+    for sid in ("S1", "S2", "S3"):
+        store.put(sid, _spec(sid).to_dict())
+
+    assert store.retain({"S1", "S3"}) == 1
+    assert store.service_ids() == {"S1", "S3"}
+
+
+def test_json_store_ignores_master_list(tmp_path):
+    save_master_list([{"INF_ID": "S1", "INF_NM": "Test"}], tmp_path)
+    store = JsonSpecStore(tmp_path)
+    store.put("S1", _spec("S1").to_dict())
+
+    assert store.service_ids() == {"S1"}
+    store.clear()
+    assert (tmp_path / "all_apis.json").exists()
+
+
+def test_cleanup_keeps_master_spec(tmp_path):
+    store = SQLiteSpecStore(tmp_path / "specs.db")
+    for sid in (MASTER_LIST_SERVICE_ID, "S1", "GONE"):
+        store.put(sid, _spec(sid).to_dict())
+
+    assert cleanup_orphaned_specs(tmp_path, {"S1"}, store) == 1
+    assert store.service_ids() == {MASTER_LIST_SERVICE_ID, "S1"}
+    store.close()
+
+
+def test_sqlite_store_from_json_dir(tmp_path):
+    json_store = JsonSpecStore(tmp_path)
+    for sid in ("S1", "S2"):
+        json_store.put(sid, _spec(sid).to_dict())
+
+    store = SQLiteSpecStore.from_json_dir(tmp_path / "specs.db", tmp_path)
+    assert set(store.load_all()) == {"S1", "S2"}
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_parser_uses_store(tmp_path):
+    store = SQLiteSpecStore(tmp_path / "specs.db")
+    store.put("S1", _spec("S1").to_dict())
+    parser = SpecParser(cache_dir=tmp_path, store=store)
+
+    assert await parser.parse_spec("S1") == _spec("S1")
+    assert parser.load_cached_specs() == {"S1": _spec("S1")}
+
+    parser.clear_cache("S1")
+    assert store.get("S1") is None
+    store.close()
+
+
+def test_clear_cache_removes_everything(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser.store.put("S1", _spec("S1").to_dict())
+    (tmp_path / "all_apis.json").write_text("{}", encoding="utf-8")
+    parser.inf_seq_index.set("S1", 2)
+    parser.fetch_times.set("S1", 1.0)
+
+    parser.clear_cache()
+
+    assert list(tmp_path.glob("*.json")) == []
+    assert parser.inf_seq_index.get("S1") is None
+    assert SpecParser(cache_dir=tmp_path).fetch_times.get("S1") is None
+
+
+def test_sqlite_store_keeps_indexes_in_database(tmp_path):
+    (tmp_path / "inf_seq.json").write_text('{"S1": 3}', encoding="utf-8")
+    store = SQLiteSpecStore.from_json_dir(tmp_path / "specs.db", tmp_path)
+    (tmp_path / "inf_seq.json").unlink()
+    parser = SpecParser(cache_dir=tmp_path, store=store)
+
+    assert parser.inf_seq_index.get("S1") == 3
+    parser.fetch_times.set("S1", 12.5)
+    parser.inf_seq_index.set("S2", 4)
+    assert list(tmp_path.glob("*.json")) == []
+
+    reopened = SpecParser(cache_dir=tmp_path, store=SQLiteSpecStore(tmp_path / "specs.db"))
+    assert reopened.fetch_times.get("S1") == 12.5
+    assert reopened.inf_seq_index.get("S2") == 4
+
+    parser.clear_cache()
+    assert parser.fetch_times.get("S1") is None
+    store.close()
+    reopened.store.close()
+
+
+def test_client_preload_specs(tmp_path):
+    store = SQLiteSpecStore(tmp_path / "specs.db")
+    store.replace_all({sid: _spec(sid).to_dict() for sid in ("S1", "S2")})
+    client = AssemblyAPIClient(api_key="test_key", spec_parser=SpecParser(cache_dir=tmp_path, store=store))
+
+    assert client.preload_specs() == 2
+    assert client.parsed_specs["S2"].endpoint == "ep_s2"
+    store.close()
+
+
+def test_spec_store_requires_the_core_methods():
+    class Incomplete(SpecStore):
+        def get(self, service_id):
+            return None
+
+    with pytest.raises(TypeError, match="put"):
+        Incomplete()
@@ -0,0 +1,101 @@
+"""Tests for lazy client construction and shared client state."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.generated import Service
+from assembly_client.parser import APISpec, SpecParser
+from assembly_client.session import AssemblySession
+from assembly_client.state import ClientState
+from assembly_client.sync import save_master_list
+
+
+def _spec(service_id, endpoint):
+    return APISpec(
+        service_id=service_id,
+        endpoint=endpoint,
+        endpoint_url=f"https://open.assembly.go.kr/portal/openapi/{endpoint}",
+        basic_params=[],
+        request_params=[],
+        response_fields=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_construction_does_no_io(tmp_path, monkeypatch, baked_table):
+    cache_dir = tmp_path / "specs"
+
+    def no_registry(cache_dir):
+        raise AssertionError("registry loaded")
+
+    monkeypatch.setattr("assembly_client.state.get_registry", no_registry)
+    client = AssemblyAPIClient(api_key="k", state=ClientState(cache_dir=cache_dir))
+
+    assert client._resolve_service_id(Service.국회의원_발의법률안) == Service.국회의원_발의법률안.value
+    assert client._resolve_service_id("OK7XM1000938DS17215") == "OK7XM1000938DS17215"
+    assert await client.get_endpoint(Service.국회의원_발의법률안) == "nzmimeepazxkubdpn"
+    assert client.state._spec_parser is None
+    assert not cache_dir.exists()
+
+
+def test_registry_and_parser_created_on_demand(tmp_path):
+    cache_dir = tmp_path / "specs"
+    client = AssemblyAPIClient(api_key="k", state=ClientState(cache_dir=cache_dir))
+
+    assert dict(client.service_map) == {}
+    assert not cache_dir.exists()
+
+    assert client.spec_parser.cache_dir == cache_dir
+    assert cache_dir.exists()
+
+
+def test_assigned_service_map_overrides_registry(tmp_path):
+    save_master_list([{"INF_ID": "S1", "INF_NM": "본회의 일정"}], tmp_path)
+    client = AssemblyAPIClient(api_key="k", spec_parser=SpecParser(cache_dir=tmp_path))
+    assert client.name_to_id["본회의 일정"] == "S1"
+
+    client.service_map = {"X1": "위원회 현황"}
+    client.name_to_id = {"위원회 현황": "X1"}
+
+    assert client._resolve_service_id("위원회 현황") == "X1"
+    assert client.registry.names["S1"] == "본회의 일정"
+
+
+@pytest.mark.asyncio
+async def test_clients_share_state(tmp_path):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser.store.put("S1", _spec("S1", "ep_s1").to_dict())
+    parser.parse_spec = AsyncMock(return_value=_spec("S2", "ep_s2"))
+
+    async with AssemblySession() as session:
+        state = ClientState(spec_parser=parser).preload()
+        first = AssemblyAPIClient(api_key="k", session=session, state=state)
+        second = AssemblyAPIClient(api_key="k", session=session, state=state)
+
+        assert await first.get_endpoint("S1") == "ep_s1"
+        assert await first.get_endpoint("S2") == "ep_s2"
+        assert await second.get_endpoint("S2") == "ep_s2"
+
+    parser.parse_spec.assert_awaited_once_with("S2")
+    assert second.parsed_specs is first.parsed_specs
+    assert second.spec_parser is parser
+
+
+@pytest.mark.asyncio
+async def test_synced_spec_overrides_baked_endpoint(tmp_path, baked_table):
+    parser = SpecParser(cache_dir=tmp_path)
+    parser.store.put(Service.국회의원_발의법률안.value, _spec(Service.국회의원_발의법률안.value, "resynced").to_dict())
+    client = AssemblyAPIClient(api_key="k", spec_parser=parser)
+
+    assert await client.get_endpoint(Service.국회의원_발의법률안) == "resynced"
+
+
+def test_state_registry_follows_master_list_updates(tmp_path):
+    save_master_list([{"INF_ID": "S1", "INF_NM": "본회의 일정"}], tmp_path)
+    state = ClientState(cache_dir=tmp_path)
+    assert dict(state.registry.names) == {"S1": "본회의 일정"}
+
+    save_master_list([{"INF_ID": "S1", "INF_NM": "본회의 일정"}, {"INF_ID": "S2", "INF_NM": "위원회 현황"}], tmp_path)
+    assert state.registry.names["S2"] == "위원회 현황"
@@ -0,0 +1,168 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from pydantic import BaseModel, Field
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.errors import AssemblyAPIError
+from assembly_client.streaming import RowStreamDecoder
+
+
+class FakeModel(BaseModel):
+    HG_NM: str | None = Field(None)
+    AGE: str | None = Field(None)
+
+
+def _body(rows, total=None, code="INFO-000", endpoint="test_endpoint", indent=None):
+    head = [{"list_total_count": len(rows) if total is None else total}, {"RESULT": {"CODE": code, "MESSAGE": "ok"}}]
+    return json.dumps({endpoint: [{"head": head}, {"row": rows}]}, ensure_ascii=False, indent=indent)
+
+
+def _feed_in_chunks(text, size):
+    decoder = RowStreamDecoder()
+    rows = []
+    for i in range(0, len(text), size):
+        rows.extend(decoder.feed(text[i : i + size]))
+    rows.extend(decoder.close())
+    return decoder, rows
+
+
+# --- RowStreamDecoder ---
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 10_000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_decoder_matches_json_loads(size, indent):
+    rows = [{"HG_NM": f"의원{i}", "AGE": i, "RATE": 1.5, "NONE": None, "NESTED": {"a": [1, 2]}} for i in range(20)]
+    decoder, decoded = _feed_in_chunks(_body(rows, total=123, indent=indent), size)
+
+    assert decoded == rows
+    assert decoder.root_key == "test_endpoint"
+    assert decoder.total_count == 123
+    assert decoder.result["CODE"] == "INFO-000"
+    assert decoder.done
+
+
+def test_decoder_head_available_before_rows():
+    text = _body([{"A": "1"}, {"A": "2"}])
+    cut = text.index('{"A"')
+    decoder = RowStreamDecoder()
+
+    assert decoder.feed(text[:cut]) == []
+    assert decoder.total_count == 2
+    assert decoder.feed(text[cut:]) == [{"A": "1"}, {"A": "2"}]
+
+
+def test_decoder_number_split_across_chunks():
+    decoder = RowStreamDecoder()
+    text = '{"ep": [{"head": [{"list_total_count": 12345}]}, {"row": [{"N": 67890}]}]}'
+    cut = text.index("67890") + 2
+    rows = decoder.feed(text[:cut]) + decoder.feed(text[cut:]) + decoder.close()
+    assert rows == [{"N": 67890}]
+    assert decoder.total_count == 12345
+
+
+def test_decoder_result_only_body():
+    decoder, rows = _feed_in_chunks('{"RESULT": {"CODE": "INFO-200", "MESSAGE": "no data"}}', 5)
+    assert rows == []
+    assert decoder.root_key is None
+    assert decoder.result == {"CODE": "INFO-200", "MESSAGE": "no data"}
+
+
+def test_decoder_rejects_truncated_body():
+    decoder = RowStreamDecoder()
+    decoder.feed(_body([{"A": "1"}])[:-5])
+    with pytest.raises(ValueError, match="[Tt]runcated"):
+        decoder.close()
+
+
+def test_decoder_rejects_trailing_data():
+    decoder = RowStreamDecoder()
+    decoder.feed(_body([]) + " {}")
+    with pytest.raises(ValueError, match="Unexpected data"):
+        decoder.close()
+
+
+# --- AssemblyAPIClient.stream_rows ---
+
+
+def _make_streaming_client(handler, model_map=None):
+    with patch.dict("os.environ", {"ASSEMBLY_API_KEY": "test_key"}):
+        client = AssemblyAPIClient()
+    client.get_endpoint = AsyncMock(return_value="test_endpoint")
+    client._resolve_service_id = MagicMock(side_effect=lambda x: x)
+    client.session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_walks_pages():
+    all_rows = [{"HG_NM": f"의원{i}", "AGE": "21"} for i in range(5)]
+    requested = []
+
+    def handler(request):
+        p_index = int(request.url.params["pIndex"])
+        p_size = int(request.url.params["pSize"])
+        requested.append(p_index)
+        page = all_rows[(p_index - 1) * p_size : p_index * p_size]
+        return httpx.Response(200, text=_body(page, total=len(all_rows)))
+
+    client = _make_streaming_client(handler)
+    with patch("assembly_client.api.MODEL_MAP", {"TEST_SVC_ID": FakeModel}):
+        rows = [row async for row in client.stream_rows("TEST_SVC_ID", p_size=2)]
+
+    assert requested == [1, 2, 3]
+    assert all(isinstance(row, FakeModel) for row in rows)
+    assert [row.HG_NM for row in rows] == [r["HG_NM"] for r in all_rows]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_decode_modes():
+    rows = [{"HG_NM": "홍길동", "AGE": "21"}]
+    client = _make_streaming_client(lambda request: httpx.Response(200, text=_body(rows)))
+
+    with patch("assembly_client.api.MODEL_MAP", {"TEST_SVC_ID": FakeModel}):
+        as_dict = [row async for row in client.stream_rows("TEST_SVC_ID", decode="dict")]
+        constructed = [row async for row in client.stream_rows("TEST_SVC_ID", decode="construct")]
+        client.field_names = MagicMock(return_value=["AGE", "HG_NM"])
+        as_tuple = [row async for row in client.stream_rows("TEST_SVC_ID", decode="tuple")]
+
+    assert as_dict == rows
+    assert isinstance(constructed[0], FakeModel) and constructed[0].HG_NM == "홍길동"
+    assert as_tuple == [("21", "홍길동")]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_raises_api_error_from_head():
+    client = _make_streaming_client(lambda request: httpx.Response(200, text=_body([{"A": "1"}], code="ERROR-300")))
+
+    with pytest.raises(AssemblyAPIError) as exc:
+        async for _ in client.stream_rows("TEST_SVC_ID", decode="dict"):
+            pass
+    assert "ERROR-300" in str(exc.value)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_no_data():
+    body = '{"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}'
+    client = _make_streaming_client(lambda request: httpx.Response(200, text=body))
+
+    rows = [row async for row in client.stream_rows("TEST_SVC_ID", decode="dict")]
+    assert rows == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_http_error():
+    client = _make_streaming_client(lambda request: httpx.Response(500, text="boom"))
+
+    with pytest.raises(AssemblyAPIError) as exc:
+        async for _ in client.stream_rows("TEST_SVC_ID", decode="dict"):
+            pass
+    assert "500" in str(exc.value)
+    await client.close()
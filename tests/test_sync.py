@@ -0,0 +1,159 @@
+"""Tests for the spec sync worker pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assembly_client.errors import AssemblyAPIError
+from assembly_client.parser import SpecParser
+from assembly_client.sync import (
+    diff_master_lists,
+    fetch_master_list,
+    load_master_rows,
+    save_master_list,
+    sync_all_services,
+)
+
+
+def _parser_with_services(tmp_path, delays, fail=()):
+    parser = SpecParser(cache_dir=tmp_path)
+    save_master_list([{"INF_ID": sid, "INF_NM": f"Service {sid}"} for sid in delays], tmp_path)
+
+    state = {"active": 0, "max_active": 0, "finished": []}
+
+    async def parse_spec(service_id, inf_seq=2):
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            await asyncio.sleep(delays[service_id])
+            if service_id in fail:
+                raise RuntimeError("boom")
+            return MagicMock()
+        finally:
+            state["active"] -= 1
+            state["finished"].append(service_id)
+
+    parser.parse_spec = parse_spec
+    return parser, state
+
+
+@pytest.mark.asyncio
+async def test_slow_service_does_not_block_other_slots(tmp_path):
+    delays = {"A_SLOW": 0.3, **{f"B{i}": 0.01 for i in range(8)}}
+    parser, state = _parser_with_services(tmp_path, delays)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stats = await sync_all_services("test_key", parser, concurrency=2)
+    elapsed = loop.time() - started
+
+    # With fixed chunks every chunk containing the slow service would wait for it;
+    # here the second slot works through all fast services meanwhile.
+    assert elapsed < 0.3 + 0.1
+    assert state["finished"][-1] == "A_SLOW"
+    assert state["max_active"] == 2
+    assert stats["updated"] == 9
+    assert stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_include_failures_and_timings(tmp_path):
+    delays = {"S1": 0.0, "S2": 0.05, "S3": 0.0}
+    parser, _ = _parser_with_services(tmp_path, delays, fail={"S3"})
+
+    stats = await sync_all_services("test_key", parser, concurrency=5)
+
+    assert stats["updated"] == 2
+    assert stats["failed"] == 1
+    assert set(stats["timings"]) == {"S1", "S2", "S3"}
+    assert stats["timings"]["S2"] >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_invalid_concurrency(tmp_path):
+    with pytest.raises(ValueError):
+        await sync_all_services("test_key", SpecParser(cache_dir=tmp_path), concurrency=0)
+
+
+def test_diff_master_lists():
+    old = [{"INF_ID": "A", "INF_NM": "a"}, {"INF_ID": "B", "INF_NM": "b"}, {"INF_ID": "C", "INF_NM": "c"}]
+    new = [{"INF_ID": "A", "INF_NM": "a"}, {"INF_ID": "B", "INF_NM": "b2"}, {"INF_ID": "D", "INF_NM": "d"}]
+
+    assert diff_master_lists(old, new) == {"added": ["D"], "changed": ["B"], "removed": ["C"]}
+
+
+@pytest.mark.asyncio
+async def test_refresh_checks_changed_services_and_honours_max_age(tmp_path, monkeypatch):
+    parser = SpecParser(cache_dir=tmp_path)
+    save_master_list([{"INF_ID": "OLD", "INF_NM": "old"}, {"INF_ID": "EDITED", "INF_NM": "v1"}], tmp_path)
+    new_rows = [{"INF_ID": "OLD", "INF_NM": "old"}, {"INF_ID": "EDITED", "INF_NM": "v2"}, {"INF_ID": "NEW", "INF_NM": "n"}]
+
+    async def fetch_master_list(api_key, parser):
+        return new_rows
+
+    monkeypatch.setattr("assembly_client.sync.fetch_master_list", fetch_master_list)
+
+    seen = {}
+
+    async def fetch_spec(service_id, inf_seq=2, max_age=None):
+        seen[service_id] = max_age
+        return MagicMock(), "updated" if max_age == 0 else "cached"
+
+    parser.fetch_spec = fetch_spec
+
+    stats = await sync_all_services("test_key", parser, refresh=True, max_age=3600)
+
+    assert seen == {"OLD": 3600, "EDITED": 0, "NEW": 0}
+    assert stats["updated"] == 2
+    assert stats["cached"] == 1
+    assert stats["master_diff"] == {"added": ["NEW"], "changed": ["EDITED"], "removed": []}
+
+
+def _paged_response(rows, total):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {"master": [{"head": [{"list_total_count": total}]}, {"row": rows}]}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_fetch_master_list_raises_on_failed_page(tmp_path):
+    page = [{"INF_ID": f"S{i}"} for i in range(100)]
+    session = MagicMock()
+    session.get = AsyncMock(side_effect=[_paged_response(page, 150), RuntimeError("connection reset")])
+    parser = SpecParser(cache_dir=tmp_path, session=session)
+    parser.parse_spec = AsyncMock(return_value=MagicMock(endpoint="master"))
+
+    with pytest.raises(AssemblyAPIError, match="page 2"):
+        await fetch_master_list("test_key", parser, session)
+
+
+@pytest.mark.asyncio
+async def test_fetch_master_list_raises_on_short_list(tmp_path):
+    session = MagicMock()
+    session.get = AsyncMock(return_value=_paged_response([{"INF_ID": "S1"}], 3))
+    parser = SpecParser(cache_dir=tmp_path, session=session)
+    parser.parse_spec = AsyncMock(return_value=MagicMock(endpoint="master"))
+
+    with pytest.raises(AssemblyAPIError, match="1 of 3"):
+        await fetch_master_list("test_key", parser, session)
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_partial_master_list_keeps_cache(tmp_path, monkeypatch):
+    parser = SpecParser(cache_dir=tmp_path)
+    rows = [{"INF_ID": "A", "INF_NM": "a"}, {"INF_ID": "B", "INF_NM": "b"}]
+    save_master_list(rows, tmp_path)
+    parser.store.put("B", {"service_id": "B"})
+
+    async def fetch_master_list(api_key, parser):
+        raise AssemblyAPIError("Incomplete master list: got 1 of 2 rows")
+
+    monkeypatch.setattr("assembly_client.sync.fetch_master_list", fetch_master_list)
+
+    with pytest.raises(AssemblyAPIError):
+        await sync_all_services("test_key", parser, refresh=True)
+
+    assert load_master_rows(tmp_path) == rows
+    assert parser.store.get("B") == {"service_id": "B"}
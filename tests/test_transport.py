@@ -0,0 +1,49 @@
+"""Tests for HTTP transport configuration."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.transport import TransportConfig
+
+
+def test_transport_defaults_match_previous_behaviour():
+    config = TransportConfig()
+    timeout = config.timeout()
+    assert timeout == httpx.Timeout(30.0)
+
+    limits = config.limits()
+    assert limits.max_connections == 100
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 5.0
+
+
+def test_transport_custom_settings():
+    config = TransportConfig(
+        max_connections=8,
+        max_keepalive_connections=8,
+        keepalive_expiry=60.0,
+        connect_timeout=2.0,
+        read_timeout=15.0,
+    )
+    assert config.limits() == httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=60.0)
+    assert config.timeout() == httpx.Timeout(connect=2.0, read=15.0, write=30.0, pool=30.0)
+
+
+@pytest.mark.asyncio
+async def test_client_uses_transport_config():
+    config = TransportConfig(read_timeout=5.0, max_connections=4)
+
+    with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as client_cls:
+        client = AssemblyAPIClient(api_key="test_key", transport=config)
+        client.client
+
+    kwargs = client_cls.call_args.kwargs
+    assert kwargs["limits"].max_connections == 4
+    assert kwargs["http2"] is False
+    assert client.client.timeout.read == 5.0
+    # The spec parser created by the client inherits the same settings
+    assert client.spec_parser.transport is config
+    await client.close()
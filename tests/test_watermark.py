@@ -0,0 +1,133 @@
+"""Tests for watermark-based incremental pulls."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from assembly_client.api import AssemblyAPIClient
+from assembly_client.watermark import WatermarkStore, date_key, watermark_key
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a test client with mocked dependencies."""
+    with patch.object(AssemblyAPIClient, "__init__", lambda self, *args, **kwargs: None):
+        c = AssemblyAPIClient.__new__(AssemblyAPIClient)
+        c.api_key = "test_key"
+        c.service_map = {}
+        c.name_to_id = {}
+        c.parsed_specs = {}
+        c.watermarks = WatermarkStore(tmp_path / "watermarks.json")
+        c._resolve_service_id = MagicMock(side_effect=lambda x: x)
+        return c
+
+
+def _newest_first(dates, p_size):
+    """Mock _fetch_page over rows sorted newest first, recording requested pages."""
+    rows = [{"BILL_ID": f"B{i}", "PROPOSE_DT": d} for i, d in enumerate(dates)]
+    requested = []
+
+    async def fetch_page(service_id, params, p_index, p_size_, decode=None):
+        requested.append(p_index)
+        page = rows[(p_index - 1) * p_size : p_index * p_size]
+        return (page, len(rows)) if page else None
+
+    return fetch_page, requested
+
+
+async def _collect(client, **kwargs):
+    rows = []
+    async for page in client.get_new_data("SVC", "PROPOSE_DT", p_size=2, decode="dict", **kwargs):
+        rows.extend(page)
+    return rows
+
+
+def test_date_key_normalizes_formats():
+    assert date_key("2024-05-30") == date_key("20240530") == date_key("2024.05.30")
+    assert date_key("2024-05-30 10:00:00") > date_key("2024-05-30")
+    assert date_key(None) == ""
+
+
+def test_date_key_compares_mixed_precision():
+    assert date_key("2024-05-30") == "20240530000000"
+    assert date_key("2024.5.3") > date_key("2024-04-30")
+    assert date_key("2024-05-30 9:00") < date_key("2024-05-30 10:00")
+    assert date_key("2024-05-30 10:00") == date_key("20240530100000")
+    assert date_key("2024-05-31") > date_key("2024-05-30 23:59:59")
+
+
+def test_watermark_key_ignores_paging_and_api_key():
+    assert watermark_key("SVC", {"AGE": 21, "pIndex": 3, "KEY": "x"}) == watermark_key("SVC", {"AGE": "21"})
+    assert watermark_key("SVC", {"AGE": "21"}) != watermark_key("SVC", {"AGE": "22"})
+
+
+def test_store_persists_and_clears(tmp_path):
+    path = tmp_path / "watermarks.json"
+    store = WatermarkStore(path)
+    store.set("SVC", {"AGE": "21"}, "PROPOSE_DT", "2024-05-30")
+    store.set("OTHER", None, "REG_DATE", "2024-01-01")
+
+    reloaded = WatermarkStore(path)
+    assert reloaded.get("SVC", {"AGE": "21"}, "PROPOSE_DT") == "2024-05-30"
+    assert reloaded.get("SVC", {"AGE": "21"}, "REG_DATE") is None
+
+    reloaded.clear("SVC")
+    assert WatermarkStore(path).get("SVC", {"AGE": "21"}, "PROPOSE_DT") is None
+    assert WatermarkStore(path).get("OTHER", None, "REG_DATE") == "2024-01-01"
+
+
+@pytest.mark.asyncio
+async def test_first_run_fetches_everything_and_sets_watermark(client):
+    dates = ["2024-05-30", "2024-05-29", "2024-05-20", "2024-05-01", "2024-04-15"]
+    client._fetch_page, requested = _newest_first(dates, 2)
+
+    rows = await _collect(client)
+
+    assert [r["PROPOSE_DT"] for r in rows] == dates
+    assert requested == [1, 2, 3]
+    assert client.watermarks.get("SVC", {}, "PROPOSE_DT") == "2024-05-30"
+
+
+@pytest.mark.asyncio
+async def test_stops_paging_at_watermark(client):
+    client.watermarks.set("SVC", {}, "PROPOSE_DT", "2024-05-20")
+    dates = ["2024-06-02", "2024-06-01", "2024-05-20", "2024-05-01", "2024-04-15", "2024-04-01"]
+    client._fetch_page, requested = _newest_first(dates, 2)
+
+    rows = await _collect(client)
+
+    # Rows on the watermark date are returned again; older ones are not
+    assert [r["PROPOSE_DT"] for r in rows] == ["2024-06-02", "2024-06-01", "2024-05-20"]
+    assert requested == [1, 2]
+    assert client.watermarks.get("SVC", {}, "PROPOSE_DT") == "2024-06-02"
+
+
+@pytest.mark.asyncio
+async def test_watermarks_are_per_parameter_set(client):
+    client.watermarks.set("SVC", {"AGE": "21"}, "PROPOSE_DT", "2024-06-01")
+    client._fetch_page, requested = _newest_first(["2024-06-02", "2024-05-01"], 2)
+
+    rows = []
+    async for page in client.get_new_data("SVC", "PROPOSE_DT", {"AGE": "22"}, p_size=2, decode="dict"):
+        rows.extend(page)
+
+    assert len(rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_watermark_not_advanced_when_consumer_stops_early(client):
+    client._fetch_page, _ = _newest_first(["2024-06-02", "2024-06-01", "2024-05-20"], 2)
+
+    async for _ in client.get_new_data("SVC", "PROPOSE_DT", p_size=2, decode="dict"):
+        break
+
+    assert client.watermarks.get("SVC", {}, "PROPOSE_DT") is None
+
+
+@pytest.mark.asyncio
+async def test_nothing_new_yields_nothing(client):
+    client.watermarks.set("SVC", {}, "PROPOSE_DT", "2024-06-02")
+    client._fetch_page, requested = _newest_first(["2024-06-01", "2024-05-20", "2024-05-01"], 2)
+
+    assert await _collect(client) == []
+    assert requested == [1]
+    assert client.watermarks.get("SVC", {}, "PROPOSE_DT") == "2024-06-02"
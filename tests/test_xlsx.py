@@ -0,0 +1,65 @@
+"""Tests for the native xlsx reader used by spec parsing."""
+
+import subprocess
+import sys
+from io import BytesIO
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+
+from assembly_client.parser import parse_spec_workbook
+from assembly_client.xlsx import XlsxFormatError, iter_sheet_rows
+
+from test_parse_workbook import SPEC_ROWS, make_workbook
+
+
+def _openpyxl_rows(content):
+    # Full (not read-only) mode pads every row to the sheet width
+    ws = openpyxl.load_workbook(BytesIO(content))["Sheet1"]
+    return list(ws.iter_rows(values_only=True))
+
+
+def test_rows_match_openpyxl():
+    content = make_workbook(SPEC_ROWS + [(), (None, None, "C only"), (1.5, True, "=A1"), ("D only",)])
+    assert list(iter_sheet_rows(content)) == [tuple(row) for row in _openpyxl_rows(content)]
+
+
+def test_rows_with_empty_trailing_cells_are_padded():
+    content = make_workbook([("AGE", "STRING(필수)"), (1, "BILL_ID"), ("No", "출력명", "출력설명")])
+    assert list(iter_sheet_rows(content)) == [
+        ("AGE", "STRING(필수)", None),
+        (1, "BILL_ID", None),
+        ("No", "출력명", "출력설명"),
+    ]
+
+
+def test_sheet_is_resolved_by_name():
+    wb = openpyxl.Workbook()
+    wb.active.title = "Cover"
+    wb.active.append(["not this one"])
+    wb.create_sheet("Sheet1").append(["요청주소"])
+    buffer = BytesIO()
+    wb.save(buffer)
+
+    assert list(iter_sheet_rows(buffer.getvalue())) == [("요청주소",)]
+
+
+def test_unknown_layout_raises_format_error():
+    with pytest.raises(XlsxFormatError):
+        list(iter_sheet_rows(b"not a zip file"))
+    with pytest.raises(XlsxFormatError, match="not found"):
+        list(iter_sheet_rows(make_workbook(SPEC_ROWS), "Sheet9"))
+
+
+def test_spec_parsing_falls_back_to_openpyxl():
+    with patch("assembly_client.xlsx.iter_sheet_rows", side_effect=XlsxFormatError("odd layout")):
+        spec = parse_spec_workbook("TEST_SVC", make_workbook(SPEC_ROWS))
+    assert spec.endpoint == "nzmimeepazxkubdpn"
+    assert len(spec.response_fields) == 3
+
+
+def test_parser_import_does_not_load_openpyxl():
+    script = "import assembly_client.parser, sys; print('openpyxl' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"